@@ -12,6 +12,7 @@ from agrr_core.usecase.gateways.field_gateway import FieldGateway
 from agrr_core.usecase.gateways.crop_profile_gateway import CropProfileGateway
 from agrr_core.usecase.gateways.weather_gateway import WeatherGateway
 from agrr_core.usecase.gateways.interaction_rule_gateway import InteractionRuleGateway
+from agrr_core.usecase.gateways.completion_table_gateway import CompletionTableGateway
 from agrr_core.usecase.interactors.allocation_adjust_interactor import AllocationAdjustInteractor
 from agrr_core.usecase.dto.allocation_adjust_request_dto import AllocationAdjustRequestDTO
 from agrr_core.adapter.presenters.allocation_adjust_cli_presenter import (
@@ -31,6 +32,7 @@ class AllocationAdjustCliController:
         crop_profile_gateway_internal: CropProfileGateway,
         presenter: AllocationAdjustCliPresenter,
         interaction_rule_gateway: Optional[InteractionRuleGateway] = None,
+        completion_table_gateway: Optional[CompletionTableGateway] = None,
     ):
         """Initialize with injected dependencies.
         
@@ -43,6 +45,7 @@ class AllocationAdjustCliController:
             crop_profile_gateway_internal: Internal gateway for growth period optimization
             presenter: Presenter for output formatting
             interaction_rule_gateway: Optional gateway for interaction rules
+            completion_table_gateway: Optional gateway for completion tables
         """
         self.allocation_result_gateway = allocation_result_gateway
         self.move_instruction_gateway = move_instruction_gateway
@@ -53,6 +56,7 @@ class AllocationAdjustCliController:
         self.presenter = presenter
         self.logger = get_logger()
         self.interaction_rule_gateway = interaction_rule_gateway
+        self.completion_table_gateway = completion_table_gateway
         
         # Instantiate interactor
         self.interactor = AllocationAdjustInteractor(
@@ -62,6 +66,7 @@ class AllocationAdjustCliController:
             weather_gateway=weather_gateway,
             crop_profile_gateway_internal=crop_profile_gateway_internal,
             interaction_rule_gateway=interaction_rule_gateway,
+            completion_table_gateway=completion_table_gateway,
         )
     
     def create_argument_parser(self) -> argparse.ArgumentParser:
@@ -124,7 +129,23 @@ Example 2: With interaction rules
     --interaction-rules-file interaction_rules.json \\
     --planning-start 2024-04-01 --planning-end 2024-10-31
 
-Example 3: With JSON output (for further processing)
+Example 3: Fast interactive adjustment with completion tables
+  agrr optimize allocate ... --completion-tables completion_tables.json \\
+    --format json > current_allocation.json
+  agrr optimize adjust \\
+    --current-allocation current_allocation.json \\
+    --moves moves.json \\
+    --weather-file weather.json \\
+    --fields-file fields.json \\
+    --crops-file crops.json \\
+    --completion-tables completion_tables.json \\
+    --planning-start 2024-04-01 --planning-end 2024-10-31
+
+  Completion dates are looked up instead of recalculated from weather data.
+  Use the same weather, crops and planning period as the allocate run: tables
+  written for another weather file or crop profile are ignored (recalculated).
+
+Example 4: With JSON output (for further processing)
   agrr optimize adjust \\
     --current-allocation current_allocation.json \\
     --moves moves.json \\
@@ -328,6 +349,12 @@ Error: "Time overlap with allocation ... (considering X-day fallow period)"
             required=False,
             help="Path to interaction rules JSON file (optional)",
         )
+        parser.add_argument(
+            "--completion-tables",
+            "-ct",
+            required=False,
+            help="Path to completion tables JSON file written by 'agrr optimize allocate --completion-tables' (optional, faster GDD completion)",
+        )
         parser.add_argument(
             "--format",
             "-fmt",
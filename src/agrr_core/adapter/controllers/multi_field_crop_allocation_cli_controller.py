@@ -10,6 +10,7 @@ from agrr_core.usecase.gateways.field_gateway import FieldGateway
 from agrr_core.usecase.gateways.crop_profile_gateway import CropProfileGateway
 from agrr_core.usecase.gateways.weather_gateway import WeatherGateway
 from agrr_core.usecase.gateways.interaction_rule_gateway import InteractionRuleGateway
+from agrr_core.usecase.gateways.completion_table_gateway import CompletionTableGateway
 from agrr_core.usecase.ports.input.multi_field_crop_allocation_input_port import (
     MultiFieldCropAllocationInputPort,
 )
@@ -41,6 +42,7 @@ class MultiFieldCropAllocationCliController(MultiFieldCropAllocationInputPort):
         crop_profile_gateway_internal: CropProfileGateway,
         interaction_rule_gateway: Optional[InteractionRuleGateway] = None,
         config: Optional[OptimizationConfig] = None,
+        completion_table_gateway: Optional[CompletionTableGateway] = None,
     ) -> None:
         """Initialize with injected dependencies.
         
@@ -52,6 +54,8 @@ class MultiFieldCropAllocationCliController(MultiFieldCropAllocationInputPort):
             crop_profile_gateway_internal: Internal gateway for crop profile operations in growth period optimization
             interaction_rule_gateway: Optional gateway for loading interaction rules
             config: Optional optimization configuration
+            completion_table_gateway: Optional gateway for saving completion tables
+                (used by 'agrr optimize adjust --completion-tables')
             
         Note:
             File paths are NOT passed to Controller/Interactor.
@@ -78,6 +82,7 @@ class MultiFieldCropAllocationCliController(MultiFieldCropAllocationInputPort):
             crop_profile_gateway_internal=crop_profile_gateway_internal,
             config=self.config,
             interaction_rules=self.interaction_rules,
+            completion_table_gateway=completion_table_gateway,
         )
 
     def execute(
@@ -495,6 +500,18 @@ Growth Period Candidate Filtering (Default: Enabled):
             action="store_true",
             help="Enable parallel candidate generation for faster computation",
         )
+        parser.add_argument(
+            "--candidate-workers",
+            type=int,
+            default=None,
+            help="Worker processes for candidate generation (default: 1 = in-process, 0 = all CPUs)",
+        )
+        parser.add_argument(
+            "--local-search-workers",
+            type=int,
+            default=None,
+            help="Worker processes for local search neighbor evaluation (default: 1 = in-process, 0 = all CPUs)",
+        )
         parser.add_argument(
             "--disable-local-search",
             action="store_true",
@@ -507,6 +524,12 @@ Growth Period Candidate Filtering (Default: Enabled):
             default="dp",
             help="Algorithm for initial allocation: 'dp' (optimal per-field) or 'greedy' (fast heuristic). Default: dp",
         )
+        parser.add_argument(
+            "--completion-tables",
+            "-ct",
+            required=False,
+            help="Write per-crop completion tables to this JSON file for faster 'agrr optimize adjust --completion-tables' (optional)",
+        )
         parser.add_argument(
             "--no-filter-redundant",
             action="store_true",
@@ -592,6 +615,14 @@ Growth Period Candidate Filtering (Default: Enabled):
             # Create a new config with updated parallel setting
             config = replace(config, enable_parallel_candidate_generation=True)
         
+        candidate_workers = getattr(args, 'candidate_workers', None)
+        if candidate_workers is not None:
+            config = replace(config, candidate_generation_workers=candidate_workers)
+        
+        local_search_workers = getattr(args, 'local_search_workers', None)
+        if local_search_workers is not None:
+            config = replace(config, local_search_workers=local_search_workers)
+        
         # Create request DTO
         # Note: crops are loaded by Interactor via CropProfileGateway
         request = MultiFieldCropAllocationRequestDTO(
@@ -122,6 +122,9 @@ Examples:
   
   # Save weather data to file (JSON format)
   agrr weather --location 40.7128,-74.0060 --days 5 --json > weather.json
+  
+  # Save 30 years of data as a binary columnar file (fast to load, use as --weather-file)
+  agrr weather --location 35.6762,139.6503 --start-date 1994-01-01 --end-date 2023-12-31 --data-source jma --output weather.npz
 
 Major Cities:
   Tokyo:       35.6762,139.6503
@@ -196,7 +199,8 @@ Output (JSON):
         
         weather_parser.add_argument(
             '--output', '-o',
-            help='Output file path (optional)'
+            help='Output file path (optional). .npz/.parquet writes a binary columnar file '
+                 'readable by every --weather-file/--input option'
         )
         
         # Forecast command (16-day forecast from tomorrow)
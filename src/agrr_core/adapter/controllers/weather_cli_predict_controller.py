@@ -52,6 +52,12 @@ Examples:
   agrr predict --input historical.json --output forecast_max.json --days 30 --model lightgbm \\
                --metrics temperature_max
   
+  # Daily forecasts for the same station: keep trained models between runs
+  agrr predict --input historical.json --output forecast.json --days 30 --model lightgbm \\
+               --model-store ~/.cache/agrr/models
+  agrr predict --input historical.json --output forecast.json --days 30 --model arima \\
+               --model-store ~/.cache/agrr/models --station-id tokyo
+  
   # Use ensemble of multiple models (best accuracy)
   agrr predict --input historical.json --output forecast.json --days 30 --model ensemble
   
@@ -207,6 +213,34 @@ Notes:
                  'Example: --metrics temperature,temperature_max,temperature_min'
         )
         
+        # Model store argument (LightGBM boosters, ARIMA orders)
+        parser.add_argument(
+            '--model-store',
+            metavar='DIR',
+            help='Directory for trained models. LightGBM models are reused when the input data is unchanged '
+                 'and refit when only new days were appended; ARIMA keeps the chosen order and warm-starts '
+                 'from the last fitted parameters, so repeated forecasts skip training.'
+        )
+        
+        # ARIMA order search parallelism
+        parser.add_argument(
+            '--arima-search-workers',
+            type=int,
+            default=1,
+            metavar='N',
+            help='Processes fitting ARIMA order candidates in parallel when the order is searched '
+                 '(default: 1, serial)'
+        )
+        
+        # Station of the input data (model store key)
+        parser.add_argument(
+            '--station-id',
+            metavar='ID',
+            help='Station the input data belongs to, used to keep stored models apart (default: derived '
+                 'from the first days of the input). Set it when the input is a sliding window of a '
+                 'station\'s history, so its ARIMA order is reused although the first days change.'
+        )
+        
         return parser
     
     
@@ -216,6 +250,7 @@ Notes:
             # Get model type and metrics from args
             model_type = getattr(args, 'model', 'arima')
             metrics_str = getattr(args, 'metrics', 'temperature')
+            station_id = getattr(args, 'station_id', None)
             
             # LightGBMの場合は自動的に全メトリックを予測（CLIヘルプに記載済み）
             if model_type == 'lightgbm':
@@ -245,7 +280,8 @@ Notes:
                     input_source=args.input,
                     output_destination=args.output,
                     prediction_days=args.days,
-                    predict_all_temperature_metrics=True
+                    predict_all_temperature_metrics=True,
+                    station_id=station_id
                 )
             elif model_type == 'mock':
                 # Mock mode: use last year's same period data
@@ -253,7 +289,8 @@ Notes:
                     input_source=args.input,
                     output_destination=args.output,
                     prediction_days=args.days,
-                    predict_all_temperature_metrics=True
+                    predict_all_temperature_metrics=True,
+                    station_id=station_id
                 )
             else:
                 # ARIMA等は単一メトリックのみ
@@ -269,7 +306,8 @@ Notes:
                     input_source=args.input,
                     output_destination=args.output,
                     prediction_days=args.days,
-                    predict_all_temperature_metrics=False
+                    predict_all_temperature_metrics=False,
+                    station_id=station_id
                 )
             
             # Display success message
@@ -0,0 +1,113 @@
+"""Completion table file gateway implementation.
+
+Gateway implementation for saving and loading per-crop completion tables as
+JSON files (written by `optimize allocate`, read by `optimize adjust`).
+"""
+
+import hashlib
+import json
+from datetime import datetime
+from typing import List, Optional
+
+from agrr_core.usecase.gateways.completion_table_gateway import CompletionTableGateway
+from agrr_core.usecase.services.crop_completion_table import CropCompletionTable
+from agrr_core.adapter.interfaces.io.file_service_interface import FileServiceInterface
+
+class CompletionTableFileGateway(CompletionTableGateway):
+    """File-based gateway for completion table operations.
+
+    When a weather file is configured, save() records its hash and get_all()
+    ignores tables written for a different weather file.
+    """
+
+    def __init__(
+        self,
+        file_repository: FileServiceInterface,
+        file_path: str = "",
+        weather_file_path: str = "",
+    ):
+        """Initialize with file repository and file path.
+
+        Args:
+            file_repository: File service for file I/O operations
+            file_path: Path to the completion tables JSON file
+            weather_file_path: Weather file the tables are built from
+                (empty: not checked)
+        """
+        self.file_repository = file_repository
+        self.file_path = file_path
+        self.weather_file_path = weather_file_path
+
+    def save(self, tables: List[CropCompletionTable]) -> None:
+        """Save completion tables to the configured file.
+
+        JSON format:
+        {
+          "weather_fingerprint": "9f2c...",          // SHA-256 of the weather file
+          "completion_tables": [
+            {
+              "crop_id": "tomato",
+              "variety": "Momotaro",
+              "first_start": "2024-04-01",
+              "growth_days": [106, 105, null, ...],  // One entry per start day
+              "fingerprint": "3a7d..."               // Crop profile and start days
+            }
+          ]
+        }
+        """
+        data = {
+            "weather_fingerprint": self._weather_fingerprint(),
+            "completion_tables": [
+                {
+                    "crop_id": table.crop_id,
+                    "variety": table.variety,
+                    "first_start": table.first_start.date().isoformat(),
+                    "growth_days": table.growth_days,
+                    "fingerprint": table.fingerprint,
+                }
+                for table in tables
+            ]
+        }
+        self.file_repository.write(json.dumps(data), self.file_path)
+
+    def get_all(self) -> List[CropCompletionTable]:
+        """Get completion tables from the configured file.
+
+        Returns:
+            Completion tables, empty list if no file is configured, it does not
+            exist or it was written for a different weather file
+
+        Raises:
+            ValueError: If the file format is invalid
+        """
+        if not self.file_path or not self.file_repository.exists(self.file_path):
+            return []
+
+        try:
+            data = json.loads(self.file_repository.read(self.file_path))
+            if self.weather_file_path and data.get("weather_fingerprint") != self._weather_fingerprint():
+                return []
+            return [
+                CropCompletionTable(
+                    crop_id=table_data["crop_id"],
+                    variety=table_data.get("variety"),
+                    first_start=datetime.strptime(table_data["first_start"], "%Y-%m-%d"),
+                    growth_days=[
+                        None if days is None else int(days)
+                        for days in table_data["growth_days"]
+                    ],
+                    fingerprint=table_data.get("fingerprint"),
+                )
+                for table_data in data["completion_tables"]
+            ]
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError) as e:
+            raise ValueError(f"Invalid completion table file format: {e}")
+
+    def _weather_fingerprint(self) -> Optional[str]:
+        """SHA-256 of the configured weather file (None if not configured)."""
+        if not self.weather_file_path:
+            return None
+        digest = hashlib.sha256()
+        for chunk in self.file_repository.read_chunks(self.weather_file_path):
+            digest.update(chunk.encode('utf-8'))
+        return digest.hexdigest()
@@ -50,19 +50,7 @@ class CropProfileFileGateway(CropProfileGateway):
         if not self.file_path:
             raise ValueError("file_path not set. Cannot load crop profile.")
         
-        # Read file using repository
-        content = self.file_repository.read(self.file_path)
-        
-        # Parse JSON
-        data = json.loads(content)
-        
-        # Check if this is a collection file or single profile file
-        if 'crops' in data:
-            # Collection file - get first crop (for backward compatibility)
-            return self._parse_crop_data(data['crops'][0])
-        else:
-            # Single profile file
-            return self._parse_single_profile(data)
+        return self.file_repository.load_cached('crop_profile', self.file_path, self._parse_first_profile)
     
     def get_all(self) -> List[CropProfile]:
         """Get all crop profiles from the file.
@@ -186,10 +174,31 @@ class CropProfileFileGateway(CropProfileGateway):
         if self._cache is not None:
             return
         
+        # Parsed profiles are shared across daemon requests; keep a copy of the dict
+        self._cache = dict(self.file_repository.load_cached('crop_profiles', self.file_path, self._parse_all_profiles))
+    
+    def _parse_first_profile(self) -> CropProfile:
+        """Parse the profile returned by get() from file."""
+        # Read file using repository
+        content = self.file_repository.read(self.file_path)
+        
+        # Parse JSON
+        data = json.loads(content)
+        
+        # Check if this is a collection file or single profile file
+        if 'crops' in data:
+            # Collection file - get first crop (for backward compatibility)
+            return self._parse_crop_data(data['crops'][0])
+        else:
+            # Single profile file
+            return self._parse_single_profile(data)
+    
+    def _parse_all_profiles(self) -> Dict[str, CropProfile]:
+        """Parse all crops from file, keyed by cache key."""
         content = self.file_repository.read(self.file_path)
         data = json.loads(content)
         
-        self._cache = {}
+        profiles = {}
         
         # Check if this is a collection file or single profile file
         if 'crops' in data:
@@ -197,12 +206,13 @@ class CropProfileFileGateway(CropProfileGateway):
             for crop_data in data['crops']:
                 crop_profile = self._parse_crop_data(crop_data)
                 key = self._make_cache_key(crop_profile)
-                self._cache[key] = crop_profile
+                profiles[key] = crop_profile
         else:
             # Single profile file
             crop_profile = self._parse_single_profile(data)
             key = self._make_cache_key(crop_profile)
-            self._cache[key] = crop_profile
+            profiles[key] = crop_profile
+        return profiles
     
     def _make_cache_key(self, profile: CropProfile) -> str:
         """Create cache key from crop profile."""
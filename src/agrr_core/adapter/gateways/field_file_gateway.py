@@ -3,6 +3,7 @@
 This gateway directly implements FieldGateway interface for file-based field data access.
 """
 
+import json
 from typing import List, Dict, Any, Optional
 
 from agrr_core.entity.entities.field_entity import Field
@@ -110,33 +111,8 @@ class FieldFileGateway(FieldGateway):
             if not self.file_repository.exists(file_path):
                 raise FileError(f"File not found: {file_path}")
             
-            # Read and parse JSON
-            content = self.file_repository.read(file_path)
-            import json
-            data = json.loads(content)
-            
-            fields = []
-            
-            # Handle different JSON structures
-            if isinstance(data, dict):
-                if 'fields' in data:
-                    # Multiple fields format
-                    field_list = data['fields']
-                else:
-                    # Single field format
-                    field_list = [data]
-            elif isinstance(data, list):
-                # Direct array format
-                field_list = data
-            else:
-                raise FileError("Invalid JSON structure. Expected object or array.")
-            
-            # Convert each field data to Field entity
-            for field_data in field_list:
-                field = self._convert_dict_to_field(field_data)
-                fields.append(field)
-            
-            return fields
+            # Parsed fields are shared across daemon requests; return a copy of the list
+            return list(self.file_repository.load_cached('fields', file_path, lambda: self._parse_fields_file(file_path)))
             
         except FileError:
             raise
@@ -145,6 +121,35 @@ class FieldFileGateway(FieldGateway):
         except Exception as e:
             raise FileError(f"Failed to read field data from file {file_path}: {e}")
     
+    def _parse_fields_file(self, file_path: str) -> List[Field]:
+        """Read and convert field data from JSON file."""
+        # Read and parse JSON
+        content = self.file_repository.read(file_path)
+        data = json.loads(content)
+        
+        fields = []
+        
+        # Handle different JSON structures
+        if isinstance(data, dict):
+            if 'fields' in data:
+                # Multiple fields format
+                field_list = data['fields']
+            else:
+                # Single field format
+                field_list = [data]
+        elif isinstance(data, list):
+            # Direct array format
+            field_list = data
+        else:
+            raise FileError("Invalid JSON structure. Expected object or array.")
+        
+        # Convert each field data to Field entity
+        for field_data in field_list:
+            field = self._convert_dict_to_field(field_data)
+            fields.append(field)
+        
+        return fields
+    
     def get_field_by_id(self, file_path: str, field_id: str) -> Optional[Field]:
         """Get a specific field by ID from file.
         
@@ -39,6 +39,11 @@ class InteractionRuleFileGateway(InteractionRuleGateway):
         Raises:
             FileError: If file cannot be read or JSON is invalid
         """
+        # Parsed rules are shared across daemon requests; return a copy of the list
+        return list(self.file_repository.load_cached('interaction_rules', self.file_path, self._read_rules))
+    
+    def _read_rules(self) -> List[InteractionRule]:
+        """Read and deserialize interaction rules from the configured file."""
         try:
             # Read file using repository
             content = self.file_repository.read(self.file_path)
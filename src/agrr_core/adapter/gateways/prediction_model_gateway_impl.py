@@ -14,11 +14,20 @@ NOTE: This gateway is currently not used in CLI commands.
       When implementing these advanced features, update agrr_core_container.py to use this gateway.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
 from typing import List, Dict, Any, Optional
 
+import numpy as np
+
 from agrr_core.entity import WeatherData, Forecast
 from agrr_core.entity.exceptions.prediction_error import PredictionError
 from agrr_core.usecase.gateways.prediction_model_gateway import PredictionModelGateway
+from agrr_core.usecase.gateways.batch_prediction_executor import (
+    BatchPredictionExecutor,
+    SerialBatchPredictionExecutor,
+)
 from agrr_core.adapter.interfaces.ml.prediction_service_interface import PredictionServiceInterface
 
 class PredictionModelGatewayImpl(PredictionModelGateway):
@@ -33,7 +42,8 @@ class PredictionModelGatewayImpl(PredictionModelGateway):
         self,
         arima_service: Optional[PredictionServiceInterface] = None,
         lightgbm_service: Optional[PredictionServiceInterface] = None,
-        default_model: str = 'arima'
+        default_model: str = 'arima',
+        batch_executor: Optional[BatchPredictionExecutor] = None
     ):
         """
         Initialize prediction model gateway.
@@ -42,6 +52,8 @@ class PredictionModelGatewayImpl(PredictionModelGateway):
             arima_service: ARIMA prediction service (Framework layer, injected)
             lightgbm_service: LightGBM prediction service (Framework layer, injected)
             default_model: Default model to use ('arima' or 'lightgbm')
+            batch_executor: Runs the per-dataset predictions of batch_predict
+                (Framework layer, injected; None: one after another in this process)
         """
         self.models = {}
         
@@ -52,6 +64,7 @@ class PredictionModelGatewayImpl(PredictionModelGateway):
             self.models['lightgbm'] = lightgbm_service
         
         self.default_model = default_model
+        self.batch_executor = batch_executor or SerialBatchPredictionExecutor()
         
         if not self.models:
             raise ValueError("At least one prediction model service must be provided")
@@ -203,50 +216,79 @@ class PredictionModelGatewayImpl(PredictionModelGateway):
         
         model_configs = model_configs or {}
         
-        # Get predictions from each model
-        all_predictions = []
         for model_type in model_types:
             if model_type not in self.models:
                 raise PredictionError(f"Model '{model_type}' not available for ensemble")
-            
-            config = model_configs.get(model_type, {})
-            preds = self.predict(
-                historical_data, metric, prediction_days, model_type, config
+        
+        # Fit members concurrently; derived inputs of historical_data
+        # (series, features, climatology) are computed once and shared by
+        # all members, since the dataset scopes stay open until every member is done
+        with ExitStack() as scopes:
+            for model_type in dict.fromkeys(model_types):
+                scopes.enter_context(self.models[model_type].dataset_scope())
+            all_predictions = self._predict_members(
+                historical_data, metric, prediction_days, model_types, model_configs
             )
-            all_predictions.append(preds)
         
-        # Ensemble predictions (weighted average)
+        if any(len(preds) < prediction_days for preds in all_predictions):
+            raise PredictionError("Ensemble members returned fewer forecasts than prediction_days")
+        
+        # Ensemble predictions (weighted average), members x days
+        weight_column = np.array(weights)[:, None]
+        values = np.array([
+            [f.predicted_value for f in preds[:prediction_days]] for preds in all_predictions
+        ], dtype=np.float64)
+        ensemble_values = np.sum(weight_column * values, axis=0)
+        
+        # Weighted sum of the confidence bounds members provide
+        ensemble_lower = self._weighted_bound_sum(weight_column, all_predictions, prediction_days, 'confidence_lower')
+        ensemble_upper = self._weighted_bound_sum(weight_column, all_predictions, prediction_days, 'confidence_upper')
+        
         ensemble_forecasts = []
         for i in range(prediction_days):
-            # Weighted average of predicted values
-            ensemble_value = sum(
-                weight * preds[i].predicted_value
-                for weight, preds in zip(weights, all_predictions)
-            )
-            
-            # Weighted average of confidence intervals
-            ensemble_lower = sum(
-                weight * preds[i].confidence_lower
-                for weight, preds in zip(weights, all_predictions)
-                if preds[i].confidence_lower is not None
-            )
-            
-            ensemble_upper = sum(
-                weight * preds[i].confidence_upper
-                for weight, preds in zip(weights, all_predictions)
-                if preds[i].confidence_upper is not None
-            )
-            
             forecast = Forecast(
                 date=all_predictions[0][i].date,
-                predicted_value=ensemble_value,
-                confidence_lower=ensemble_lower if ensemble_lower else None,
-                confidence_upper=ensemble_upper if ensemble_upper else None
+                predicted_value=float(ensemble_values[i]),
+                confidence_lower=float(ensemble_lower[i]) if ensemble_lower[i] else None,
+                confidence_upper=float(ensemble_upper[i]) if ensemble_upper[i] else None
             )
             ensemble_forecasts.append(forecast)
         
         return ensemble_forecasts
     
+    def _predict_members(
+        self,
+        historical_data: List[WeatherData],
+        metric: str,
+        prediction_days: int,
+        model_types: List[str],
+        model_configs: Dict[str, Dict[str, Any]]
+    ) -> List[List[Forecast]]:
+        """Predict with every ensemble member concurrently (results in member order)."""
+        with ThreadPoolExecutor(max_workers=len(model_types)) as executor:
+            futures = [
+                executor.submit(
+                    self.predict, historical_data, metric, prediction_days,
+                    model_type, model_configs.get(model_type, {})
+                )
+                for model_type in model_types
+            ]
+            return [future.result() for future in futures]
+    
+    @staticmethod
+    def _weighted_bound_sum(
+        weight_column: np.ndarray,
+        all_predictions: List[List[Forecast]],
+        prediction_days: int,
+        bound: str
+    ) -> np.ndarray:
+        """Sum weighted confidence bounds per day, skipping missing bounds."""
+        bounds = np.array([
+            [getattr(f, bound) if getattr(f, bound) is not None else np.nan for f in preds[:prediction_days]]
+            for preds in all_predictions
+        ], dtype=np.float64)
+        return np.nansum(weight_column * bounds, axis=0)
+    
     # Implement PredictionModelGateway interface methods
     
     def predict_multiple_metrics(
@@ -313,8 +355,9 @@ class PredictionModelGatewayImpl(PredictionModelGateway):
     ) -> Dict[str, Any]:
         """Train prediction model with given configuration.
         
-        Note: Current implementation uses pre-trained models,
-        so this method returns model information.
+        Services that train ahead of prediction (e.g. LightGBM with a model
+        store) train here; subsequent predict() calls on the same data reuse
+        the trained model. Other services only return model information.
         
         Args:
             training_data: Training data
@@ -326,6 +369,13 @@ class PredictionModelGatewayImpl(PredictionModelGateway):
         """
         model_type = model_config.get('model_type', self.default_model)
         
+        if model_type not in self.models:
+            raise PredictionError(f"Model '{model_type}' not available")
+        
+        service = self.models[model_type]
+        if hasattr(service, 'train_model'):
+            return service.train_model(training_data, model_config, metric)
+        
         return {
             'model_type': model_type,
             'metric': metric,
@@ -394,18 +444,15 @@ class PredictionModelGatewayImpl(PredictionModelGateway):
             
         Returns:
             List of prediction results for each dataset
+            ({'error': message} for datasets that failed)
         """
-        results = []
-        
-        for historical_data in historical_data_list:
-            try:
-                result = self.predict_multiple_metrics(
-                    historical_data, metrics, model_config
-                )
-                results.append(result)
-            except Exception as e:
-                # Add error result
-                results.append({'error': str(e)})
+        outcomes = self.batch_executor.run(
+            partial(self.predict_multiple_metrics, metrics=metrics, model_config=model_config),
+            historical_data_list
+        )
         
-        return results
+        return [
+            outcome.value if outcome.error is None else {'error': outcome.error}
+            for outcome in outcomes
+        ]
 
@@ -4,11 +4,12 @@ This gateway directly implements WeatherGateway interface for file-based weather
 """
 
 import json
+import re
 import pandas as pd
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Union
+from datetime import date, datetime
 
-from agrr_core.entity import WeatherData, Forecast
+from agrr_core.entity import WeatherData, WeatherSeries, Forecast
 import os
 import time
 from agrr_core.entity.exceptions.file_error import FileError
@@ -17,31 +18,53 @@ from agrr_core.usecase.gateways.weather_gateway import WeatherGateway
 from agrr_core.usecase.dto.weather_data_with_location_dto import WeatherDataWithLocationDTO
 from agrr_core.framework.validation.output_validator import OutputValidator, OutputValidationError
 
+# Time values starting with an ISO date can be range-filtered before conversion
+_ISO_DATE_PREFIX = re.compile(r'\d{4}-\d{2}-\d{2}')
+
 class WeatherFileGateway(WeatherGateway):
     """File-based implementation of WeatherGateway.
     
     Reads weather data from JSON/CSV files.
     File path is configured at initialization.
     Directly implements WeatherGateway interface without intermediate layers.
+    
+    Files on disk are parsed incrementally (the file repository streams the
+    records): records are converted one at a time and records outside the
+    optional date range are dropped while parsing. Binary columnar files
+    (.npz, .parquet) are read by the file repository as well
+    (read_weather_columns).
     """
     
-    def __init__(self, file_repository: FileServiceInterface, file_path: str):
+    def __init__(
+        self,
+        file_repository: FileServiceInterface,
+        file_path: str,
+        start_date: Optional[Union[date, str]] = None,
+        end_date: Optional[Union[date, str]] = None,
+        use_mmap: Optional[bool] = None,
+    ):
         """Initialize weather file gateway.
         
         Args:
             file_repository: File repository for file I/O operations (Framework layer)
             file_path: File path to weather data file
+            start_date: Only read records from this date (inclusive)
+            end_date: Only read records up to this date (inclusive)
+            use_mmap: Read files through a memory map (None: large files only)
         """
         self.file_repository = file_repository
         self.file_path = file_path
+        self.start_date = start_date
+        self.end_date = end_date
+        self.use_mmap = use_mmap
     
-    def get(self) -> List[WeatherData]:
+    def get(self) -> WeatherSeries:
         """Get weather data from configured file.
         
         Returns:
-            List of WeatherData entities
+            WeatherSeries (read-only sequence of WeatherData entities)
         """
-        return self.read_weather_data_from_file(self.file_path)
+        return self.read_weather_data_from_file(self.file_path, self.start_date, self.end_date)
     
     def create(self, weather_data: List[WeatherData], destination: str) -> None:
         """Create weather data at destination.
@@ -91,8 +114,19 @@ class WeatherFileGateway(WeatherGateway):
     
     # ===== Reading Methods =====
     
-    def read_weather_data_from_file(self, file_path: str) -> List[WeatherData]:
-        """Read weather data from JSON or CSV file."""
+    def read_weather_data_from_file(
+        self,
+        file_path: str,
+        start_date: Optional[Union[date, str]] = None,
+        end_date: Optional[Union[date, str]] = None,
+    ) -> WeatherSeries:
+        """Read weather data from JSON or CSV file.
+        
+        Args:
+            file_path: Weather data file
+            start_date: Only read records from this date (inclusive)
+            end_date: Only read records up to this date (inclusive)
+        """
         try:
             if not self.file_repository.exists(file_path):
                 raise FileError(f"File not found: {file_path}")
@@ -105,11 +139,24 @@ class WeatherFileGateway(WeatherGateway):
             t0 = time.perf_counter() if prof else 0.0
             
             if extension == '.json':
-                result = self._read_json_file(file_path)
+                reader = self._read_json_file
             elif extension == '.csv':
-                result = self._read_csv_file(file_path)
+                reader = self._read_csv_file
+            elif self.file_repository.is_columnar_weather_file(file_path):
+                reader = self._read_columnar_file
             else:
-                raise FileError(f"Unsupported file format: {extension}. Supported formats: .json, .csv")
+                raise FileError(
+                    f"Unsupported file format: {extension}. Supported formats: .json, .csv, .npz, .parquet"
+                )
+            start_date = self._to_date(start_date)
+            end_date = self._to_date(end_date)
+            kind = 'weather'
+            if start_date or end_date:
+                kind = f"weather[{start_date or ''}..{end_date or ''}]"
+            # Parsed series are shared across daemon requests (read-only, no copy needed)
+            result = self.file_repository.load_cached(
+                kind, file_path, lambda: reader(file_path, start_date, end_date)
+            )
             if prof:
                 t1 = time.perf_counter()
                 print(f"[PROFILE] WeatherFileGateway.read file={file_path} fmt={extension} records={len(result)} elapsed={t1-t0:.3f}s", flush=True)
@@ -120,61 +167,103 @@ class WeatherFileGateway(WeatherGateway):
         except Exception as e:
             raise FileError(f"Failed to read weather data from file {file_path}: {e}")
     
-    def _read_json_file(self, file_path: str) -> List[WeatherData]:
-        """Read weather data from JSON file."""
+    def _read_json_file(
+        self,
+        file_path: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> WeatherSeries:
+        """Read weather data from JSON file.
+        
+        Records are a top-level array, the "data" or "weather_data" array of
+        a top-level object, or the object itself.
+        """
         try:
-            content = self.file_repository.read(file_path)
-            data = json.loads(content)
-            
-            weather_data_list = []
-            
-            # Handle different JSON structures
-            if isinstance(data, dict):
-                # Check if data is wrapped in a structure
-                if 'data' in data:
-                    data_list = data['data']
-                elif 'weather_data' in data:
-                    data_list = data['weather_data']
-                else:
-                    # Assume the dict itself contains the data list
-                    data_list = [data]
-            elif isinstance(data, list):
-                data_list = data
-            else:
-                raise FileError("Invalid JSON structure. Expected object or array.")
-            
-            for item in data_list:
-                weather_data = self._convert_dict_to_weather_data(item)
-                if weather_data:
-                    weather_data_list.append(weather_data)
-            
-            return weather_data_list
+            records = self.file_repository.read_json_records(file_path, use_mmap=self.use_mmap)
+            return self._to_weather_series(records, start_date, end_date)
             
         except Exception as e:
             raise FileError(f"Failed to read JSON file {file_path}: {e}")
     
-    def _read_csv_file(self, file_path: str) -> List[WeatherData]:
+    def _read_csv_file(
+        self,
+        file_path: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> WeatherSeries:
         """Read weather data from CSV file."""
         try:
-            content = self.file_repository.read(file_path)
-            # Use pandas to read CSV from content
-            import io
-            df = pd.read_csv(io.StringIO(content))
-            
-            weather_data_list = []
-            
-            for _, row in df.iterrows():
-                # Convert row to dict for processing
-                item = row.to_dict()
-                weather_data = self._convert_dict_to_weather_data(item)
-                if weather_data:
-                    weather_data_list.append(weather_data)
-            
-            return weather_data_list
+            records = self.file_repository.read_csv_records(file_path, use_mmap=self.use_mmap)
+            return self._to_weather_series(records, start_date, end_date)
             
         except Exception as e:
             raise FileError(f"Failed to read CSV file {file_path}: {e}")
     
+    def _read_columnar_file(
+        self,
+        file_path: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> WeatherSeries:
+        """Read weather data from a binary columnar file (.npz/.parquet)."""
+        try:
+            return self.file_repository.read_weather_columns(
+                file_path, start_date, end_date, use_mmap=self.use_mmap is not False
+            )
+        except Exception as e:
+            raise FileError(f"Failed to read columnar weather file {file_path}: {e}")
+    
+    def _to_weather_series(
+        self,
+        items: Iterable[Dict[str, Any]],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> WeatherSeries:
+        """Convert raw records to a WeatherSeries, skipping invalid records."""
+        return WeatherSeries.from_weather_data(
+            self._iter_weather_data(items, start_date, end_date)
+        )
+    
+    def _iter_weather_data(
+        self,
+        items: Iterable[Dict[str, Any]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+    ) -> Iterator[WeatherData]:
+        """Convert records in the date range, skipping invalid records."""
+        filtered = start_date is not None or end_date is not None
+        start = start_date.isoformat() if start_date else None
+        end = end_date.isoformat() if end_date else None
+        
+        for item in items:
+            if filtered and isinstance(item, dict):
+                # Cheap check on the raw ISO date before converting the record
+                raw = item.get('time') or item.get('date') or item.get('datetime')
+                if isinstance(raw, str) and _ISO_DATE_PREFIX.match(raw):
+                    day = raw[:10]
+                    if (start and day < start) or (end and day > end):
+                        continue
+            
+            weather_data = self._convert_dict_to_weather_data(item)
+            if not weather_data:
+                continue
+            if filtered:
+                day = weather_data.time.date()
+                if (start_date and day < start_date) or (end_date and day > end_date):
+                    continue
+            yield weather_data
+    
+    @staticmethod
+    def _to_date(value: Optional[Union[date, str]]) -> Optional[date]:
+        """Convert a date bound given as date, datetime or ISO string."""
+        if value is None or value == '':
+            return None
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return datetime.strptime(value[:10], '%Y-%m-%d').date()
+    
     def _convert_dict_to_weather_data(self, data: Dict[str, Any]) -> Optional[WeatherData]:
         """Convert dictionary to WeatherData entity."""
         try:
@@ -184,7 +273,10 @@ class WeatherFileGateway(WeatherGateway):
                 return None
             
             # Handle different time formats
-            if isinstance(time_str, str):
+            if isinstance(time_str, str) and len(time_str) == 10 and _ISO_DATE_PREFIX.match(time_str):
+                # Plain dates (most daily files) without the cost of strptime
+                time = datetime(int(time_str[:4]), int(time_str[5:7]), int(time_str[8:]))
+            elif isinstance(time_str, str):
                 # Try common datetime formats
                 for fmt in ['%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ']:
                     try:
@@ -239,7 +331,7 @@ class WeatherFileGateway(WeatherGateway):
             from pathlib import Path
             path = Path(file_path)
             extension = path.suffix.lower()
-            return extension in ['.json', '.csv']
+            return extension in ('.json', '.csv') or self.file_repository.is_columnar_weather_file(file_path)
         except Exception:
             return False
     
@@ -6,6 +6,7 @@ This gateway directly implements WeatherGateway interface for JMA access.
 import logging
 from typing import Dict, Tuple, List, Optional
 from datetime import datetime
+from urllib.parse import urlsplit
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
@@ -15,6 +16,7 @@ from agrr_core.entity.exceptions.weather_data_not_found_error import WeatherData
 from agrr_core.entity.exceptions.html_fetch_error import HtmlFetchError
 from agrr_core.adapter.interfaces.io.html_table_service_interface import HtmlTableServiceInterface
 from agrr_core.adapter.interfaces.structures.html_table_structures import HtmlTable, TableRow
+from agrr_core.adapter.utils.concurrent_fetch import fetch_all
 from agrr_core.usecase.dto.weather_data_with_location_dto import WeatherDataWithLocationDTO
 from agrr_core.usecase.gateways.weather_gateway import WeatherGateway
 
@@ -97,13 +99,25 @@ class WeatherJMAGateway(WeatherGateway):
     
     BASE_URL = "https://www.data.jma.go.jp/obd/stats/etrn/view/daily_s1.php"
     
-    def __init__(self, html_table_fetcher: HtmlTableServiceInterface):
+    def __init__(
+        self,
+        html_table_fetcher: HtmlTableServiceInterface,
+        max_concurrency: int = 1,
+        base_url: Optional[str] = None
+    ):
         """Initialize JMA weather gateway.
         
         Args:
-            html_table_fetcher: HTML table fetch service
+            html_table_fetcher: HTML table fetch service (must be thread-safe
+                when max_concurrency > 1; HtmlTableService shares one
+                requests.Session, so connections are reused)
+            max_concurrency: Maximum number of months fetched concurrently
+                (1: one month at a time)
+            base_url: Override BASE_URL (e.g. a mirror or a local stub server)
         """
         self.html_table_fetcher = html_table_fetcher
+        self.max_concurrency = max_concurrency
+        self.base_url = base_url or self.BASE_URL
         self.logger = logging.getLogger(__name__)
     
     def get(self) -> List[WeatherData]:
@@ -217,40 +231,39 @@ class WeatherJMAGateway(WeatherGateway):
                     f"end_date ({end_date})"
                 )
             
-            # Collect data for each month in the range
-            all_weather_data = []
-            failed_months = []
-            
-            # Start from the first day of the start month
+            # Months in the range, starting from the first day of the start month
+            months = []
             current = start.replace(day=1)
             end_month = end.replace(day=1)
-            
             while current <= end_month:
-                try:
-                    # Build URL for this month
-                    url = self._build_url(prec_no, block_no, current.year, current.month)
-                    
-                    # Fetch HTML tables
-                    tables = self.html_table_fetcher.get(url)
-                    
-                    # Find data table (id="tablefix1")
-                    data_table = self._find_data_table(tables)
-                    
-                    # Convert to WeatherData entities
-                    weather_data_list = self._parse_jma_table(data_table, start_date, end_date, current.year, current.month)
-                    all_weather_data.extend(weather_data_list)
-                    
-                except (HtmlFetchError, WeatherAPIError) as e:
-                    # Log failure but continue with other months (Partial Success strategy)
-                    failed_months.append((current.year, current.month))
-                    self.logger.warning(
-                        f"Failed to fetch data for {current.year}-{current.month:02d}: {e}. "
-                        f"Continuing with available data."
-                    )
-                
+                months.append((current.year, current.month))
                 # Move to next month using relativedelta (handles month-end correctly)
                 current = current + relativedelta(months=1)
             
+            def fetch_month(year_month: Tuple[int, int]) -> List[WeatherData]:
+                year, month = year_month
+                # Fetch HTML tables and find data table (id="tablefix1")
+                tables = self.html_table_fetcher.get(self._build_url(prec_no, block_no, year, month))
+                data_table = self._find_data_table(tables)
+                # Convert to WeatherData entities
+                return self._parse_jma_table(data_table, start_date, end_date, year, month)
+            
+            # Failed months are logged and skipped (Partial Success strategy)
+            results, failures = fetch_all(
+                months,
+                fetch_month,
+                max_concurrency=self.max_concurrency,
+                host=urlsplit(self.base_url).netloc,
+                errors=(HtmlFetchError, WeatherAPIError),
+            )
+            all_weather_data = [record for _, month_data in results for record in month_data]
+            failed_months = [year_month for year_month, _ in failures]
+            for (year, month), e in failures:
+                self.logger.warning(
+                    f"Failed to fetch data for {year}-{month:02d}: {e}. "
+                    f"Continuing with available data."
+                )
+            
             # If we got no data at all, raise error
             if not all_weather_data:
                 raise WeatherDataNotFoundError(
@@ -296,7 +309,7 @@ class WeatherJMAGateway(WeatherGateway):
             Full URL for CSV download
         """
         return (
-            f"{self.BASE_URL}?"
+            f"{self.base_url}?"
             f"prec_no={prec_no}&"
             f"block_no={block_no}&"
             f"year={year}&"
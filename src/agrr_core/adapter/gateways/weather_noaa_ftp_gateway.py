@@ -8,7 +8,9 @@ Data source: ftp://ftp.ncei.noaa.gov/pub/data/noaa/
 """
 
 import logging
-from typing import Dict, Tuple, List, Optional
+import queue
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Tuple, List, Optional
 from datetime import datetime, timedelta
 import ftplib
 import gzip
@@ -17,6 +19,7 @@ from io import BytesIO
 from agrr_core.entity import WeatherData, Location
 from agrr_core.entity.exceptions.weather_api_error import WeatherAPIError
 from agrr_core.entity.exceptions.weather_data_not_found_error import WeatherDataNotFoundError
+from agrr_core.adapter.utils.concurrent_fetch import fetch_all
 from agrr_core.usecase.dto.weather_data_with_location_dto import WeatherDataWithLocationDTO
 from agrr_core.usecase.gateways.weather_gateway import WeatherGateway
 
@@ -329,6 +332,51 @@ LOCATION_MAPPING: Dict[Tuple[float, float], Tuple[str, str, str, float, float]]
     (41.32, -105.67): ("725645", "24022", "LARAMIE REGIONAL AIRPORT, WY", 41.3170, -105.6730),
 }
 
+class FTPConnectionPool:
+    """Logged-in FTP connections reused across downloads.
+    
+    A connection is returned to the pool after a download, or after a
+    permanent (5xx) reply such as a missing file; any other error closes it.
+    """
+    
+    def __init__(self, connect: Callable[[], ftplib.FTP]):
+        """Initialize pool.
+        
+        Args:
+            connect: Function opening a new logged-in connection
+        """
+        self._connect = connect
+        self._idle: "queue.SimpleQueue[ftplib.FTP]" = queue.SimpleQueue()
+    
+    @contextmanager
+    def connection(self) -> Iterator[ftplib.FTP]:
+        """Borrow a connection (opened on demand)."""
+        try:
+            ftp = self._idle.get_nowait()
+        except queue.Empty:
+            ftp = self._connect()
+        try:
+            yield ftp
+        except ftplib.error_perm:
+            self._idle.put(ftp)
+            raise
+        except BaseException:
+            ftp.close()
+            raise
+        self._idle.put(ftp)
+    
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                ftp = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                ftp.quit()
+            except ftplib.all_errors:
+                ftp.close()
+
 class WeatherNOAAFTPGateway(WeatherGateway):
     """Gateway for fetching long-term historical weather data from NOAA ISD via FTP.
     
@@ -340,8 +388,26 @@ class WeatherNOAAFTPGateway(WeatherGateway):
     FTP_HOST = "ftp.ncei.noaa.gov"
     FTP_BASE_PATH = "/pub/data/noaa"
     
-    def __init__(self):
-        """Initialize NOAA FTP weather gateway."""
+    def __init__(
+        self,
+        max_concurrency: int = 1,
+        ftp_host: Optional[str] = None,
+        ftp_port: int = 21,
+        timeout: int = 60
+    ):
+        """Initialize NOAA FTP weather gateway.
+        
+        Args:
+            max_concurrency: Maximum number of years fetched concurrently
+                (1: one year at a time)
+            ftp_host: Override FTP_HOST (e.g. a mirror or a local stub server)
+            ftp_port: FTP control port
+            timeout: Connection timeout in seconds
+        """
+        self.max_concurrency = max_concurrency
+        self.ftp_host = ftp_host or self.FTP_HOST
+        self.ftp_port = ftp_port
+        self.timeout = timeout
         self.logger = logging.getLogger(__name__)
     
     def get(self) -> List[WeatherData]:
@@ -459,32 +525,33 @@ class WeatherNOAAFTPGateway(WeatherGateway):
                     f"end_date ({end_date})"
                 )
             
-            # Collect data for each year in the range
-            all_weather_data = []
-            failed_years = []
-            
-            current_year = start.year
-            end_year = end.year
-            
-            while current_year <= end_year:
-                try:
-                    self.logger.info(f"Fetching data for year {current_year}...")
-                    
-                    # Fetch FTP data for this year
-                    year_data = self._fetch_year_data_ftp(usaf, wban, current_year, start_date, end_date)
-                    all_weather_data.extend(year_data)
-                    
-                    self.logger.info(f"Successfully fetched {len(year_data)} hourly records for {current_year}")
-                    
-                except Exception as e:
-                    # Log failure but continue with other years
-                    failed_years.append(current_year)
-                    self.logger.warning(
-                        f"Failed to fetch data for {current_year}: {e}. "
-                        f"Continuing with available data."
-                    )
-                
-                current_year += 1
+            def fetch_year(year: int) -> List[WeatherData]:
+                self.logger.info(f"Fetching data for year {year}...")
+                year_data = self._fetch_year_data_ftp(
+                    usaf, wban, year, start_date, end_date, connections=connections
+                )
+                self.logger.info(f"Successfully fetched {len(year_data)} hourly records for {year}")
+                return year_data
+            
+            # Years share logged-in connections; failed years are logged and
+            # skipped (Partial Success strategy)
+            connections = FTPConnectionPool(self._connect)
+            try:
+                results, failures = fetch_all(
+                    range(start.year, end.year + 1),
+                    fetch_year,
+                    max_concurrency=self.max_concurrency,
+                    host=f"{self.ftp_host}:{self.ftp_port}",
+                )
+            finally:
+                connections.close()
+            all_weather_data = [record for _, year_data in results for record in year_data]
+            failed_years = [year for year, _ in failures]
+            for year, e in failures:
+                self.logger.warning(
+                    f"Failed to fetch data for {year}: {e}. "
+                    f"Continuing with available data."
+                )
             
             # If we got no data at all, raise error
             if not all_weather_data:
@@ -528,13 +595,29 @@ class WeatherNOAAFTPGateway(WeatherGateway):
         except Exception as e:
             raise WeatherAPIError(f"Failed to fetch NOAA data: {e}")
     
+    def _connect(self) -> ftplib.FTP:
+        """Open an anonymous FTP connection.
+        
+        Returns:
+            Logged-in FTP connection
+        """
+        ftp = ftplib.FTP(timeout=self.timeout)
+        try:
+            ftp.connect(self.ftp_host, self.ftp_port)
+            ftp.login()  # Anonymous login
+        except BaseException:
+            ftp.close()
+            raise
+        return ftp
+    
     def _fetch_year_data_ftp(
         self,
         usaf: str,
         wban: str,
         year: int,
         start_date: str,
-        end_date: str
+        end_date: str,
+        connections: Optional[FTPConnectionPool] = None
     ) -> List[WeatherData]:
         """Fetch weather data for a specific year via FTP.
         
@@ -544,6 +627,8 @@ class WeatherNOAAFTPGateway(WeatherGateway):
             year: Year to fetch
             start_date: Filter start date (YYYY-MM-DD)
             end_date: Filter end date (YYYY-MM-DD)
+            connections: Connection pool to borrow from (None: use a new
+                connection for this year only)
             
         Returns:
             List of hourly WeatherData
@@ -552,18 +637,15 @@ class WeatherNOAAFTPGateway(WeatherGateway):
         filename = f"{usaf}-{wban}-{year}.gz"
         ftp_path = f"{self.FTP_BASE_PATH}/{year}"
         
+        own_connections = connections is None
+        if own_connections:
+            connections = FTPConnectionPool(self._connect)
         try:
-            # Connect to FTP
-            ftp = ftplib.FTP(self.FTP_HOST, timeout=60)
-            ftp.login()  # Anonymous login
-            
-            # Change to year directory
-            ftp.cwd(ftp_path)
-            
             # Download file to memory
             data_buffer = BytesIO()
-            ftp.retrbinary(f"RETR {filename}", data_buffer.write)
-            ftp.quit()
+            with connections.connection() as ftp:
+                ftp.cwd(ftp_path)
+                ftp.retrbinary(f"RETR {filename}", data_buffer.write)
             
             # Decompress gzip
             data_buffer.seek(0)
@@ -577,6 +659,9 @@ class WeatherNOAAFTPGateway(WeatherGateway):
             raise WeatherAPIError(f"FTP error accessing {ftp_path}/{filename}: {e}")
         except Exception as e:
             raise WeatherAPIError(f"Failed to fetch FTP data for {year}: {e}")
+        finally:
+            if own_connections:
+                connections.close()
     
     def _parse_isd_data(
         self,
@@ -6,14 +6,17 @@ https://www.ncei.noaa.gov/products/land-based-station/integrated-surface-databas
 """
 
 import logging
+import threading
 from typing import Dict, Tuple, List, Optional
 from datetime import datetime, date, timedelta
+from urllib.parse import urlsplit
 import re
 
 from agrr_core.entity import WeatherData, Location
 from agrr_core.entity.exceptions.weather_api_error import WeatherAPIError
 from agrr_core.entity.exceptions.weather_data_not_found_error import WeatherDataNotFoundError
 from agrr_core.adapter.interfaces.clients.http_client_interface import HttpClientInterface
+from agrr_core.adapter.utils.concurrent_fetch import fetch_all
 from agrr_core.usecase.dto.weather_data_with_location_dto import WeatherDataWithLocationDTO
 from agrr_core.usecase.gateways.weather_gateway import WeatherGateway
 
@@ -255,14 +258,29 @@ class WeatherNOAAGateway(WeatherGateway):
     # NOAA ISD データアクセスURL
     BASE_URL = "https://www.ncei.noaa.gov/data/global-hourly/access"
     
-    def __init__(self, http_client: HttpClientInterface):
+    def __init__(
+        self,
+        http_client: HttpClientInterface,
+        max_concurrency: int = 1,
+        base_url: Optional[str] = None,
+        timeout: int = 30
+    ):
         """Initialize NOAA weather gateway.
         
         Args:
             http_client: HTTP client for data access
+            max_concurrency: Maximum number of years fetched concurrently
+                (1: one year at a time)
+            base_url: Override BASE_URL (e.g. a mirror or a local stub server)
+            timeout: Request timeout in seconds
         """
         self.http_client = http_client
+        self.max_concurrency = max_concurrency
+        self.base_url = base_url or self.BASE_URL
+        self.timeout = timeout
         self.logger = logging.getLogger(__name__)
+        self._session = None
+        self._session_lock = threading.Lock()
     
     def get(self) -> List[WeatherData]:
         """Get weather data from configured source.
@@ -380,38 +398,29 @@ class WeatherNOAAGateway(WeatherGateway):
                     f"end_date ({end_date})"
                 )
             
-            # Collect data for each year in the range
-            all_weather_data = []
-            failed_years = []
+            # Format: {USAF}{WBAN}.csv (no hyphens, no year in filename)
+            filename = f"{usaf}{wban}.csv"
             
-            current_year = start.year
-            end_year = end.year
+            def fetch_year(year: int) -> List[WeatherData]:
+                url = f"{self.base_url}/{year}/{filename}"
+                self.logger.info(f"Fetching NOAA data from: {url}")
+                # Fetch CSV data (as text) and parse it
+                return self._parse_noaa_csv(self._fetch_csv_text(url), start_date, end_date)
             
-            while current_year <= end_year:
-                try:
-                    # Build filename for this year
-                    # Format: {USAF}{WBAN}.csv (no hyphens, no year in filename)
-                    filename = f"{usaf}{wban}.csv"
-                    url = f"{self.BASE_URL}/{current_year}/{filename}"
-                    
-                    self.logger.info(f"Fetching NOAA data from: {url}")
-                    
-                    # Fetch CSV data (as text)
-                    response_text = self._fetch_csv_text(url)
-                    
-                    # Parse CSV data
-                    year_data = self._parse_noaa_csv(response_text, start_date, end_date)
-                    all_weather_data.extend(year_data)
-                    
-                except Exception as e:
-                    # Log failure but continue with other years
-                    failed_years.append(current_year)
-                    self.logger.warning(
-                        f"Failed to fetch data for {current_year}: {e}. "
-                        f"Continuing with available data."
-                    )
-                
-                current_year += 1
+            # Failed years are logged and skipped (Partial Success strategy)
+            results, failures = fetch_all(
+                range(start.year, end.year + 1),
+                fetch_year,
+                max_concurrency=self.max_concurrency,
+                host=urlsplit(self.base_url).netloc,
+            )
+            all_weather_data = [record for _, year_data in results for record in year_data]
+            failed_years = [year for year, _ in failures]
+            for year, e in failures:
+                self.logger.warning(
+                    f"Failed to fetch data for {year}: {e}. "
+                    f"Continuing with available data."
+                )
             
             # If we got no data at all, raise error
             if not all_weather_data:
@@ -475,12 +484,31 @@ class WeatherNOAAGateway(WeatherGateway):
         import requests
         
         try:
-            response = requests.get(url, timeout=30)
+            response = self._get_session().get(url, timeout=self.timeout)
             response.raise_for_status()
             return response.text
         except requests.RequestException as e:
             raise WeatherAPIError(f"Failed to fetch NOAA data from {url}: {e}")
     
+    def _get_session(self):
+        """Get the HTTP session shared by all fetches (keeps connections alive).
+        
+        Returns:
+            requests.Session with a connection pool sized for max_concurrency
+        """
+        import requests
+        
+        with self._session_lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_maxsize=max(1, self.max_concurrency)
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._session = session
+            return self._session
+    
     def _parse_noaa_csv(
         self,
         csv_text: str,
@@ -1,7 +1,10 @@
 """File service interface for adapter layer."""
 
 from abc import ABC, abstractmethod
-from typing import Any
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from agrr_core.entity.entities.weather_series_entity import WeatherSeries
 
 
 class FileServiceInterface(ABC):
@@ -12,6 +15,94 @@ class FileServiceInterface(ABC):
         """Read file content as string."""
         pass
     
+    @abstractmethod
+    def read_chunks(self, file_path: str, use_mmap: Optional[bool] = None) -> Iterable[str]:
+        """Read file content as text chunks (streamed, for large files).
+        
+        Args:
+            file_path: File to read
+            use_mmap: Read through a memory map (None: decided by file size)
+        """
+        pass
+    
+    @abstractmethod
+    def read_json_records(self, file_path: str, use_mmap: Optional[bool] = None) -> Iterable[Any]:
+        """Read the records of a JSON file one at a time (streamed).
+        
+        Records are a top-level array, the "data" or "weather_data" array of
+        a top-level object, or the object itself.
+        
+        Args:
+            file_path: File to read
+            use_mmap: Read through a memory map (None: decided by file size)
+        """
+        pass
+    
+    @abstractmethod
+    def read_csv_records(
+        self, file_path: str, use_mmap: Optional[bool] = None
+    ) -> Iterable[Dict[str, Optional[str]]]:
+        """Read the rows of a CSV file one at a time (streamed).
+        
+        Args:
+            file_path: File to read (first row is the header)
+            use_mmap: Read through a memory map (None: decided by file size)
+        """
+        pass
+    
+    @abstractmethod
+    def load_cached(self, kind: str, file_path: str, loader: Callable[[], Any]) -> Any:
+        """Load parsed file content, through the warm parsed-file cache if enabled.
+        
+        Args:
+            kind: What the loader produces (e.g. "weather", "fields")
+            file_path: File the loader reads
+            loader: Function parsing the file
+        
+        Returns:
+            Parsed content (shared and read-only when cached)
+        """
+        pass
+    
+    @abstractmethod
+    def is_columnar_weather_file(self, file_path: str) -> bool:
+        """Check whether a path is a binary columnar weather file (.npz/.parquet)."""
+        pass
+    
+    @abstractmethod
+    def read_weather_columns(
+        self,
+        file_path: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        use_mmap: bool = True,
+    ) -> WeatherSeries:
+        """Read a weather series from a binary columnar file (.npz/.parquet).
+        
+        Args:
+            file_path: File to read
+            start_date: Only read records from this date (inclusive)
+            end_date: Only read records up to this date (inclusive)
+            use_mmap: Memory-map uncompressed columns
+        """
+        pass
+    
+    @abstractmethod
+    def write_weather_columns(
+        self,
+        series: WeatherSeries,
+        file_path: str,
+        location: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Write a weather series to a binary columnar file (.npz/.parquet).
+        
+        Args:
+            series: Weather series
+            file_path: Destination file
+            location: Optional location information stored as metadata
+        """
+        pass
+    
     @abstractmethod
     def write(self, content: Any, file_path: str) -> None:
         """Write content to file."""
@@ -6,7 +6,7 @@ Gateway implementations inject these services.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, ContextManager
 
 from agrr_core.entity import WeatherData, Forecast
 
@@ -77,4 +77,17 @@ class PredictionServiceInterface(ABC):
             Minimum days of historical data needed
         """
         pass
-
+    
+    @abstractmethod
+    def dataset_scope(self) -> ContextManager[None]:
+        """
+        Share inputs derived from a historical dataset between calls.
+        
+        Predictions made inside the block on the same historical data
+        (also from other threads and other services) derive series and
+        features once instead of once per call.
+        
+        Returns:
+            Context manager delimiting the sharing
+        """
+        pass
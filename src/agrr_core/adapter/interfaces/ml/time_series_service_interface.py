@@ -1,7 +1,7 @@
 """Time series analysis service interface for adapter layer."""
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional
+from typing import List, Optional, Sequence, Tuple
 import numpy as np
 
 class TimeSeriesServiceInterface(ABC):
@@ -27,8 +27,17 @@ class TimeSeriesModelInterface(ABC):
     """Interface for time series model operations."""
     
     @abstractmethod
-    def fit(self) -> 'FittedTimeSeriesModelInterface':
-        """Fit the model to data."""
+    def fit(
+        self,
+        start_params: Optional[Sequence[float]] = None,
+        maxiter: Optional[int] = None
+    ) -> 'FittedTimeSeriesModelInterface':
+        """Fit the model to data.
+        
+        Args:
+            start_params: Initial parameters (e.g. of a previous fit; warm start)
+            maxiter: Maximum optimizer iterations (None: implementation default)
+        """
         pass
 
 class FittedTimeSeriesModelInterface(ABC):
@@ -48,4 +57,19 @@ class FittedTimeSeriesModelInterface(ABC):
             confidence_intervals can be None if not available
         """
         pass
+    
+    @property
+    def order(self) -> Optional[Tuple[int, int, int]]:
+        """Order of the fitted model (None if not exposed)."""
+        return None
+    
+    @property
+    def params(self) -> Optional[List[float]]:
+        """Fitted parameters (None if not exposed)."""
+        return None
+    
+    @property
+    def aic(self) -> Optional[float]:
+        """Akaike information criterion of the fit (None if not exposed)."""
+        return None
 
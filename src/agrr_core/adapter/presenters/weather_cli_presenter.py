@@ -1,21 +1,30 @@
 """CLI weather presenter for adapter layer."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from datetime import datetime
 import sys
 import json
 
 from agrr_core.entity.entities.weather_entity import WeatherData
+from agrr_core.entity.entities.weather_series_entity import WeatherSeries
 from agrr_core.usecase.dto.weather_data_response_dto import WeatherDataResponseDTO
 from agrr_core.usecase.dto.weather_data_list_response_dto import WeatherDataListResponseDTO
 from agrr_core.usecase.ports.output.weather_presenter_output_port import WeatherPresenterOutputPort
+from agrr_core.adapter.interfaces.io.file_service_interface import FileServiceInterface
 
 class WeatherCLIPresenter(WeatherPresenterOutputPort):
     """CLI presenter for weather data display in terminal."""
     
-    def __init__(self, output_stream=sys.stdout):
-        """Initialize CLI presenter with output stream."""
+    def __init__(self, output_stream=sys.stdout, file_repository: Optional[FileServiceInterface] = None):
+        """Initialize CLI presenter with output stream.
+        
+        Args:
+            output_stream: Stream for terminal output
+            file_repository: File repository writing binary columnar files
+                (.npz/.parquet); without it, output files are JSON/table only
+        """
         self.output_stream = output_stream
+        self.file_repository = file_repository
     
     def format_weather_data(self, weather_data: WeatherData) -> Dict[str, Any]:
         """Format a single weather data entity to response format."""
@@ -142,7 +151,11 @@ class WeatherCLIPresenter(WeatherPresenterOutputPort):
         self.output_stream.write(json_output + "\n")
     
     def display_weather_data_to_file(self, weather_data_list: WeatherDataListResponseDTO, output_file: str) -> None:
-        """Display weather data to a file in JSON format."""
+        """Display weather data to a file in JSON format (or columnar for .npz/.parquet)."""
+        if self._is_columnar_file(output_file):
+            self.display_weather_data_to_columnar_file(weather_data_list, output_file)
+            return
+        
         data = self.format_weather_data_list_dto(weather_data_list)
         json_output = json.dumps(data, indent=2, ensure_ascii=False)
         
@@ -153,8 +166,47 @@ class WeatherCLIPresenter(WeatherPresenterOutputPort):
         except Exception as e:
             self.output_stream.write(f"Error saving to file {output_file}: {str(e)}\n")
     
+    def _is_columnar_file(self, output_file: str) -> bool:
+        """Check whether an output file is written in a binary columnar format."""
+        return self.file_repository is not None and self.file_repository.is_columnar_weather_file(output_file)
+    
+    def display_weather_data_to_columnar_file(self, weather_data_list: WeatherDataListResponseDTO, output_file: str) -> None:
+        """Save weather data to a binary columnar file (.npz or .parquet)."""
+        try:
+            series = WeatherSeries.from_weather_data(
+                WeatherData(
+                    time=datetime.fromisoformat(item.time),
+                    temperature_2m_max=item.temperature_2m_max,
+                    temperature_2m_min=item.temperature_2m_min,
+                    temperature_2m_mean=item.temperature_2m_mean,
+                    precipitation_sum=item.precipitation_sum,
+                    sunshine_duration=item.sunshine_duration,
+                    wind_speed_10m=item.wind_speed_10m,
+                    weather_code=item.weather_code,
+                )
+                for item in weather_data_list.data
+            )
+            location = None
+            if weather_data_list.location:
+                location = {
+                    "latitude": weather_data_list.location.latitude,
+                    "longitude": weather_data_list.location.longitude,
+                    "elevation": weather_data_list.location.elevation,
+                    "timezone": weather_data_list.location.timezone,
+                }
+            if self.file_repository is None:
+                raise ValueError("columnar output needs a file repository")
+            self.file_repository.write_weather_columns(series, output_file, location=location)
+            self.output_stream.write(f"Weather data saved to: {output_file}\n")
+        except Exception as e:
+            self.output_stream.write(f"Error saving to file {output_file}: {str(e)}\n")
+    
     def display_weather_data_table_to_file(self, weather_data_list: WeatherDataListResponseDTO, output_file: str) -> None:
-        """Display weather data to a file in table format."""
+        """Display weather data to a file in table format (or columnar for .npz/.parquet)."""
+        if self._is_columnar_file(output_file):
+            self.display_weather_data_to_columnar_file(weather_data_list, output_file)
+            return
+        
         if not weather_data_list.data:
             with open(output_file, 'w', encoding='utf-8') as f:
                 f.write("No weather data available.\n")
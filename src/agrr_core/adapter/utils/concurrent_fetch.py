@@ -0,0 +1,105 @@
+"""Bounded concurrent fetching for weather gateways (adapter layer).
+
+Gateways that download one page/file per month or year (JMA, NOAA, NOAA FTP)
+run those downloads through fetch_all:
+
+    results, failures = fetch_all(months, fetch_month, max_concurrency=4, host=host)
+
+- Downloads run on a thread pool of at most max_concurrency workers
+  (max_concurrency <= 1 keeps the original sequential behavior)
+- Requests to one host are additionally limited process-wide by one shared
+  semaphore per host, so several gateways or commands running in one process
+  do not open more connections to a server than it tolerates. The limit is
+  the same for every host and set once at startup (configure_per_host_limit)
+- Results and failures are returned in key order, so partial-success
+  reporting (failed months/years) does not depend on completion order
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+DEFAULT_PER_HOST_LIMIT = 4
+
+_per_host_limit = DEFAULT_PER_HOST_LIMIT
+_host_semaphores: Dict[str, threading.BoundedSemaphore] = {}
+_host_semaphores_lock = threading.Lock()
+
+def configure_per_host_limit(limit: int) -> None:
+    """Set the maximum concurrent requests to any one host, process-wide.
+
+    Meant to be called at startup, before any fetch: fetches already holding
+    a host semaphore finish under the previous limit.
+
+    Args:
+        limit: Maximum concurrent requests to a host (at least 1)
+    """
+    global _per_host_limit
+    with _host_semaphores_lock:
+        limit = max(1, int(limit))
+        if limit != _per_host_limit:
+            _per_host_limit = limit
+            _host_semaphores.clear()
+
+def host_semaphore(host: str) -> threading.BoundedSemaphore:
+    """Get the process-wide semaphore limiting concurrent requests to a host.
+
+    Args:
+        host: Host name (optionally with port)
+
+    Returns:
+        Semaphore shared by all callers using the same host
+    """
+    key = host.lower()
+    with _host_semaphores_lock:
+        semaphore = _host_semaphores.get(key)
+        if semaphore is None:
+            semaphore = _host_semaphores[key] = threading.BoundedSemaphore(_per_host_limit)
+        return semaphore
+
+def fetch_all(
+    keys: Iterable[K],
+    fetch: Callable[[K], V],
+    max_concurrency: int = 1,
+    host: Optional[str] = None,
+    errors: Tuple[Type[BaseException], ...] = (Exception,),
+) -> Tuple[List[Tuple[K, V]], List[Tuple[K, BaseException]]]:
+    """Fetch every key, concurrently when max_concurrency > 1.
+
+    Args:
+        keys: Keys to fetch (e.g. (year, month) tuples or years)
+        fetch: Function fetching one key (must be thread-safe when concurrent)
+        max_concurrency: Maximum number of concurrent fetches
+        host: Host the fetches go to (enables the per-host limit)
+        errors: Exception types recorded as failures of a single key; any
+            other exception propagates
+
+    Returns:
+        Tuple of ([(key, value)], [(key, exception)]), both in key order
+    """
+    keys = list(keys)
+    limiter = host_semaphore(host) if host else None
+
+    def attempt(key: K) -> Tuple[K, Optional[V], Optional[BaseException]]:
+        try:
+            if limiter is None:
+                return key, fetch(key), None
+            with limiter:
+                return key, fetch(key), None
+        except errors as e:
+            return key, None, e
+
+    if max_concurrency <= 1 or len(keys) <= 1:
+        outcomes = [attempt(key) for key in keys]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(keys)), thread_name_prefix='agrr-fetch'
+        ) as pool:
+            outcomes = list(pool.map(attempt, keys))
+
+    results = [(key, value) for key, value, error in outcomes if error is None]
+    failures = [(key, error) for key, _, error in outcomes if error is not None]
+    return results, failures
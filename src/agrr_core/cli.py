@@ -14,6 +14,7 @@ from agrr_core.adapter.gateways.crop_profile_llm_gateway import CropProfileLLMGa
 from agrr_core.adapter.gateways.weather_file_gateway import WeatherFileGateway
 from agrr_core.adapter.gateways.optimization_result_inmemory_gateway import OptimizationResultInMemoryGateway
 from agrr_core.adapter.gateways.interaction_rule_file_gateway import InteractionRuleFileGateway
+from agrr_core.adapter.gateways.completion_table_file_gateway import CompletionTableFileGateway
 from agrr_core.adapter.gateways.field_file_gateway import FieldFileGateway
 from agrr_core.adapter.presenters.crop_profile_craft_presenter import CropProfileCraftPresenter
 from agrr_core.adapter.presenters.multi_field_crop_allocation_cli_presenter import MultiFieldCropAllocationCliPresenter
@@ -29,6 +30,40 @@ from agrr_core.adapter.gateways.task_schedule_llm_gateway import TaskScheduleLLM
 from agrr_core.usecase.interactors.task_schedule_generation_interactor import TaskScheduleGenerationInteractor
 
 
+def _arg_value(args, *flags: str) -> Optional[str]:
+    """Value of an option given in args as "FLAG VALUE" or "FLAG=VALUE".
+
+    Like argparse, the last occurrence of any of flags wins (None if absent).
+    """
+    value = None
+    for index, arg in enumerate(args):
+        for flag in flags:
+            if arg == flag:
+                if index + 1 < len(args):
+                    value = args[index + 1]
+            elif arg.startswith(flag + '='):
+                value = arg[len(flag) + 1:]
+    return value
+
+
+def _completion_table_gateway(
+    args, file_repository: FileService, weather_file_path: str
+) -> Optional[CompletionTableFileGateway]:
+    """Completion table gateway of --completion-tables/-ct (None if not given).
+
+    Tables are tied to weather_file_path: ones written for another weather
+    file are not loaded.
+    """
+    completion_tables_path = _arg_value(args, '--completion-tables', '-ct')
+    if not completion_tables_path:
+        return None
+    return CompletionTableFileGateway(
+        file_repository=file_repository,
+        file_path=completion_tables_path,
+        weather_file_path=weather_file_path,
+    )
+
+
 def print_help() -> None:
     """Print main help message."""
     help_text = """
@@ -768,13 +803,13 @@ Examples:
             
             command = args[1]
             if command == 'start':
-                manager.start()
+                manager.start(args[2:])
             elif command == 'stop':
                 manager.stop()
             elif command == 'status':
                 manager.status()
             elif command == 'restart':
-                manager.restart()
+                manager.restart(args[2:])
             else:
                 logger.error(f"Error: Unknown daemon command '{command}'")
                 logger.info("Available: start, stop, status, restart")
@@ -857,9 +892,12 @@ For detailed help on each subcommand:
                     except (ValueError, IndexError):
                         pass
             
+                # Only the evaluation period is read from the weather file
                 weather_gateway = WeatherFileGateway(
                     file_repository=file_repository,
-                    file_path=weather_file_path
+                    file_path=weather_file_path,
+                    start_date=_arg_value(args, '--evaluation-start', '-s'),
+                    end_date=_arg_value(args, '--evaluation-end', '-e'),
                 )
             
                 # Load field configuration
@@ -963,10 +1001,12 @@ For detailed help on each subcommand:
                     logger.error("Error: --weather-file is required for allocate command")
                     sys.exit(1)
             
-                # Setup weather gateway
+                # Setup weather gateway (only the planning period is read)
                 weather_gateway = WeatherFileGateway(
                     file_repository=file_repository,
-                    file_path=weather_file_path
+                    file_path=weather_file_path,
+                    start_date=_arg_value(args, '--planning-start', '-s'),
+                    end_date=_arg_value(args, '--planning-end', '-e'),
                 )
             
                 # Parse args to extract fields-file path
@@ -1024,6 +1064,9 @@ For detailed help on each subcommand:
                         file_path=interaction_rules_path
                     )
             
+                # Setup completion table gateway (optional)
+                completion_table_gateway = _completion_table_gateway(args, file_repository, weather_file_path)
+            
                 # Setup internal crop profile gateway for growth period optimizer
                 inmemory_crop_profile_repo = CropProfileInMemoryGateway()
                 crop_profile_gateway_internal = CropProfileInMemoryGateway()
@@ -1039,6 +1082,7 @@ For detailed help on each subcommand:
                     presenter=presenter,
                     crop_profile_gateway_internal=crop_profile_gateway_internal,
                     interaction_rule_gateway=interaction_rule_gateway,
+                    completion_table_gateway=completion_table_gateway,
                 )
                 controller.run(args[2:])  # Skip 'optimize' and 'allocate'
             
@@ -1135,9 +1179,12 @@ For detailed help on each subcommand:
                     file_path=moves_path
                 )
                 
+                # Moves may start before the planning period, so only its end
+                # bounds the weather read
                 weather_gateway = WeatherFileGateway(
                     file_repository=file_repository,
-                    file_path=weather_file_path
+                    file_path=weather_file_path,
+                    end_date=_arg_value(args, '--planning-end', '-e'),
                 )
                 
                 # Parse optional fields and crops files
@@ -1184,6 +1231,9 @@ For detailed help on each subcommand:
                     file_path=interaction_rules_path
                 )
                 
+                # Setup completion table gateway (optional)
+                completion_table_gateway = _completion_table_gateway(args, file_repository, weather_file_path)
+                
                 # Setup internal crop profile gateway
                 crop_profile_gateway_internal = CropProfileInMemoryGateway()
                 
@@ -1200,6 +1250,7 @@ For detailed help on each subcommand:
                     crop_profile_gateway_internal=crop_profile_gateway_internal,
                     presenter=presenter,
                     interaction_rule_gateway=interaction_rule_gateway,
+                    completion_table_gateway=completion_table_gateway,
                 )
                 
                 asyncio.run(controller.run(args[2:]))  # Skip 'optimize' and 'adjust'
@@ -1266,9 +1317,12 @@ For detailed help on each subcommand:
                     except (ValueError, IndexError):
                         pass
                 
+                # Only the planning period is read from the weather file
                 weather_gateway = WeatherFileGateway(
                     file_repository=file_repository,
-                    file_path=weather_file_path
+                    file_path=weather_file_path,
+                    start_date=_arg_value(args, '--planning-start'),
+                    end_date=_arg_value(args, '--planning-end'),
                 )
                 
                 # Parse args to extract interaction-rules path
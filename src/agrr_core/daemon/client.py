@@ -2,7 +2,7 @@
 import socket
 import json
 import sys
-from typing import List
+from typing import Dict, List
 
 from . import SOCKET_PATH
 
@@ -21,12 +21,39 @@ def send_to_daemon(args: List[str]) -> int:
         'args': args
     }
     
+    response = _send_request(request, timeout=300)  # 5分タイムアウト
+    
+    # 出力
+    if response.get('stdout'):
+        print(response['stdout'], end='')
+    
+    if response.get('stderr'):
+        print(response['stderr'], end='', file=sys.stderr)
+    
+    return response.get('exit_code', 0)
+
+def query_status(socket_path: str = SOCKET_PATH, timeout: float = 5.0) -> Dict:
+    """
+    Ask the daemon for its status (mode, workers, data cache counters).
+    
+    Args:
+        socket_path: UNIX socket path
+        timeout: Socket timeout in seconds
+        
+    Returns:
+        Status dict reported by the daemon
+    """
+    response = _send_request({'control': 'status'}, timeout=timeout, socket_path=socket_path)
+    return response.get('status', {})
+
+def _send_request(request: Dict, timeout: float, socket_path: str = SOCKET_PATH) -> Dict:
+    """Send one JSON request and return the decoded response."""
     # ソケット接続
     sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-    sock.settimeout(300)  # 5分タイムアウト
+    sock.settimeout(timeout)
     
     try:
-        sock.connect(SOCKET_PATH)
+        sock.connect(socket_path)
         
         # リクエスト送信（改行で終端）
         request_data = json.dumps(request).encode('utf-8') + b'\n'
@@ -42,17 +69,7 @@ def send_to_daemon(args: List[str]) -> int:
             response_data += chunk
         
         # レスポンスパース
-        response = json.loads(response_data.decode('utf-8'))
-        
-        # 出力
-        if response.get('stdout'):
-            print(response['stdout'], end='')
-        
-        if response.get('stderr'):
-            print(response['stderr'], end='', file=sys.stderr)
-        
-        return response.get('exit_code', 0)
+        return json.loads(response_data.decode('utf-8'))
         
     finally:
         sock.close()
-
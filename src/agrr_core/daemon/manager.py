@@ -5,6 +5,7 @@ import subprocess
 import signal
 import time
 from pathlib import Path
+from typing import List, Optional
 
 from . import SOCKET_PATH
 from agrr_core.framework.logging.agrr_logger import get_logger
@@ -28,16 +29,16 @@ class DaemonManager:
         cmd = args[0]
         
         if cmd == 'start':
-            self.start()
+            self.start(args[1:])
         elif cmd == 'stop':
             self.stop()
         elif cmd == 'status':
             self.status()
         elif cmd == 'restart':
-            self.restart()
+            self.restart(args[1:])
         elif cmd == '_server':
             # Internal command: start daemon server
-            self._start_server()
+            self._start_server(args[1:])
         else:
             get_logger().error(f"Unknown command: {cmd}")
             self._print_help()
@@ -61,9 +62,16 @@ Usage:
 Commands:
   start      Start daemon in background (one-time setup)
   stop       Stop daemon
-  status     Check if daemon is running
+  status     Check if daemon is running (and data cache hit/miss counters)
   restart    Restart daemon (if configuration changed)
 
+Options (start/restart):
+  --workers N     Handle requests concurrently on N worker processes
+                  (default: daemon.workers in config, 1 = one request at a time,
+                  0 = one worker per CPU)
+  --max-queue M   Requests allowed to wait for a free worker; further requests
+                  fail immediately with exit code 75 (default: daemon.max_queue, 16)
+
 Workflow:
   1. Start daemon (optional, for better performance):
      $ agrr daemon start
@@ -83,6 +91,9 @@ Examples:
   # Enable fast mode
   agrr daemon start
 
+  # Serve up to 4 requests in parallel (e.g. for a web backend)
+  agrr daemon start --workers 4 --max-queue 32
+
   # Run commands (automatically use daemon if available)
   agrr weather --location 35.6762,139.6503 --days 7
 
@@ -93,8 +104,14 @@ Examples:
   agrr daemon stop
 """)
     
-    def start(self):
-        """Start daemon in background."""
+    def start(self, args: Optional[List[str]] = None):
+        """Start daemon in background.
+        
+        Args:
+            args: Server options (--workers N, --max-queue M)
+        """
+        server_options = self._parse_server_options(args or [])
+        
         # 既に起動しているか確認
         if self._is_running():
             get_logger().warning("✗ Daemon is already running")
@@ -114,8 +131,8 @@ Examples:
         # デーモンプロセスを起動（内部コマンド _server を使用）
         # PyInstallerバイナリでも動作するように、自分自身を実行
         process = subprocess.Popen(
-            [executable, 'daemon', '_server'] if getattr(sys, 'frozen', False) 
-            else [executable, '-m', 'agrr_core', 'daemon', '_server'],
+            ([executable, 'daemon', '_server'] if getattr(sys, 'frozen', False) 
+             else [executable, '-m', 'agrr_core', 'daemon', '_server']) + server_options,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             start_new_session=True,  # デーモン化
@@ -134,12 +151,47 @@ Examples:
         get_logger().error("✗ Daemon failed to start")
         sys.exit(1)
     
-    def _start_server(self):
+    def _start_server(self, args: Optional[List[str]] = None):
         """Start daemon server (internal command)."""
         from .server import AgrrDaemon
-        daemon = AgrrDaemon()
+        options = self._parse_server_options(args or [])
+        kwargs = {}
+        for flag, value in zip(options[::2], options[1::2]):
+            kwargs['workers' if flag == '--workers' else 'max_queue'] = int(value)
+        daemon = AgrrDaemon(**kwargs)
         daemon.start(pid_file=PID_FILE)
     
+    def _parse_server_options(self, args: List[str]) -> List[str]:
+        """Validate server options and return them normalized.
+        
+        Args:
+            args: Arguments after the daemon subcommand
+            
+        Returns:
+            Flat list of [flag, value, ...] for the _server command
+        """
+        options = []
+        i = 0
+        while i < len(args):
+            flag = args[i]
+            if flag not in ('--workers', '--max-queue'):
+                get_logger().error(f"Unknown option: {flag}")
+                sys.exit(1)
+            if i + 1 >= len(args):
+                get_logger().error(f"Option {flag} requires a value")
+                sys.exit(1)
+            try:
+                value = int(args[i + 1])
+            except ValueError:
+                get_logger().error(f"Option {flag} requires an integer, got '{args[i + 1]}'")
+                sys.exit(1)
+            if value < 0:
+                get_logger().error(f"Option {flag} must be >= 0")
+                sys.exit(1)
+            options += [flag, str(value)]
+            i += 2
+        return options
+    
     def stop(self):
         """Stop daemon."""
         if not self._is_running():
@@ -187,16 +239,44 @@ Examples:
                 get_logger().info(f"✓ Daemon is running (PID: {pid})")
             else:
                 get_logger().info("✓ Daemon is running")
+            self._print_server_status()
         else:
             get_logger().warning("✗ Daemon is not running")
             sys.exit(1)
     
-    def restart(self):
+    def _print_server_status(self):
+        """Print mode and data cache counters reported by the daemon."""
+        from .client import query_status
+        try:
+            status = query_status()
+        except (OSError, ValueError):
+            return  # Older daemon or busy socket: keep the basic status
+        if not status:
+            return
+        
+        get_logger().info(
+            f"  Mode: {status['mode']} ({status['workers']} workers, queue {status['max_queue']})"
+        )
+        cache = status.get('cache')
+        if cache is None:
+            get_logger().info("  Data cache: disabled")
+            return
+        lookups = cache['hits'] + cache['misses']
+        hit_rate = f"{cache['hits'] / lookups:.0%}" if lookups else "n/a"
+        get_logger().info(
+            f"  Data cache: {cache['hits']} hits, {cache['misses']} misses "
+            f"(hit rate {hit_rate}), {cache['evictions']} evictions, "
+            f"{cache['entries']} entries, "
+            f"{cache['bytes'] / 1024 / 1024:.1f}/{cache['max_bytes'] / 1024 / 1024:.0f} MB"
+            + (f" over {cache['processes']} workers" if status['mode'] == 'concurrent' else "")
+        )
+    
+    def restart(self, args: Optional[List[str]] = None):
         """Restart daemon."""
         get_logger().info("Restarting daemon...")
         self.stop()
         time.sleep(0.5)
-        self.start()
+        self.start(args)
     
     def _is_running(self) -> bool:
         """Check if daemon is running."""
@@ -1,108 +1,309 @@
-"""Daemon server implementation."""
+"""Daemon server implementation.
+
+Two request modes:
+
+- Serial (daemon.workers = 1, default): requests are executed one at a time
+  inside the daemon process.
+- Concurrent (daemon.workers > 1, or 0 for one per CPU): each connection is
+  served by a lightweight thread that hands the CLI call to a pool of
+  pre-warmed worker processes. Output is captured inside the worker that
+  runs the request, so the daemon process never swaps sys.stdout/sys.stderr
+  and concurrent requests cannot mix their output. At most
+  workers + daemon.max_queue requests are admitted at once; further requests
+  are rejected immediately with BUSY_EXIT_CODE so callers can back off and
+  retry. Connection threads are bounded too (admitted requests plus
+  SPARE_CONNECTION_THREADS); further connections wait in the listen backlog.
+
+Parsed input files (weather, crop profiles, interaction rules, fields) are
+kept in a per-process ParsedFileCache (daemon.cache_max_mb) so repeated
+requests on the same files skip parsing; `agrr daemon status` reports its
+hit/miss counters, summed over the worker processes in concurrent mode.
+"""
 import socket
 import json
 import os
 import sys
 import io
 import signal
+import threading
 import time
-from typing import Optional
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from . import SOCKET_PATH
 from ..framework.logging.agrr_logger import DaemonLogger
 from ..framework.config.config_loader import get_config
+from ..framework.services.io.parsed_file_cache import (
+    configure_parsed_file_cache,
+    get_parsed_file_cache,
+)
+
+# Exit code returned when the request queue is full (EX_TEMPFAIL)
+BUSY_EXIT_CODE = 75
+
+# Connection threads beyond workers + max_queue, used to answer control
+# requests and reject requests with BUSY_EXIT_CODE while all slots are taken
+SPARE_CONNECTION_THREADS = 2
+
+def preload_modules() -> None:
+    """Import heavy modules so that requests do not pay for them."""
+    # Basic modules
+    from agrr_core.framework.agrr_core_container import WeatherCliContainer
+    from agrr_core.adapter.gateways.crop_profile_file_gateway import CropProfileFileGateway
+    from agrr_core.adapter.gateways.crop_profile_inmemory_gateway import CropProfileInMemoryGateway
+    from agrr_core.adapter.gateways.crop_profile_llm_gateway import CropProfileLLMGateway
+    from agrr_core.adapter.gateways.weather_file_gateway import WeatherFileGateway
+    from agrr_core.adapter.gateways.field_file_gateway import FieldFileGateway
+    from agrr_core.adapter.presenters.crop_profile_craft_presenter import CropProfileCraftPresenter
+    from agrr_core.adapter.controllers.crop_cli_craft_controller import CropCliCraftController
+    from agrr_core.framework.services.clients.llm_client import LLMClient
+    from agrr_core.framework.services.io.file_service import FileService
+
+    # Optimize-related modules (for allocation adjust performance)
+    from agrr_core.adapter.controllers.allocation_adjust_cli_controller import AllocationAdjustCliController
+    from agrr_core.adapter.gateways.allocation_result_file_gateway import AllocationResultFileGateway
+    from agrr_core.adapter.gateways.move_instruction_file_gateway import MoveInstructionFileGateway
+    from agrr_core.usecase.interactors.allocation_adjust_interactor import AllocationAdjustInteractor
+    from agrr_core.usecase.interactors.growth_period_optimize_interactor import GrowthPeriodOptimizeInteractor
+    from agrr_core.adapter.gateways.interaction_rule_file_gateway import InteractionRuleFileGateway
+    from agrr_core.cli import execute_cli_direct
+
+def execute_request(args: List[str]) -> Dict:
+    """Execute one CLI request and capture its output.
+
+    Args:
+        args: Command line arguments
+
+    Returns:
+        Response dict with stdout, stderr and exit_code
+    """
+    # 標準出力/エラー出力をキャプチャ
+    old_stdout = sys.stdout
+    old_stderr = sys.stderr
+    stdout_capture = io.StringIO()
+    stderr_capture = io.StringIO()
+    sys.stdout = stdout_capture
+    sys.stderr = stderr_capture
+
+    exit_code = 0
+
+    try:
+        # 既存のCLI実行関数を呼び出し
+        from agrr_core.cli import execute_cli_direct
+        execute_cli_direct(args)
+    except SystemExit as e:
+        exit_code = e.code if e.code is not None else 0
+    except Exception as e:
+        # エラーの詳細を記録（原因特定のため）
+        import traceback
+        error_details = traceback.format_exc()
+        print(f"Error: {e}", file=sys.stderr)
+        # FileNotFoundError/OSErrorの場合は必ず詳細なトレースバックを出力（原因特定のため）
+        if isinstance(e, OSError):
+            print(f"Traceback:\n{error_details}", file=sys.stderr)
+        # FileNotFoundErrorの場合はファイル名も出力
+        if isinstance(e, FileNotFoundError):
+            print(f"Missing file: {getattr(e, 'filename', 'unknown')}", file=sys.stderr)
+        exit_code = 1
+    finally:
+        # 出力を復元
+        sys.stdout = old_stdout
+        sys.stderr = old_stderr
+
+    return {
+        'stdout': stdout_capture.getvalue(),
+        'stderr': stderr_capture.getvalue(),
+        'exit_code': exit_code
+    }
+
+def _warm_worker(cache_max_bytes: int = 0) -> None:
+    """Worker process initializer: preload modules and create the data cache."""
+    configure_parsed_file_cache(cache_max_bytes)
+    try:
+        preload_modules()
+    except Exception:
+        pass
+
+def _execute_in_worker(
+    handler: Callable[[List[str]], Dict], args: List[str]
+) -> Tuple[Dict, int, Optional[Dict]]:
+    """Run a request in a worker and report the worker's cache counters.
+
+    Returns:
+        Tuple of (response, worker pid, cache stats or None if disabled)
+    """
+    response = handler(args)
+    cache = get_parsed_file_cache()
+    return response, os.getpid(), cache.stats() if cache else None
+
+def _sum_cache_stats(stats: List[Dict]) -> Optional[Dict]:
+    """Sum cache counters of several processes (None if no process has a cache)."""
+    if not stats:
+        return None
+    total = {key: sum(s[key] for s in stats) for key in stats[0]}
+    total['max_bytes'] = stats[0]['max_bytes']  # Budget is per process
+    total['processes'] = len(stats)
+    return total
+
+def _ping() -> int:
+    """Trivial task used to start worker processes ahead of requests."""
+    return os.getpid()
 
 class AgrrDaemon:
     """Daemon server for fast CLI execution."""
-    
-    def __init__(self):
-        """Initialize daemon (imports all heavy modules at startup)."""
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        socket_path: str = SOCKET_PATH,
+        request_handler: Callable[[List[str]], Dict] = execute_request,
+        cache_max_mb: Optional[float] = None,
+    ):
+        """Initialize daemon (imports all heavy modules at startup).
+
+        Args:
+            workers: Worker processes (1 = serial, 0 = one per CPU);
+                     default from config daemon.workers
+            max_queue: Requests allowed to wait for a worker in concurrent mode;
+                       default from config daemon.max_queue
+            socket_path: UNIX socket path
+            request_handler: Function executing a request (must be picklable
+                             in concurrent mode)
+            cache_max_mb: Memory budget of the parsed file cache per process
+                          (0 disables); default from config daemon.cache_max_mb
+        """
         # Load configuration
         self.config = get_config()
-        
+
         # Initialize logger
         daemon_log_file = self.config.get("logging.daemon_log_file", "/tmp/agrr_daemon.log")
         self.logger = DaemonLogger(daemon_log_file)
-        
+
+        if workers is None:
+            workers = int(self.config.get("daemon.workers", 1))
+        if max_queue is None:
+            max_queue = int(self.config.get("daemon.max_queue", 16))
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.max_queue = max(0, max_queue)
+        self.socket_path = socket_path
+        self.request_handler = request_handler
+        if cache_max_mb is None:
+            cache_max_mb = float(self.config.get("daemon.cache_max_mb", 256))
+        self.cache_max_bytes = int(cache_max_mb * 1024 * 1024)
+        configure_parsed_file_cache(self.cache_max_bytes)
+        self._worker_cache_stats: Dict[int, Dict] = {}
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        self._pending: Set[Future] = set()  # Requests submitted to the pool
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_queue)
+        # Bounds connection threads; the accept loop waits when all are busy
+        self._connection_slots = threading.BoundedSemaphore(
+            self.workers + self.max_queue + SPARE_CONNECTION_THREADS
+        )
+        self.ready = threading.Event()  # Set once connections are accepted
+        self._stopping = threading.Event()
+
         # 重いモジュールを事前インポート（起動時の2秒はここで消費）
         # これによりリクエスト処理時は高速化される
         self.logger.info("Starting daemon, loading modules...")
-        
+
         # 事前に重いモジュールをすべてインポート
         try:
-            # Basic modules
-            from agrr_core.framework.agrr_core_container import WeatherCliContainer
-            from agrr_core.adapter.gateways.crop_profile_file_gateway import CropProfileFileGateway
-            from agrr_core.adapter.gateways.crop_profile_inmemory_gateway import CropProfileInMemoryGateway
-            from agrr_core.adapter.gateways.crop_profile_llm_gateway import CropProfileLLMGateway
-            from agrr_core.adapter.gateways.weather_file_gateway import WeatherFileGateway
-            from agrr_core.adapter.gateways.field_file_gateway import FieldFileGateway
-            from agrr_core.adapter.presenters.crop_profile_craft_presenter import CropProfileCraftPresenter
-            from agrr_core.adapter.controllers.crop_cli_craft_controller import CropCliCraftController
-            from agrr_core.framework.services.clients.llm_client import LLMClient
-            from agrr_core.framework.services.io.file_service import FileService
-            
-            # Optimize-related modules (for allocation adjust performance)
-            from agrr_core.adapter.controllers.allocation_adjust_cli_controller import AllocationAdjustCliController
-            from agrr_core.adapter.gateways.allocation_result_file_gateway import AllocationResultFileGateway
-            from agrr_core.adapter.gateways.move_instruction_file_gateway import MoveInstructionFileGateway
-            from agrr_core.usecase.interactors.allocation_adjust_interactor import AllocationAdjustInteractor
-            from agrr_core.usecase.interactors.growth_period_optimize_interactor import GrowthPeriodOptimizeInteractor
-            from agrr_core.adapter.gateways.interaction_rule_file_gateway import InteractionRuleFileGateway
-            
+            preload_modules()
             self.logger.info("Modules loaded successfully")
         except Exception as e:
             self.logger.error(f"Error loading modules", error=str(e))
-        
+
+    @property
+    def concurrent(self) -> bool:
+        """Whether requests are executed on a worker pool."""
+        return self.workers > 1
+
     def start(self, pid_file: Optional[str] = None):
         """
         Start daemon server.
-        
+
         Args:
             pid_file: Path to PID file
         """
         # ソケット作成
-        if os.path.exists(SOCKET_PATH):
+        if os.path.exists(self.socket_path):
             # 既存のソケットを削除
             try:
-                os.remove(SOCKET_PATH)
+                os.remove(self.socket_path)
             except OSError:
                 pass
-        
+
         sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-        
+
         try:
-            sock.bind(SOCKET_PATH)
-            os.chmod(SOCKET_PATH, 0o666)  # 誰でもアクセス可能
-            sock.listen(5)
-            
+            if self.concurrent:
+                # Start (and warm) all workers before accepting connections
+                self._start_pool()
+
+            sock.bind(self.socket_path)
+            os.chmod(self.socket_path, 0o666)  # 誰でもアクセス可能
+            sock.listen(max(5, self.workers + self.max_queue))
+
             # PIDファイル作成
             if pid_file:
                 with open(pid_file, 'w') as f:
                     f.write(str(os.getpid()))
-            
-            self.logger.daemon_started(os.getpid(), SOCKET_PATH)
-            
+
+            self.logger.daemon_started(os.getpid(), self.socket_path)
+            if self.concurrent:
+                self.logger.info(
+                    f"Concurrent mode: {self.workers} workers, queue size {self.max_queue}"
+                )
+
             # シグナルハンドラー設定
             def signal_handler(signum, frame):
                 self.logger.daemon_stopped(os.getpid())
                 sock.close()
-                if os.path.exists(SOCKET_PATH):
-                    os.remove(SOCKET_PATH)
+                if os.path.exists(self.socket_path):
+                    os.remove(self.socket_path)
                 if pid_file and os.path.exists(pid_file):
                     os.remove(pid_file)
                 sys.exit(0)
-            
-            signal.signal(signal.SIGINT, signal_handler)
-            signal.signal(signal.SIGTERM, signal_handler)
-            
+
+            if threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGINT, signal_handler)
+                signal.signal(signal.SIGTERM, signal_handler)
+
+            self.ready.set()
+
             # リクエストループ
             while True:
+                if self.concurrent:
+                    self._connection_slots.acquire()
                 try:
                     conn, addr = sock.accept()
+                except OSError:
+                    if self.concurrent:
+                        self._connection_slots.release()
+                    if sock.fileno() == -1:
+                        break  # Socket closed (shutdown)
+                    raise
+
+                if self._stopping.is_set():
+                    conn.close()  # Wake-up connection from stop()
+                    if self.concurrent:
+                        self._connection_slots.release()
+                    break
+
+                if self.concurrent:
+                    threading.Thread(
+                        target=self._serve_concurrent, args=(conn,), daemon=True
+                    ).start()
+                    continue
+
+                try:
                     self.logger.request_received("unknown", str(addr))
                     start_time = time.time()
-                    
+
                     try:
                         self._handle_request(conn)
                         duration = time.time() - start_time
@@ -110,83 +311,196 @@ class AgrrDaemon:
                     except Exception as e:
                         duration = time.time() - start_time
                         self.logger.request_failed("unknown", str(e), duration)
-                        
+
                 except Exception as e:
                     self.logger.error(f"Error in request loop", error=str(e))
-                    
+
         finally:
+            self.ready.clear()
             sock.close()
-            if os.path.exists(SOCKET_PATH):
-                os.remove(SOCKET_PATH)
+            self._shutdown_pool()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
             if pid_file and os.path.exists(pid_file):
                 os.remove(pid_file)
-    
-    def _handle_request(self, conn):
-        """Handle single request."""
+
+    def stop(self) -> None:
+        """Stop a running daemon: the request loop exits and cleans up."""
+        self._stopping.set()
         try:
-            # リクエスト受信（改行まで）
-            data = b''
-            while True:
-                chunk = conn.recv(1024)
-                if not chunk:
-                    break
-                data += chunk
-                if b'\n' in data:
-                    break
-            
-            if not data:
+            # Wake up the blocked accept() (closing the socket does not)
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as wake:
+                wake.connect(self.socket_path)
+        except OSError:
+            pass  # Not listening (not started or already stopped)
+
+    def _start_pool(self) -> None:
+        """Create the worker pool and wait until every worker is running."""
+        with self._pool_lock:
+            self._pool = self._new_pool()
+            for future in [self._pool.submit(_ping) for _ in range(self.workers)]:
+                future.result()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        """Create a worker pool (workers start on first use)."""
+        self._worker_cache_stats.clear()
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_warm_worker,
+            initargs=(self.cache_max_bytes,),
+        )
+
+    def _shutdown_pool(self) -> None:
+        """Stop the worker pool (pending requests are cancelled)."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._stop_pool(self._pool)
+                self._pool = None
+
+    def _stop_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Cancel requests not yet running and shut the pool down without waiting.
+
+        Equivalent to shutdown(cancel_futures=True), which needs Python 3.9.
+        """
+        for future in list(self._pending):
+            future.cancel()
+        pool.shutdown(wait=False)
+
+    def _submit(self, pool: ProcessPoolExecutor, args: List[str]) -> Future:
+        """Submit a request to the pool, tracking it until it is done."""
+        future = pool.submit(_execute_in_worker, self.request_handler, args)
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+        return future
+
+    def _run_on_pool(self, args: List[str]) -> Dict:
+        """Execute a request on the worker pool, restarting it once if broken."""
+        for attempt in range(2):
+            pool = self._pool
+            try:
+                response, pid, cache_stats = self._submit(pool, args).result()
+                if cache_stats is not None:
+                    self._worker_cache_stats[pid] = cache_stats
+                return response
+            except BrokenProcessPool:
+                # A worker died (e.g. killed by the OS); replace the pool
+                self.logger.error("Worker pool broken, restarting workers")
+                with self._pool_lock:
+                    if self._pool is pool:
+                        self._stop_pool(pool)
+                        self._pool = self._new_pool()
+        return {
+            'stdout': '',
+            'stderr': "Error: daemon worker process terminated unexpectedly\n",
+            'exit_code': 1
+        }
+
+    def _serve_concurrent(self, conn) -> None:
+        """Serve one connection in concurrent mode (runs in its own thread)."""
+        start_time = time.time()
+        try:
+            request = self._read_request(conn)
+            if request is None:
+                return
+            if 'control' in request:
+                self._send_response(conn, self._control_response(request))
                 return
-            
-            request = json.loads(data.decode('utf-8'))
             args = request.get('args', [])
-            
-            # 標準出力/エラー出力をキャプチャ
-            old_stdout = sys.stdout
-            old_stderr = sys.stderr
-            stdout_capture = io.StringIO()
-            stderr_capture = io.StringIO()
-            sys.stdout = stdout_capture
-            sys.stderr = stderr_capture
-            
-            exit_code = 0
-            
+            command = args[0] if args else "help"
+
+            # Backpressure: reject instead of queueing without bound
+            if not self._slots.acquire(blocking=False):
+                self.logger.warning("Request rejected: daemon busy", command=command)
+                self._send_response(conn, {
+                    'stdout': '',
+                    'stderr': (
+                        f"❌ Daemon busy: {self.workers} workers and "
+                        f"{self.max_queue} queued requests in progress. Retry later.\n"
+                    ),
+                    'exit_code': BUSY_EXIT_CODE,
+                    'error': 'busy',
+                })
+                return
+
             try:
-                # 既存のCLI実行関数を呼び出し
-                from agrr_core.cli import execute_cli_direct
-                execute_cli_direct(args)
-            except SystemExit as e:
-                exit_code = e.code if e.code is not None else 0
-            except Exception as e:
-                # エラーの詳細を記録（原因特定のため）
-                import traceback
-                error_details = traceback.format_exc()
-                print(f"Error: {e}", file=sys.stderr)
-                # FileNotFoundError/OSErrorの場合は必ず詳細なトレースバックを出力（原因特定のため）
-                if isinstance(e, (FileNotFoundError, OSError)) or isinstance(e, OSError):
-                    print(f"Traceback:\n{error_details}", file=sys.stderr)
-                # FileNotFoundErrorの場合はファイル名も出力
-                if isinstance(e, FileNotFoundError):
-                    print(f"Missing file: {getattr(e, 'filename', 'unknown')}", file=sys.stderr)
-                exit_code = 1
+                self.logger.request_received(command)
+                response = self._run_on_pool(args)
             finally:
-                # 出力を復元
-                sys.stdout = old_stdout
-                sys.stderr = old_stderr
-            
-            # レスポンス作成
-            response = {
-                'stdout': stdout_capture.getvalue(),
-                'stderr': stderr_capture.getvalue(),
-                'exit_code': exit_code
-            }
-            
-            # レスポンス送信（改行で終端）
-            response_data = json.dumps(response).encode('utf-8') + b'\n'
-            conn.sendall(response_data)
-            
-            # 送信完了を明示的に伝える
-            conn.shutdown(socket.SHUT_WR)
-            
+                self._slots.release()
+
+            self._send_response(conn, response)
+            self.logger.request_completed(command, time.time() - start_time, response['exit_code'])
+        except Exception as e:
+            self.logger.request_failed("unknown", str(e), time.time() - start_time)
+        finally:
+            conn.close()
+            self._connection_slots.release()
+
+    def status(self) -> Dict:
+        """Get daemon status (mode, capacity and data cache counters)."""
+        if self.concurrent:
+            cache = _sum_cache_stats(list(self._worker_cache_stats.values()))
+        else:
+            local = get_parsed_file_cache()
+            cache = _sum_cache_stats([local.stats()] if local else [])
+        return {
+            'pid': os.getpid(),
+            'mode': 'concurrent' if self.concurrent else 'serial',
+            'workers': self.workers,
+            'max_queue': self.max_queue,
+            'cache': cache,
+        }
+
+    def _control_response(self, request: Dict) -> Dict:
+        """Answer a control request (handled by the daemon, not a worker)."""
+        if request['control'] == 'status':
+            return {'stdout': '', 'stderr': '', 'exit_code': 0, 'status': self.status()}
+        return {
+            'stdout': '',
+            'stderr': f"Unknown control request: {request['control']}\n",
+            'exit_code': 1,
+        }
+
+    def _read_request(self, conn) -> Optional[Dict]:
+        """Receive a newline-terminated JSON request (None if empty)."""
+        # リクエスト受信（改行まで）
+        data = b''
+        while True:
+            chunk = conn.recv(1024)
+            if not chunk:
+                break
+            data += chunk
+            if b'\n' in data:
+                break
+
+        if not data:
+            return None
+
+        return json.loads(data.decode('utf-8'))
+
+    def _send_response(self, conn, response: Dict) -> None:
+        """Send a newline-terminated JSON response and close the write side."""
+        # レスポンス送信（改行で終端）
+        response_data = json.dumps(response).encode('utf-8') + b'\n'
+        conn.sendall(response_data)
+
+        # 送信完了を明示的に伝える
+        conn.shutdown(socket.SHUT_WR)
+
+    def _handle_request(self, conn):
+        """Handle single request."""
+        try:
+            request = self._read_request(conn)
+            if request is None:
+                return
+            if 'control' in request:
+                self._send_response(conn, self._control_response(request))
+                return
+
+            args = request.get('args', [])
+            response = self.request_handler(args)
+            self._send_response(conn, response)
+
         except Exception as e:
             self.logger.error(f"Error in _handle_request", error=str(e))
         finally:
@@ -200,4 +514,3 @@ def main():
 
 if __name__ == '__main__':
     main()
-
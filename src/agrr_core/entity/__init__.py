@@ -1,6 +1,7 @@
 """Entity layer package."""
 
 from .entities.weather_entity import WeatherData
+from .entities.weather_series_entity import WeatherSeries
 from .entities.weather_location_entity import Location
 from .entities.weather_date_range_entity import DateRange
 from .entities.prediction_forecast_entity import Forecast
@@ -33,6 +34,7 @@ from .exceptions.prediction_error import PredictionError
 
 __all__ = [
     "WeatherData",
+    "WeatherSeries",
     "Location", 
     "DateRange",
     "Forecast",
@@ -0,0 +1,361 @@
+"""Columnar weather series entity.
+
+WeatherSeries stores a weather time series as NumPy columns instead of a list
+of WeatherData objects:
+
+- ordinals: int64 proleptic Gregorian ordinals of the dates (date.toordinal())
+- one float64 column per WeatherData variable, NaN for missing values
+
+A WeatherData record with its float objects takes about 180 bytes; a row of
+the columns takes 64 bytes. Slicing (by position or by date range on a sorted series) returns a
+view on the same arrays, so sub-periods cost no copies.
+
+WeatherSeries is a read-only Sequence of WeatherData, so code written against
+List[WeatherData] keeps working: indexing builds one record and iteration
+builds records block by block. Records are never cached on the series, so it
+only ever holds the columns; the GDD and stress-impact computations read the
+columns (ordinals, column()) instead of records.
+"""
+
+from collections.abc import Sequence
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from agrr_core.entity.entities.weather_entity import WeatherData
+
+# WeatherData variables stored as columns (weather_code is stored as float)
+WEATHER_VARIABLES = (
+    'temperature_2m_max',
+    'temperature_2m_min',
+    'temperature_2m_mean',
+    'precipitation_sum',
+    'sunshine_duration',
+    'wind_speed_10m',
+    'weather_code',
+)
+
+# Records built at a time while iterating
+_ITER_BLOCK = 4096
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+def _to_ordinal(day: Union[date, datetime]) -> int:
+    if isinstance(day, datetime):
+        day = day.date()
+    return day.toordinal()
+
+class WeatherSeries(Sequence):
+    """Columnar, read-only sequence of daily (or timed) weather records.
+
+    Usage:
+        series = WeatherSeries.from_weather_data(weather_data_list)
+        temps = series.column('temperature_2m_mean')      # float64, NaN = missing
+        season = series.between(date(2024, 4, 1), date(2024, 9, 30))  # view
+        records = series.to_list()                        # List[WeatherData]
+    """
+
+    __hash__ = None
+
+    def __init__(
+        self,
+        ordinals: Iterable[int],
+        columns: Optional[Dict[str, Iterable[Optional[float]]]] = None,
+        day_microseconds: Optional[Iterable[int]] = None,
+        tz: Optional[tzinfo] = None,
+    ):
+        """Initialize series from columns (copied).
+
+        Args:
+            ordinals: Date ordinals (date.toordinal())
+            columns: Variable name -> values (None/NaN for missing); absent
+                variables are all missing
+            day_microseconds: Time of day of each record in microseconds
+                (None: all records at midnight)
+            tz: Time zone of the record times
+        """
+        ordinals = np.array(ordinals, dtype=np.int64, ndmin=1)
+        columns = columns or {}
+        unknown = set(columns) - set(WEATHER_VARIABLES)
+        if unknown:
+            raise ValueError(f"Unknown weather variables: {sorted(unknown)}")
+
+        arrays = {}
+        for name in WEATHER_VARIABLES:
+            if name in columns:
+                values = np.array(
+                    [np.nan if v is None else v for v in columns[name]], dtype=np.float64
+                )
+                if len(values) != len(ordinals):
+                    raise ValueError(
+                        f"Column {name} has {len(values)} values, expected {len(ordinals)}"
+                    )
+            else:
+                values = np.full(len(ordinals), np.nan)
+            arrays[name] = _read_only(values)
+
+        micros = None
+        if day_microseconds is not None:
+            micros = np.array(day_microseconds, dtype=np.int64, ndmin=1)
+            if len(micros) != len(ordinals):
+                raise ValueError("day_microseconds must have one value per record")
+            micros = _read_only(micros) if micros.any() else None
+
+        self._init_arrays(_read_only(ordinals), arrays, micros, tz)
+
+    def _init_arrays(
+        self,
+        ordinals: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        day_microseconds: Optional[np.ndarray],
+        tz: Optional[tzinfo],
+    ) -> None:
+        self._ordinals = ordinals
+        self._columns = columns
+        self._day_microseconds = day_microseconds
+        self._tz = tz
+        self._sorted: Optional[bool] = None
+
+    @classmethod
+    def _view(
+        cls,
+        ordinals: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        day_microseconds: Optional[np.ndarray],
+        tz: Optional[tzinfo],
+    ) -> 'WeatherSeries':
+        """Create a series sharing the given (read-only) arrays."""
+        series = cls.__new__(cls)
+        series._init_arrays(ordinals, columns, day_microseconds, tz)
+        return series
+
+    @classmethod
+    def from_arrays(
+        cls,
+        ordinals: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        day_microseconds: Optional[np.ndarray] = None,
+        tz: Optional[tzinfo] = None,
+    ) -> 'WeatherSeries':
+        """Create a series on existing arrays without copying.
+
+        Arrays with the storage dtypes (int64 ordinals, float64 columns) are
+        used as-is (and flagged read-only), e.g. memory-mapped file columns;
+        others are converted. Absent variables are all missing.
+        """
+        ordinals = _read_only(np.asarray(ordinals, dtype=np.int64))
+        arrays = {}
+        for name in WEATHER_VARIABLES:
+            if name in columns:
+                values = np.asarray(columns[name], dtype=np.float64)
+                if values.shape != ordinals.shape:
+                    raise ValueError(
+                        f"Column {name} has {len(values)} values, expected {len(ordinals)}"
+                    )
+            else:
+                values = np.full(len(ordinals), np.nan)
+            arrays[name] = _read_only(values)
+        if day_microseconds is not None:
+            day_microseconds = _read_only(np.asarray(day_microseconds, dtype=np.int64))
+        return cls._view(ordinals, arrays, day_microseconds, tz)
+
+    @classmethod
+    def from_weather_data(cls, weather_data: Iterable[WeatherData]) -> 'WeatherSeries':
+        """Create a series from WeatherData records (list or iterator).
+
+        Raises:
+            ValueError: If records mix time zones
+        """
+        if isinstance(weather_data, WeatherSeries):
+            return weather_data
+
+        ordinals: List[int] = []
+        micros: List[int] = []
+        values: Dict[str, List[Optional[float]]] = {name: [] for name in WEATHER_VARIABLES}
+        tz = None
+        for index, record in enumerate(weather_data):
+            moment = record.time
+            if isinstance(moment, datetime):
+                if index == 0:
+                    tz = moment.tzinfo
+                elif moment.tzinfo != tz:
+                    raise ValueError("Weather records have different time zones")
+                micros.append(
+                    ((moment.hour * 60 + moment.minute) * 60 + moment.second) * 1_000_000
+                    + moment.microsecond
+                )
+            else:
+                micros.append(0)
+            ordinals.append(moment.toordinal())
+            for name in WEATHER_VARIABLES:
+                values[name].append(getattr(record, name))
+
+        return cls(ordinals, values, day_microseconds=micros, tz=tz)
+
+    # ===== Columns =====
+
+    @property
+    def ordinals(self) -> np.ndarray:
+        """Date ordinals (read-only int64 array)."""
+        return self._ordinals
+
+    def column(self, name: str) -> np.ndarray:
+        """Get the values of a variable (read-only float64 array, NaN = missing).
+
+        Raises:
+            KeyError: If name is not a WeatherData variable
+        """
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError(
+                f"Unknown weather variable: {name}. Available: {', '.join(WEATHER_VARIABLES)}"
+            ) from None
+
+    @property
+    def day_microseconds(self) -> Optional[np.ndarray]:
+        """Time of day of the records in microseconds (None: all at midnight)."""
+        return self._day_microseconds
+
+    @property
+    def tzinfo(self) -> Optional[tzinfo]:
+        """Time zone of the record times."""
+        return self._tz
+
+    def dates(self) -> List[date]:
+        """Get the record dates."""
+        return [date.fromordinal(int(o)) for o in self._ordinals]
+
+    def times(self) -> List[datetime]:
+        """Get the record times (as WeatherData.time)."""
+        midnight = time(tzinfo=self._tz)
+        times = [datetime.combine(date.fromordinal(int(o)), midnight) for o in self._ordinals]
+        if self._day_microseconds is not None:
+            times = [
+                t + timedelta(microseconds=int(us))
+                for t, us in zip(times, self._day_microseconds)
+            ]
+        return times
+
+    @property
+    def is_sorted(self) -> bool:
+        """Whether dates are in non-decreasing order."""
+        if self._sorted is None:
+            self._sorted = bool(np.all(self._ordinals[1:] >= self._ordinals[:-1]))
+        return self._sorted
+
+    def unique_dates(self) -> 'WeatherSeries':
+        """Get one record per date in date order (later records win, as in by_date).
+
+        A sorted series without duplicate dates is returned as-is; otherwise
+        the selected records are copied.
+        """
+        ordinals = self._ordinals
+        if len(ordinals) < 2 or bool(np.all(ordinals[1:] > ordinals[:-1])):
+            return self
+        order = np.argsort(ordinals, kind='stable')
+        sorted_ordinals = ordinals[order]
+        last = np.append(sorted_ordinals[1:] != sorted_ordinals[:-1], True)
+        return self._take(order[last])
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the column arrays in bytes."""
+        size = self._ordinals.nbytes + sum(c.nbytes for c in self._columns.values())
+        if self._day_microseconds is not None:
+            size += self._day_microseconds.nbytes
+        return size
+
+    # ===== Slicing =====
+
+    def between(
+        self, start: Union[date, datetime], end: Union[date, datetime]
+    ) -> 'WeatherSeries':
+        """Get records from start to end date (inclusive).
+
+        On a sorted series the result is a view sharing the arrays; otherwise
+        matching records are copied in their original order.
+        """
+        start_ordinal, end_ordinal = _to_ordinal(start), _to_ordinal(end)
+        if self.is_sorted:
+            lo = int(np.searchsorted(self._ordinals, start_ordinal, side='left'))
+            hi = int(np.searchsorted(self._ordinals, end_ordinal, side='right'))
+            return self[lo:max(lo, hi)]
+        mask = (self._ordinals >= start_ordinal) & (self._ordinals <= end_ordinal)
+        return self._take(np.flatnonzero(mask))
+
+    def _take(self, index: Union[slice, np.ndarray]) -> 'WeatherSeries':
+        micros = self._day_microseconds
+        return WeatherSeries._view(
+            _read_only(self._ordinals[index]),
+            {name: _read_only(values[index]) for name, values in self._columns.items()},
+            None if micros is None else _read_only(micros[index]),
+            self._tz,
+        )
+
+    # ===== List API =====
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._take(index)
+        position = range(len(self))[index]  # IndexError when out of range
+        return self._take(slice(position, position + 1))._build_records()[0]
+
+    def __iter__(self) -> Iterator[WeatherData]:
+        for start in range(0, len(self), _ITER_BLOCK):
+            yield from self._take(slice(start, start + _ITER_BLOCK))._build_records()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, WeatherSeries):
+            other = other.to_list()
+        elif not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return self.to_list() == list(other)
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "WeatherSeries(0 records)"
+        return (
+            f"WeatherSeries({len(self)} records, "
+            f"{date.fromordinal(int(self._ordinals[0]))} .. "
+            f"{date.fromordinal(int(self._ordinals[-1]))})"
+        )
+
+    def to_list(self) -> List[WeatherData]:
+        """Materialize the records as a (new) list of WeatherData."""
+        return self._build_records()
+
+    def by_date(self) -> Dict[date, WeatherData]:
+        """Get records by date as a new dict (later records win for duplicate dates)."""
+        return {record.time.date(): record for record in self}
+
+    def _build_records(self) -> List[WeatherData]:
+        midnight = time(tzinfo=self._tz)
+        times = [
+            datetime.combine(date.fromordinal(o), midnight) for o in self._ordinals.tolist()
+        ]
+        if self._day_microseconds is not None:
+            times = [
+                t + timedelta(microseconds=us)
+                for t, us in zip(times, self._day_microseconds.tolist())
+            ]
+
+        # tolist() converts whole columns to Python floats at once; NaN != NaN
+        names = list(self._columns)
+        columns = [
+            [None if v != v else v for v in self._columns[name].tolist()] for name in names
+        ]
+        code_index = names.index('weather_code')
+        records = []
+        for moment, row in zip(times, zip(*columns)):
+            values = dict(zip(names, row))
+            if row[code_index] is not None:
+                values['weather_code'] = int(row[code_index])
+            records.append(WeatherData(time=moment, **values))
+        return records
@@ -15,7 +15,7 @@ class WeatherValidator:
             return False
         
         # Check if it's a valid file path with supported extensions
-        supported_extensions = ['.json', '.csv']
+        supported_extensions = ['.json', '.csv', '.npz', '.parquet']
         return any(source.lower().endswith(ext) for ext in supported_extensions)
     
     @staticmethod
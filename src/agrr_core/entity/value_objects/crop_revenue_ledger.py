@@ -0,0 +1,82 @@
+"""Crop revenue ledger value object.
+
+Tracks cumulative expected revenue per crop across a set of allocations.
+
+This ledger:
+- Keeps running totals keyed by crop_id
+- Is updated incrementally as allocations are added to / removed from a solution
+- Answers the market demand budget question ("how much of this crop is
+  already sold?") in O(1) instead of summing over all allocations
+
+Design:
+- Same aggregation rule as OptimizationMetrics.calculate_crop_cumulative_revenue()
+  (allocations with expected_revenue=None contribute nothing)
+- Adding allocations in list order yields exactly the list-based sums
+- Mutable accumulation state
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable
+
+if TYPE_CHECKING:
+    from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+
+@dataclass
+class CropRevenueLedger:
+    """Running cumulative revenue per crop.
+
+    Usage:
+        ledger = CropRevenueLedger.from_allocations(allocations)
+        metrics = OptimizationMetrics.create_for_allocation(
+            ..., revenue_ledger=ledger
+        )
+        allocations.append(allocation)
+        ledger.add(allocation)
+
+    Fields:
+        totals: Cumulative expected revenue by crop_id
+    """
+
+    totals: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_allocations(cls, allocations: Iterable['CropAllocation']) -> 'CropRevenueLedger':
+        """Create a ledger holding the totals of existing allocations.
+
+        Args:
+            allocations: CropAllocation or any object with crop.crop_id and expected_revenue
+
+        Returns:
+            CropRevenueLedger with per-crop totals
+        """
+        ledger = cls()
+        for allocation in allocations:
+            ledger.add(allocation)
+        return ledger
+
+    def cumulative_revenue(self, crop_id: str) -> float:
+        """Get cumulative revenue already allocated for a crop.
+
+        Args:
+            crop_id: Crop identifier
+
+        Returns:
+            Cumulative revenue (0.0 if the crop has no allocations)
+        """
+        return self.totals.get(crop_id, 0.0)
+
+    def add(self, allocation: 'CropAllocation') -> None:
+        """Add an allocation's expected revenue to its crop's total."""
+        if allocation.expected_revenue is not None:
+            crop_id = allocation.crop.crop_id
+            self.totals[crop_id] = self.totals.get(crop_id, 0.0) + allocation.expected_revenue
+
+    def remove(self, allocation: 'CropAllocation') -> None:
+        """Subtract an allocation's expected revenue from its crop's total."""
+        if allocation.expected_revenue is not None:
+            crop_id = allocation.crop.crop_id
+            self.totals[crop_id] = self.totals.get(crop_id, 0.0) - allocation.expected_revenue
+
+    def copy(self) -> 'CropRevenueLedger':
+        """Create an independent copy of the ledger."""
+        return CropRevenueLedger(totals=dict(self.totals))
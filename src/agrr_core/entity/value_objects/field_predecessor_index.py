@@ -0,0 +1,115 @@
+"""Field predecessor index value object.
+
+Per-field allocations sorted by completion date, for "previous crop" lookups.
+
+Interaction impact and soil recovery both depend on the allocation that
+completed most recently on or before a candidate's start date in the same
+field. Scanning a field schedule for it is O(n) per lookup; this index
+answers it with a binary search.
+
+The index is a read-only Mapping of field_id -> allocations (sorted by
+completion date), so it can be passed wherever a field_schedules dict is
+expected, and is updated incrementally with add()/remove().
+
+Design:
+- Keys are completion dates, compared with the query start date exactly
+  like the linear scan (completion_date <= start_date)
+- Among allocations with the same completion date the earliest added one
+  is the predecessor, matching the first-found rule of the linear scan
+- Mutable accumulation state
+"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+
+class FieldPredecessorIndex(Mapping):
+    """Allocations per field, sorted by completion date.
+
+    Usage:
+        schedules = FieldPredecessorIndex.from_allocations(allocations)
+        previous = schedules.previous(field.field_id, start_date)
+        schedules.add(new_allocation)
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._completions: Dict[str, list] = {}
+        self._items: Dict[str, List['CropAllocation']] = {}
+
+    @classmethod
+    def from_allocations(cls, allocations: Iterable['CropAllocation']) -> 'FieldPredecessorIndex':
+        """Create an index holding existing allocations.
+
+        Args:
+            allocations: CropAllocation or any object with field.field_id and completion_date
+
+        Returns:
+            FieldPredecessorIndex with all allocations added in order
+        """
+        index = cls()
+        for allocation in allocations:
+            index.add(allocation)
+        return index
+
+    def __getitem__(self, field_id: str) -> List['CropAllocation']:
+        return self._items[field_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def previous(self, field_id: str, start_date) -> Optional['CropAllocation']:
+        """Get the latest allocation in a field completed on or before start_date.
+
+        Args:
+            field_id: Field identifier
+            start_date: Start date of the allocation being evaluated
+
+        Returns:
+            Previous allocation, or None if there is none
+        """
+        completions = self._completions.get(field_id)
+        if not completions:
+            return None
+        pos = bisect_right(completions, start_date) - 1
+        if pos < 0:
+            return None
+        # First added among allocations completing on the same date
+        pos = bisect_left(completions, completions[pos])
+        return self._items[field_id][pos]
+
+    def add(self, allocation: 'CropAllocation') -> None:
+        """Add an allocation to its field."""
+        field_id = allocation.field.field_id
+        completions = self._completions.setdefault(field_id, [])
+        items = self._items.setdefault(field_id, [])
+        pos = bisect_right(completions, allocation.completion_date)
+        completions.insert(pos, allocation.completion_date)
+        items.insert(pos, allocation)
+
+    def remove(self, allocation: 'CropAllocation') -> None:
+        """Remove an allocation (matched by identity).
+
+        Raises:
+            ValueError: If allocation is not in the index
+        """
+        field_id = allocation.field.field_id
+        completions = self._completions.get(field_id, [])
+        items = self._items.get(field_id, [])
+        lo = bisect_left(completions, allocation.completion_date)
+        hi = bisect_right(completions, allocation.completion_date)
+        for pos in range(lo, hi):
+            if items[pos] is allocation:
+                del completions[pos]
+                del items[pos]
+                if not items:
+                    del self._completions[field_id]
+                    del self._items[field_id]
+                return
+        raise ValueError(f"Allocation not in index: {allocation.allocation_id}")
@@ -0,0 +1,95 @@
+"""Interaction rule table value object.
+
+Precompiled lookup of interaction rule impacts keyed by group pair.
+
+Applying rules directly loops over previous groups × current groups × all
+rules, filtering by rule type and matching group names every time. The
+table does this work once:
+
+    (prev_group, curr_group) -> (impact_ratio, ...)
+
+Design:
+- Only rules of the compiled rule types are included
+  (default: RuleType.CONTINUOUS_CULTIVATION)
+- Undirected rules are keyed under both group orders
+- Impacts of 1.0 are omitted (they do not change the product)
+- Impacts keep rule order, so combined impacts are multiplied in the same
+  order as the rule loop and give identical results
+"""
+
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from agrr_core.entity.entities.interaction_rule_entity import InteractionRule
+from agrr_core.entity.value_objects.rule_type import RuleType
+
+class InteractionRuleTable:
+    """Interaction rule impacts indexed by (source group, target group).
+
+    Usage:
+        table = InteractionRuleTable(rules)
+        impact = table.combined_impact(previous_crop.groups, crop.groups)
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[InteractionRule],
+        rule_types: Sequence[RuleType] = (RuleType.CONTINUOUS_CULTIVATION,),
+    ):
+        """Compile rules into a group-pair table.
+
+        Args:
+            rules: Interaction rules (rules of other types are ignored)
+            rule_types: Rule types to include
+        """
+        impacts: Dict[Tuple[str, str], List[float]] = {}
+        for rule in rules:
+            if rule.rule_type not in rule_types or rule.impact_ratio == 1.0:
+                continue
+            pairs = [(rule.source_group, rule.target_group)]
+            if not rule.is_directional and rule.source_group != rule.target_group:
+                pairs.append((rule.target_group, rule.source_group))
+            for pair in pairs:
+                impacts.setdefault(pair, []).append(rule.impact_ratio)
+
+        self._impacts: Dict[Tuple[str, str], Tuple[float, ...]] = {
+            pair: tuple(values) for pair, values in impacts.items()
+        }
+        self._combined: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], float] = {}
+
+    def __len__(self) -> int:
+        """Number of group pairs with a non-neutral impact."""
+        return len(self._impacts)
+
+    def impacts(self, source_group: str, target_group: str) -> Tuple[float, ...]:
+        """Get impact ratios of the rules matching a group pair (rule order)."""
+        return self._impacts.get((source_group, target_group), ())
+
+    def combined_impact(
+        self,
+        source_groups: Sequence[str],
+        target_groups: Sequence[str],
+    ) -> float:
+        """Get the product of impacts over all source × target group pairs.
+
+        Results are memoized per (source_groups, target_groups).
+
+        Args:
+            source_groups: Groups of the previous crop
+            target_groups: Groups of the current crop
+
+        Returns:
+            Combined impact ratio (1.0 if no rules apply)
+        """
+        if not self._impacts or not source_groups or not target_groups:
+            return 1.0
+
+        key = (tuple(source_groups), tuple(target_groups))
+        combined = self._combined.get(key)
+        if combined is None:
+            combined = 1.0
+            for source_group in key[0]:
+                for target_group in key[1]:
+                    for impact in self._impacts.get((source_group, target_group), ()):
+                        combined *= impact
+            self._combined[key] = combined
+        return combined
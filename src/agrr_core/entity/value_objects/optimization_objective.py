@@ -28,13 +28,17 @@ Usage Example:
 """
 
 from dataclasses import dataclass
-from typing import Optional, List, Callable, TypeVar, TYPE_CHECKING
+from typing import Optional, List, Callable, TypeVar, Union, TYPE_CHECKING
+
+from agrr_core.entity.value_objects.field_predecessor_index import FieldPredecessorIndex
+from agrr_core.entity.value_objects.interaction_rule_table import InteractionRuleTable
 
 if TYPE_CHECKING:
     from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
     from agrr_core.entity.entities.field_entity import Field
     from agrr_core.entity.entities.crop_entity import Crop
     from agrr_core.entity.entities.interaction_rule_entity import InteractionRule
+    from agrr_core.entity.value_objects.crop_revenue_ledger import CropRevenueLedger
 
 @dataclass(frozen=True)
 class OptimizationMetrics:
@@ -99,14 +103,15 @@ class OptimizationMetrics:
         start_date,
         current_allocations: Optional[List['CropAllocation']] = None,
         field_schedules: Optional[dict] = None,
-        interaction_rules: Optional[List['InteractionRule']] = None,
+        interaction_rules: Optional[Union[List['InteractionRule'], InteractionRuleTable]] = None,
         yield_factor: float = 1.0,
         planning_start_date = None,
+        revenue_ledger: Optional['CropRevenueLedger'] = None,
     ) -> 'OptimizationMetrics':
         """Create OptimizationMetrics for allocation with automatic calculations.
         
         This factory method automatically calculates:
-        - crop_cumulative_revenue from current_allocations
+        - crop_cumulative_revenue from revenue_ledger (O(1)) or current_allocations (O(n))
         - interaction_impact from field_schedules and interaction_rules
         - soil_recovery_factor from field_schedules and planning_start_date
         
@@ -123,33 +128,38 @@ class OptimizationMetrics:
             field: Field entity (for interaction rules)
             start_date: Start date (for interaction rules and soil recovery)
             current_allocations: Currently selected allocations
-            field_schedules: Dict mapping field_id to allocations
-            interaction_rules: List of interaction rules
+            field_schedules: Dict mapping field_id to allocations, or a
+                             FieldPredecessorIndex (O(log n) previous-crop lookup)
+            interaction_rules: List of interaction rules, or a precompiled InteractionRuleTable
             yield_factor: Yield reduction factor (default: 1.0)
             planning_start_date: Planning period start date (for soil recovery calculation)
+            revenue_ledger: Running per-crop revenue totals of the current allocations;
+                            takes precedence over current_allocations
             
         Returns:
             OptimizationMetrics with all calculations performed
         """
         # Calculate cumulative revenue (SINGLE SOURCE OF TRUTH)
         crop_cumulative_revenue = 0.0
-        if current_allocations:
+        if revenue_ledger is not None:
+            crop_cumulative_revenue = revenue_ledger.cumulative_revenue(crop_id)
+        elif current_allocations:
             crop_cumulative_revenue = cls.calculate_crop_cumulative_revenue(
                 crop_id, current_allocations
             )
         
-        # Calculate interaction impact (SINGLE SOURCE OF TRUTH)
+        # Calculate interaction impact and soil recovery factor (SINGLE SOURCE OF TRUTH)
+        # Both depend on the previous allocation in this field, looked up once
         interaction_impact = 1.0
-        if field_schedules is not None:
-            interaction_impact = cls.calculate_interaction_impact(
-                crop, field, start_date, field_schedules, interaction_rules
-            )
-        
-        # Calculate soil recovery factor (SINGLE SOURCE OF TRUTH)
         soil_recovery_factor = 1.0
         if field_schedules is not None:
-            soil_recovery_factor = cls.calculate_soil_recovery_factor(
-                field, start_date, field_schedules, planning_start_date
+            previous_alloc = cls.find_previous_allocation(field, start_date, field_schedules)
+            if interaction_rules:
+                interaction_impact = cls._interaction_impact_after(
+                    crop, previous_alloc, interaction_rules
+                )
+            soil_recovery_factor = cls._soil_recovery_factor_after(
+                start_date, previous_alloc, planning_start_date
             )
         
         return cls(
@@ -330,20 +340,21 @@ class OptimizationMetrics:
             )
         """
         import dataclasses
+        from agrr_core.entity.value_objects.crop_revenue_ledger import CropRevenueLedger
         
         # Sort all allocations by profit rate (descending)
         # This ensures best allocations get revenue budget first
         sorted_allocs = sorted(allocations, key=lambda a: a.profit_rate, reverse=True)
         
         # Recalculate each allocation with cumulative context
-        # calculate_crop_cumulative_revenue() automatically tracks per-crop cumulative
+        # The ledger tracks per-crop cumulative revenue of processed allocations
         # No need to manually group by crop!
         final_allocations = []
-        processed_allocs = []
+        ledger = CropRevenueLedger()
         
         for alloc in sorted_allocs:
             # Use create_for_allocation() factory - handles all calculations internally
-            # Automatically calculates crop_cumulative_revenue for this crop
+            # crop_cumulative_revenue for this crop is read from the ledger
             metrics = cls.create_for_allocation(
                 area_used=alloc.area_used,
                 revenue_per_area=alloc.crop.revenue_per_area,
@@ -354,10 +365,10 @@ class OptimizationMetrics:
                 crop=alloc.crop,
                 field=alloc.field,
                 start_date=alloc.start_date,
-                current_allocations=processed_allocs,
                 field_schedules=field_schedules,
                 interaction_rules=interaction_rules,
                 planning_start_date=planning_start_date,
+                revenue_ledger=ledger,
             )
             
             # Extract calculated values
@@ -371,17 +382,48 @@ class OptimizationMetrics:
                 profit=new_profit
             )
             final_allocations.append(adjusted_alloc)
-            processed_allocs.append(adjusted_alloc)
+            ledger.add(adjusted_alloc)
         
         return final_allocations
     
     @staticmethod
+    def find_previous_allocation(
+        field: 'Field',
+        start_date,
+        field_schedules,
+    ) -> Optional['CropAllocation']:
+        """Find the allocation in a field that completed most recently before start_date.
+        
+        This is the SINGLE SOURCE OF TRUTH for "previous crop" lookups used by
+        interaction rules and soil recovery.
+        
+        Args:
+            field: The field being allocated to
+            start_date: Start date of this allocation
+            field_schedules: Dict mapping field_id to list of allocations, or a
+                             FieldPredecessorIndex (binary search instead of a scan)
+            
+        Returns:
+            Latest allocation with completion_date <= start_date, or None
+        """
+        if isinstance(field_schedules, FieldPredecessorIndex):
+            return field_schedules.previous(field.field_id, start_date)
+        
+        previous_alloc = None
+        for alloc in field_schedules.get(field.field_id, []):
+            if alloc.completion_date <= start_date:
+                if previous_alloc is None or alloc.completion_date > previous_alloc.completion_date:
+                    previous_alloc = alloc
+        return previous_alloc
+    
+    @classmethod
     def calculate_interaction_impact(
+        cls,
         crop: 'Crop',
         field: 'Field',
         start_date,
         field_schedules: dict,
-        interaction_rules: Optional[List['InteractionRule']] = None
+        interaction_rules: Optional[Union[List['InteractionRule'], InteractionRuleTable]] = None
     ) -> float:
         """Calculate interaction impact for a crop allocation.
         
@@ -392,8 +434,8 @@ class OptimizationMetrics:
             crop: The crop being allocated
             field: The field being allocated to
             start_date: Start date of this allocation
-            field_schedules: Dict mapping field_id to list of allocations
-            interaction_rules: List of interaction rules (optional)
+            field_schedules: Dict mapping field_id to list of allocations (or FieldPredecessorIndex)
+            interaction_rules: List of interaction rules or InteractionRuleTable (optional)
             
         Returns:
             Interaction impact factor (1.0 = no impact, <1.0 = penalty, >1.0 = benefit)
@@ -407,19 +449,17 @@ class OptimizationMetrics:
         if not interaction_rules:
             return 1.0
         
-        # Get previous allocation in this field
-        field_allocs = field_schedules.get(field.field_id, [])
-        if not field_allocs:
-            return 1.0  # No previous crop
-        
-        # Find the allocation that ends just before this one
-        previous_alloc = None
-        for alloc in field_allocs:
-            if alloc.completion_date <= start_date:
-                if previous_alloc is None or alloc.completion_date > previous_alloc.completion_date:
-                    previous_alloc = alloc
-        
-        if not previous_alloc:
+        previous_alloc = cls.find_previous_allocation(field, start_date, field_schedules)
+        return cls._interaction_impact_after(crop, previous_alloc, interaction_rules)
+    
+    @staticmethod
+    def _interaction_impact_after(
+        crop: 'Crop',
+        previous_alloc: Optional['CropAllocation'],
+        interaction_rules: Union[List['InteractionRule'], InteractionRuleTable],
+    ) -> float:
+        """Interaction impact of planting crop after previous_alloc."""
+        if previous_alloc is None:
             return 1.0  # No previous crop before this date
         
         previous_crop = previous_alloc.crop
@@ -432,30 +472,17 @@ class OptimizationMetrics:
         if not crop.groups or not previous_crop.groups:
             return 1.0
         
-        # Import RuleType here to avoid circular dependency
-        from agrr_core.entity.value_objects.rule_type import RuleType
-        
-        # Find all applicable continuous_cultivation rules
-        combined_impact = 1.0
-        
-        for prev_group in previous_crop.groups:
-            for curr_group in crop.groups:
-                for rule in interaction_rules:
-                    # Only check continuous_cultivation rules
-                    if rule.rule_type != RuleType.CONTINUOUS_CULTIVATION:
-                        continue
-                    
-                    # Get impact for this group combination
-                    impact = rule.get_impact(prev_group, curr_group)
-                    
-                    # If impact is not 1.0, apply it (multiply)
-                    if impact != 1.0:
-                        combined_impact *= impact
-        
-        return combined_impact
+        # Continuous cultivation rules by (previous group, current group)
+        rule_table = (
+            interaction_rules
+            if isinstance(interaction_rules, InteractionRuleTable)
+            else InteractionRuleTable(interaction_rules)
+        )
+        return rule_table.combined_impact(previous_crop.groups, crop.groups)
     
-    @staticmethod
+    @classmethod
     def calculate_soil_recovery_factor(
+        cls,
         field: 'Field',
         start_date,
         field_schedules: dict,
@@ -475,7 +502,7 @@ class OptimizationMetrics:
         Args:
             field: The field being allocated to
             start_date: Start date of this allocation
-            field_schedules: Dict mapping field_id to list of allocations
+            field_schedules: Dict mapping field_id to list of allocations (or FieldPredecessorIndex)
             planning_start_date: Planning period start date (used if no previous crop)
             
         Returns:
@@ -487,34 +514,26 @@ class OptimizationMetrics:
             )
             # Returns: 1.05 (30-day fallow period)
         """
-        # Get previous allocation in this field
-        field_allocs = field_schedules.get(field.field_id, [])
-        
-        if not field_allocs:
-            # No previous crop - calculate from planning start if available
+        previous_alloc = cls.find_previous_allocation(field, start_date, field_schedules)
+        return cls._soil_recovery_factor_after(start_date, previous_alloc, planning_start_date)
+    
+    @staticmethod
+    def _soil_recovery_factor_after(
+        start_date,
+        previous_alloc: Optional['CropAllocation'],
+        planning_start_date = None,
+    ) -> float:
+        """Soil recovery factor of starting at start_date after previous_alloc."""
+        if previous_alloc is None:
+            # No previous crop before this date - use planning start if available
             if planning_start_date is not None:
                 days_since_last_crop = (start_date - planning_start_date).days
             else:
                 # No planning start date - assume maximum recovery
                 return 1.10
         else:
-            # Find the allocation that ends just before this one
-            previous_alloc = None
-            for alloc in field_allocs:
-                if alloc.completion_date <= start_date:
-                    if previous_alloc is None or alloc.completion_date > previous_alloc.completion_date:
-                        previous_alloc = alloc
-            
-            if not previous_alloc:
-                # No previous crop before this date - use planning start if available
-                if planning_start_date is not None:
-                    days_since_last_crop = (start_date - planning_start_date).days
-                else:
-                    # No planning start date - assume maximum recovery
-                    return 1.10
-            else:
-                # Calculate days since previous crop completion
-                days_since_last_crop = (start_date - previous_alloc.completion_date).days
+            # Calculate days since previous crop completion
+            days_since_last_crop = (start_date - previous_alloc.completion_date).days
         
         # Apply recovery factor based on fallow period
         if days_since_last_crop >= 60:
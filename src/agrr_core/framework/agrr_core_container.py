@@ -1,5 +1,6 @@
 """Unified dependency injection container for agrr.core application."""
 
+import os
 from typing import Dict, Any, Optional
 
 from agrr_core.framework.services.io.file_service import FileService
@@ -8,6 +9,7 @@ from agrr_core.framework.services.io.html_table_service import HtmlTableService
 from agrr_core.framework.services.io.csv_service import CsvService
 from agrr_core.adapter.gateways.weather_api_gateway import WeatherAPIGateway
 from agrr_core.adapter.gateways.weather_jma_gateway import WeatherJMAGateway
+from agrr_core.adapter.utils.concurrent_fetch import DEFAULT_PER_HOST_LIMIT, configure_per_host_limit
 from agrr_core.adapter.gateways.weather_noaa_gateway import WeatherNOAAGateway
 from agrr_core.adapter.gateways.weather_noaa_ftp_gateway import WeatherNOAAFTPGateway
 from agrr_core.adapter.gateways.weather_nasa_power_gateway import WeatherNASAPowerGateway
@@ -19,6 +21,7 @@ from agrr_core.adapter.controllers.weather_cli_controller import WeatherCliFetch
 from agrr_core.adapter.controllers.weather_cli_predict_controller import WeatherCliPredictController
 from agrr_core.adapter.gateways.prediction_gateway_impl import PredictionGatewayImpl
 from agrr_core.adapter.gateways.prediction_mock_gateway import PredictionMockGateway
+from agrr_core.adapter.gateways.prediction_model_gateway_impl import PredictionModelGatewayImpl
 from agrr_core.framework.services.ml.arima_prediction_service import ARIMAPredictionService
 from agrr_core.framework.services.ml.time_series_arima_service import TimeSeriesARIMAService
 from agrr_core.usecase.interactors.weather_fetch_interactor import FetchWeatherDataInteractor
@@ -29,6 +32,7 @@ from agrr_core.usecase.interactors.prediction_manage_interactor import ModelMana
 from agrr_core.usecase.ports.output.advanced_prediction_output_port import AdvancedPredictionOutputPort
 from agrr_core.usecase.ports.output.prediction_presenter_output_port import PredictionPresenterOutputPort
 from agrr_core.usecase.gateways.weather_gateway import WeatherGateway
+from agrr_core.usecase.gateways.batch_prediction_executor import BatchPredictionExecutor
 from agrr_core.adapter.interfaces.ml.time_series_service_interface import TimeSeriesServiceInterface
 
 class AgrrCoreContainer:
@@ -103,7 +107,9 @@ class AgrrCoreContainer:
     def get_cli_presenter(self) -> WeatherCLIPresenter:
         """Get CLI presenter instance."""
         if 'cli_presenter' not in self._instances:
-            self._instances['cli_presenter'] = WeatherCLIPresenter()
+            self._instances['cli_presenter'] = WeatherCLIPresenter(
+                file_repository=self.get_file_repository_impl()
+            )
         return self._instances['cli_presenter']
     
     def get_fetch_weather_interactor(self) -> FetchWeatherDataInteractor:
@@ -151,14 +157,30 @@ class AgrrCoreContainer:
         """Get ARIMA prediction service instance (Framework layer)."""
         if 'prediction_arima_service' not in self._instances:
             time_series_service = self.get_time_series_service()
-            self._instances['prediction_arima_service'] = ARIMAPredictionService(time_series_service)
+            order_cache = None
+            cache_dir = self.config.get('arima_order_cache_dir')
+            if cache_dir:
+                from agrr_core.framework.services.ml.arima_order_cache import ARIMAOrderCache
+                order_cache = ARIMAOrderCache(cache_dir)
+            self._instances['prediction_arima_service'] = ARIMAPredictionService(
+                time_series_service,
+                order_cache=order_cache,
+                search_workers=int(self.config.get('arima_search_workers', 1))
+            )
         return self._instances['prediction_arima_service']
     
     def get_prediction_lightgbm_service(self):
         """Get LightGBM prediction service instance."""
         if 'prediction_lightgbm_service' not in self._instances:
             from agrr_core.framework.services.ml.lightgbm_prediction_service import LightGBMPredictionService
-            self._instances['prediction_lightgbm_service'] = LightGBMPredictionService()
+            model_store = None
+            store_dir = self.config.get('lightgbm_model_store_dir')
+            if store_dir:
+                from agrr_core.framework.services.ml.lightgbm_model_store import LightGBMModelStore
+                model_store = LightGBMModelStore(store_dir)
+            self._instances['prediction_lightgbm_service'] = LightGBMPredictionService(
+                model_store=model_store
+            )
         return self._instances['prediction_lightgbm_service']
     
     def get_weather_api_gateway(self) -> WeatherAPIGateway:
@@ -186,24 +208,41 @@ class AgrrCoreContainer:
             self._instances['csv_downloader'] = CsvService(timeout=timeout)
         return self._instances['csv_downloader']
     
+    def _configure_fetch_limits(self) -> None:
+        """Apply the process-wide per-host request limit of concurrent fetches."""
+        configure_per_host_limit(
+            self.config.get('weather_fetch_per_host_limit', DEFAULT_PER_HOST_LIMIT)
+        )
+    
     def get_weather_jma_gateway(self) -> WeatherJMAGateway:
         """Get JMA weather gateway instance."""
         if 'weather_jma_gateway' not in self._instances:
+            self._configure_fetch_limits()
             html_table_fetcher = self.get_html_table_fetcher()
-            self._instances['weather_jma_gateway'] = WeatherJMAGateway(html_table_fetcher)
+            self._instances['weather_jma_gateway'] = WeatherJMAGateway(
+                html_table_fetcher,
+                max_concurrency=self.config.get('weather_fetch_concurrency', 4)
+            )
         return self._instances['weather_jma_gateway']
     
     def get_weather_noaa_gateway(self) -> WeatherNOAAGateway:
         """Get NOAA weather gateway instance (HTTP/ISD)."""
         if 'weather_noaa_gateway' not in self._instances:
+            self._configure_fetch_limits()
             http_client = self.get_http_service_impl()
-            self._instances['weather_noaa_gateway'] = WeatherNOAAGateway(http_client)
+            self._instances['weather_noaa_gateway'] = WeatherNOAAGateway(
+                http_client,
+                max_concurrency=self.config.get('weather_fetch_concurrency', 4)
+            )
         return self._instances['weather_noaa_gateway']
     
     def get_weather_noaa_ftp_gateway(self) -> WeatherNOAAFTPGateway:
         """Get NOAA FTP weather gateway instance (long-term historical data: 1901-present)."""
         if 'weather_noaa_ftp_gateway' not in self._instances:
-            self._instances['weather_noaa_ftp_gateway'] = WeatherNOAAFTPGateway()
+            self._configure_fetch_limits()
+            self._instances['weather_noaa_ftp_gateway'] = WeatherNOAAFTPGateway(
+                max_concurrency=self.config.get('weather_fetch_concurrency', 4)
+            )
         return self._instances['weather_noaa_ftp_gateway']
     
     def get_weather_nasa_power_gateway(self) -> WeatherNASAPowerGateway:
@@ -274,6 +313,15 @@ class AgrrCoreContainer:
         return self._instances['file_predict_cli_controller']
     
     # Prediction Components
+    def get_prediction_model_gateway(self) -> PredictionModelGatewayImpl:
+        """Get prediction model gateway instance (ARIMA, batch runs on the batch executor)."""
+        if 'prediction_model_gateway' not in self._instances:
+            self._instances['prediction_model_gateway'] = PredictionModelGatewayImpl(
+                arima_service=self.get_prediction_arima_service(),
+                batch_executor=self.get_batch_prediction_executor()
+            )
+        return self._instances['prediction_model_gateway']
+    
     def get_multi_metric_prediction_input_port(self) -> MultiMetricPredictionInteractor:
         """Get multi-metric prediction input port instance."""
         if 'multi_metric_prediction_input_port' not in self._instances:
@@ -281,8 +329,8 @@ class AgrrCoreContainer:
             prediction_presenter = self.get_prediction_presenter_output_port()
             self._instances['multi_metric_prediction_input_port'] = MultiMetricPredictionInteractor(
                 weather_data_gateway=weather_repository,
-                weather_data_repository_gateway=weather_repository,
-                prediction_service_gateway=weather_repository,
+                model_config_gateway=weather_repository,
+                prediction_model_gateway=self.get_prediction_model_gateway(),
                 prediction_presenter_output_port=prediction_presenter
             )
         return self._instances['multi_metric_prediction_input_port']
@@ -298,15 +346,27 @@ class AgrrCoreContainer:
             )
         return self._instances['model_evaluation_input_port']
     
+    def get_batch_prediction_executor(self) -> BatchPredictionExecutor:
+        """Get batch prediction executor instance (Framework layer).
+        
+        Locations run on batch_prediction_workers processes (default 1: serial,
+        0: number of CPUs), sharing batch_prediction_max_memory_mb (default: no cap).
+        """
+        if 'batch_prediction_executor' not in self._instances:
+            from agrr_core.framework.services.ml.batch_prediction_pool import BatchPredictionPool
+            max_memory_mb = self.config.get('batch_prediction_max_memory_mb')
+            self._instances['batch_prediction_executor'] = BatchPredictionPool(
+                max_workers=int(self.config.get('batch_prediction_workers', 1)),
+                max_memory_mb=int(max_memory_mb) if max_memory_mb else None
+            )
+        return self._instances['batch_prediction_executor']
+    
     def get_batch_prediction_input_port(self) -> BatchPredictionInteractor:
         """Get batch prediction input port instance."""
         if 'batch_prediction_input_port' not in self._instances:
-            weather_repository = self.get_weather_repository()
-            prediction_presenter = self.get_prediction_presenter_output_port()
             self._instances['batch_prediction_input_port'] = BatchPredictionInteractor(
-                weather_data_gateway=weather_repository,
-                prediction_service_gateway=weather_repository,
-                prediction_presenter_output_port=prediction_presenter
+                multi_metric_prediction_interactor=self.get_multi_metric_prediction_input_port(),
+                batch_executor=self.get_batch_prediction_executor()
             )
         return self._instances['batch_prediction_input_port']
     
@@ -364,6 +424,19 @@ class AgrrCoreContainer:
             except (ValueError, IndexError):
                 pass
         
+        # Extract model store directory (LightGBM boosters, ARIMA orders) from args
+        if args and '--model-store' in args:
+            store_index = args.index('--model-store')
+            if store_index + 1 < len(args):
+                self.config['lightgbm_model_store_dir'] = args[store_index + 1]
+                self.config['arima_order_cache_dir'] = os.path.join(args[store_index + 1], 'arima')
+        
+        # Extract ARIMA order search parallelism from args
+        if args and '--arima-search-workers' in args:
+            workers_index = args.index('--arima-search-workers')
+            if workers_index + 1 < len(args):
+                self.config['arima_search_workers'] = args[workers_index + 1]
+        
         # Create controller with appropriate service injected
         weather_gateway = self.get_weather_gateway()
         prediction_gateway = self.get_prediction_gateway(model_type=model_type)  # ← モデルを指定
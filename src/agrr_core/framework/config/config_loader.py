@@ -80,6 +80,9 @@ class ConfigLoader:
                 }
             },
             "daemon": {
+                "workers": 1,
+                "max_queue": 16,
+                "cache_max_mb": 256,
                 "health_check": {
                     "enabled": True,
                     "check_interval": 60,
@@ -113,6 +116,9 @@ class ConfigLoader:
             "AGRR_EMAIL_TO": ("notifications", "email", "to_emails"),
             "AGRR_SLACK_ENABLED": ("notifications", "slack", "enabled"),
             "AGRR_SLACK_WEBHOOK": ("notifications", "slack", "webhook_url"),
+            "AGRR_DAEMON_WORKERS": ("daemon", "workers"),
+            "AGRR_DAEMON_MAX_QUEUE": ("daemon", "max_queue"),
+            "AGRR_DAEMON_CACHE_MAX_MB": ("daemon", "cache_max_mb"),
             "AGRR_SOCKET_PATH": ("paths", "socket_path"),
             "AGRR_PID_FILE": ("paths", "pid_file")
         }
@@ -131,7 +137,7 @@ class ConfigLoader:
             current = current[key]
         
         # Convert string values to appropriate types
-        if path[-1] in ["smtp_port", "check_interval", "retry_interval", "max_retries", "max_consecutive_failures"]:
+        if path[-1] in ["smtp_port", "check_interval", "retry_interval", "max_retries", "max_consecutive_failures", "workers", "max_queue", "cache_max_mb"]:
             value = int(value)
         elif path[-1] in ["response_timeout"]:
             value = float(value)
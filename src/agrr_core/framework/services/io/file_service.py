@@ -1,6 +1,21 @@
 """File service implementation for framework layer."""
 
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, Optional
+
 from agrr_core.adapter.interfaces.io.file_service_interface import FileServiceInterface
+from agrr_core.entity.entities.weather_series_entity import WeatherSeries
+from agrr_core.framework.services.io.parsed_file_cache import load_cached
+from agrr_core.framework.services.io.streaming_record_reader import (
+    iter_csv_records,
+    iter_json_records,
+    iter_text_chunks,
+)
+from agrr_core.framework.services.io.weather_columnar_store import (
+    is_columnar_weather_file,
+    read_weather_columns,
+    write_weather_columns,
+)
 
 
 class FileService(FileServiceInterface):
@@ -19,6 +34,59 @@ class FileService(FileServiceInterface):
             from agrr_core.entity.exceptions.file_error import FileError
             raise FileError(f"Failed to read file {file_path}: {e}")
     
+    def read_chunks(self, file_path: str, use_mmap: Optional[bool] = None) -> Iterator[str]:
+        """Read file content as text chunks streamed from disk."""
+        try:
+            yield from iter_text_chunks(file_path, use_mmap=use_mmap)
+        except Exception as e:
+            from agrr_core.entity.exceptions.file_error import FileError
+            raise FileError(f"Failed to read file {file_path}: {e}")
+    
+    def read_json_records(self, file_path: str, use_mmap: Optional[bool] = None) -> Iterator[Any]:
+        """Read the records of a JSON file streamed from disk."""
+        return iter_json_records(self.read_chunks(file_path, use_mmap=use_mmap))
+    
+    def read_csv_records(
+        self, file_path: str, use_mmap: Optional[bool] = None
+    ) -> Iterator[Dict[str, Optional[str]]]:
+        """Read the rows of a CSV file streamed from disk."""
+        return iter_csv_records(self.read_chunks(file_path, use_mmap=use_mmap))
+    
+    def load_cached(self, kind: str, file_path: str, loader: Callable[[], Any]) -> Any:
+        """Load parsed file content through the process-wide parsed-file cache."""
+        return load_cached(kind, file_path, loader)
+    
+    def is_columnar_weather_file(self, file_path: str) -> bool:
+        """Check whether a path is a binary columnar weather file (.npz/.parquet)."""
+        return is_columnar_weather_file(file_path)
+    
+    def read_weather_columns(
+        self,
+        file_path: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        use_mmap: bool = True,
+    ) -> WeatherSeries:
+        """Read a weather series from a binary columnar file (.npz/.parquet)."""
+        try:
+            return read_weather_columns(file_path, start_date, end_date, use_mmap=use_mmap)
+        except Exception as e:
+            from agrr_core.entity.exceptions.file_error import FileError
+            raise FileError(f"Failed to read file {file_path}: {e}")
+    
+    def write_weather_columns(
+        self,
+        series: WeatherSeries,
+        file_path: str,
+        location: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Write a weather series to a binary columnar file (.npz/.parquet)."""
+        try:
+            write_weather_columns(series, file_path, location=location)
+        except Exception as e:
+            from agrr_core.entity.exceptions.file_error import FileError
+            raise FileError(f"Failed to write file {file_path}: {e}")
+    
     def write(self, content: str, file_path: str) -> None:
         """Write content to file."""
         try:
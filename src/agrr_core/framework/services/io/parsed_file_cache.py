@@ -0,0 +1,187 @@
+"""Cross-request cache of parsed input files (framework layer).
+
+The daemon serves many CLI calls that read the same weather, crop profile,
+interaction rule and field files. Parsing them into entities dominates the
+run time of short commands such as `optimize adjust` or `candidates`.
+
+ParsedFileCache keeps the parsed objects in memory, keyed by
+
+    (kind, absolute path, mtime_ns, size)
+
+so an edited file is re-read automatically. Entries are evicted in LRU order
+once the estimated memory of all entries exceeds the budget.
+
+The cache is process-wide but disabled by default: only the daemon enables it
+(see configure_parsed_file_cache). Gateways read through load_cached(), which
+simply calls the loader when the cache is disabled or the path cannot be
+stat'ed (e.g. in-memory test doubles).
+
+Cached objects are shared between requests and must be treated as read-only:
+get_or_load returns the cached object itself, not a copy. Gateways that hand
+out mutable lists or dicts copy them before returning (e.g. the field and
+interaction rule gateways); a WeatherSeries is returned as-is, since it is
+read-only and never caches records, so its estimated size (the column arrays)
+is what it keeps holding while cached.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+CacheKey = Tuple[str, str, int, int]
+
+class ParsedFileCache:
+    """LRU cache of parsed file contents with a memory budget."""
+
+    def __init__(self, max_bytes: int):
+        """Initialize cache.
+
+        Args:
+            max_bytes: Memory budget for all entries (estimated bytes)
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_load(self, kind: str, file_path: str, loader: Callable[[], Any]) -> Any:
+        """Get parsed content of a file, loading it on a miss.
+
+        Args:
+            kind: What the loader produces (e.g. "weather", "fields")
+            file_path: File the loader reads
+            loader: Function parsing the file
+
+        Returns:
+            Parsed content (shared, read-only)
+        """
+        path = os.path.abspath(file_path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return loader()  # Let the loader report the error
+        key = (kind, path, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        value = loader()
+        size = estimate_size(value)
+
+        with self._lock:
+            # Drop outdated versions of the same file
+            for stale in [k for k in self._entries if k[:2] == key[:2] and k != key]:
+                self._remove(stale)
+            if size <= self.max_bytes and key not in self._entries:
+                self._entries[key] = (value, size)
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    self._remove(next(iter(self._entries)))
+                    self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache counters.
+
+        Returns:
+            Dict with hits, misses, evictions, entries, bytes and max_bytes
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    def _remove(self, key: CacheKey) -> None:
+        _, size = self._entries.pop(key)
+        self._bytes -= size
+
+def estimate_size(obj: Any) -> int:
+    """Estimate memory used by an object graph (sys.getsizeof, deep).
+
+    Follows lists, tuples, sets, dicts, dataclass fields and instance
+    attributes; shared objects are counted once. NumPy arrays count their
+    data even when they do not own it (views, memory-mapped columns).
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+
+        if isinstance(item, (str, bytes, int, float, bool, type(None))):
+            continue
+        if isinstance(item, np.ndarray):
+            # getsizeof includes the data only for arrays that own it
+            if item.base is not None:
+                total += item.nbytes
+            continue
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif is_dataclass(item):
+            stack.extend(getattr(item, f.name) for f in fields(item))
+        elif hasattr(item, '__dict__'):
+            stack.append(vars(item))
+    return total
+
+_cache: Optional[ParsedFileCache] = None
+
+def configure_parsed_file_cache(max_bytes: int) -> Optional[ParsedFileCache]:
+    """Enable (max_bytes > 0) or disable (max_bytes <= 0) the process-wide cache.
+
+    Returns:
+        The active cache, or None if disabled
+    """
+    global _cache
+    _cache = ParsedFileCache(max_bytes) if max_bytes > 0 else None
+    return _cache
+
+def get_parsed_file_cache() -> Optional[ParsedFileCache]:
+    """Get the process-wide cache (None if disabled)."""
+    return _cache
+
+def load_cached(kind: str, file_path: str, loader: Callable[[], Any]) -> Any:
+    """Load through the process-wide cache if enabled.
+
+    Args:
+        kind: What the loader produces (e.g. "weather", "fields")
+        file_path: File the loader reads
+        loader: Function parsing the file
+
+    Returns:
+        Parsed content (shared and read-only when cached)
+    """
+    cache = _cache
+    if cache is None or not file_path:
+        return loader()
+    return cache.get_or_load(kind, file_path, loader)
@@ -0,0 +1,218 @@
+"""Streaming readers for JSON and CSV record files (framework layer).
+
+Reading a weather file with read() + json.loads (or pandas over a StringIO)
+holds the file content, the parsed document and the entities in memory at
+the same time. These readers parse incrementally instead:
+
+    for record in iter_json_records(iter_text_chunks(path)):
+        ...
+
+- iter_text_chunks decodes a file in fixed-size chunks, optionally through a
+  read-only memory map whose consumed pages are released as it goes, so
+  memory stays flat for multi-decade station files
+- iter_json_records yields the objects of the record array one at a time
+  (a top-level array, or the "data"/"weather_data" array of a top-level
+  object; any other object is yielded as a single record)
+- iter_csv_records yields one dict per CSV row (header keys, string values)
+
+Both parsers take any iterable of text chunks, so in-memory content works as
+well: iter_json_records([content]).
+"""
+
+import codecs
+import csv
+import json
+import mmap
+import os
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+# Files at least this large are memory-mapped when use_mmap is None
+MMAP_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+def iter_text_chunks(
+    file_path: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    use_mmap: Optional[bool] = None,
+    encoding: str = 'utf-8',
+) -> Iterator[str]:
+    """Decode a file in chunks.
+
+    Args:
+        file_path: File to read
+        chunk_size: Bytes per chunk
+        use_mmap: Read through a memory map (None: for files of at least
+            MMAP_THRESHOLD_BYTES)
+        encoding: Text encoding
+
+    Yields:
+        Decoded text chunks
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if use_mmap is None:
+            use_mmap = size >= MMAP_THRESHOLD_BYTES
+        if use_mmap and size > 0:
+            chunks = _iter_mapped_chunks(f, size, chunk_size)
+        else:
+            chunks = iter(lambda: f.read(chunk_size), b'')
+        for chunk in chunks:
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+def _iter_mapped_chunks(f, size: int, chunk_size: int) -> Iterator[bytes]:
+    # Page-aligned chunks, so consumed pages can be dropped from the mapping
+    chunk_size = max(mmap.PAGESIZE, chunk_size - chunk_size % mmap.PAGESIZE)
+    can_release = hasattr(mmap, 'MADV_DONTNEED')
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        for start in range(0, size, chunk_size):
+            yield mapped[start:start + chunk_size]
+            if can_release:
+                mapped.madvise(mmap.MADV_DONTNEED, start, min(chunk_size, size - start))
+
+def iter_json_records(
+    chunks: Iterable[str],
+    record_keys: Sequence[str] = ('data', 'weather_data'),
+) -> Iterator[Any]:
+    """Parse records from JSON text incrementally.
+
+    Args:
+        chunks: JSON text in chunks
+        record_keys: Keys of a top-level object holding the record array
+            (the first one present is used)
+
+    Yields:
+        Decoded records
+
+    Raises:
+        ValueError: If the text is not valid JSON or not an object/array
+    """
+    stream = _JSONStream(chunks)
+    first = stream.peek()
+    if first == '[':
+        yield from stream.iter_array()
+    elif first == '{':
+        stream.advance()
+        fields: Dict[str, Any] = {}
+        streamed = False
+        while True:
+            if stream.peek() == '}':
+                stream.advance()
+                break
+            key = stream.value()
+            stream.expect(':')
+            if not streamed and key in record_keys and stream.peek() == '[':
+                yield from stream.iter_array()
+                streamed = True
+            else:
+                fields[key] = stream.value()
+            if stream.peek() == ',':
+                stream.advance()
+        if not streamed:
+            # The object itself is the only record
+            yield fields
+    else:
+        raise ValueError("Invalid JSON structure. Expected object or array.")
+    if stream.peek():
+        raise ValueError("Extra data after JSON document")
+
+def iter_csv_records(chunks: Iterable[str]) -> Iterator[Dict[str, Optional[str]]]:
+    """Parse CSV rows incrementally.
+
+    Args:
+        chunks: CSV text in chunks (first row is the header)
+
+    Yields:
+        Dict of header -> value for each row
+    """
+    yield from csv.DictReader(_iter_lines(chunks))
+
+def _iter_lines(chunks: Iterable[str]) -> Iterator[str]:
+    rest = ''
+    for chunk in chunks:
+        lines = (rest + chunk).split('\n')
+        rest = lines.pop()
+        for line in lines:
+            yield line + '\n'
+    if rest:
+        yield rest
+
+class _JSONStream:
+    """Cursor over JSON text arriving in chunks."""
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._text = ''
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk; False at end of input."""
+        if self._eof:
+            return False
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+            return False
+        self._text = self._text[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and get the next character ('' at end of input)."""
+        while True:
+            while self._pos < len(self._text) and self._text[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+            if not self._fill():
+                return ''
+
+    def advance(self) -> None:
+        self._pos += 1
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in JSON, found {found!r}")
+        self.advance()
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._text, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A value ending at the buffer end may continue (e.g. a number)
+            if end == len(self._text) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def iter_array(self) -> Iterator[Any]:
+        """Decode the elements of the next array one at a time."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.advance()
+            return
+        while True:
+            yield self.value()
+            separator = self.peek()
+            self.advance()
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError(f"Expected ',' or ']' in JSON array, found {separator!r}")
@@ -0,0 +1,303 @@
+"""Binary columnar weather files (framework layer).
+
+JSON/CSV weather files are parsed record by record on every command. The
+columnar formats store a WeatherSeries as its arrays, so loading 30 years of
+daily data is a few array reads:
+
+- .npz: NumPy zip archive (readable with numpy.load) with one .npy member
+  per column (ordinals, optional day_microseconds, one per WeatherData
+  variable) and a metadata.json member. The ordinals member is stored
+  uncompressed and memory-mapped, so a date range is located by binary
+  search without reading the columns; value columns are DEFLATE-compressed
+  (compress=True, default) or stored uncompressed and memory-mapped
+  (compress=False), in which case a range read only touches its pages.
+- .parquet: Apache Parquet (requires pyarrow), zstd-compressed with one row
+  group per calendar year (on a sorted series), so date-range filters skip
+  whole row groups.
+
+The format is chosen by file extension (see is_columnar_weather_file).
+"""
+
+import json
+import os
+import struct
+import tempfile
+import zipfile
+from datetime import date, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from agrr_core.entity.entities.weather_series_entity import WEATHER_VARIABLES, WeatherSeries
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:  # Optional dependency
+    pa = None
+    pq = None
+    PARQUET_AVAILABLE = False
+
+COLUMNAR_EXTENSIONS = ('.npz', '.parquet')
+
+FORMAT_NAME = 'agrr-weather-columns'
+FORMAT_VERSION = 1
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_METADATA_MEMBER = 'metadata.json'
+# Local file header of a zip member: fixed part and name/extra field lengths
+_ZIP_LOCAL_HEADER = struct.Struct('<4s22xHH')
+
+def is_columnar_weather_file(file_path: str) -> bool:
+    """Check whether a path has a columnar weather file extension."""
+    return os.path.splitext(file_path)[1].lower() in COLUMNAR_EXTENSIONS
+
+def write_weather_columns(
+    series: WeatherSeries,
+    file_path: str,
+    location: Optional[Dict[str, Any]] = None,
+    compress: bool = True,
+) -> None:
+    """Write a weather series to a columnar file (atomically).
+
+    Args:
+        series: Weather series
+        file_path: Destination (.npz or .parquet)
+        location: Optional location information stored as metadata
+        compress: Compress value columns (.npz; Parquet is always compressed)
+
+    Raises:
+        ValueError: If the extension is not columnar or the series has a
+            time zone that is not a fixed offset
+        ImportError: If Parquet is requested without pyarrow
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in COLUMNAR_EXTENSIONS:
+        raise ValueError(f"Unsupported columnar weather format: {extension}")
+    metadata = _metadata(series, location)
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=extension + '.tmp')
+    os.close(fd)
+    try:
+        if extension == '.npz':
+            _write_npz(series, tmp_path, metadata, compress)
+        else:
+            _write_parquet(series, tmp_path, metadata)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def read_weather_columns(
+    file_path: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    use_mmap: bool = True,
+) -> WeatherSeries:
+    """Read a weather series from a columnar file.
+
+    Args:
+        file_path: Source (.npz or .parquet)
+        start_date: Only read records from this date (inclusive)
+        end_date: Only read records up to this date (inclusive)
+        use_mmap: Memory-map uncompressed columns
+
+    Returns:
+        WeatherSeries (sharing memory-mapped arrays where possible)
+
+    Raises:
+        ValueError: If the file is not a columnar weather file
+        ImportError: If a Parquet file is read without pyarrow
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == '.npz':
+        return _read_npz(file_path, start_date, end_date, use_mmap)
+    if extension == '.parquet':
+        return _read_parquet(file_path, start_date, end_date, use_mmap)
+    raise ValueError(f"Unsupported columnar weather format: {extension}")
+
+def _metadata(series: WeatherSeries, location: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    tz_offset = None
+    if series.tzinfo is not None:
+        if not isinstance(series.tzinfo, timezone):
+            raise ValueError("Only fixed-offset time zones can be stored in columnar weather files")
+        tz_offset = series.tzinfo.utcoffset(None).total_seconds()
+    return {
+        'format': FORMAT_NAME,
+        'version': FORMAT_VERSION,
+        'records': len(series),
+        'sorted': series.is_sorted,
+        'tz_offset_seconds': tz_offset,
+        'location': location,
+    }
+
+def _tz_from_metadata(metadata: Dict[str, Any]) -> Optional[timezone]:
+    offset = metadata.get('tz_offset_seconds')
+    return None if offset is None else timezone(timedelta(seconds=offset))
+
+def _check_metadata(metadata: Dict[str, Any], file_path: str) -> None:
+    if metadata.get('format') != FORMAT_NAME:
+        raise ValueError(f"Not a columnar weather file: {file_path}")
+    if metadata.get('version', 0) > FORMAT_VERSION:
+        raise ValueError(
+            f"Columnar weather file version {metadata['version']} is newer than supported "
+            f"({FORMAT_VERSION}): {file_path}"
+        )
+
+def _range(
+    ordinals: np.ndarray, is_sorted: bool, start_date: Optional[date], end_date: Optional[date]
+) -> Any:
+    """Get the index (slice on sorted ordinals, else positions) of a date range."""
+    start = start_date.toordinal() if start_date else None
+    end = end_date.toordinal() if end_date else None
+    if is_sorted:
+        lo = int(np.searchsorted(ordinals, start, side='left')) if start is not None else 0
+        hi = int(np.searchsorted(ordinals, end, side='right')) if end is not None else len(ordinals)
+        return slice(lo, max(lo, hi))
+    mask = np.ones(len(ordinals), dtype=bool)
+    if start is not None:
+        mask &= ordinals >= start
+    if end is not None:
+        mask &= ordinals <= end
+    return np.flatnonzero(mask)
+
+# ===== NPZ =====
+
+def _write_npz(
+    series: WeatherSeries, file_path: str, metadata: Dict[str, Any], compress: bool
+) -> None:
+    value_compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    members = [('ordinals', series.ordinals, zipfile.ZIP_STORED)]
+    if series.day_microseconds is not None:
+        members.append(('day_microseconds', series.day_microseconds, value_compression))
+    members.extend((name, series.column(name), value_compression) for name in WEATHER_VARIABLES)
+
+    with zipfile.ZipFile(file_path, 'w', allowZip64=True) as archive:
+        for name, values, compression in members:
+            info = zipfile.ZipInfo(f"{name}.npy", date_time=(1980, 1, 1, 0, 0, 0))
+            info.compress_type = compression
+            with archive.open(info, 'w', force_zip64=True) as member:
+                np.lib.format.write_array(member, np.ascontiguousarray(values), allow_pickle=False)
+        archive.writestr(_METADATA_MEMBER, json.dumps(metadata))
+
+def _read_npz(
+    file_path: str, start_date: Optional[date], end_date: Optional[date], use_mmap: bool
+) -> WeatherSeries:
+    with zipfile.ZipFile(file_path) as archive:
+        names = set(archive.namelist())
+        if _METADATA_MEMBER not in names:
+            raise ValueError(f"Not a columnar weather file: {file_path}")
+        metadata = json.loads(archive.read(_METADATA_MEMBER))
+        _check_metadata(metadata, file_path)
+
+        def load(name: str) -> np.ndarray:
+            return _load_npy_member(file_path, archive, archive.getinfo(f"{name}.npy"), use_mmap)
+
+        ordinals = load('ordinals')
+        index = _range(ordinals, metadata.get('sorted', False), start_date, end_date)
+        columns = {
+            name: load(name)[index] for name in WEATHER_VARIABLES if f"{name}.npy" in names
+        }
+        micros = load('day_microseconds')[index] if 'day_microseconds.npy' in names else None
+
+    return WeatherSeries.from_arrays(
+        ordinals[index], columns, day_microseconds=micros, tz=_tz_from_metadata(metadata)
+    )
+
+def _load_npy_member(
+    file_path: str, archive: zipfile.ZipFile, info: zipfile.ZipInfo, use_mmap: bool
+) -> np.ndarray:
+    """Load a .npy member, memory-mapping it when stored uncompressed."""
+    if not (use_mmap and info.compress_type == zipfile.ZIP_STORED):
+        with archive.open(info) as member:
+            return np.lib.format.read_array(member, allow_pickle=False)
+
+    with open(file_path, 'rb') as f:
+        f.seek(info.header_offset)
+        signature, name_length, extra_length = _ZIP_LOCAL_HEADER.unpack(
+            f.read(_ZIP_LOCAL_HEADER.size)
+        )
+        if signature != b'PK\x03\x04':
+            raise ValueError(f"Corrupt zip member {info.filename} in {file_path}")
+        f.seek(name_length + extra_length, os.SEEK_CUR)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    if not shape or shape[0] == 0:
+        return np.zeros(shape, dtype=dtype)
+    return np.memmap(
+        file_path, dtype=dtype, mode='r', offset=offset, shape=shape,
+        order='F' if fortran_order else 'C',
+    )
+
+# ===== Parquet =====
+
+def _require_pyarrow() -> None:
+    if not PARQUET_AVAILABLE:
+        raise ImportError(
+            "Parquet weather files require pyarrow. Install with: pip install pyarrow "
+            "(or use the .npz format)"
+        )
+
+def _write_parquet(series: WeatherSeries, file_path: str, metadata: Dict[str, Any]) -> None:
+    _require_pyarrow()
+    arrays = {
+        'date': pa.array((series.ordinals - _EPOCH_ORDINAL).astype(np.int32)).cast(pa.date32()),
+    }
+    if series.day_microseconds is not None:
+        arrays['day_microseconds'] = pa.array(series.day_microseconds)
+    for name in WEATHER_VARIABLES:
+        arrays[name] = pa.array(series.column(name), from_pandas=True)  # NaN -> null
+
+    table = pa.table(arrays).replace_schema_metadata({FORMAT_NAME: json.dumps(metadata)})
+    with pq.ParquetWriter(file_path, table.schema, compression='zstd') as writer:
+        if not len(table):
+            writer.write_table(table)
+        for lo, hi in _year_runs(series.ordinals):
+            writer.write_table(table.slice(lo, hi - lo))
+
+def _year_runs(ordinals: np.ndarray) -> List[Tuple[int, int]]:
+    """Get (start, stop) positions of consecutive records in the same calendar year.
+
+    On a sorted series there is one run (Parquet row group) per year.
+    """
+    years = (ordinals - _EPOCH_ORDINAL).astype('datetime64[D]').astype('datetime64[Y]')
+    bounds = [0, *(np.flatnonzero(years[1:] != years[:-1]) + 1).tolist(), len(ordinals)]
+    return [(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+def _read_parquet(
+    file_path: str, start_date: Optional[date], end_date: Optional[date], use_mmap: bool
+) -> WeatherSeries:
+    _require_pyarrow()
+    schema = pq.read_schema(file_path, memory_map=use_mmap)
+    raw_metadata = (schema.metadata or {}).get(FORMAT_NAME.encode())
+    if raw_metadata is None:
+        raise ValueError(f"Not a columnar weather file: {file_path}")
+    metadata = json.loads(raw_metadata)
+    _check_metadata(metadata, file_path)
+
+    filters = []
+    if start_date:
+        filters.append(('date', '>=', start_date))
+    if end_date:
+        filters.append(('date', '<=', end_date))
+    table = pq.read_table(file_path, filters=filters or None, memory_map=use_mmap)
+
+    ordinals = table['date'].cast(pa.int32()).to_numpy().astype(np.int64) + _EPOCH_ORDINAL
+    columns = {
+        name: table[name].to_numpy(zero_copy_only=False).astype(np.float64)
+        for name in WEATHER_VARIABLES if name in table.column_names
+    }
+    micros = None
+    if 'day_microseconds' in table.column_names:
+        micros = table['day_microseconds'].to_numpy()
+    return WeatherSeries.from_arrays(
+        ordinals, columns, day_microseconds=micros, tz=_tz_from_metadata(metadata)
+    )
@@ -0,0 +1,148 @@
+"""Cache of chosen ARIMA orders and fitted parameters (Framework layer).
+
+ARIMAPredictionService fits a (5,d,5) model from scratch for every metric on
+every call and runs a stationarity test each time. For a station forecast
+daily the series only grows by a few days between runs, so the cache keeps,
+per (station, metric):
+
+- the order chosen by the last order search (and its differencing d),
+- the fitted parameters of the last fit, used as start parameters of the
+  next fit (warm start, a few optimizer iterations instead of a full fit),
+- the tail of the series it was fitted on, so a cached entry is only used
+  for a continuation of the same series.
+
+Entries live in memory and, when a root directory is given, in
+<root>/<station>/<metric>.json (written atomically) so separate CLI runs and
+daemon workers share them.
+"""
+
+import json
+import os
+import re
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Series values compared to recognise a continuation of a cached series
+TAIL_LENGTH = 14
+
+@dataclass
+class ARIMAFitState:
+    """Order and parameters of the last fit of a (station, metric) series.
+
+    Fields:
+        order: ARIMA order (p, d, q)
+        seasonal_order: Seasonal order (P, D, Q, s)
+        params: Fitted parameters (start parameters of the next fit)
+        aic: AIC of the fit
+        last_date: Last date of the fitted series (ISO format)
+        searched_date: Last date of the series the order was searched on
+        tail: Last TAIL_LENGTH values of the fitted series
+    """
+
+    order: Tuple[int, int, int]
+    seasonal_order: Tuple[int, int, int, int]
+    params: List[float]
+    aic: Optional[float]
+    last_date: str
+    searched_date: str
+    tail: List[float]
+
+    def continues(self, dates: Sequence[datetime], values: Sequence[float]) -> bool:
+        """Check whether a series continues the fitted one (same values up to last_date)."""
+        last_date = datetime.fromisoformat(self.last_date).date()
+        for index in range(len(dates) - 1, -1, -1):
+            day = dates[index].date()
+            if day == last_date:
+                break
+            if day < last_date:
+                return False
+        else:
+            return False
+
+        start = index + 1 - len(self.tail)
+        if start < 0:
+            return False
+        return bool(np.allclose(values[start:index + 1], self.tail, rtol=0.0, atol=1e-9))
+
+    def age_days(self, dates: Sequence[datetime]) -> int:
+        """Days between the order search and the end of a series."""
+        return (dates[-1].date() - datetime.fromisoformat(self.searched_date).date()).days
+
+class ARIMAOrderCache:
+    """Per-station/metric cache of ARIMA fit states.
+
+    Usage:
+        cache = ARIMAOrderCache("~/.cache/agrr/models/arima")
+        state = cache.get(station, metric)
+        ...
+        cache.put(station, metric, new_state)
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        """Initialize cache.
+
+        Args:
+            root: Directory for persisted entries (None: in memory only)
+        """
+        self.root = os.path.expanduser(root) if root else None
+        self._entries: Dict[Tuple[str, str], ARIMAFitState] = {}
+        self._lock = threading.Lock()
+
+    def get(self, station: str, metric: str) -> Optional[ARIMAFitState]:
+        """Get the fit state of a series (None if absent or unreadable)."""
+        key = (str(station), metric)
+        with self._lock:
+            state = self._entries.get(key)
+        if state is not None or self.root is None:
+            return state
+
+        try:
+            with open(self._path(*key), encoding='utf-8') as f:
+                data = json.load(f)
+            state = ARIMAFitState(
+                order=tuple(data['order']),
+                seasonal_order=tuple(data['seasonal_order']),
+                params=[float(p) for p in data['params']],
+                aic=data.get('aic'),
+                last_date=data['last_date'],
+                searched_date=data['searched_date'],
+                tail=[float(v) for v in data['tail']],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        with self._lock:
+            self._entries[key] = state
+        return state
+
+    def put(self, station: str, metric: str, state: ARIMAFitState) -> None:
+        """Store the fit state of a series."""
+        key = (str(station), metric)
+        with self._lock:
+            self._entries[key] = state
+        if self.root is None:
+            return
+
+        path = self._path(*key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(asdict(state), f, indent=2)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _path(self, station: str, metric: str) -> str:
+        return os.path.join(self.root, _safe_name(station), f"{_safe_name(metric)}.json")
+
+def _safe_name(name: str) -> str:
+    """Make an identifier usable as a file name."""
+    return re.sub(r'[^A-Za-z0-9._-]', '_', str(name)) or '_'
@@ -1,27 +1,82 @@
 """ARIMA-based weather prediction service implementation (Framework layer)."""
 
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Dict, Any, ContextManager, Optional, Sequence, Tuple
 import numpy as np
 from datetime import datetime, timedelta
 
 from agrr_core.entity import WeatherData, Forecast
 from agrr_core.entity.exceptions.prediction_error import PredictionError
+from agrr_core.framework.services.ml.arima_order_cache import (
+    TAIL_LENGTH,
+    ARIMAFitState,
+    ARIMAOrderCache,
+)
+from agrr_core.framework.services.ml.shared_dataset_inputs import (
+    SharedDatasetInputs,
+    shares_dataset_inputs,
+)
+from agrr_core.framework.services.ml.station_key import station_key
 from agrr_core.framework.services.utils.interpolation_service import InterpolationService
 from agrr_core.adapter.interfaces.ml.prediction_service_interface import PredictionServiceInterface
 from agrr_core.adapter.interfaces.ml.time_series_service_interface import TimeSeriesServiceInterface
 
+# Candidate (p, q) pairs of the automatic order search (d from the stationarity test)
+DEFAULT_ORDER_CANDIDATES = ((5, 5), (2, 2), (1, 1), (3, 0), (0, 3))
+
+def _fit_order_candidate(
+    time_series_service: TimeSeriesServiceInterface,
+    data: List[float],
+    order: Tuple[int, int, int],
+    seasonal_order: Tuple[int, int, int, int]
+):
+    """Fit one order search candidate (None if it cannot be fitted)."""
+    try:
+        return time_series_service.create_model(data, order, seasonal_order).fit()
+    except Exception:
+        return None
+
 class ARIMAPredictionService(PredictionServiceInterface):
-    """ARIMA-based prediction service (Framework layer implementation)."""
+    """ARIMA-based prediction service (Framework layer implementation).
     
-    def __init__(self, time_series_service: TimeSeriesServiceInterface):
+    With an order cache, the order of each (station, metric) series is chosen
+    by a bounded search over order_candidates (lowest AIC) when the cache is
+    cold or stale, and later fits of the same, grown series warm-start from the
+    cached parameters with at most warm_start_maxiter optimizer iterations and
+    skip the stationarity test. The station is model_config['station_id'],
+    else derived from the series (see station_key). An explicit 'order' in
+    model_config bypasses the cache.
+    """
+    
+    def __init__(
+        self,
+        time_series_service: TimeSeriesServiceInterface,
+        order_cache: Optional[ARIMAOrderCache] = None,
+        order_candidates: Sequence[Tuple[int, int]] = DEFAULT_ORDER_CANDIDATES,
+        search_workers: int = 1,
+        warm_start_maxiter: int = 10,
+        max_order_age_days: int = 30
+    ):
         """
         Initialize ARIMA prediction service.
         
         Args:
             time_series_service: Time series service for ARIMA operations
+            order_cache: Optional cache of chosen orders and fitted parameters
+            order_candidates: (p, q) pairs tried by the order search
+            search_workers: Processes fitting order candidates in parallel (<= 1: serial)
+            warm_start_maxiter: Optimizer iterations of a warm-started fit
+            max_order_age_days: Days of new data after which the order is searched again
         """
         self.time_series_service = time_series_service
+        self.order_cache = order_cache
+        self.order_candidates = tuple(order_candidates)
+        self.search_workers = search_workers
+        self.warm_start_maxiter = warm_start_maxiter
+        self.max_order_age_days = max_order_age_days
     
+    @shares_dataset_inputs
     def predict(
         self,
         historical_data: List[WeatherData],
@@ -58,6 +113,11 @@ class ARIMAPredictionService(PredictionServiceInterface):
         """Get minimum required data days (implements PredictionModelInterface)."""
         return 30
     
+    def dataset_scope(self) -> ContextManager[None]:
+        """Share derived dataset inputs within the block (implements PredictionServiceInterface)."""
+        return SharedDatasetInputs.scope()
+    
+    @shares_dataset_inputs
     def predict_multiple_metrics(
         self, 
         historical_data: List[WeatherData], 
@@ -89,29 +149,10 @@ class ARIMAPredictionService(PredictionServiceInterface):
         if len(data) < 30:
             raise PredictionError(f"Insufficient data for {metric}. Need at least 30 data points.")
         
-        # Check stationarity to determine ARIMA parameters
-        # Let ARIMA handle differencing internally via the 'd' parameter
-        is_stationary = self.time_series_service.check_stationarity(data)
-        
-        # Fit ARIMA model
-        # If data is non-stationary, use d=1 for first-order differencing
-        # If data is already stationary, use d=0
-        # Use higher-order AR and MA terms for better long-term predictions
-        order = model_config.get('order', (5, 0 if is_stationary else 1, 5))
-        # Use non-seasonal model by default (seasonal_order=(0,0,0,0))
-        # For daily data, seasonal patterns are better captured by higher-order AR terms
-        # Note: seasonal_order=None is not supported by statsmodels, use (0,0,0,0) instead
-        seasonal_order = model_config.get('seasonal_order', (0, 0, 0, 0))
-        
-        try:
-            model = self.time_series_service.create_model(data, order, seasonal_order)
-            fitted_model = model.fit()
-        except Exception as e:
-            # Try simpler model if complex one fails
-            # Use simpler non-seasonal model
-            order = (2, 0 if is_stationary else 1, 2)
-            model = self.time_series_service.create_model(data, order, (0, 0, 0, 0))
-            fitted_model = model.fit()
+        if self.order_cache is not None and 'order' not in model_config:
+            fitted_model = self._fit_with_order_cache(historical_data, data, metric, model_config)
+        else:
+            fitted_model = self._fit_default_order(data, model_config)
         
         # Make predictions
         prediction_days = model_config.get('prediction_days', 30)
@@ -152,8 +193,116 @@ class ARIMAPredictionService(PredictionServiceInterface):
         
         return forecasts
     
+    def _fit_default_order(self, data: List[float], model_config: Dict[str, Any]):
+        """Fit the configured (default (5,d,5)) order, falling back to (2,d,2)."""
+        # Check stationarity to determine ARIMA parameters
+        # Let ARIMA handle differencing internally via the 'd' parameter
+        is_stationary = self.time_series_service.check_stationarity(data)
+        
+        # Fit ARIMA model
+        # If data is non-stationary, use d=1 for first-order differencing
+        # If data is already stationary, use d=0
+        # Use higher-order AR and MA terms for better long-term predictions
+        order = model_config.get('order', (5, 0 if is_stationary else 1, 5))
+        # Use non-seasonal model by default (seasonal_order=(0,0,0,0))
+        # For daily data, seasonal patterns are better captured by higher-order AR terms
+        # Note: seasonal_order=None is not supported by statsmodels, use (0,0,0,0) instead
+        seasonal_order = model_config.get('seasonal_order', (0, 0, 0, 0))
+        
+        try:
+            model = self.time_series_service.create_model(data, order, seasonal_order)
+            return model.fit()
+        except Exception as e:
+            # Try simpler model if complex one fails
+            # Use simpler non-seasonal model
+            order = (2, 0 if is_stationary else 1, 2)
+            model = self.time_series_service.create_model(data, order, (0, 0, 0, 0))
+            return model.fit()
+    
+    def _fit_with_order_cache(
+        self,
+        historical_data: List[WeatherData],
+        data: List[float],
+        metric: str,
+        model_config: Dict[str, Any]
+    ):
+        """Warm-start from the cached fit of the series, or search an order."""
+        station = station_key(historical_data, model_config)
+        seasonal_order = tuple(model_config.get('seasonal_order', (0, 0, 0, 0)))
+        dates = [weather_data.time for weather_data in historical_data]
+        state = self.order_cache.get(station, metric)
+        
+        fitted_model = None
+        searched_date = dates[-1].date().isoformat()
+        if (
+            state is not None
+            and state.seasonal_order == seasonal_order
+            and state.continues(dates, data)
+            and state.age_days(dates) <= self.max_order_age_days
+        ):
+            try:
+                fitted_model = self.time_series_service.create_model(
+                    data, state.order, seasonal_order
+                ).fit(start_params=state.params, maxiter=self.warm_start_maxiter)
+                searched_date = state.searched_date
+            except Exception:
+                fitted_model = None
+            if fitted_model is not None and fitted_model.order != state.order:
+                fitted_model = None  # Fell back to another order; search again
+        
+        if fitted_model is None:
+            fitted_model = self._search_order(data, seasonal_order)
+            searched_date = dates[-1].date().isoformat()
+        
+        if fitted_model.order is not None and fitted_model.params is not None:
+            self.order_cache.put(station, metric, ARIMAFitState(
+                order=fitted_model.order,
+                seasonal_order=seasonal_order,
+                params=fitted_model.params,
+                aic=fitted_model.aic,
+                last_date=dates[-1].date().isoformat(),
+                searched_date=searched_date,
+                tail=[float(value) for value in data[-TAIL_LENGTH:]],
+            ))
+        return fitted_model
+    
+    def _search_order(self, data: List[float], seasonal_order: Tuple[int, int, int, int]):
+        """Fit all order candidates and return the fit with the lowest AIC."""
+        d = 0 if self.time_series_service.check_stationarity(data) else 1
+        orders = [(p, d, q) for p, q in self.order_candidates]
+        
+        workers = min(self.search_workers, len(orders))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                fits = list(executor.map(
+                    _fit_order_candidate,
+                    repeat(self.time_series_service), repeat(data), orders, repeat(seasonal_order)
+                ))
+        else:
+            fits = [
+                _fit_order_candidate(self.time_series_service, data, order, seasonal_order)
+                for order in orders
+            ]
+        
+        fits = [fit for fit in fits if fit is not None]
+        if not fits:
+            raise PredictionError("ARIMA order search failed: no candidate order could be fitted")
+        return min(fits, key=lambda fit: fit.aic if fit.aic is not None else float('inf'))
+    
     def _extract_metric_data(self, historical_data: List[WeatherData], metric: str) -> List[float]:
-        """Extract data for specific metric with linear interpolation for missing values."""
+        """Extract data for specific metric with linear interpolation for missing values.
+        
+        The interpolated series is computed once per dataset and call (see SharedDatasetInputs).
+        """
+        series = SharedDatasetInputs.for_dataset(historical_data).get_or_compute(
+            ('arima_series', metric),
+            lambda: self._interpolate_metric_data(historical_data, metric)
+        )
+        return list(series)
+    
+    @staticmethod
+    def _interpolate_metric_data(historical_data: List[WeatherData], metric: str) -> List[float]:
+        """Extract the values of a metric and interpolate missing ones."""
         data = []
         
         # Extract raw data (including None values)
@@ -255,6 +404,7 @@ class ARIMAPredictionService(PredictionServiceInterface):
         return adjusted_forecasts
     
     
+    @shares_dataset_inputs
     def evaluate_model_accuracy(
         self,
         test_data: List[WeatherData],
@@ -292,6 +442,7 @@ class ARIMAPredictionService(PredictionServiceInterface):
             'mape': mape
         }
     
+    @shares_dataset_inputs
     def train_model(
         self,
         training_data: List[WeatherData],
@@ -317,6 +468,7 @@ class ARIMAPredictionService(PredictionServiceInterface):
             'recommended_seasonal_order': (1, 1, 1, 12)
         }
     
+    @shares_dataset_inputs
     def predict_with_confidence_intervals(
         self,
         historical_data: List[WeatherData],
@@ -332,6 +484,7 @@ class ARIMAPredictionService(PredictionServiceInterface):
             'prediction_days': prediction_days
         })
     
+    @shares_dataset_inputs
     def batch_predict(
         self,
         historical_data_list: List[List[WeatherData]],
@@ -0,0 +1,205 @@
+"""Process pool for multi-location batch prediction (Framework layer).
+
+Batch prediction trains LightGBM/ARIMA models for every location, one after
+another in the calling process. The locations are independent, so this
+BatchPredictionExecutor implementation spreads them over worker processes:
+
+- Bounded: at most max_workers processes, and at most two locations per
+  worker are submitted at a time
+- Failure isolation: an exception while predicting a location becomes that
+  location's error; a worker process that dies (e.g. killed by the OS) is
+  replaced, and the locations it may have been running are re-run one at a
+  time so only the one that crashes again is reported as failed
+- Progress: an optional callback receives a BatchPredictionProgress after
+  every finished location (exceptions it raises propagate from run())
+- Peak-memory cap: max_memory_mb is split evenly over the workers and set as
+  each worker's data size limit (RLIMIT_DATA), on top of the data size the
+  worker already has when it starts (a forked worker inherits its parent's);
+  allocations beyond it raise MemoryError, which fails only that location.
+  The worker count is reduced so that every worker gets at least
+  MIN_WORKER_MEMORY_MB.
+
+Results are returned in input order regardless of completion order.
+
+With max_workers <= 1 and no memory cap, locations run in-process (no pool).
+Worker processes inherit the predict callable when processes are forked
+(Linux); on platforms that spawn processes it must be picklable.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from agrr_core.usecase.gateways.batch_prediction_executor import (
+    BatchItemResult,
+    BatchPredictionExecutor,
+    BatchPredictionProgress,
+    run_batch_item,
+)
+
+MIN_WORKER_MEMORY_MB = 256
+
+# Per-process callable, set once by the pool initializer
+_worker_predict: Optional[Callable[[Any], Any]] = None
+
+def _data_size_bytes() -> int:
+    """Get the current process data size (VmData), 0 if unknown."""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmData:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0
+
+def _init_worker(predict: Callable[[Any], Any], memory_limit_bytes: Optional[int]) -> None:
+    global _worker_predict
+    _worker_predict = predict
+    if memory_limit_bytes and resource is not None:
+        memory_limit_bytes += _data_size_bytes()
+        _, hard = resource.getrlimit(resource.RLIMIT_DATA)
+        if hard != resource.RLIM_INFINITY:
+            memory_limit_bytes = min(memory_limit_bytes, hard)
+        resource.setrlimit(resource.RLIMIT_DATA, (memory_limit_bytes, hard))
+
+def _run_item_in_worker(item: Any) -> BatchItemResult:
+    return run_batch_item(_worker_predict, item)
+
+class BatchPredictionPool(BatchPredictionExecutor):
+    """Run one prediction per location, optionally on a process pool."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = 1,
+        max_memory_mb: Optional[int] = None,
+        progress_callback: Optional[Callable[[BatchPredictionProgress], None]] = None,
+    ):
+        """Initialize pool.
+
+        Args:
+            max_workers: Number of worker processes (<= 1: run in-process,
+                0 or None: os.cpu_count())
+            max_memory_mb: Memory budget of all workers together (None: no cap)
+            progress_callback: Called after every finished location
+        """
+        self.max_workers = 1 if max_workers is not None and max_workers < 0 else max_workers
+        self.max_memory_mb = max_memory_mb
+        self.progress_callback = progress_callback
+
+    def plan(self, item_count: int) -> Tuple[int, Optional[int]]:
+        """Get worker count and per-worker memory limit (bytes) for a batch.
+
+        Returns:
+            (workers, memory_limit_bytes); workers == 0 means in-process
+        """
+        workers = self.max_workers or os.cpu_count() or 1
+        workers = max(1, min(workers, item_count))
+        if not self.max_memory_mb:
+            return (0 if workers <= 1 else workers), None
+
+        workers = max(1, min(workers, self.max_memory_mb // MIN_WORKER_MEMORY_MB))
+        return workers, self.max_memory_mb * 1024 * 1024 // workers
+
+    def run(
+        self,
+        predict: Callable[[Any], Any],
+        items: Sequence[Any],
+        labels: Optional[Sequence[str]] = None,
+    ) -> List[BatchItemResult]:
+        """Predict all items and return results in input order.
+
+        Args:
+            predict: Prediction of one item (exceptions become error results)
+            items: Items to predict (e.g. locations or historical datasets)
+            labels: Names of the items for progress reporting
+
+        Returns:
+            List of results aligned with items
+        """
+        labels = list(labels) if labels is not None else [str(i) for i in range(len(items))]
+        results: List[Optional[BatchItemResult]] = [None] * len(items)
+        progress = {'completed': 0, 'failed': 0, 'start': time.time()}
+
+        def finish(index: int, result: BatchItemResult) -> None:
+            results[index] = result
+            progress['completed'] += 1
+            if result.error is not None:
+                progress['failed'] += 1
+            if self.progress_callback is not None:
+                self.progress_callback(BatchPredictionProgress(
+                    completed=progress['completed'],
+                    failed=progress['failed'],
+                    total=len(items),
+                    elapsed_seconds=time.time() - progress['start'],
+                    label=labels[index],
+                ))
+
+        workers, memory_limit = self.plan(len(items))
+        if workers == 0:
+            for index, item in enumerate(items):
+                finish(index, run_batch_item(predict, item))
+            return results
+
+        suspects = self._run_pool(predict, list(enumerate(items)), workers, memory_limit, finish)
+        for index, item in suspects:
+            # Re-run alone: a second crash identifies the location
+            if self._run_pool(predict, [(index, item)], 1, memory_limit, finish):
+                finish(index, BatchItemResult(
+                    error="Worker process terminated unexpectedly while predicting this location"
+                ))
+        return results
+
+    @staticmethod
+    def _run_pool(
+        predict: Callable[[Any], Any],
+        indexed_items: List[Tuple[int, Any]],
+        workers: int,
+        memory_limit: Optional[int],
+        finish: Callable[[int, BatchItemResult], None],
+    ) -> List[Tuple[int, Any]]:
+        """Run items on pools of `workers` processes, replacing broken pools.
+
+        Returns:
+            Items that were running when a worker process died
+        """
+        pending: Deque[Tuple[int, Any]] = deque(indexed_items)
+        suspects: List[Tuple[int, Any]] = []
+
+        while pending:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(predict, memory_limit),
+            ) as executor:
+                in_flight: Dict[Any, Tuple[int, Any]] = {}
+                broken = False
+                while (pending and not broken) or in_flight:
+                    while pending and not broken and len(in_flight) < workers * 2:
+                        index, item = pending.popleft()
+                        in_flight[executor.submit(_run_item_in_worker, item)] = (index, item)
+
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index, item = in_flight.pop(future)
+                        try:
+                            result = future.result()
+                        except BrokenProcessPool:
+                            broken = True
+                            suspects.append((index, item))
+                            continue
+                        except Exception as e:
+                            # e.g. result could not be sent back to the parent
+                            result = BatchItemResult(error=str(e))
+                        # Outside the try: a raising progress callback is not a location failure
+                        finish(index, result)
+
+        return suspects
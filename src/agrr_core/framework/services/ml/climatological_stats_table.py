@@ -0,0 +1,154 @@
+"""Climatological statistics table (Framework layer).
+
+Per-day-of-year statistics of every weather metric, used to fill the
+lag/rolling features of future dates:
+
+    table[metric, stat, ordinal]   stat in (count, mean, std, min, max)
+
+The ordinal is the day of year in a leap year (Jan 1 = 0, Feb 29 = 59,
+Dec 31 = 365), so every month-day has a fixed slot and lookups for future
+dates are plain array indexing.
+
+Statistics are computed with grouped NumPy reductions over all samples of
+the same month-day (std is the sample standard deviation, 0 for a single
+sample). Missing values (None/NaN) are ignored.
+
+Tables are cached per historical dataset (the list object), so the
+multi-metric, evaluate and ensemble paths predicting from the same data
+compute the statistics only once.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from agrr_core.entity import WeatherData, WeatherSeries
+from agrr_core.framework.services.ml.shared_dataset_inputs import SharedDatasetInputs
+
+DAYS = 366
+
+# Ordinal of the first day of each month in a leap year
+_MONTH_OFFSETS = np.cumsum([0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30])
+
+_WEATHER_FIELDS = {
+    'temperature': 'temperature_2m_mean',
+    'temperature_max': 'temperature_2m_max',
+    'temperature_min': 'temperature_2m_min',
+    'precipitation': 'precipitation_sum',
+    'sunshine': 'sunshine_duration',
+}
+
+def day_ordinals(dates: Sequence[datetime]) -> np.ndarray:
+    """Get leap-year day-of-year ordinals (0-365) of dates."""
+    months = np.fromiter((d.month for d in dates), dtype=np.int64, count=len(dates))
+    days = np.fromiter((d.day for d in dates), dtype=np.int64, count=len(dates))
+    return _MONTH_OFFSETS[months - 1] + days - 1
+
+def ordinal_to_month_day(ordinal: int) -> str:
+    """Convert an ordinal back to its "MM-DD" key."""
+    month = int(np.searchsorted(_MONTH_OFFSETS, ordinal, side='right'))
+    return f"{month:02d}-{ordinal - _MONTH_OFFSETS[month - 1] + 1:02d}"
+
+class ClimatologicalStatsTable:
+    """366 x metric table of climatological statistics.
+
+    Usage:
+        table = ClimatologicalStatsTable.for_dataset(historical_data)
+        means = table.get('temperature', 'mean')[day_ordinals(future_dates)]
+    """
+
+    METRICS = tuple(_WEATHER_FIELDS)
+    STATS = ('count', 'mean', 'std', 'min', 'max')
+
+    def __init__(self, table: np.ndarray):
+        """Initialize from a (metric, stat, day) array (see from_weather_data)."""
+        self.table = table
+
+    @classmethod
+    def from_weather_data(cls, historical_data: List[WeatherData]) -> 'ClimatologicalStatsTable':
+        """Compute statistics of all metrics from weather data.
+
+        Args:
+            historical_data: Historical weather data
+
+        Returns:
+            ClimatologicalStatsTable
+        """
+        if isinstance(historical_data, WeatherSeries):
+            ordinals = day_ordinals(historical_data.dates())
+        else:
+            ordinals = day_ordinals([d.time for d in historical_data])
+        table = np.full((len(cls.METRICS), len(cls.STATS), DAYS), np.nan)
+
+        for m, metric in enumerate(cls.METRICS):
+            field = _WEATHER_FIELDS[metric]
+            if isinstance(historical_data, WeatherSeries):
+                values = historical_data.column(field)
+            else:
+                values = np.array([getattr(d, field) for d in historical_data], dtype=np.float64)
+            valid = ~np.isnan(values)
+            days, values = ordinals[valid], values[valid]
+
+            count = np.bincount(days, minlength=DAYS).astype(np.float64)
+            present = count > 0
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = np.bincount(days, weights=values, minlength=DAYS) / count
+                squares = np.bincount(days, weights=(values - mean[days]) ** 2, minlength=DAYS)
+                std = np.where(count > 1, np.sqrt(squares / (count - 1)), 0.0)
+
+            minimum = np.full(DAYS, np.inf)
+            maximum = np.full(DAYS, -np.inf)
+            np.minimum.at(minimum, days, values)
+            np.maximum.at(maximum, days, values)
+
+            table[m, 0] = count
+            table[m, 1] = np.where(present, mean, np.nan)
+            table[m, 2] = np.where(present, std, np.nan)
+            table[m, 3] = np.where(present, minimum, np.nan)
+            table[m, 4] = np.where(present, maximum, np.nan)
+
+        return cls(table)
+
+    @classmethod
+    def for_dataset(cls, historical_data: List[WeatherData]) -> 'ClimatologicalStatsTable':
+        """Get the table of a historical dataset (cached, see SharedDatasetInputs)."""
+        return SharedDatasetInputs.for_dataset(historical_data).get_or_compute(
+            'climatological_stats', lambda: cls.from_weather_data(historical_data)
+        )
+
+    def get(self, metric: str, stat: str) -> np.ndarray:
+        """Get one statistic of a metric for all 366 days (NaN where no samples)."""
+        return self.table[self.METRICS.index(metric), self.STATS.index(stat)]
+
+    def has_samples(self, metric: str) -> np.ndarray:
+        """Get mask of days with at least one sample of the metric."""
+        return self.get(metric, 'count') > 0
+
+    def has_temperature_companions(self) -> np.ndarray:
+        """Get mask of days with mean, max and min temperature samples."""
+        return (
+            self.has_samples('temperature')
+            & self.has_samples('temperature_max')
+            & self.has_samples('temperature_min')
+        )
+
+    def to_dict(self, metric: str) -> Dict[str, Dict[str, float]]:
+        """Get statistics of a metric as "MM-DD" -> {mean, std, min, max}.
+
+        For temperature, days with max/min samples also include
+        temp_max_mean/temp_max_std/temp_min_mean/temp_min_std.
+        """
+        companions = self.has_temperature_companions() if metric == 'temperature' else None
+        stats = {}
+        for ordinal in np.flatnonzero(self.has_samples(metric)):
+            day_stats = {
+                stat: float(self.get(metric, stat)[ordinal])
+                for stat in ('mean', 'std', 'min', 'max')
+            }
+            if companions is not None and companions[ordinal]:
+                for prefix, companion in (('temp_max', 'temperature_max'), ('temp_min', 'temperature_min')):
+                    day_stats[f'{prefix}_mean'] = float(self.get(companion, 'mean')[ordinal])
+                    day_stats[f'{prefix}_std'] = float(self.get(companion, 'std')[ordinal])
+            stats[ordinal_to_month_day(int(ordinal))] = day_stats
+        return stats
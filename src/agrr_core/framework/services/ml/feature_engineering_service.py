@@ -6,10 +6,25 @@ import pandas as pd
 from datetime import datetime, timedelta
 
 from agrr_core.entity import WeatherData
+from agrr_core.entity.entities.weather_series_entity import WeatherSeries
+from agrr_core.framework.services.ml.climatological_stats_table import (
+    ClimatologicalStatsTable,
+    day_ordinals,
+)
+from agrr_core.framework.services.ml.shared_dataset_inputs import SharedDatasetInputs
 
 class FeatureEngineeringService:
     """Service for creating features from weather time series data."""
     
+    # Base DataFrame columns -> WeatherData fields
+    _BASE_COLUMNS = {
+        'temperature': 'temperature_2m_mean',
+        'temp_max': 'temperature_2m_max',
+        'temp_min': 'temperature_2m_min',
+        'precipitation': 'precipitation_sum',
+        'sunshine': 'sunshine_duration',
+    }
+    
     @staticmethod
     def create_features(
         historical_data: List[WeatherData],
@@ -30,15 +45,23 @@ class FeatureEngineeringService:
         if lookback_days is None:
             lookback_days = [1, 7, 14, 30]
         
-        # Extract base data
-        df = pd.DataFrame([{
-            'date': d.time,
-            'temperature': d.temperature_2m_mean,
-            'temp_max': d.temperature_2m_max,
-            'temp_min': d.temperature_2m_min,
-            'precipitation': d.precipitation_sum,
-            'sunshine': d.sunshine_duration,
-        } for d in historical_data])
+        # Extract base data (columns of a WeatherSeries are used as-is)
+        if isinstance(historical_data, WeatherSeries):
+            df = pd.DataFrame({
+                'date': historical_data.times(),
+                **{
+                    name: historical_data.column(field)
+                    for name, field in FeatureEngineeringService._BASE_COLUMNS.items()
+                },
+            })
+        else:
+            df = pd.DataFrame([{
+                'date': d.time,
+                **{
+                    name: getattr(d, field)
+                    for name, field in FeatureEngineeringService._BASE_COLUMNS.items()
+                },
+            } for d in historical_data])
         
         df['date'] = pd.to_datetime(df['date'])
         df = df.sort_values('date').reset_index(drop=True)
@@ -116,6 +139,34 @@ class FeatureEngineeringService:
         
         return df
     
+    @staticmethod
+    def create_features_cached(
+        historical_data: List[WeatherData],
+        metric: str,
+        lookback_days: List[int] = None
+    ) -> pd.DataFrame:
+        """
+        Get create_features() of a historical dataset, computed once per dataset and call.
+        
+        The frame is shared by all callers (see SharedDatasetInputs); copy it
+        before modifying.
+        
+        Args:
+            historical_data: Historical weather data
+            metric: Metric to predict
+            lookback_days: List of lookback periods for lag features (default: [1, 7, 14, 30])
+            
+        Returns:
+            DataFrame with engineered features
+        """
+        if lookback_days is None:
+            lookback_days = [1, 7, 14, 30]
+        
+        return SharedDatasetInputs.for_dataset(historical_data).get_or_compute(
+            ('features', metric, tuple(lookback_days)),
+            lambda: FeatureEngineeringService.create_features(historical_data, metric, lookback_days)
+        )
+    
     @staticmethod
     def create_future_features(
         historical_data: List[WeatherData],
@@ -142,7 +193,7 @@ class FeatureEngineeringService:
             lookback_days = [1, 7, 14, 30]
         
         # Create features from historical data
-        historical_features = FeatureEngineeringService.create_features(
+        historical_features = FeatureEngineeringService.create_features_cached(
             historical_data, metric, lookback_days
         )
         
@@ -153,115 +204,29 @@ class FeatureEngineeringService:
         last_date = historical_data[-1].time
         future_dates = [last_date + timedelta(days=i+1) for i in range(prediction_days)]
         
-        # Pre-compute climatological statistics for all month-day combinations
-        # This eliminates the O(N*M) complexity where N=prediction_days, M=historical_data
-        climatological_stats = FeatureEngineeringService._precompute_climatological_stats(
-            historical_data, metric
-        )
+        # Climatological statistics for all days of the year (cached per dataset)
+        climatological_stats = ClimatologicalStatsTable.for_dataset(historical_data)
         
-        future_rows = []
-        
-        for future_date in future_dates:
-            row = {}
-            row['date'] = future_date
-            
-            # Temporal features
-            row['year'] = future_date.year
-            row['month'] = future_date.month
-            row['day'] = future_date.day
-            row['day_of_year'] = future_date.timetuple().tm_yday
-            row['day_of_week'] = future_date.weekday()
-            row['week_of_year'] = future_date.isocalendar()[1]
-            row['is_weekend'] = 1 if future_date.weekday() >= 5 else 0
-            
-            # Cyclical encoding
-            row['month_sin'] = np.sin(2 * np.pi * row['month'] / 12)
-            row['month_cos'] = np.cos(2 * np.pi * row['month'] / 12)
-            row['day_of_year_sin'] = np.sin(2 * np.pi * row['day_of_year'] / 365)
-            row['day_of_year_cos'] = np.cos(2 * np.pi * row['day_of_year'] / 365)
-            
-            # Season flags
-            row['is_winter'] = 1 if row['month'] in [12, 1, 2] else 0
-            row['is_spring'] = 1 if row['month'] in [3, 4, 5] else 0
-            row['is_summer'] = 1 if row['month'] in [6, 7, 8] else 0
-            row['is_autumn'] = 1 if row['month'] in [9, 10, 11] else 0
-            
-            future_rows.append(row)
-        
-        future_df = pd.DataFrame(future_rows)
+        future_df = FeatureEngineeringService._create_future_calendar_features(future_dates)
         
         # Apply pre-computed climatological statistics
-        for i, future_date in enumerate(future_dates):
-            month_day = f"{future_date.month:02d}-{future_date.day:02d}"
-            
-            if month_day in climatological_stats:
-                stats = climatological_stats[month_day]
-                
-                # Apply climatological values for lag features
-                climatological_value = stats['mean']
-                for lag in lookback_days:
-                    future_df.loc[i, f'{target_col}_lag{lag}'] = climatological_value
-                
-                # Rolling statistics using climatological data
-                future_df.loc[i, f'{target_col}_ma7'] = climatological_value
-                future_df.loc[i, f'{target_col}_ma14'] = climatological_value
-                future_df.loc[i, f'{target_col}_ma30'] = climatological_value
-                future_df.loc[i, f'{target_col}_std7'] = stats['std']
-                future_df.loc[i, f'{target_col}_std14'] = stats['std']
-                future_df.loc[i, f'{target_col}_std30'] = stats['std']
-                future_df.loc[i, f'{target_col}_min7'] = stats['min']
-                future_df.loc[i, f'{target_col}_min14'] = stats['min']
-                future_df.loc[i, f'{target_col}_min30'] = stats['min']
-                future_df.loc[i, f'{target_col}_max7'] = stats['max']
-                future_df.loc[i, f'{target_col}_max14'] = stats['max']
-                future_df.loc[i, f'{target_col}_max30'] = stats['max']
-                future_df.loc[i, f'{target_col}_diff1'] = 0  # Unknown
-                future_df.loc[i, f'{target_col}_diff7'] = 0  # Unknown
-                future_df.loc[i, f'{target_col}_ema7'] = climatological_value
-                future_df.loc[i, f'{target_col}_ema30'] = climatological_value
-                
-                # Add temp_max and temp_min features for temperature metric
-                if metric == 'temperature' and 'temp_max_mean' in stats:
-                    climatological_max = stats['temp_max_mean']
-                    for lag in lookback_days:
-                        future_df.loc[i, f'temp_max_lag{lag}'] = climatological_max
-                    
-                    # Rolling statistics for temp_max
-                    future_df.loc[i, 'temp_max_ma7'] = climatological_max
-                    future_df.loc[i, 'temp_max_ma14'] = climatological_max
-                    future_df.loc[i, 'temp_max_ma30'] = climatological_max
-                    future_df.loc[i, 'temp_max_std7'] = stats['temp_max_std']
-                    future_df.loc[i, 'temp_max_std14'] = stats['temp_max_std']
-                    future_df.loc[i, 'temp_max_std30'] = stats['temp_max_std']
-                    
-                    climatological_min = stats['temp_min_mean']
-                    for lag in lookback_days:
-                        future_df.loc[i, f'temp_min_lag{lag}'] = climatological_min
-                    
-                    # Rolling statistics for temp_min
-                    future_df.loc[i, 'temp_min_ma7'] = climatological_min
-                    future_df.loc[i, 'temp_min_ma14'] = climatological_min
-                    future_df.loc[i, 'temp_min_ma30'] = climatological_min
-                    future_df.loc[i, 'temp_min_std7'] = stats['temp_min_std']
-                    future_df.loc[i, 'temp_min_std14'] = stats['temp_min_std']
-                    future_df.loc[i, 'temp_min_std30'] = stats['temp_min_std']
-            else:
-                # フォールバック禁止 - データがない場合はエラー
-                raise ValueError(
-                    f"No historical data found for date {future_date.strftime('%Y-%m-%d')} (month-day: {month_day}). "
-                    f"Metric: {metric}. Need at least 1 historical sample for climatological prediction."
-                )
+        FeatureEngineeringService._apply_climatological_features(
+            future_df, future_dates, metric, lookback_days, climatological_stats
+        )
         
         # Cross-metric features
         if metric == 'temperature' and 'temp_range' in historical_features.columns:
-            # Use historical mean range for this season
-            for i, future_date in enumerate(future_dates):
-                month = future_date.month
+            # Use historical mean range for this season (computed once per month)
+            month_ranges = {}
+            for month in {future_date.month for future_date in future_dates}:
                 historical_month_data = historical_features[historical_features['month'] == month]
                 if len(historical_month_data) > 0:
-                    future_df.loc[i, 'temp_range'] = historical_month_data['temp_range'].mean()
+                    month_ranges[month] = historical_month_data['temp_range'].mean()
                 else:
-                    future_df.loc[i, 'temp_range'] = historical_features['temp_range'].iloc[-1]
+                    month_ranges[month] = historical_features['temp_range'].iloc[-1]
+            FeatureEngineeringService._assign_future_columns(future_df, {
+                'temp_range': [month_ranges[future_date.month] for future_date in future_dates],
+            })
             
             if 'has_precipitation' in historical_features.columns:
                 future_df['has_precipitation'] = 0  # Unknown
@@ -272,6 +237,145 @@ class FeatureEngineeringService:
         
         return future_df
     
+    @staticmethod
+    def _create_future_calendar_features(future_dates: List[datetime]) -> pd.DataFrame:
+        """Create date and temporal feature columns for future dates.
+        
+        Args:
+            future_dates: Dates to create features for
+            
+        Returns:
+            DataFrame with one row per date (same columns as create_features' temporal features)
+        """
+        if not future_dates:
+            return pd.DataFrame()
+        
+        months = [d.month for d in future_dates]
+        days_of_year = [d.timetuple().tm_yday for d in future_dates]
+        days_of_week = [d.weekday() for d in future_dates]
+        
+        # Trigonometric values are computed per element (as scalars) so they
+        # match the historical feature rows bit for bit
+        return pd.DataFrame({
+            'date': future_dates,
+            'year': [d.year for d in future_dates],
+            'month': months,
+            'day': [d.day for d in future_dates],
+            'day_of_year': days_of_year,
+            'day_of_week': days_of_week,
+            'week_of_year': [d.isocalendar()[1] for d in future_dates],
+            'is_weekend': [1 if w >= 5 else 0 for w in days_of_week],
+            'month_sin': [np.sin(2 * np.pi * m / 12) for m in months],
+            'month_cos': [np.cos(2 * np.pi * m / 12) for m in months],
+            'day_of_year_sin': [np.sin(2 * np.pi * y / 365) for y in days_of_year],
+            'day_of_year_cos': [np.cos(2 * np.pi * y / 365) for y in days_of_year],
+            'is_winter': [1 if m in [12, 1, 2] else 0 for m in months],
+            'is_spring': [1 if m in [3, 4, 5] else 0 for m in months],
+            'is_summer': [1 if m in [6, 7, 8] else 0 for m in months],
+            'is_autumn': [1 if m in [9, 10, 11] else 0 for m in months],
+        })
+    
+    @staticmethod
+    def _apply_climatological_features(
+        future_df: pd.DataFrame,
+        future_dates: List[datetime],
+        metric: str,
+        lookback_days: List[int],
+        climatological_stats: ClimatologicalStatsTable
+    ) -> None:
+        """Fill lag/rolling feature columns of future rows with climatological values.
+        
+        Future dates are mapped to day-of-year ordinals once and every feature
+        column is taken from the statistics table as a whole. For temperature,
+        temp_max/temp_min cross-metric columns are set on rows whose day has
+        max and min samples.
+        
+        Args:
+            future_df: Future feature frame (modified in place)
+            future_dates: Dates of the rows of future_df
+            metric: Metric to fill features for
+            lookback_days: Lag periods
+            climatological_stats: Statistics table of the historical data
+            
+        Raises:
+            ValueError: If a future date has no historical sample
+        """
+        target_col = FeatureEngineeringService._get_target_column(metric)
+        ordinals = day_ordinals(future_dates)
+        
+        missing = np.flatnonzero(~climatological_stats.has_samples(metric)[ordinals])
+        if len(missing):
+            # フォールバック禁止 - データがない場合はエラー
+            future_date = future_dates[missing[0]]
+            month_day = f"{future_date.month:02d}-{future_date.day:02d}"
+            raise ValueError(
+                f"No historical data found for date {future_date.strftime('%Y-%m-%d')} (month-day: {month_day}). "
+                f"Metric: {metric}. Need at least 1 historical sample for climatological prediction."
+            )
+        
+        means = climatological_stats.get(metric, 'mean')[ordinals]
+        stds = climatological_stats.get(metric, 'std')[ordinals]
+        mins = climatological_stats.get(metric, 'min')[ordinals]
+        maxs = climatological_stats.get(metric, 'max')[ordinals]
+        
+        columns = {}
+        for lag in lookback_days:
+            columns[f'{target_col}_lag{lag}'] = means
+        for window in [7, 14, 30]:
+            columns[f'{target_col}_ma{window}'] = means
+        for window in [7, 14, 30]:
+            columns[f'{target_col}_std{window}'] = stds
+        for window in [7, 14, 30]:
+            columns[f'{target_col}_min{window}'] = mins
+        for window in [7, 14, 30]:
+            columns[f'{target_col}_max{window}'] = maxs
+        zeros = np.zeros(len(future_dates))
+        columns[f'{target_col}_diff1'] = zeros  # Unknown
+        columns[f'{target_col}_diff7'] = zeros  # Unknown
+        columns[f'{target_col}_ema7'] = means
+        columns[f'{target_col}_ema30'] = means
+        FeatureEngineeringService._assign_future_columns(future_df, columns)
+        
+        has_cross = climatological_stats.has_temperature_companions()[ordinals]
+        if metric == 'temperature' and has_cross.any():
+            columns = {}
+            for prefix, companion in (('temp_max', 'temperature_max'), ('temp_min', 'temperature_min')):
+                cross_means = climatological_stats.get(companion, 'mean')[ordinals]
+                cross_stds = climatological_stats.get(companion, 'std')[ordinals]
+                for lag in lookback_days:
+                    columns[f'{prefix}_lag{lag}'] = cross_means
+                for window in [7, 14, 30]:
+                    columns[f'{prefix}_ma{window}'] = cross_means
+                for window in [7, 14, 30]:
+                    columns[f'{prefix}_std{window}'] = cross_stds
+            FeatureEngineeringService._assign_future_columns(
+                future_df, columns, rows=has_cross
+            )
+    
+    @staticmethod
+    def _assign_future_columns(
+        future_df: pd.DataFrame,
+        columns: Dict[str, Any],
+        rows: np.ndarray = None
+    ) -> None:
+        """Assign float feature columns, optionally only on selected rows.
+        
+        Unselected rows keep their current value (NaN for new columns).
+        Existing columns keep their position; new columns are appended.
+        Nothing is assigned to a frame without rows.
+        """
+        if len(future_df) == 0:
+            return
+        for name, values in columns.items():
+            values = np.asarray(values, dtype=np.float64)
+            if rows is not None and not rows.all():
+                if name in future_df.columns:
+                    current = future_df[name].to_numpy(dtype=np.float64)
+                else:
+                    current = np.full(len(future_df), np.nan)
+                values = np.where(rows, values, current)
+            future_df[name] = values
+    
     @staticmethod
     def _get_target_column(metric: str) -> str:
         """Get target column name for metric."""
@@ -365,78 +469,16 @@ class FeatureEngineeringService:
         metric: str
     ) -> Dict[str, Dict[str, float]]:
         """
-        Pre-compute climatological statistics for all month-day combinations.
+        Get climatological statistics of a metric keyed by month-day.
         
-        This optimization reduces complexity from O(N*M) to O(M) where:
-        - N = prediction_days
-        - M = historical_data length
+        Dict view of ClimatologicalStatsTable (cached per dataset); feature
+        builders use the table directly.
         
         Args:
             historical_data: Historical weather data
             metric: Metric to compute statistics for
             
         Returns:
-            Dictionary mapping month-day to statistics
+            Dictionary mapping month-day ("MM-DD") to statistics
         """
-        from collections import defaultdict
-        import statistics
-        
-        # Group data by month-day
-        month_day_groups = defaultdict(list)
-        month_day_max_groups = defaultdict(list)
-        month_day_min_groups = defaultdict(list)
-        
-        for hist_data in historical_data:
-            month_day = f"{hist_data.time.month:02d}-{hist_data.time.day:02d}"
-            
-            # Extract value based on metric
-            val = None
-            if metric == 'temperature':
-                val = hist_data.temperature_2m_mean
-                if hist_data.temperature_2m_max is not None:
-                    month_day_max_groups[month_day].append(hist_data.temperature_2m_max)
-                if hist_data.temperature_2m_min is not None:
-                    month_day_min_groups[month_day].append(hist_data.temperature_2m_min)
-            elif metric == 'temperature_max':
-                val = hist_data.temperature_2m_max
-                if hist_data.temperature_2m_max is not None:
-                    month_day_max_groups[month_day].append(hist_data.temperature_2m_max)
-            elif metric == 'temperature_min':
-                val = hist_data.temperature_2m_min
-                if hist_data.temperature_2m_min is not None:
-                    month_day_min_groups[month_day].append(hist_data.temperature_2m_min)
-            elif metric == 'precipitation':
-                val = hist_data.precipitation_sum
-            elif metric == 'sunshine':
-                val = hist_data.sunshine_duration
-            
-            if val is not None:
-                month_day_groups[month_day].append(val)
-        
-        # Compute statistics for each month-day
-        stats = {}
-        for month_day, values in month_day_groups.items():
-            if not values:
-                continue
-                
-            stats[month_day] = {
-                'mean': statistics.mean(values),
-                'std': statistics.stdev(values) if len(values) > 1 else 0.0,
-                'min': min(values),
-                'max': max(values),
-            }
-            
-            # Add temp_max and temp_min statistics for temperature metric
-            if metric == 'temperature':
-                if month_day in month_day_max_groups and month_day_max_groups[month_day]:
-                    max_values = month_day_max_groups[month_day]
-                    stats[month_day]['temp_max_mean'] = statistics.mean(max_values)
-                    stats[month_day]['temp_max_std'] = statistics.stdev(max_values) if len(max_values) > 1 else 0.0
-                
-                if month_day in month_day_min_groups and month_day_min_groups[month_day]:
-                    min_values = month_day_min_groups[month_day]
-                    stats[month_day]['temp_min_mean'] = statistics.mean(min_values)
-                    stats[month_day]['temp_min_std'] = statistics.stdev(min_values) if len(min_values) > 1 else 0.0
-        
-        return stats
-
+        return ClimatologicalStatsTable.for_dataset(historical_data).to_dict(metric)
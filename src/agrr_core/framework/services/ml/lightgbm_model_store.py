@@ -0,0 +1,262 @@
+"""On-disk registry of trained LightGBM boosters (Framework layer).
+
+LightGBMPredictionService trains one booster per metric on every call. For
+stations forecast daily the training data only grows by a few rows between
+runs, so the store keeps trained boosters on disk and lets the service
+
+- reuse a booster trained on exactly the same data (inference only), or
+- refit the leaf values of a booster trained on a prefix of the data
+  (newly appended days) instead of growing new trees.
+
+Layout:
+
+    <root>/<station>/<metric>/<feature_set>/<data_hash>.txt   booster (LightGBM text format)
+    <root>/<station>/<metric>/<feature_set>/<data_hash>.json  metadata
+
+feature_set identifies the feature columns and training parameters;
+data_hash is the fingerprint of the training matrix and labels, so a model is
+only reused for identical inputs. Files are written atomically, so several
+processes (e.g. daemon workers) can share one store.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+try:
+    import lightgbm as lgb
+    LIGHTGBM_AVAILABLE = True
+except ImportError:
+    LIGHTGBM_AVAILABLE = False
+
+@dataclass
+class StoredModel:
+    """Booster loaded from the store with its metadata."""
+
+    booster: Any
+    feature_names: List[str]
+    data_hash: str
+    n_rows: int
+    refits: int
+    path: str
+
+def fingerprint(X: pd.DataFrame, y: Sequence[float]) -> str:
+    """Hash a training matrix and its labels (column names, values and order)."""
+    digest = hashlib.sha1()
+    digest.update(json.dumps([str(c) for c in X.columns]).encode('utf-8'))
+    digest.update(np.ascontiguousarray(X.to_numpy(dtype=np.float64)).tobytes())
+    digest.update(np.ascontiguousarray(np.asarray(y, dtype=np.float64)).tobytes())
+    return digest.hexdigest()
+
+def feature_set_version(version: str, feature_names: Sequence[str], params: Dict[str, Any]) -> str:
+    """Identify a feature set and training parameters.
+
+    Args:
+        version: Version of the feature engineering code
+        feature_names: Feature columns in training order
+        params: LightGBM training parameters
+
+    Returns:
+        Short identifier, e.g. "v1-3f2a9c0d1b2e"
+    """
+    payload = json.dumps(
+        {'features': list(feature_names), 'params': params},
+        sort_keys=True, default=str,
+    )
+    return f"v{version}-{hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]}"
+
+class LightGBMModelStore:
+    """Directory-backed store of LightGBM boosters keyed by training data.
+
+    Usage:
+        store = LightGBMModelStore("~/.cache/agrr/models")
+        model = store.load(station, metric, feature_set, fingerprint(X, y))
+        if model is None:
+            parent = store.find_prefix(station, metric, feature_set, X, y)
+    """
+
+    def __init__(self, root: str, max_entries: int = 64):
+        """Initialize store.
+
+        Args:
+            root: Store directory (created on first save)
+            max_entries: Models kept per (station, metric, feature_set);
+                         least recently written are removed first
+        """
+        if not LIGHTGBM_AVAILABLE:
+            raise ImportError(
+                "LightGBM is not installed. Install with: pip install lightgbm"
+            )
+        self.root = os.path.expanduser(root)
+        self.max_entries = max_entries
+
+    def load(
+        self, station: str, metric: str, feature_set: str, data_hash: str
+    ) -> Optional[StoredModel]:
+        """Load the model trained on exactly the given data (None if absent)."""
+        return self._read(self._entry_path(station, metric, feature_set, data_hash))
+
+    def find_prefix(
+        self,
+        station: str,
+        metric: str,
+        feature_set: str,
+        X: pd.DataFrame,
+        y: Sequence[float],
+    ) -> Optional[StoredModel]:
+        """Find the model trained on the longest prefix of (X, y).
+
+        A model qualifies when its training data equals the first n_rows of
+        (X, y), i.e. the new data only appends rows.
+
+        Returns:
+            Stored model, or None if no model was trained on a prefix
+        """
+        directory = self._dir(station, metric, feature_set)
+        candidates = []
+        for meta in self._list_metadata(directory):
+            if 0 < meta['n_rows'] < len(X):
+                candidates.append(meta)
+        candidates.sort(key=lambda meta: meta['n_rows'], reverse=True)
+
+        hashes: Dict[int, str] = {}
+        for meta in candidates:
+            n = meta['n_rows']
+            if n not in hashes:
+                hashes[n] = fingerprint(X.iloc[:n], np.asarray(y)[:n])
+            if hashes[n] == meta['data_hash']:
+                model = self._read(os.path.join(directory, meta['data_hash']))
+                if model is not None:
+                    return model
+        return None
+
+    def save(
+        self,
+        station: str,
+        metric: str,
+        feature_set: str,
+        data_hash: str,
+        booster: Any,
+        n_rows: int,
+        refits: int = 0,
+        replaces: Optional[StoredModel] = None,
+    ) -> str:
+        """Save a booster (only its best iteration's trees).
+
+        Args:
+            station: Station identifier
+            metric: Predicted metric
+            feature_set: Feature set identifier (see feature_set_version)
+            data_hash: Fingerprint of the training data
+            booster: Trained LightGBM booster
+            n_rows: Number of training rows
+            refits: Incremental refits since the last full training
+            replaces: Model superseded by this one (removed after saving)
+
+        Returns:
+            Path of the saved entry (without extension)
+        """
+        path = self._entry_path(station, metric, feature_set, data_hash)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        best_iteration = getattr(booster, 'best_iteration', 0)
+        model_str = booster.model_to_string(
+            num_iteration=best_iteration if best_iteration and best_iteration > 0 else None
+        )
+        metadata = {
+            'station': station,
+            'metric': metric,
+            'feature_set': feature_set,
+            'data_hash': data_hash,
+            'n_rows': n_rows,
+            'refits': refits,
+            'feature_names': booster.feature_name(),
+        }
+        self._write_atomic(path + '.txt', model_str)
+        self._write_atomic(path + '.json', json.dumps(metadata, indent=2))
+
+        if replaces is not None and replaces.path != path:
+            self._remove(replaces.path)
+        self._prune(os.path.dirname(path))
+        return path
+
+    # ===== Internal helpers =====
+
+    def _dir(self, station: str, metric: str, feature_set: str) -> str:
+        return os.path.join(self.root, _safe_name(station), _safe_name(metric), _safe_name(feature_set))
+
+    def _entry_path(self, station: str, metric: str, feature_set: str, data_hash: str) -> str:
+        return os.path.join(self._dir(station, metric, feature_set), data_hash)
+
+    def _read(self, path: str) -> Optional[StoredModel]:
+        try:
+            with open(path + '.json', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(path + '.txt', encoding='utf-8') as f:
+                booster = lgb.Booster(model_str=f.read())
+        except (OSError, ValueError, lgb.basic.LightGBMError):
+            return None  # Missing or partially written entry
+        return StoredModel(
+            booster=booster,
+            feature_names=meta['feature_names'],
+            data_hash=meta['data_hash'],
+            n_rows=meta['n_rows'],
+            refits=meta.get('refits', 0),
+            path=path,
+        )
+
+    def _list_metadata(self, directory: str) -> List[Dict[str, Any]]:
+        if not os.path.isdir(directory):
+            return []
+        metadata = []
+        for name in os.listdir(directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(directory, name), encoding='utf-8') as f:
+                    metadata.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return metadata
+
+    def _prune(self, directory: str) -> None:
+        entries = [
+            os.path.join(directory, name[:-len('.json')])
+            for name in os.listdir(directory) if name.endswith('.json')
+        ]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda path: os.path.getmtime(path + '.json'))
+        for path in entries[:len(entries) - self.max_entries]:
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        for suffix in ('.json', '.txt'):
+            try:
+                os.remove(path + suffix)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _write_atomic(path: str, content: str) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+def _safe_name(name: str) -> str:
+    """Make an identifier usable as a directory name."""
+    return re.sub(r'[^A-Za-z0-9._-]', '_', str(name)) or '_'
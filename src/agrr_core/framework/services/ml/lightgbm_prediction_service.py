@@ -1,6 +1,6 @@
 """LightGBM-based weather prediction service implementation (Framework layer)."""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, ContextManager, Optional, Tuple
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
@@ -19,16 +19,50 @@ from agrr_core.entity import WeatherData, Forecast
 from agrr_core.entity.exceptions.prediction_error import PredictionError
 from agrr_core.adapter.interfaces.ml.prediction_service_interface import PredictionServiceInterface
 from agrr_core.framework.services.ml.feature_engineering_service import FeatureEngineeringService
+from agrr_core.framework.services.ml.climatological_stats_table import (
+    ClimatologicalStatsTable,
+    day_ordinals,
+)
+from agrr_core.framework.services.ml.lightgbm_model_store import (
+    LightGBMModelStore,
+    feature_set_version,
+    fingerprint,
+)
+from agrr_core.framework.services.ml.shared_dataset_inputs import (
+    SharedDatasetInputs,
+    shares_dataset_inputs,
+)
+from agrr_core.framework.services.ml.station_key import station_key
 
 class LightGBMPredictionService(PredictionServiceInterface):
-    """LightGBM-based prediction service (Framework layer implementation)."""
+    """LightGBM-based prediction service (Framework layer implementation).
     
-    def __init__(self, model_params: Optional[Dict[str, Any]] = None):
+    With a model store, trained boosters are kept on disk per station
+    (model_config['station_id'], else derived from the series, see
+    station_key) and metric. A booster trained on the same data is reused
+    without training; when the data only gained new days, the stored
+    booster's leaf values are refit on the new training set instead of
+    training from scratch (full retraining after max_refits refits).
+    """
+    
+    # Bump when feature engineering changes so stored models are not reused
+    FEATURE_SET_VERSION = "1"
+    
+    def __init__(
+        self,
+        model_params: Optional[Dict[str, Any]] = None,
+        model_store: Optional[LightGBMModelStore] = None,
+        refit_decay_rate: float = 0.9,
+        max_refits: int = 30,
+    ):
         """
         Initialize LightGBM prediction service.
         
         Args:
             model_params: Optional LightGBM parameters (defaults to optimized params)
+            model_store: Optional on-disk store of trained boosters
+            refit_decay_rate: Weight of the old leaf values when refitting a stored booster
+            max_refits: Incremental refits before a stored booster is retrained
         """
         if not LIGHTGBM_AVAILABLE:
             raise ImportError(
@@ -53,7 +87,11 @@ class LightGBMPredictionService(PredictionServiceInterface):
         self.feature_engineering = FeatureEngineeringService()
         self.model = None
         self.feature_names = None
+        self.model_store = model_store
+        self.refit_decay_rate = refit_decay_rate
+        self.max_refits = max_refits
     
+    @shares_dataset_inputs
     def predict(
         self,
         historical_data: List[WeatherData],
@@ -90,6 +128,11 @@ class LightGBMPredictionService(PredictionServiceInterface):
         """Get minimum required data days (implements PredictionModelInterface)."""
         return 90
     
+    def dataset_scope(self) -> ContextManager[None]:
+        """Share derived dataset inputs within the block (implements PredictionServiceInterface)."""
+        return SharedDatasetInputs.scope()
+    
+    @shares_dataset_inputs
     def predict_multiple_metrics(
         self, 
         historical_data: List[WeatherData], 
@@ -180,9 +223,6 @@ class LightGBMPredictionService(PredictionServiceInterface):
             y_train = y_train_dict[metric]
             y_val = y_val_dict[metric]
             
-            train_data = lgb.Dataset(X_train, label=y_train)
-            val_data = lgb.Dataset(X_val, label=y_val, reference=train_data)
-            
             # Use optimized parameters for faster training
             params = self.model_params.copy()
             params.update({
@@ -192,11 +232,9 @@ class LightGBMPredictionService(PredictionServiceInterface):
             })
             params.update(model_config.get('lgb_params', {}))
             
-            model = lgb.train(
-                params,
-                train_data,
-                valid_sets=[val_data],
-                callbacks=[lgb.early_stopping(params.get('early_stopping_rounds', 30))],
+            model, _ = self._train_booster(
+                metric, X_train, y_train, X_val, y_val, params, 30,
+                station_key(historical_data, model_config)
             )
             models[metric] = model
         
@@ -312,118 +350,27 @@ class LightGBMPredictionService(PredictionServiceInterface):
         metrics: List[str],
         prediction_days: int,
         lookback_days: List[int],
-        climatological_stats: Dict[str, Dict[str, Dict[str, float]]]
+        climatological_stats: ClimatologicalStatsTable
     ) -> pd.DataFrame:
         """Create future features for multi-target prediction."""
         # Generate future dates
         last_date = historical_data[-1].time
         future_dates = [last_date + timedelta(days=i+1) for i in range(prediction_days)]
         
-        future_rows = []
-        
-        for future_date in future_dates:
-            row = {}
-            row['date'] = future_date
-            
-            # Temporal features
-            row['year'] = future_date.year
-            row['month'] = future_date.month
-            row['day'] = future_date.day
-            row['day_of_year'] = future_date.timetuple().tm_yday
-            row['day_of_week'] = future_date.weekday()
-            row['week_of_year'] = future_date.isocalendar()[1]
-            row['is_weekend'] = 1 if future_date.weekday() >= 5 else 0
-            
-            # Cyclical encoding
-            row['month_sin'] = np.sin(2 * np.pi * row['month'] / 12)
-            row['month_cos'] = np.cos(2 * np.pi * row['month'] / 12)
-            row['day_of_year_sin'] = np.sin(2 * np.pi * row['day_of_year'] / 365)
-            row['day_of_year_cos'] = np.cos(2 * np.pi * row['day_of_year'] / 365)
-            
-            # Season flags
-            row['is_winter'] = 1 if row['month'] in [12, 1, 2] else 0
-            row['is_spring'] = 1 if row['month'] in [3, 4, 5] else 0
-            row['is_summer'] = 1 if row['month'] in [6, 7, 8] else 0
-            row['is_autumn'] = 1 if row['month'] in [9, 10, 11] else 0
-            
-            future_rows.append(row)
-        
-        future_df = pd.DataFrame(future_rows)
+        future_df = self.feature_engineering._create_future_calendar_features(future_dates)
         
         # Apply climatological statistics for all metrics
         for metric in metrics:
-            target_col = self.feature_engineering._get_target_column(metric)
-            climatological_stats_metric = climatological_stats[metric]
-            
-            for i, future_date in enumerate(future_dates):
-                month_day = f"{future_date.month:02d}-{future_date.day:02d}"
-                
-                if month_day in climatological_stats_metric:
-                    stats = climatological_stats_metric[month_day]
-                    
-                    # Apply climatological values
-                    climatological_value = stats['mean']
-                    for lag in lookback_days:
-                        future_df.loc[i, f'{target_col}_lag{lag}'] = climatological_value
-                    
-                    # Rolling statistics
-                    future_df.loc[i, f'{target_col}_ma7'] = climatological_value
-                    future_df.loc[i, f'{target_col}_ma14'] = climatological_value
-                    future_df.loc[i, f'{target_col}_ma30'] = climatological_value
-                    future_df.loc[i, f'{target_col}_std7'] = stats['std']
-                    future_df.loc[i, f'{target_col}_std14'] = stats['std']
-                    future_df.loc[i, f'{target_col}_std30'] = stats['std']
-                    future_df.loc[i, f'{target_col}_min7'] = stats['min']
-                    future_df.loc[i, f'{target_col}_min14'] = stats['min']
-                    future_df.loc[i, f'{target_col}_min30'] = stats['min']
-                    future_df.loc[i, f'{target_col}_max7'] = stats['max']
-                    future_df.loc[i, f'{target_col}_max14'] = stats['max']
-                    future_df.loc[i, f'{target_col}_max30'] = stats['max']
-                    future_df.loc[i, f'{target_col}_diff1'] = 0
-                    future_df.loc[i, f'{target_col}_diff7'] = 0
-                    future_df.loc[i, f'{target_col}_ema7'] = climatological_value
-                    future_df.loc[i, f'{target_col}_ema30'] = climatological_value
-                    
-                    # Add cross-metric features for temperature
-                    if metric == 'temperature' and 'temp_max_mean' in stats:
-                        climatological_max = stats['temp_max_mean']
-                        for lag in lookback_days:
-                            future_df.loc[i, f'temp_max_lag{lag}'] = climatological_max
-                        
-                        future_df.loc[i, 'temp_max_ma7'] = climatological_max
-                        future_df.loc[i, 'temp_max_ma14'] = climatological_max
-                        future_df.loc[i, 'temp_max_ma30'] = climatological_max
-                        future_df.loc[i, 'temp_max_std7'] = stats['temp_max_std']
-                        future_df.loc[i, 'temp_max_std14'] = stats['temp_max_std']
-                        future_df.loc[i, 'temp_max_std30'] = stats['temp_max_std']
-                        
-                        climatological_min = stats['temp_min_mean']
-                        for lag in lookback_days:
-                            future_df.loc[i, f'temp_min_lag{lag}'] = climatological_min
-                        
-                        future_df.loc[i, 'temp_min_ma7'] = climatological_min
-                        future_df.loc[i, 'temp_min_ma14'] = climatological_min
-                        future_df.loc[i, 'temp_min_ma30'] = climatological_min
-                        future_df.loc[i, 'temp_min_std7'] = stats['temp_min_std']
-                        future_df.loc[i, 'temp_min_std14'] = stats['temp_min_std']
-                        future_df.loc[i, 'temp_min_std30'] = stats['temp_min_std']
-                else:
-                    raise ValueError(
-                        f"No historical data found for date {future_date.strftime('%Y-%m-%d')} (month-day: {month_day}). "
-                        f"Metric: {metric}. Need at least 1 historical sample for climatological prediction."
-                    )
+            self.feature_engineering._apply_climatological_features(
+                future_df, future_dates, metric, lookback_days, climatological_stats
+            )
         
         # Add cross-metric features for temperature
         if 'temperature' in metrics:
             # Add temp_range feature
-            for i, future_date in enumerate(future_dates):
-                month_day = f"{future_date.month:02d}-{future_date.day:02d}"
-                if month_day in climatological_stats['temperature'] and 'temp_max_mean' in climatological_stats['temperature'][month_day]:
-                    temp_max = climatological_stats['temperature'][month_day]['temp_max_mean']
-                    temp_min = climatological_stats['temperature'][month_day]['temp_min_mean']
-                    future_df.loc[i, 'temp_range'] = temp_max - temp_min
-                else:
-                    future_df.loc[i, 'temp_range'] = 0  # Default value
+            self.feature_engineering._assign_future_columns(future_df, {
+                'temp_range': self._climatological_temp_range(climatological_stats, future_dates),
+            })
             
             # Add precipitation features
             future_df['has_precipitation'] = 0  # Unknown for future
@@ -434,6 +381,20 @@ class LightGBMPredictionService(PredictionServiceInterface):
         
         return future_df
     
+    @staticmethod
+    def _climatological_temp_range(
+        climatological_stats: ClimatologicalStatsTable,
+        future_dates: List[datetime]
+    ) -> np.ndarray:
+        """Get climatological temperature range of dates (0 where unknown)."""
+        ordinals = day_ordinals(future_dates)
+        temp_range = (
+            climatological_stats.get('temperature_max', 'mean')[ordinals]
+            - climatological_stats.get('temperature_min', 'mean')[ordinals]
+        )
+        known = climatological_stats.has_temperature_companions()[ordinals]
+        return np.where(known, temp_range, 0.0)  # Default value
+    
     def _create_shared_features(
         self,
         historical_data: List[WeatherData],
@@ -452,20 +413,16 @@ class LightGBMPredictionService(PredictionServiceInterface):
         
         # Create base features that are common across all metrics
         t_base_start = time.perf_counter() if prof else 0.0
-        base_features = self.feature_engineering.create_features(
+        base_features = self.feature_engineering.create_features_cached(
             historical_data, 'temperature', lookback_days  # Use temperature as base
         )
         if prof:
             t_base_end = time.perf_counter()
             print(f"[PROFILE] LightGBM: base_features elapsed={t_base_end-t_base_start:.3f}s samples={len(historical_data)}", flush=True)
         
-        # Pre-compute climatological statistics for all metrics
+        # Climatological statistics table for all metrics (cached per dataset)
         t_climate_start = time.perf_counter() if prof else 0.0
-        climatological_stats = {}
-        for metric in metrics:
-            climatological_stats[metric] = self.feature_engineering._precompute_climatological_stats(
-                historical_data, metric
-            )
+        climatological_stats = ClimatologicalStatsTable.for_dataset(historical_data)
         
         if prof:
             t_climate_end = time.perf_counter()
@@ -502,7 +459,7 @@ class LightGBMPredictionService(PredictionServiceInterface):
         t_feature_start = time.perf_counter() if prof else 0.0
         lookback_days = shared_features['lookback_days']
         base_features = shared_features['base_features']
-        climatological_stats = shared_features['climatological_stats'][metric]
+        climatological_stats = shared_features['climatological_stats']
         
         # Get target column for this metric
         target_col = self.feature_engineering._get_target_column(metric)
@@ -551,21 +508,15 @@ class LightGBMPredictionService(PredictionServiceInterface):
             t_train_prep = time.perf_counter()
             print(f"[PROFILE] LightGBM-{metric}: train_preparation elapsed={t_train_prep-t_train_start:.3f}s features={len(available_features)} samples={len(X)}", flush=True)
         
-        # Train LightGBM model
-        train_data = lgb.Dataset(X_train, label=y_train)
-        val_data = lgb.Dataset(X_val, label=y_val, reference=train_data)
-        
         # Update model parameters from config
         params = self.model_params.copy()
         params.update(model_config.get('lgb_params', {}))
         
         # Train model
         t_model_start = time.perf_counter() if prof else 0.0
-        model = lgb.train(
-            params,
-            train_data,
-            valid_sets=[val_data],
-            callbacks=[lgb.early_stopping(params.get('early_stopping_rounds', 50))],
+        model, _ = self._train_booster(
+            metric, X_train, y_train, X_val, y_val, params, 50,
+            station_key(historical_data, model_config)
         )
         
         if prof:
@@ -642,115 +593,26 @@ class LightGBMPredictionService(PredictionServiceInterface):
         metric: str,
         prediction_days: int,
         lookback_days: List[int],
-        climatological_stats: Dict[str, Dict[str, float]]
+        climatological_stats: ClimatologicalStatsTable
     ) -> pd.DataFrame:
         """Create optimized future features using pre-computed statistics."""
         # Generate future dates
         last_date = historical_data[-1].time
         future_dates = [last_date + timedelta(days=i+1) for i in range(prediction_days)]
         
-        future_rows = []
-        target_col = self.feature_engineering._get_target_column(metric)
-        
-        for future_date in future_dates:
-            row = {}
-            row['date'] = future_date
-            
-            # Temporal features
-            row['year'] = future_date.year
-            row['month'] = future_date.month
-            row['day'] = future_date.day
-            row['day_of_year'] = future_date.timetuple().tm_yday
-            row['day_of_week'] = future_date.weekday()
-            row['week_of_year'] = future_date.isocalendar()[1]
-            row['is_weekend'] = 1 if future_date.weekday() >= 5 else 0
-            
-            # Cyclical encoding
-            row['month_sin'] = np.sin(2 * np.pi * row['month'] / 12)
-            row['month_cos'] = np.cos(2 * np.pi * row['month'] / 12)
-            row['day_of_year_sin'] = np.sin(2 * np.pi * row['day_of_year'] / 365)
-            row['day_of_year_cos'] = np.cos(2 * np.pi * row['day_of_year'] / 365)
-            
-            # Season flags
-            row['is_winter'] = 1 if row['month'] in [12, 1, 2] else 0
-            row['is_spring'] = 1 if row['month'] in [3, 4, 5] else 0
-            row['is_summer'] = 1 if row['month'] in [6, 7, 8] else 0
-            row['is_autumn'] = 1 if row['month'] in [9, 10, 11] else 0
-            
-            future_rows.append(row)
-        
-        future_df = pd.DataFrame(future_rows)
+        future_df = self.feature_engineering._create_future_calendar_features(future_dates)
         
         # Apply pre-computed climatological statistics
-        for i, future_date in enumerate(future_dates):
-            month_day = f"{future_date.month:02d}-{future_date.day:02d}"
-            
-            if month_day in climatological_stats:
-                stats = climatological_stats[month_day]
-                
-                # Apply climatological values
-                climatological_value = stats['mean']
-                for lag in lookback_days:
-                    future_df.loc[i, f'{target_col}_lag{lag}'] = climatological_value
-                
-                # Rolling statistics
-                future_df.loc[i, f'{target_col}_ma7'] = climatological_value
-                future_df.loc[i, f'{target_col}_ma14'] = climatological_value
-                future_df.loc[i, f'{target_col}_ma30'] = climatological_value
-                future_df.loc[i, f'{target_col}_std7'] = stats['std']
-                future_df.loc[i, f'{target_col}_std14'] = stats['std']
-                future_df.loc[i, f'{target_col}_std30'] = stats['std']
-                future_df.loc[i, f'{target_col}_min7'] = stats['min']
-                future_df.loc[i, f'{target_col}_min14'] = stats['min']
-                future_df.loc[i, f'{target_col}_min30'] = stats['min']
-                future_df.loc[i, f'{target_col}_max7'] = stats['max']
-                future_df.loc[i, f'{target_col}_max14'] = stats['max']
-                future_df.loc[i, f'{target_col}_max30'] = stats['max']
-                future_df.loc[i, f'{target_col}_diff1'] = 0
-                future_df.loc[i, f'{target_col}_diff7'] = 0
-                future_df.loc[i, f'{target_col}_ema7'] = climatological_value
-                future_df.loc[i, f'{target_col}_ema30'] = climatological_value
-                
-                # Add cross-metric features for temperature
-                if metric == 'temperature' and 'temp_max_mean' in stats:
-                    climatological_max = stats['temp_max_mean']
-                    for lag in lookback_days:
-                        future_df.loc[i, f'temp_max_lag{lag}'] = climatological_max
-                    
-                    future_df.loc[i, 'temp_max_ma7'] = climatological_max
-                    future_df.loc[i, 'temp_max_ma14'] = climatological_max
-                    future_df.loc[i, 'temp_max_ma30'] = climatological_max
-                    future_df.loc[i, 'temp_max_std7'] = stats['temp_max_std']
-                    future_df.loc[i, 'temp_max_std14'] = stats['temp_max_std']
-                    future_df.loc[i, 'temp_max_std30'] = stats['temp_max_std']
-                    
-                    climatological_min = stats['temp_min_mean']
-                    for lag in lookback_days:
-                        future_df.loc[i, f'temp_min_lag{lag}'] = climatological_min
-                    
-                    future_df.loc[i, 'temp_min_ma7'] = climatological_min
-                    future_df.loc[i, 'temp_min_ma14'] = climatological_min
-                    future_df.loc[i, 'temp_min_ma30'] = climatological_min
-                    future_df.loc[i, 'temp_min_std7'] = stats['temp_min_std']
-                    future_df.loc[i, 'temp_min_std14'] = stats['temp_min_std']
-                    future_df.loc[i, 'temp_min_std30'] = stats['temp_min_std']
-            else:
-                raise ValueError(
-                    f"No historical data found for date {future_date.strftime('%Y-%m-%d')} (month-day: {month_day}). "
-                    f"Metric: {metric}. Need at least 1 historical sample for climatological prediction."
-                )
+        self.feature_engineering._apply_climatological_features(
+            future_df, future_dates, metric, lookback_days, climatological_stats
+        )
         
         # Add cross-metric features for temperature
         if metric == 'temperature':
             # Add temp_range feature
-            for i, future_date in enumerate(future_dates):
-                month_day = f"{future_date.month:02d}-{future_date.day:02d}"
-                if month_day in climatological_stats and 'temp_max_mean' in climatological_stats[month_day]:
-                    temp_max = climatological_stats[month_day]['temp_max_mean']
-                    temp_min = climatological_stats[month_day]['temp_min_mean']
-                    future_df.loc[i, 'temp_range'] = temp_max - temp_min
-                else:
-                    future_df.loc[i, 'temp_range'] = 0  # Default value
+            self.feature_engineering._assign_future_columns(future_df, {
+                'temp_range': self._climatological_temp_range(climatological_stats, future_dates),
+            })
             
             # Add precipitation features
             future_df['has_precipitation'] = 0  # Unknown for future
@@ -774,46 +636,9 @@ class LightGBMPredictionService(PredictionServiceInterface):
                 f"Insufficient data for LightGBM. Need at least 90 data points, got {len(historical_data)}."
             )
         
-        # Extract lookback days from config
         lookback_days = model_config.get('lookback_days', [1, 7, 14, 30])
-        
-        # Create features from historical data
-        features_df = self.feature_engineering.create_features(
-            historical_data, metric, lookback_days
-        )
-        
-        # Get target column
-        target_col = self.feature_engineering._get_target_column(metric)
-        
-        # Get feature names (excluding date and target)
-        feature_names = self.feature_engineering.get_feature_names(metric, lookback_days)
-        
-        # Filter to only available features
-        available_features = [f for f in feature_names if f in features_df.columns]
-        
-        # Prepare training data
-        X = features_df[available_features]
-        y = features_df[target_col]
-        
-        # Split into train/validation (use last 20% for validation)
-        split_idx = int(len(X) * 0.8)
-        X_train, X_val = X[:split_idx], X[split_idx:]
-        y_train, y_val = y[:split_idx], y[split_idx:]
-        
-        # Train LightGBM model
-        train_data = lgb.Dataset(X_train, label=y_train)
-        val_data = lgb.Dataset(X_val, label=y_val, reference=train_data)
-        
-        # Update model parameters from config
-        params = self.model_params.copy()
-        params.update(model_config.get('lgb_params', {}))
-        
-        # Train model
-        model = lgb.train(
-            params,
-            train_data,
-            valid_sets=[val_data],
-            callbacks=[lgb.early_stopping(params.get('early_stopping_rounds', 50))],
+        model, available_features, X_val, y_val, _ = self._train_single_metric(
+            historical_data, metric, model_config
         )
         
         # Save model and feature names for feature importance
@@ -870,6 +695,123 @@ class LightGBMPredictionService(PredictionServiceInterface):
         
         return forecasts
     
+    def _train_single_metric(
+        self,
+        historical_data: List[WeatherData],
+        metric: str,
+        model_config: Dict[str, Any]
+    ) -> Tuple[Any, List[str], pd.DataFrame, pd.Series, str]:
+        """Build features for one metric and train its booster.
+        
+        Returns:
+            Tuple of (booster, feature names, X_val, y_val, source) where source
+            is 'trained', 'store' or 'refit'
+        """
+        # Extract lookback days from config
+        lookback_days = model_config.get('lookback_days', [1, 7, 14, 30])
+        
+        # Create features from historical data
+        features_df = self.feature_engineering.create_features_cached(
+            historical_data, metric, lookback_days
+        )
+        
+        # Get target column
+        target_col = self.feature_engineering._get_target_column(metric)
+        
+        # Get feature names (excluding date and target)
+        feature_names = self.feature_engineering.get_feature_names(metric, lookback_days)
+        
+        # Filter to only available features
+        available_features = [f for f in feature_names if f in features_df.columns]
+        
+        # Prepare training data
+        X = features_df[available_features]
+        y = features_df[target_col]
+        
+        # Split into train/validation (use last 20% for validation)
+        split_idx = int(len(X) * 0.8)
+        X_train, X_val = X[:split_idx], X[split_idx:]
+        y_train, y_val = y[:split_idx], y[split_idx:]
+        
+        # Update model parameters from config
+        params = self.model_params.copy()
+        params.update(model_config.get('lgb_params', {}))
+        
+        # Train model (or reuse/refit a stored one)
+        model, source = self._train_booster(
+            metric, X_train, y_train, X_val, y_val, params, 50,
+            station_key(historical_data, model_config)
+        )
+        return model, available_features, X_val, y_val, source
+    
+    def _train_booster(
+        self,
+        metric: str,
+        X_train: pd.DataFrame,
+        y_train,
+        X_val: pd.DataFrame,
+        y_val,
+        params: Dict[str, Any],
+        default_early_stopping_rounds: int,
+        station: str
+    ) -> Tuple[Any, str]:
+        """Train a booster, reusing or refitting a stored one when possible.
+        
+        Args:
+            station: Model store station (see station_key)
+        
+        Returns:
+            Tuple of (booster, source) where source is 'trained', 'store' or 'refit'
+        """
+        store = self.model_store
+        if store is None:
+            return self._fit_booster(
+                X_train, y_train, X_val, y_val, params, default_early_stopping_rounds
+            ), 'trained'
+        
+        feature_set = feature_set_version(self.FEATURE_SET_VERSION, list(X_train.columns), params)
+        data_hash = fingerprint(X_train, y_train)
+        
+        stored = store.load(station, metric, feature_set, data_hash)
+        if stored is not None:
+            return stored.booster, 'store'
+        
+        parent = store.find_prefix(station, metric, feature_set, X_train, y_train)
+        if parent is not None and parent.refits < self.max_refits:
+            # Appended days: refit leaf values, keep the tree structure
+            model = parent.booster.refit(X_train, y_train, decay_rate=self.refit_decay_rate)
+            store.save(
+                station, metric, feature_set, data_hash, model, len(X_train),
+                refits=parent.refits + 1, replaces=parent,
+            )
+            return model, 'refit'
+        
+        model = self._fit_booster(
+            X_train, y_train, X_val, y_val, params, default_early_stopping_rounds
+        )
+        store.save(station, metric, feature_set, data_hash, model, len(X_train), replaces=parent)
+        return model, 'trained'
+    
+    def _fit_booster(
+        self,
+        X_train: pd.DataFrame,
+        y_train,
+        X_val: pd.DataFrame,
+        y_val,
+        params: Dict[str, Any],
+        default_early_stopping_rounds: int
+    ) -> Any:
+        """Train a new booster with early stopping on the validation split."""
+        train_data = lgb.Dataset(X_train, label=y_train)
+        val_data = lgb.Dataset(X_val, label=y_val, reference=train_data)
+        return lgb.train(
+            params,
+            train_data,
+            valid_sets=[val_data],
+            callbacks=[lgb.early_stopping(params.get('early_stopping_rounds', default_early_stopping_rounds))],
+        )
+    
+    @shares_dataset_inputs
     def evaluate_model_accuracy(
         self,
         test_data: List[WeatherData],
@@ -930,20 +872,36 @@ class LightGBMPredictionService(PredictionServiceInterface):
             'r2': r2
         }
     
+    @shares_dataset_inputs
     def train_model(
         self,
         training_data: List[WeatherData],
         model_config: Dict[str, Any],
         metric: str
     ) -> Dict[str, Any]:
-        """Train LightGBM model."""
-        # This is handled in _predict_single_metric
-        # Return model info
+        """Train LightGBM model (stored in the model store, if configured).
+        
+        Returns:
+            Model info; 'source' tells whether the booster was trained,
+            loaded from the store or refit on appended days
+        """
+        if len(training_data) < 90:
+            raise PredictionError(
+                f"Insufficient data for LightGBM. Need at least 90 data points, got {len(training_data)}."
+            )
+        
+        model, available_features, _, _, source = self._train_single_metric(
+            training_data, metric, model_config
+        )
+        self.model = model
+        self.feature_names = available_features
+        
         return {
             'model_type': 'lightgbm',
             'metric': metric,
             'training_samples': len(training_data),
-            'status': 'trained'
+            'status': 'trained',
+            'source': source,
         }
     
     def get_model_info(self, model_type: str) -> Dict[str, Any]:
@@ -966,6 +924,7 @@ class LightGBMPredictionService(PredictionServiceInterface):
             ]
         }
     
+    @shares_dataset_inputs
     def predict_with_confidence_intervals(
         self,
         historical_data: List[WeatherData],
@@ -980,6 +939,7 @@ class LightGBMPredictionService(PredictionServiceInterface):
             'calculate_confidence_intervals': True,
         })
     
+    @shares_dataset_inputs
     def batch_predict(
         self,
         historical_data_list: List[List[WeatherData]],
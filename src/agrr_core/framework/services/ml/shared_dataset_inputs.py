@@ -0,0 +1,118 @@
+"""Per-call cache of derived prediction inputs (Framework layer).
+
+Every model prediction starts by deriving inputs from the historical data:
+interpolated metric series (ARIMA), the engineered feature frame and the
+climatological statistics table (LightGBM). Multi-metric and evaluate runs
+derive the same inputs from the same data several times within one call.
+
+SharedDatasetInputs memoizes them per historical dataset (the list object)
+while a prediction call is running:
+
+    @shares_dataset_inputs
+    def predict_multiple_metrics(self, historical_data, metrics, model_config):
+        ...
+        inputs = SharedDatasetInputs.for_dataset(historical_data)
+        series = inputs.get_or_compute(('series', metric), lambda: extract(...))
+
+The cache only lives inside SharedDatasetInputs.scope() (opened by the
+decorated service methods, and through the services' dataset_scope() by
+ensemble prediction around all of its members) and is dropped when the outermost scope exits, so
+no dataset is kept alive after the call and a dataset edited between calls
+is never answered from a stale cache. Outside a scope nothing is shared.
+
+Each key is computed once, also when several threads ask for it at the same
+time (the others wait for the first). Cached values are shared, so callers
+must not modify them.
+"""
+
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Tuple
+
+from agrr_core.entity import WeatherData
+
+class SharedDatasetInputs:
+    """Inputs derived from one historical dataset, computed once per key."""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._values: Dict[Hashable, Any] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_dataset(cls, historical_data: List[WeatherData]) -> 'SharedDatasetInputs':
+        """Get the inputs of a historical dataset.
+
+        Inside a scope, datasets are kept by identity until the scope exits;
+        outside a scope every call gets a new, empty cache.
+        """
+        key = id(historical_data)
+        with _cache_lock:
+            if _scope_depth == 0:
+                return cls()
+            entry = _cache.get(key)
+            if entry is not None and entry[0] is historical_data:
+                return entry[1]
+
+            inputs = cls()
+            # Keep a reference to the list so its id cannot be reused while cached
+            _cache[key] = (historical_data, inputs)
+            return inputs
+
+    @staticmethod
+    @contextmanager
+    def scope() -> Iterator[None]:
+        """Share dataset inputs between the calls made inside the block.
+
+        Scopes nest (also across threads); the cache is cleared when the
+        outermost one exits.
+        """
+        global _scope_depth
+        with _cache_lock:
+            _scope_depth += 1
+        try:
+            yield
+        finally:
+            with _cache_lock:
+                _scope_depth -= 1
+                if _scope_depth == 0:
+                    _cache.clear()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Get a cached input, computing it on first use.
+
+        Args:
+            key: Identifies the input (e.g. ('features', metric, lookback_days))
+            compute: Computes the input from the dataset
+
+        Returns:
+            Cached (shared) value
+        """
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    return self._values[key]
+            value = compute()
+            with self._lock:
+                self._values[key] = value
+                self._key_locks.pop(key, None)
+            return value
+
+def shares_dataset_inputs(method: Callable) -> Callable:
+    """Run a prediction service method inside SharedDatasetInputs.scope()."""
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        with SharedDatasetInputs.scope():
+            return method(*args, **kwargs)
+    return wrapper
+
+_cache: Dict[int, Tuple[List[WeatherData], SharedDatasetInputs]] = {}
+_cache_lock = threading.Lock()
+_scope_depth = 0
@@ -0,0 +1,44 @@
+"""Station keys of the on-disk model caches (Framework layer).
+
+LightGBMModelStore and ARIMAOrderCache keep their entries per station. The
+station is model_config['station_id'] when the caller names it (agrr predict
+--station-id). Otherwise it is derived from the series itself: the first date
+and the first HEAD_LENGTH daily records. Appending days keeps the key, so
+daily runs on a growing history reuse their own entries, while different
+stations never overwrite (or evict) each other's entries.
+"""
+
+import hashlib
+from itertools import islice
+from typing import Any, Dict, Sequence
+
+from agrr_core.entity import WeatherData
+
+# Leading records identifying a series without an explicit station id
+HEAD_LENGTH = 30
+
+def station_key(historical_data: Sequence[WeatherData], model_config: Dict[str, Any]) -> str:
+    """Cache key of the station a series belongs to.
+
+    Args:
+        historical_data: Historical weather series (chronological)
+        model_config: Model configuration (optional 'station_id')
+
+    Returns:
+        model_config['station_id'], or "series-<hash of the series head>"
+    """
+    station_id = model_config.get('station_id')
+    if station_id:
+        return str(station_id)
+
+    digest = hashlib.sha1()
+    for weather_data in islice(historical_data, HEAD_LENGTH):
+        digest.update(repr((
+            weather_data.time.date().isoformat(),
+            weather_data.temperature_2m_mean,
+            weather_data.temperature_2m_max,
+            weather_data.temperature_2m_min,
+            weather_data.precipitation_sum,
+            weather_data.sunshine_duration,
+        )).encode('utf-8'))
+    return f"series-{digest.hexdigest()[:16]}"
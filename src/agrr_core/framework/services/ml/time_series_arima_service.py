@@ -1,6 +1,6 @@
 """Time series ARIMA service implementation for framework layer."""
 
-from typing import List, Tuple, Optional
+from typing import List, Optional, Sequence, Tuple
 import numpy as np
 
 try:
@@ -79,13 +79,28 @@ class ARIMAModel(TimeSeriesModelInterface):
         else:
             self._arima_model = ARIMA(data, order=order, seasonal_order=seasonal_order)
     
-    def fit(self) -> 'FittedARIMAModel':
-        """Fit the ARIMA model to data."""
+    def fit(
+        self,
+        start_params: Optional[Sequence[float]] = None,
+        maxiter: Optional[int] = None
+    ) -> 'FittedARIMAModel':
+        """Fit the ARIMA model to data.
+        
+        Args:
+            start_params: Initial parameters (warm start from a previous fit)
+            maxiter: Maximum optimizer iterations (None: statsmodels default)
+        """
         if not STATSMODELS_AVAILABLE:
             raise RuntimeError("Statsmodels is not available. Please install statsmodels.")
         
+        fit_kwargs = {}
+        if start_params is not None:
+            fit_kwargs['start_params'] = np.asarray(start_params, dtype=float)
+        if maxiter is not None:
+            fit_kwargs['method_kwargs'] = {'maxiter': maxiter}
+        
         try:
-            fitted_model = self._arima_model.fit()
+            fitted_model = self._arima_model.fit(**fit_kwargs)
             return FittedARIMAModel(fitted_model)
         except Exception as e:
             # Try simpler model if complex one fails
@@ -113,6 +128,25 @@ class FittedARIMAModel(FittedTimeSeriesModelInterface):
             forecast_result = self.fitted_model.get_forecast(steps=steps)
             return forecast_result.predicted_mean
     
+    @property
+    def order(self) -> Optional[Tuple[int, int, int]]:
+        """Order of the fitted model (may differ from the requested one after a fallback)."""
+        model = getattr(self.fitted_model, 'model', None)
+        order = getattr(model, 'order', None)
+        return tuple(order) if order is not None else None
+    
+    @property
+    def params(self) -> Optional[List[float]]:
+        """Fitted parameters."""
+        params = getattr(self.fitted_model, 'params', None)
+        return [float(p) for p in np.asarray(params)] if params is not None else None
+    
+    @property
+    def aic(self) -> Optional[float]:
+        """Akaike information criterion of the fit."""
+        aic = getattr(self.fitted_model, 'aic', None)
+        return float(aic) if aic is not None else None
+    
     def get_forecast_with_intervals(self, steps: int) -> Tuple[np.ndarray, Optional[np.ndarray]]:
         """Generate forecasts with confidence intervals."""
         try:
@@ -68,7 +68,14 @@ class OptimizationConfig:
     
     # ===== Greedy Allocation =====
     
-    # (No specific parameters for now)
+    enable_lazy_greedy: bool = True
+    """Use the priority-queue (lazy re-scoring) greedy allocation.
+    
+    After each pick only candidates sharing its crop (market demand budget) or
+    its field (interaction rules, soil recovery) are re-scored; stale heap
+    entries are dropped when popped. Produces the same allocations as the
+    full re-sort, which is kept as the reference implementation (False).
+    """
     
     # ===== Local Search =====
     
@@ -84,6 +91,19 @@ class OptimizationConfig:
     enable_neighbor_sampling: bool = True
     """Enable neighbor sampling to limit computational cost."""
     
+    local_search_workers: int = 1
+    """Number of worker processes for scoring each iteration's neighbor moves.
+    
+    Workers keep a read-only copy of fields, crops and interaction rules for
+    the whole local search and receive compact move encodings; results keep
+    move order, so the accepted move is identical for any worker count.
+    
+    Values:
+        - 1: Evaluate in-process (no pool, default)
+        - N > 1: Use up to N worker processes
+        - 0: Use os.cpu_count() workers
+    """
+    
     enable_incremental_feasibility: bool = True
     """Enable incremental feasibility checking for faster validation."""
     
@@ -123,6 +143,20 @@ class OptimizationConfig:
     enable_parallel_candidate_generation: bool = True
     """Enable parallel candidate generation for faster preprocessing."""
     
+    candidate_generation_workers: int = 1
+    """Number of worker processes for growth period optimization during candidate generation.
+    
+    Each field×crop (or crop, for period_template) optimization runs as an
+    independent task on a process pool. Workers receive a one-time copy of the
+    weather data and crop profiles; merged candidates keep task order, so
+    results are identical for any worker count.
+    
+    Values:
+        - 1: Run in-process (no pool, default)
+        - N > 1: Use up to N worker processes
+        - 0: Use os.cpu_count() workers
+    """
+    
     max_period_replace_alternatives: int = 5
     """Maximum number of period alternatives to try in period replace operation."""
     
@@ -140,6 +174,36 @@ class OptimizationConfig:
     alns_removal_rate: float = 0.3
     """Fraction of solution to remove in each ALNS iteration (0.0-1.0)."""
     
+    alns_starts: int = 1
+    """Number of independent ALNS trajectories (multi-start when > 1).
+    
+    Each trajectory gets the full ALNS iteration budget (the alns_iterations
+    setting above) with its own seed and operator-weight initialisation; the
+    best solution found is shared between trajectories every
+    alns_exchange_interval iterations.
+    """
+    
+    alns_workers: int = 1
+    """Number of worker processes for multi-start ALNS trajectories.
+    
+    Values:
+        - 1: Run trajectories in-process (default)
+        - N > 1: Use up to N worker processes
+        - 0: Use os.cpu_count() workers
+    
+    Results do not depend on the worker count.
+    """
+    
+    alns_seed: Optional[int] = None
+    """Master seed for multi-start ALNS (None: not reproducible).
+    
+    Per-trajectory seeds are derived from it, so a run with an iteration
+    budget is reproducible from this seed alone.
+    """
+    
+    alns_exchange_interval: int = 20
+    """Iterations between incumbent exchanges in multi-start ALNS."""
+    
     @classmethod
     def fast_profile(cls) -> 'OptimizationConfig':
         """Create a fast optimization profile (lower quality, higher speed).
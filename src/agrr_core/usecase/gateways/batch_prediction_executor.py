@@ -0,0 +1,117 @@
+"""Batch prediction executor interface (UseCase layer).
+
+Batch prediction runs one independent prediction per location (or per
+historical dataset). This interface decides where those predictions run;
+interactors and gateways only hand over the per-item callable.
+
+Clean Architecture:
+- Interface and the in-process default defined in UseCase layer
+- Process pool implementation in Framework layer
+  (framework/services/ml/batch_prediction_pool.py)
+"""
+
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Sequence
+
+@dataclass
+class BatchPredictionProgress:
+    """Progress of a batch after a location finished.
+
+    Fields:
+        completed: Locations finished so far (successful or failed)
+        failed: Locations that failed so far
+        total: Locations in the batch
+        elapsed_seconds: Time since the batch started
+        label: Label of the location that just finished
+    """
+
+    completed: int
+    failed: int
+    total: int
+    elapsed_seconds: float
+    label: str
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one location (value on success, error message on failure)."""
+
+    value: Any = None
+    error: Optional[str] = None
+
+def run_batch_item(predict: Callable[[Any], Any], item: Any) -> BatchItemResult:
+    """Predict one location, turning failures into an error result."""
+    try:
+        return BatchItemResult(value=predict(item))
+    except MemoryError:
+        return BatchItemResult(error="Memory limit exceeded while predicting this location")
+    except Exception as e:
+        return BatchItemResult(error=str(e))
+
+class BatchPredictionExecutor(ABC):
+    """Interface for running one prediction per batch item."""
+
+    @abstractmethod
+    def run(
+        self,
+        predict: Callable[[Any], Any],
+        items: Sequence[Any],
+        labels: Optional[Sequence[str]] = None,
+    ) -> List[BatchItemResult]:
+        """Predict all items and return results in input order.
+
+        Args:
+            predict: Prediction of one item (exceptions become error results)
+            items: Items to predict (e.g. locations or historical datasets)
+            labels: Names of the items for progress reporting
+
+        Returns:
+            List of results aligned with items
+        """
+        pass
+
+class SerialBatchPredictionExecutor(BatchPredictionExecutor):
+    """Run batch items one after another in the calling process.
+
+    Used when no executor is injected.
+    """
+
+    def __init__(
+        self,
+        progress_callback: Optional[Callable[[BatchPredictionProgress], None]] = None,
+    ):
+        """Initialize executor.
+
+        Args:
+            progress_callback: Called after every finished location
+                (exceptions it raises propagate from run())
+        """
+        self.progress_callback = progress_callback
+
+    def run(
+        self,
+        predict: Callable[[Any], Any],
+        items: Sequence[Any],
+        labels: Optional[Sequence[str]] = None,
+    ) -> List[BatchItemResult]:
+        """Predict all items in order (see BatchPredictionExecutor.run)."""
+        labels = list(labels) if labels is not None else [str(i) for i in range(len(items))]
+        start = time.time()
+        results: List[BatchItemResult] = []
+        failed = 0
+
+        for index, item in enumerate(items):
+            result = run_batch_item(predict, item)
+            results.append(result)
+            if result.error is not None:
+                failed += 1
+            if self.progress_callback is not None:
+                self.progress_callback(BatchPredictionProgress(
+                    completed=index + 1,
+                    failed=failed,
+                    total=len(items),
+                    elapsed_seconds=time.time() - start,
+                    label=labels[index],
+                ))
+        return results
@@ -0,0 +1,38 @@
+"""Completion table gateway interface.
+
+Gateway for persisting per-crop completion tables between
+`optimize allocate` (writes) and `optimize adjust` (reads). Tables are only
+valid for the weather they were built from: implementations record it on
+save and return no tables when it has changed.
+
+Note:
+    Source configuration (file path, database connection, etc.) is provided
+    at initialization time, not at method call time.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from agrr_core.usecase.services.crop_completion_table import CropCompletionTable
+
+class CompletionTableGateway(ABC):
+    """Gateway interface for completion table operations."""
+
+    @abstractmethod
+    def save(self, tables: List[CropCompletionTable]) -> None:
+        """Save completion tables to configured destination.
+
+        Args:
+            tables: Completion tables (one per crop profile)
+        """
+        pass
+
+    @abstractmethod
+    def get_all(self) -> List[CropCompletionTable]:
+        """Get completion tables from configured source.
+
+        Returns:
+            Completion tables, empty list if the source does not exist or the
+            tables were built from other weather
+        """
+        pass
@@ -20,11 +20,12 @@ Constraints:
 import uuid
 import time
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 
 from agrr_core.entity.entities.field_entity import Field
 from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.entity.entities.crop_profile_entity import CropProfile
 from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
 from agrr_core.entity.entities.field_schedule_entity import FieldSchedule
 from agrr_core.entity.entities.multi_field_optimization_result_entity import (
@@ -41,11 +42,13 @@ from agrr_core.usecase.gateways.field_gateway import FieldGateway
 from agrr_core.usecase.gateways.crop_profile_gateway import CropProfileGateway
 from agrr_core.usecase.gateways.weather_gateway import WeatherGateway
 from agrr_core.usecase.gateways.interaction_rule_gateway import InteractionRuleGateway
+from agrr_core.usecase.gateways.completion_table_gateway import CompletionTableGateway
 from agrr_core.usecase.interactors.growth_period_optimize_interactor import (
     GrowthPeriodOptimizeInteractor,
 )
 from agrr_core.usecase.services.violation_checker_service import ViolationCheckerService
 from agrr_core.usecase.services.interaction_rule_service import InteractionRuleService
+from agrr_core.usecase.services.crop_completion_table import CropCompletionTable
 
 class AllocationAdjustInteractor:
     """Interactor for allocation adjustment use case."""
@@ -58,6 +61,7 @@ class AllocationAdjustInteractor:
         weather_gateway: WeatherGateway,
         crop_profile_gateway_internal: CropProfileGateway,
         interaction_rule_gateway: Optional[InteractionRuleGateway] = None,
+        completion_table_gateway: Optional[CompletionTableGateway] = None,
     ):
         """Initialize with injected dependencies.
         
@@ -68,6 +72,8 @@ class AllocationAdjustInteractor:
             weather_gateway: Gateway for weather data operations
             crop_profile_gateway_internal: Internal gateway for growth period optimization
             interaction_rule_gateway: Optional gateway for interaction rules
+            completion_table_gateway: Optional gateway for completion tables
+                written by `optimize allocate` (answers GDD completion by lookup)
         """
         self.allocation_result_gateway = allocation_result_gateway
         self.field_gateway = field_gateway
@@ -75,6 +81,10 @@ class AllocationAdjustInteractor:
         self.weather_gateway = weather_gateway
         self.crop_profile_gateway_internal = crop_profile_gateway_internal
         self.interaction_rule_gateway = interaction_rule_gateway
+        self.completion_table_gateway = completion_table_gateway
+        
+        # Completion tables by (crop_id, variety), loaded on demand
+        self._completion_tables: Dict[Tuple[str, Optional[str]], CropCompletionTable] = {}
         
         # Interaction rules loaded on demand
         self.interaction_rules: List[InteractionRule] = []
@@ -153,6 +163,9 @@ class AllocationAdjustInteractor:
             t_rules1 = time.perf_counter()
             print(f"[PROFILE] AllocationAdjust: load_rules elapsed={t_rules1-t_rules0:.3f}s", flush=True)
         
+        # Load completion tables if gateway is provided
+        self._load_completion_tables()
+        
         # Apply move instructions with GDD calculation
         t_apply0 = time.perf_counter() if prof else 0.0
         adjusted_result, applied_moves, rejected_moves = self._apply_moves(
@@ -629,6 +642,34 @@ class AllocationAdjustInteractor:
         
         return adjusted_result, applied_moves, rejected_moves
     
+    def _load_completion_tables(self) -> None:
+        """Load completion tables from gateway.
+        
+        A table is kept only if it was built for the crop profile that
+        _calculate_completion_date would otherwise use for its crop and
+        variety; stale tables (other profile or start days) are ignored.
+        """
+        self._completion_tables = {}
+        if not self.completion_table_gateway:
+            return
+        for table in self.completion_table_gateway.get_all():
+            crop_profile = self._find_crop_profile(table.crop_id, table.variety)
+            if (
+                crop_profile is not None
+                and crop_profile.crop.variety == table.variety
+                and table.matches(crop_profile)
+            ):
+                self._completion_tables.setdefault((table.crop_id, table.variety), table)
+    
+    def _find_crop_profile(self, crop_id: str, variety: Optional[str]) -> Optional[CropProfile]:
+        """Crop profile of a crop: same crop_id and variety, else the first with the crop_id."""
+        # Gateway handles caching internally
+        candidates = [cp for cp in self.crop_gateway.get_all() if cp.crop.crop_id == crop_id]
+        for cp in candidates:
+            if cp.crop.variety == variety:
+                return cp
+        return candidates[0] if candidates else None
+    
     def _calculate_completion_date(
         self,
         crop: Crop,
@@ -653,14 +694,19 @@ class AllocationAdjustInteractor:
         prof = os.getenv("AGRR_PROFILE") == "1"
         t_all0 = time.perf_counter() if prof else 0.0
         
+        # Answer by lookup when a completion table covers the evaluation window
+        table = self._completion_tables.get((crop.crop_id, crop.variety))
+        if table is not None:
+            completion = self._completion_from_table(table, crop, start_date, planning_period_end)
+            if completion is not None:
+                if prof:
+                    t_all1 = time.perf_counter()
+                    print(f"[PROFILE] AllocationAdjust: completion_table_lookup elapsed={t_all1-t_all0:.3f}s", flush=True)
+                return completion
+        
         # Get crop profile from gateway (gateway handles caching internally)
         t_crop0 = time.perf_counter() if prof else 0.0
-        all_crops = self.crop_gateway.get_all()
-        crop_profile = None
-        for cp in all_crops:
-            if cp.crop.crop_id == crop.crop_id:
-                crop_profile = cp
-                break
+        crop_profile = self._find_crop_profile(crop.crop_id, crop.variety)
         
         if crop_profile is None:
             raise ValueError(f"Crop profile not found for crop {crop.crop_id}")
@@ -742,4 +788,51 @@ class AllocationAdjustInteractor:
         finally:
             # Clean up
             self.crop_profile_gateway_internal.delete()
-
+    
+    def _completion_from_table(
+        self,
+        table: CropCompletionTable,
+        crop: Crop,
+        start_date: datetime,
+        planning_period_end: datetime,
+    ) -> Optional[Tuple[datetime, int]]:
+        """Calculate completion date from a completion table.
+        
+        Selects the same candidate as the GrowthPeriodOptimizeInteractor path:
+        start dates after start_date up to planning_period_end (stopping at the
+        first one that cannot complete in time), shortest candidate per
+        completion date, then the earliest start.
+        
+        Returns:
+            Tuple of (completion_date, growth_days), or None if the table does
+            not cover the evaluation window
+            
+        Raises:
+            ValueError: If crop cannot complete growth by planning_period_end
+        """
+        first = start_date + timedelta(days=1)
+        if not table.covers(first, planning_period_end):
+            return None
+        
+        # Completion date -> (start_date, growth_days) of the shortest candidate
+        shortest: Dict[datetime, Tuple[datetime, int]] = {}
+        current = first
+        while current <= planning_period_end:
+            completion = table.completion(current)
+            if completion is None or completion[0] > planning_period_end:
+                break
+            completion_date, growth_days = completion
+            if completion_date not in shortest or growth_days < shortest[completion_date][1]:
+                shortest[completion_date] = (current, growth_days)
+            current += timedelta(days=1)
+        
+        if not shortest:
+            raise ValueError(
+                f"Crop {crop.name} cannot complete growth starting on or after {start_date} "
+                f"by planning period end {planning_period_end}"
+            )
+        
+        completion_date, (_, growth_days) = min(
+            shortest.items(), key=lambda item: item[1][0]
+        )
+        return completion_date, growth_days
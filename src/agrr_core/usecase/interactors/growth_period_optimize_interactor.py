@@ -18,11 +18,11 @@ The evaluation period has dual meaning:
 
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict
-from collections import defaultdict
 
 from agrr_core.entity.entities.crop_profile_entity import CropProfile
 from agrr_core.entity.entities.crop_entity import Crop
 from agrr_core.entity.entities.weather_entity import WeatherData
+from agrr_core.entity.entities.weather_series_entity import WeatherSeries
 from agrr_core.entity.entities.field_entity import Field
 from agrr_core.usecase.dto.growth_period_optimize_request_dto import (
     OptimalGrowthPeriodRequestDTO,
@@ -54,6 +54,15 @@ from agrr_core.entity.value_objects.yield_impact_accumulator import (
 )
 from agrr_core.usecase.interactors.base_optimizer import BaseOptimizer
 from agrr_core.usecase.gateways.weather_interpolator import WeatherInterpolator
+from agrr_core.usecase.services.growth_period_candidates import (
+    CompletionSweep,
+    daily_weather_series,
+    filter_shortest_per_completion_date,
+    no_candidate_error,
+    slide_window,
+    sort_by_cost,
+    window_start_dates,
+)
 import os
 import time
 
@@ -70,13 +79,25 @@ class GrowthPeriodOptimizeInteractor(
         optimization_result_gateway: OptimizationResultGateway = None,
         interaction_rule_gateway: InteractionRuleGateway = None,
         weather_interpolator: Optional[WeatherInterpolator] = None,
+        use_gdd_prefix_sum: bool = True,
     ):
+        """Initialize interactor.
+
+        Args:
+            use_gdd_prefix_sum: If True (default), evaluate start dates with
+                GDDPrefixSumEngine (binary search on cumulative GDD arrays) and
+                yield factors with StressImpactKernel (prefix sums of daily
+                stress impacts). If False, re-accumulate GDD and stress impacts
+                day by day from each start date (reference path, kept for
+                parity checks).
+        """
         super().__init__()  # Initialize BaseOptimizer
         self.crop_profile_gateway = crop_profile_gateway
         self.weather_gateway = weather_gateway
         self.optimization_result_gateway = optimization_result_gateway
         self.interaction_rule_gateway = interaction_rule_gateway
         self.weather_interpolator = weather_interpolator
+        self.use_gdd_prefix_sum = use_gdd_prefix_sum
         
         # Use existing growth progress calculator
         self.growth_progress_interactor = GrowthProgressCalculateInteractor(
@@ -128,30 +149,11 @@ class GrowthPeriodOptimizeInteractor(
             valid_candidates = self._filter_shortest_candidates_per_completion_date(valid_candidates)
         
         if not valid_candidates:
-            # Calculate total required GDD for better error message
-            total_required_gdd = sum(
-                sr.thermal.required_gdd 
-                for sr in crop_profile.stage_requirements
-            )
-            
-            # Check if any candidate completed but exceeded deadline
-            completed_candidates = [c for c in candidates if c.completion_date is not None]
-            if completed_candidates:
-                earliest_completion = min(c.completion_date for c in completed_candidates)
-                # Only show earliest completion if it's within a reasonable range (not due to bug)
-                if earliest_completion <= request.evaluation_period_end + timedelta(days=365):
-                    raise ValueError(
-                        f"No candidate can complete by the deadline ({request.evaluation_period_end.date()}). "
-                        f"Earliest possible completion is {earliest_completion.date()}. "
-                        f"Consider extending the deadline or choosing an earlier start date range."
-                    )
-            
-            # Default error message
-            raise ValueError(
-                f"No candidate can complete growth within the planning period. "
-                f"Total required GDD: {total_required_gdd:.1f}. "
-                f"Planning period: {request.evaluation_period_start.date()} to {request.evaluation_period_end.date()}. "
-                f"Consider extending the deadline, reducing GDD requirements, or choosing different start dates."
+            raise no_candidate_error(
+                candidates,
+                crop_profile,
+                request.evaluation_period_start,
+                request.evaluation_period_end,
             )
         
         # Use BaseOptimizer's select_best (unified objective function)
@@ -185,13 +187,15 @@ class GrowthPeriodOptimizeInteractor(
     ) -> List[CandidateResultDTO]:
         """Evaluate candidates using efficient sliding window algorithm.
         
-        This method uses a sliding window approach to minimize redundant calculations:
-        1. Calculate completion for first start date
-        2. Slide start date forward, subtracting removed days and adding new days as needed
-        3. Check if completion date exceeds deadline
+        With use_gdd_prefix_sum (default), per-stage cumulative GDD arrays are
+        built once and each start date's completion is found by binary search:
+        1. Precompute prefix sums of daily GDD per stage (GDDPrefixSumEngine)
+        2. Resolve completion for all start dates in one vectorized sweep
+        3. Slide start date forward, stopping once completion exceeds deadline
         
-        Time complexity: O(M) where M is weather data length
-        vs. naive O(N×M) where N is number of candidates
+        Time complexity: O(S·M + N·S·log M) where M is weather data length,
+        N is number of candidates and S is number of stages
+        vs. naive O(N×M) day-by-day re-accumulation
         
         Args:
             request: Request DTO with evaluation parameters
@@ -221,37 +225,43 @@ class GrowthPeriodOptimizeInteractor(
         # Stage requirements (for stage-aware GDD accumulation)
         stage_requirements = crop_profile.stage_requirements
         
-        # Create weather data lookup by date
-        weather_by_date = {w.time.date(): w for w in weather_data}
+        # Weather in date order, one record per date: the prefix-sum sweep
+        # reads its columns, so no WeatherData is built on that path
+        series = daily_weather_series(weather_data)
+        if not len(series):
+            raise ValueError("No weather data available")
         
-        # Sort dates to ensure chronological order
-        sorted_dates = sorted(weather_by_date.keys())
+        # Date lookup only for interpolation and the day-by-day reference path
+        weather_by_date = None
+        sorted_dates = None
+        if self.weather_interpolator or not self.use_gdd_prefix_sum:
+            weather_by_date = series.by_date()
+            sorted_dates = series.dates()
         
         # Apply interpolation if interpolator is provided
         if self.weather_interpolator:
             weather_by_date = self.weather_interpolator.interpolate_temperature(
                 weather_by_date, sorted_dates
             )
+            series = WeatherSeries.from_weather_data(
+                weather_by_date[d] for d in sorted_dates
+            )
         
-        if not sorted_dates:
-            raise ValueError("No weather data available")
-        
-        # Initialize for first candidate (evaluation_period_start)
-        start_date = request.evaluation_period_start
-        current_start = start_date
-        accumulated_gdd = 0.0
-        window_start_idx = 0
-        window_end_idx = 0
-        
-        results = []
-        gdd_per_candidate = []  # Track accumulated GDD for each candidate
+        # First candidate (evaluation_period_start)
+        current_start = request.evaluation_period_start
         
-        # Initial scan removed in favor of stage-aware computation path
         t_init0 = time.perf_counter() if prof else 0.0
         
+        # Prefix-sum sweep on the weather columns (None: day-by-day reference path)
+        sweep = None
+        if self.use_gdd_prefix_sum:
+            sweep = CompletionSweep(series, stage_requirements)
+        
         # Early-stop fast path: compute completion from current_start using stage-aware accumulation
         if request.early_stop_at_first:
-            comp = self._compute_completion_from_start(
+            results = []
+            comp = self._compute_completion(
+                sweep=sweep,
                 start=current_start,
                 weather_by_date=weather_by_date,
                 sorted_dates=sorted_dates,
@@ -277,40 +287,32 @@ class GrowthPeriodOptimizeInteractor(
             t_init1 = time.perf_counter()
             print(f"[PROFILE] GrowthPeriod: initial_scan elapsed={t_init1-t_init0:.3f}s", flush=True)
         t_slide0 = time.perf_counter() if prof else 0.0
-        while current_start < request.evaluation_period_end:
-            # Move start date forward
-            prev_start = current_start
-            current_start += timedelta(days=1)
-            
-            # For multi-stage with different temperature profiles, exact sliding-window subtraction
-            # is non-trivial. Use stage-aware recomputation from current_start to completion.
-            comp = self._compute_completion_from_start(
-                start=current_start,
-                weather_by_date=weather_by_date,
-                sorted_dates=sorted_dates,
-                stage_requirements=stage_requirements,
+        
+        # Resolve completion and yield factor for the whole window in one pass.
+        # For multi-stage with different temperature profiles, exact sliding-window
+        # subtraction is non-trivial: each start date is resolved stage-aware.
+        if sweep is not None:
+            completions = sweep.completions(
+                window_start_dates(current_start, request.evaluation_period_end)
             )
-            
-            # Check if this candidate is valid
-            if comp is None:
-                break
-            completion_date, growth_days, yield_factor = comp
-            if completion_date <= request.evaluation_period_end:
-                results.append(CandidateResultDTO(
-                    start_date=current_start,
-                    completion_date=completion_date,
-                    growth_days=growth_days,
-                    field=request.field,
-                    crop=crop,
-                    is_optimal=False,
-                    yield_factor=yield_factor,
-                ))
-                # Early-stop option: stop sliding once a valid candidate is found
-                if request.early_stop_at_first:
-                    break
-            else:
-                # Completion exceeds deadline - stop here
-                break
+
+            def completion_of(start):
+                return completions[start]
+        else:
+            def completion_of(start):
+                return self._compute_completion_from_start(
+                    start=start,
+                    weather_by_date=weather_by_date,
+                    sorted_dates=sorted_dates,
+                    stage_requirements=stage_requirements,
+                )
+        results = slide_window(
+            current_start,
+            request.evaluation_period_end,
+            request.field,
+            crop,
+            completion_of,
+        )
         
         if prof:
             t_slide1 = time.perf_counter()
@@ -319,15 +321,16 @@ class GrowthPeriodOptimizeInteractor(
         # Save intermediate results if gateway is available
         if self.optimization_result_gateway:
             intermediate_results = []
-            for idx, candidate in enumerate(results):
+            for candidate in results:
+                # Every collected candidate completed, i.e. reached the total required GDD
                 intermediate_result = OptimizationIntermediateResult(
                     start_date=candidate.start_date,
                     completion_date=candidate.completion_date,
                     growth_days=candidate.growth_days,
-                    accumulated_gdd=gdd_per_candidate[idx] if idx < len(gdd_per_candidate) else 0.0,
+                    accumulated_gdd=total_required_gdd,
                     field=candidate.field,
                     is_optimal=candidate.is_optimal,
-                    base_temperature=temperature_profile.base_temperature,
+                    base_temperature=stage_requirements[0].temperature.base_temperature,
                 )
                 intermediate_results.append(intermediate_result)
             
@@ -338,19 +341,28 @@ class GrowthPeriodOptimizeInteractor(
         # Sort candidates by cost (ascending: lower cost is better)
         # Valid candidates (with cost) come first, sorted by cost
         # Invalid candidates (without cost) come last, maintaining chronological order
-        valid_results = [r for r in results if r.total_cost is not None]
-        invalid_results = [r for r in results if r.total_cost is None]
-        
-        # Sort valid candidates by cost (ascending)
-        valid_results.sort(key=lambda r: r.total_cost)
-        
-        # Return sorted valid candidates followed by invalid candidates
-        out = valid_results + invalid_results
+        out = sort_by_cost(results)
         if prof:
             t_all1 = time.perf_counter()
             print(f"[PROFILE] GrowthPeriod: total elapsed={t_all1-t_all0:.3f}s out_candidates={len(out)}", flush=True)
         return out
 
+    def _compute_completion(
+        self, sweep, start, weather_by_date, sorted_dates, stage_requirements
+    ):
+        """Compute completion from a start date using the prefix-sum sweep if available.
+
+        Returns tuple (completion_date, growth_days, yield_factor) or None if cannot complete.
+        """
+        if sweep is None:
+            return self._compute_completion_from_start(
+                start=start,
+                weather_by_date=weather_by_date,
+                sorted_dates=sorted_dates,
+                stage_requirements=stage_requirements,
+            )
+        return sweep.completions([start])[start]
+
     def _compute_completion_from_start(self, start, weather_by_date, sorted_dates, stage_requirements):
         """Compute completion date using stage-aware GDD accumulation from a start date.
 
@@ -552,22 +564,7 @@ class GrowthPeriodOptimizeInteractor(
             Filtered list with only the shortest candidate per completion date,
             ordered by completion_date descending (future to past)
         """
-        # Group candidates by completion_date
-        completion_groups: Dict[datetime, List[CandidateResultDTO]] = defaultdict(list)
-        
-        for candidate in candidates:
-            if candidate.completion_date is not None and candidate.growth_days is not None:
-                completion_groups[candidate.completion_date].append(candidate)
-        
-        # Select shortest candidate from each group
-        filtered = []
-        for completion_date in sorted(completion_groups.keys(), reverse=True):  # Future to past
-            group = completion_groups[completion_date]
-            # Find candidate with minimum growth_days
-            shortest = min(group, key=lambda c: c.growth_days)
-            filtered.append(shortest)
-        
-        return filtered
+        return filter_shortest_per_completion_date(candidates)
 
     def _get_crop_profile(
         self, crop_id: str, variety: Optional[str]
@@ -6,10 +6,15 @@ accumulation from a given start date using crop requirements and weather data.
 The calculation follows a simple linear GDD accumulation model:
 - Total required GDD = sum of all stage requirements
 - Daily progress = (cumulative GDD / total required GDD) * 100
+
+Daily GDD and stress impacts are computed on the weather columns
+(WeatherSeries) as arrays, one stage run at a time; only the progress
+records of the response are built per day.
 """
 
-from datetime import timedelta
-from typing import List
+from typing import List, Sequence, Tuple
+
+import numpy as np
 
 from agrr_core.entity.entities.crop_profile_entity import CropProfile
 from agrr_core.entity.entities.growth_progress_entity import GrowthProgress
@@ -18,8 +23,7 @@ from agrr_core.entity.entities.growth_progress_timeline_entity import (
 )
 from agrr_core.entity.entities.growth_stage_entity import GrowthStage
 from agrr_core.entity.entities.stage_requirement_entity import StageRequirement
-from agrr_core.entity.entities.weather_entity import WeatherData
-from agrr_core.entity.value_objects.yield_impact_accumulator import YieldImpactAccumulator
+from agrr_core.entity.entities.weather_series_entity import WeatherSeries
 from agrr_core.usecase.dto.growth_progress_calculate_request_dto import (
     GrowthProgressCalculateRequestDTO,
 )
@@ -32,6 +36,8 @@ from agrr_core.usecase.gateways.weather_gateway import WeatherGateway
 from agrr_core.usecase.ports.input.growth_progress_calculate_input_port import (
     GrowthProgressCalculateInputPort,
 )
+from agrr_core.usecase.services.gdd_prefix_sum_engine import daily_gdd_array
+from agrr_core.usecase.services.stress_impact_kernel import daily_stress_impacts_array
 
 class GrowthProgressCalculateInteractor(GrowthProgressCalculateInputPort):
     """Interactor for calculating growth progress timeline."""
@@ -81,7 +87,7 @@ class GrowthProgressCalculateInteractor(GrowthProgressCalculateInputPort):
         self,
         crop_profile: CropProfile,
         start_date,
-        weather_data_list: List[WeatherData],
+        weather_data_list: Sequence,
     ) -> GrowthProgressTimeline:
         """Calculate growth progress based on GDD accumulation with yield impact tracking."""
         # Calculate total required GDD
@@ -92,56 +98,110 @@ class GrowthProgressCalculateInteractor(GrowthProgressCalculateInputPort):
         if total_required_gdd <= 0:
             raise ValueError("Total required GDD must be positive")
 
-        cumulative_gdd = 0.0
-        progress_list = []
-        
-        # Initialize yield impact accumulator
-        yield_accumulator = YieldImpactAccumulator()
-
-        for weather_data in weather_data_list:
-            # Determine current stage based on cumulative GDD
-            current_stage = self._determine_current_stage(
-                cumulative_gdd, crop_profile.stage_requirements
-            )
-
-            # Calculate daily GDD using the current stage's temperature profile
-            daily_gdd = current_stage.daily_gdd(weather_data)
-            cumulative_gdd += daily_gdd
-            
-            # Calculate and accumulate daily stress impacts
-            daily_impacts = current_stage.temperature.calculate_daily_stress_impacts(
-                weather=weather_data
-            )
-            yield_accumulator.accumulate_daily_impact(
-                daily_impacts=daily_impacts,
-            )
-
-            # Calculate growth percentage (cap at 100%)
-            growth_percentage = min(
-                (cumulative_gdd / total_required_gdd) * 100.0, 100.0
-            )
+        series = WeatherSeries.from_weather_data(weather_data_list)
+        stage_index, cumulative_gdd = self._accumulate_gdd(
+            series.column('temperature_2m_mean'), crop_profile.stage_requirements
+        )
+        growth_percentage = np.minimum(cumulative_gdd / total_required_gdd * 100.0, 100.0)
 
-            # Create progress record
-            progress = GrowthProgress(
-                date=weather_data.time,
-                cumulative_gdd=cumulative_gdd,
+        progress_list = [
+            GrowthProgress(
+                date=moment,
+                cumulative_gdd=cumulative,
                 total_required_gdd=total_required_gdd,
-                growth_percentage=growth_percentage,
-                current_stage=current_stage.stage,
-                is_complete=(growth_percentage >= 100.0),
+                growth_percentage=percentage,
+                current_stage=crop_profile.stage_requirements[stage].stage,
+                is_complete=(percentage >= 100.0),
+            )
+            for moment, stage, cumulative, percentage in zip(
+                series.times(),
+                stage_index.tolist(),
+                cumulative_gdd.tolist(),
+                growth_percentage.tolist(),
             )
-            progress_list.append(progress)
-        
-        # Get final yield factor
-        yield_factor = yield_accumulator.get_yield_factor()
+        ]
 
         return GrowthProgressTimeline(
             crop=crop_profile.crop,
             start_date=start_date,
             progress_list=progress_list,
-            yield_factor=yield_factor,
+            yield_factor=self._yield_factor(
+                series, crop_profile.stage_requirements, stage_index
+            ),
         )
 
+    def _accumulate_gdd(
+        self, t_mean: np.ndarray, stage_requirements: List[StageRequirement]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Stage index and cumulative GDD of each day.
+
+        The stage of a day is determined from the cumulative GDD before it
+        (_determine_current_stage), and its daily GDD uses that stage's
+        temperature profile. Days are resolved one stage run at a time: the
+        run ends on the first day whose cumulative GDD reaches the stage's
+        accumulated requirement.
+
+        Returns:
+            (stage index per day, cumulative GDD per day)
+        """
+        n_days = len(t_mean)
+        thresholds = np.cumsum([sr.thermal.required_gdd for sr in stage_requirements])
+        stage_index = np.empty(n_days, dtype=np.int64)
+        cumulative_gdd = np.empty(n_days, dtype=np.float64)
+        gdd_by_profile = {}
+
+        cumulative = 0.0
+        pos = 0
+        while pos < n_days:
+            stage = min(
+                int(np.searchsorted(thresholds, cumulative, side='right')),
+                len(stage_requirements) - 1,
+            )
+            profile = stage_requirements[stage].temperature
+            if profile not in gdd_by_profile:
+                gdd_by_profile[profile] = daily_gdd_array(profile, t_mean)
+            # Sequential sums from the carried cumulative (same rounding as day by day)
+            running = np.cumsum(
+                np.concatenate(([cumulative], gdd_by_profile[profile][pos:]))
+            )[1:]
+            end = n_days
+            if stage < len(stage_requirements) - 1:
+                reached = int(np.searchsorted(running, thresholds[stage], side='left'))
+                end = min(pos + reached + 1, n_days)
+            stage_index[pos:end] = stage
+            cumulative_gdd[pos:end] = running[:end - pos]
+            cumulative = float(running[end - pos - 1])
+            pos = end
+        return stage_index, cumulative_gdd
+
+    def _yield_factor(
+        self,
+        series: WeatherSeries,
+        stage_requirements: List[StageRequirement],
+        stage_index: np.ndarray,
+    ) -> float:
+        """Yield factor from the daily stress impacts of each day's stage profile.
+
+        Same multiplicative accumulation as YieldImpactAccumulator.
+        """
+        t_mean = series.column('temperature_2m_mean')
+        t_max = series.column('temperature_2m_max')
+        t_min = series.column('temperature_2m_min')
+        daily_factor = np.ones(len(series))
+        for stage in np.unique(stage_index).tolist():
+            days = stage_index == stage
+            impacts = daily_stress_impacts_array(
+                stage_requirements[stage].temperature,
+                t_mean[days],
+                t_max[days],
+                t_min[days],
+            )
+            factor = np.ones(int(days.sum()))
+            for impact in impacts.values():
+                factor *= np.where(impact > 0, np.maximum(0.0, 1.0 - impact), 1.0)
+            daily_factor[days] = factor
+        return max(0.0, float(np.prod(daily_factor)))
+
     def _determine_current_stage(
         self, cumulative_gdd: float, stage_requirements: List[StageRequirement]
     ) -> StageRequirement:
@@ -31,6 +31,7 @@ Optimizations (Phase 1-3):
 - Phase 3: Adaptive early stopping
 """
 
+import heapq
 import time
 import uuid
 
@@ -54,15 +55,27 @@ from agrr_core.usecase.dto.optimization_config import OptimizationConfig
 from agrr_core.usecase.gateways.field_gateway import FieldGateway
 from agrr_core.usecase.gateways.crop_profile_gateway import CropProfileGateway
 from agrr_core.usecase.gateways.weather_gateway import WeatherGateway
+from agrr_core.usecase.gateways.completion_table_gateway import CompletionTableGateway
 from agrr_core.usecase.interactors.growth_period_optimize_interactor import GrowthPeriodOptimizeInteractor
 from agrr_core.usecase.dto.growth_period_optimize_request_dto import OptimalGrowthPeriodRequestDTO
 from agrr_core.usecase.services.neighbor_generator_service import NeighborGeneratorService
+from agrr_core.usecase.services.neighbor_evaluation_pool import NeighborEvaluationPool
 from agrr_core.usecase.interactors.base_optimizer import BaseOptimizer
 from agrr_core.entity.value_objects.optimization_objective import OptimizationMetrics
+from agrr_core.entity.value_objects.crop_revenue_ledger import CropRevenueLedger
+from agrr_core.entity.value_objects.field_predecessor_index import FieldPredecessorIndex
 from agrr_core.entity.entities.interaction_rule_entity import InteractionRule
 from agrr_core.usecase.services.interaction_rule_service import InteractionRuleService
 from agrr_core.usecase.services.alns_optimizer_service import ALNSOptimizer
+from agrr_core.usecase.services.multi_start_alns_optimizer_service import MultiStartALNSOptimizer
 from agrr_core.usecase.services.violation_checker_service import ViolationCheckerService
+from agrr_core.usecase.services.field_interval_index import FieldIntervalIndex
+from agrr_core.usecase.services.candidate_pool import CandidatePool
+from agrr_core.usecase.services.crop_completion_table import build_completion_tables
+from agrr_core.usecase.services.growth_period_worker_pool import (
+    GrowthPeriodTask,
+    GrowthPeriodWorkerPool,
+)
 
 @dataclass
 class AllocationCandidate:
@@ -84,7 +97,8 @@ class AllocationCandidate:
         self, 
         current_allocations: Optional[List[CropAllocation]] = None,
         field_schedules: Optional[Dict[str, List[CropAllocation]]] = None,
-        interaction_rules: Optional[List] = None
+        interaction_rules: Optional[List] = None,
+        revenue_ledger: Optional[CropRevenueLedger] = None,
     ) -> OptimizationMetrics:
         """Get optimization metrics with raw calculation parameters (implements Optimizable protocol).
         
@@ -101,6 +115,7 @@ class AllocationCandidate:
             current_allocations: List of currently selected allocations (for market demand tracking)
             field_schedules: Dict mapping field_id to allocations (for interaction rules)
             interaction_rules: List of interaction rules (for continuous cultivation, etc.)
+            revenue_ledger: Per-crop revenue totals (replaces scanning current_allocations)
             
         Returns:
             OptimizationMetrics containing raw parameters for calculation
@@ -119,6 +134,7 @@ class AllocationCandidate:
             current_allocations=current_allocations,
             field_schedules=field_schedules,
             interaction_rules=interaction_rules,
+            revenue_ledger=revenue_ledger,
         )
     
     # ===== Baseline Properties (NO CONTEXT - for filtering only) =====
@@ -200,11 +216,14 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         crop_profile_gateway_internal: CropProfileGateway,
         config: Optional[OptimizationConfig] = None,
         interaction_rules: Optional[List[InteractionRule]] = None,
+        completion_table_gateway: Optional[CompletionTableGateway] = None,
     ):
         super().__init__()  # Initialize BaseOptimizer
         self.field_gateway = field_gateway
         self.crop_gateway = crop_gateway
         self.weather_gateway = weather_gateway
+        # Optional: persist per-crop completion tables for allocation adjustment
+        self.completion_table_gateway = completion_table_gateway
         self.config = config or OptimizationConfig()
         
         # Inject crop_profile_gateway for growth period optimizer
@@ -231,7 +250,7 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         )
         
         # Create ALNS optimizer if enabled
-        self.alns_optimizer = ALNSOptimizer(self.config) if self.config.enable_alns else None
+        self.alns_optimizer = self._create_alns_optimizer(self.config) if self.config.enable_alns else None
 
     def execute(
         self,
@@ -270,16 +289,29 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         fields = self._load_fields(request.field_ids)
         crops = self.crop_gateway.get_all()
         
+        # Weather of the run, read once for the worker pool and the completion
+        # tables (the sequential legacy path reads it through
+        # GrowthPeriodOptimizeInteractor instead)
+        uses_worker_pool = (
+            optimization_config.candidate_generation_strategy == "period_template"
+            or optimization_config.enable_parallel_candidate_generation
+        )
+        weather_data = None
+        if uses_worker_pool or self.completion_table_gateway is not None:
+            weather_data = self.weather_gateway.get()
+        
         # Phase 1: Generate candidates based on strategy
         if optimization_config.candidate_generation_strategy == "period_template":
             # Use Period Template strategy
             candidates = self._generate_candidates_with_period_template(
-                fields, crops, request, optimization_config, algorithm
+                fields, crops, request, optimization_config, algorithm, weather_data
             )
         else:
             # Use legacy candidate pool strategy
             if optimization_config.enable_parallel_candidate_generation:
-                candidates = self._generate_candidates_parallel(fields, crops, request, optimization_config)
+                candidates = self._generate_candidates_parallel(
+                    fields, crops, request, optimization_config, weather_data
+                )
             else:
                 candidates = self._generate_candidates(fields, crops, request, optimization_config)
         
@@ -315,7 +347,8 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
                 candidates, 
                 crops,
                 request.optimization_objective,
-                planning_start_date
+                planning_start_date,
+                optimization_config,
             )
             algorithm_name = "Greedy"
         
@@ -344,6 +377,17 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
             algorithm_used=algorithm_name,
         )
         
+        # Phase 5: Persist completion tables for `optimize adjust` (optional)
+        if self.completion_table_gateway is not None:
+            self.completion_table_gateway.save(
+                build_completion_tables(
+                    crops,
+                    weather_data,
+                    request.planning_period_start,
+                    request.planning_period_end,
+                )
+            )
+        
         return MultiFieldCropAllocationResponseDTO(optimization_result=result)
 
     def _load_fields(self, field_ids: List[str]) -> List[Field]:
@@ -467,27 +511,58 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         crops: List,
         request: MultiFieldCropAllocationRequestDTO,
         config: OptimizationConfig,
+        weather_data=None,
     ) -> List[AllocationCandidate]:
         """Generate candidates in parallel for all field×crop combinations (Phase 2).
         
-        This significantly speeds up candidate generation by parallelizing DP optimization.
-        Expected speedup: 20-50x for typical problems.
+        Each field×crop growth period optimization is an independent task run by
+        GrowthPeriodWorkerPool on up to config.candidate_generation_workers processes.
+        Workers get a one-time snapshot of weather data and crop profiles, so no
+        per-task crop state goes through the shared crop_profile_gateway_internal.
+        Candidates are merged in field × crop order (deterministic).
+        
+        weather_data is the weather already read for the run (None: read it
+        from weather_gateway).
         """
+        if weather_data is None:
+            weather_data = self.weather_gateway.get()
+        pool = GrowthPeriodWorkerPool(
+            weather_data=weather_data,
+            crop_profiles=list(crops),
+            max_workers=config.candidate_generation_workers,
+        )
         
         # Create tasks for all field × crop combinations
         tasks = []
         for field in fields:
-            for crop_aggregate in crops:
-                task = self._generate_candidates_for_field_crop(
-                    field, crop_aggregate, request, config
-                )
-                tasks.append(task)
+            for crop_index in range(len(crops)):
+                tasks.append(GrowthPeriodTask(
+                    field=field,
+                    crop_index=crop_index,
+                    evaluation_period_start=request.planning_period_start,
+                    evaluation_period_end=request.planning_period_end,
+                    filter_redundant_candidates=request.filter_redundant_candidates,
+                ))
+        
+        results = pool.run(tasks)
         
-        # Execute tasks sequentially (synchronous execution)
+        # Merge in task order
         all_candidates = []
-        for task in tasks:
-            candidate_list = task
-            all_candidates.extend(candidate_list)
+        for task, result in zip(tasks, results):
+            crop = crops[task.crop_index].crop
+            if result.error is not None:
+                # Crop cannot complete growth in the planning period
+                import logging
+                logger = logging.getLogger(__name__)
+                logger.warning(
+                    f"Skipping crop '{crop.name} ({crop.variety})' in field '{task.field.name}': {result.error}"
+                )
+                continue
+            all_candidates.extend(
+                self._build_field_crop_candidates(
+                    task.field, crop, result.candidates, request, config
+                )
+            )
         
         # ===== LEGACY POST-FILTERING - DO NOT REPLICATE =====
         # See _generate_candidates() for warning about legacy filtering code.
@@ -503,6 +578,7 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         request: MultiFieldCropAllocationRequestDTO,
         config: OptimizationConfig,
         algorithm: str,
+        weather_data=None,
     ) -> List[AllocationCandidate]:
         """Generate candidates using Period Template strategy (recommended).
         
@@ -515,13 +591,12 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
             request: Allocation request
             config: Optimization config
             algorithm: Algorithm name ("greedy" or "dp")
+            weather_data: Weather already read for the run (None: read it
+                from weather_gateway)
             
         Returns:
             List of AllocationCandidate
         """
-        from agrr_core.usecase.dto.growth_period_optimize_request_dto import (
-            OptimalGrowthPeriodRequestDTO
-        )
         from agrr_core.entity.entities.period_template_entity import PeriodTemplate
         
         # Generate period templates for each crop using GrowthPeriodOptimizeInteractor
@@ -533,45 +608,50 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
             daily_fixed_cost=0.0
         )
         
-        templates_by_crop = {}
-        
-        for crop_aggregate in crops:
-            crop = crop_aggregate.crop
-            
-            # Generate templates for this crop using GrowthPeriodOptimizeInteractor
-            optimization_request = OptimalGrowthPeriodRequestDTO(
-                crop_id=crop.crop_id,
-                variety=crop.variety,
+        # One growth period optimization per crop (templates are field-independent)
+        if weather_data is None:
+            weather_data = self.weather_gateway.get()
+        pool = GrowthPeriodWorkerPool(
+            weather_data=weather_data,
+            crop_profiles=list(crops),
+            max_workers=config.candidate_generation_workers,
+        )
+        tasks = [
+            GrowthPeriodTask(
+                field=reference_field,
+                crop_index=crop_index,
                 evaluation_period_start=request.planning_period_start,
                 evaluation_period_end=request.planning_period_end,
-                field=reference_field,
                 filter_redundant_candidates=False,  # We want all possible templates
             )
+            for crop_index in range(len(crops))
+        ]
+        results = pool.run(tasks)
+        
+        templates_by_crop = {}
+        
+        for crop_aggregate, result in zip(crops, results):
+            crop = crop_aggregate.crop
             
-            # Set crop requirement in growth period optimizer gateway
-            self.crop_profile_gateway_internal.save(crop_aggregate)
-            
-            try:
-                optimization_result = self.growth_period_optimizer.execute(optimization_request)
-                
-                # Convert CandidateResultDTO to PeriodTemplate using factory method
-                templates = []
-                limit = min(len(optimization_result.candidates), config.max_templates_per_crop)
-                
-                for assessment in optimization_result.candidates[:limit]:
-                    template = PeriodTemplate.from_candidate_result(
-                        candidate=assessment,
-                        crop=crop,
-                        accumulated_gdd=0.0  # TODO: Add accumulated_gdd to CandidateResultDTO
-                    )
-                    if template is not None:
-                        templates.append(template)
-                
-                templates_by_crop[crop.crop_id] = templates
-                
-            except ValueError as e:
+            if result.error is not None:
                 # Crop cannot complete growth in the planning period
                 templates_by_crop[crop.crop_id] = []
+                continue
+            
+            # Convert CandidateResultDTO to PeriodTemplate using factory method
+            templates = []
+            limit = min(len(result.candidates), config.max_templates_per_crop)
+            
+            for assessment in result.candidates[:limit]:
+                template = PeriodTemplate.from_candidate_result(
+                    candidate=assessment,
+                    crop=crop,
+                    accumulated_gdd=0.0  # TODO: Add accumulated_gdd to CandidateResultDTO
+                )
+                if template is not None:
+                    templates.append(template)
+            
+            templates_by_crop[crop.crop_id] = templates
         
         # Generate candidates by applying templates to fields
         candidates = []
@@ -667,14 +747,37 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
             except Exception:
                 pass  # Ignore cleanup errors
         
-        # Generate area×period candidates
+        return self._build_field_crop_candidates(
+            field, crop, optimization_result.candidates, request, config
+        )
+    
+    def _build_field_crop_candidates(
+        self,
+        field: Field,
+        crop: Crop,
+        candidate_periods: List,
+        request: MultiFieldCropAllocationRequestDTO,
+        config: OptimizationConfig,
+    ) -> List[AllocationCandidate]:
+        """Build area×period allocation candidates from growth period results.
+        
+        Args:
+            field: Field the periods were optimized for
+            crop: Crop entity
+            candidate_periods: CandidateResultDTO list from GrowthPeriodOptimizeInteractor
+            request: Allocation request
+            config: Optimization config
+            
+        Returns:
+            List of allocation candidates
+        """
         candidates = []
         field_max_area = field.area
         
         for area_level in config.area_levels:
             area_used = field_max_area * area_level
             
-            for candidate_period in optimization_result.candidates[:config.top_period_candidates]:
+            for candidate_period in candidate_periods[:config.top_period_candidates]:
                 if candidate_period.completion_date is None:
                     continue
                 
@@ -744,6 +847,7 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         crops: List,
         optimization_objective: str,
         planning_start_date,
+        config: Optional[OptimizationConfig] = None,
     ) -> List[CropAllocation]:
         """Select allocations using greedy allocation with dynamic re-sorting.
         
@@ -752,15 +856,28 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         penalties are properly considered.
         
         Applies interaction rules (continuous cultivation) to adjust revenue dynamically.
+        Ties in profit rate are broken by candidate order.
+        
+        With config.enable_lazy_greedy (default) the same selection is made by
+        _lazy_greedy_allocation(); otherwise all remaining candidates are
+        re-sorted after every pick.
         
         Note: optimization_objective parameter is kept for backward compatibility
         but the actual optimization uses the unified objective (profit maximization).
         """
+        cfg = config or self.config
+        if cfg.enable_lazy_greedy:
+            return self._lazy_greedy_allocation(candidates, planning_start_date)
+        
         # Track allocated resources
-        field_schedules: Dict[str, List[CropAllocation]] = {}  # field_id -> allocations
+        field_schedules = FieldPredecessorIndex()  # field_id -> allocations (previous-crop lookups)
+        schedule_index = FieldIntervalIndex()  # Fallow-aware overlap checks
+        rule_table = self.interaction_rule_service.rule_table
         crop_areas: Dict[str, float] = {c.crop.crop_id: 0.0 for c in crops}
-        # Note: No need to manually track crop_revenues!
-        # OptimizationMetrics.calculate_crop_cumulative_revenue() handles this (single source of truth)
+        revenue_ledger = CropRevenueLedger()  # Market demand tracking
+        
+        # Original position of each candidate (tie-breaker)
+        position = {id(c): i for i, c in enumerate(candidates)}
         
         # Greedily select allocations with dynamic re-sorting
         allocations = []
@@ -773,11 +890,15 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
             # - interaction impact (continuous cultivation, rotation, etc.)
             # This is the SINGLE SOURCE OF TRUTH for all profit calculations
             
-            # Sort by profit with current context
+            # Sort by profit with current context (earlier candidates first on ties)
             # Pass allocations, field_schedules, interaction_rules, and planning_start_date
             remaining_candidates.sort(
-                key=lambda x: self._get_candidate_sort_key_with_full_context(
-                    x, allocations, field_schedules, self.interaction_rule_service.rules, planning_start_date
+                key=lambda x: (
+                    self._get_candidate_sort_key_with_full_context(
+                        x, allocations, field_schedules, rule_table, planning_start_date,
+                        revenue_ledger,
+                    ),
+                    -position[id(x)],
                 ),
                 reverse=True
             )
@@ -785,20 +906,8 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
             # Try to allocate the best candidates
             allocated = False
             for candidate in remaining_candidates:
-                # Check time overlap with existing allocations in the same field
-                field_id = candidate.field.field_id
-                if field_id not in field_schedules:
-                    field_schedules[field_id] = []
-                
-                has_overlap = False
-                for existing in field_schedules[field_id]:
-                    # Use overlaps_with_fallow to respect fallow period constraint
-                    # Call from candidate (AllocationCandidate) to use the flexible method
-                    if candidate.overlaps_with_fallow(existing):
-                        has_overlap = True
-                        break
-                
-                if has_overlap:
+                # Respect fallow period constraint (O(log n) interval lookup)
+                if schedule_index.overlaps(candidate):
                     continue  # Skip this candidate
                 
                 # Found a feasible candidate - allocate it
@@ -806,14 +915,17 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
                 crop_id = candidate.crop.crop_id
                 # Convert candidate to allocation with full context
                 allocation = self._candidate_to_allocation(
-                    candidate, allocations, field_schedules, self.interaction_rule_service.rules, planning_start_date
+                    candidate, allocations, field_schedules, rule_table, planning_start_date,
+                    revenue_ledger,
                 )
                 allocations.append(allocation)
-                field_schedules[field_id].append(allocation)
+                field_schedules.add(allocation)
+                schedule_index.add(allocation)
+                revenue_ledger.add(allocation)
                 crop_areas[crop_id] += allocation.area_used
                 
-                # No need to manually update crop_revenues or interaction_impact!
-                # Next iteration will automatically calculate them
+                # Interaction impact is recalculated from field_schedules
+                # in the next iteration
                 
                 remaining_candidates.remove(candidate)
                 allocated = True
@@ -825,13 +937,104 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         
         return allocations
     
+    def _lazy_greedy_allocation(
+        self,
+        candidates: List[AllocationCandidate],
+        planning_start_date,
+    ) -> List[CropAllocation]:
+        """Greedy allocation on a max-heap with lazy re-scoring.
+        
+        Selects the same allocations as the full re-sort in _greedy_allocation().
+        A candidate's profit rate depends on the current solution only through
+        - its crop's cumulative revenue (market demand limit), and
+        - the latest allocation completed before it in its field
+          (interaction rules, soil recovery).
+        So after allocating crop c in field f, only candidates of crop c and
+        candidates of field f starting after the new allocation are re-scored.
+        Each re-score bumps the candidate's version; heap entries with an old
+        version are dropped when popped. Candidates that overlap the schedule
+        are dropped for good (the schedule only grows).
+        
+        Heap entries are (-profit_rate, position, version), so ties pop in
+        candidate order.
+        
+        Time Complexity: O((n + r) log n) where r is the number of re-scores
+        
+        Args:
+            candidates: Allocation candidates
+            planning_start_date: Planning period start date (for soil recovery)
+            
+        Returns:
+            Allocations in selection order
+        """
+        rules = self.interaction_rule_service.rule_table
+        field_schedules = FieldPredecessorIndex()
+        schedule_index = FieldIntervalIndex()
+        revenue_ledger = CropRevenueLedger()
+        allocations: List[CropAllocation] = []
+        
+        def score(i: int) -> float:
+            return self._get_candidate_sort_key_with_full_context(
+                candidates[i], allocations, field_schedules, rules, planning_start_date, revenue_ledger
+            )
+        
+        by_crop: Dict[str, List[int]] = {}
+        by_field: Dict[str, List[int]] = {}
+        for i, candidate in enumerate(candidates):
+            by_crop.setdefault(candidate.crop.crop_id, []).append(i)
+            by_field.setdefault(candidate.field.field_id, []).append(i)
+        
+        alive = [True] * len(candidates)
+        version = [0] * len(candidates)
+        heap = [(-score(i), i, 0) for i in range(len(candidates))]
+        heapq.heapify(heap)
+        
+        while heap:
+            _, i, entry_version = heapq.heappop(heap)
+            if not alive[i] or entry_version != version[i]:
+                continue  # Already used, dropped, or re-scored since
+            
+            alive[i] = False
+            candidate = candidates[i]
+            if schedule_index.overlaps(candidate):
+                continue
+            
+            field_id = candidate.field.field_id
+            crop_id = candidate.crop.crop_id
+            allocation = self._candidate_to_allocation(
+                candidate, allocations, field_schedules, rules, planning_start_date, revenue_ledger
+            )
+            allocations.append(allocation)
+            field_schedules.add(allocation)
+            schedule_index.add(allocation)
+            revenue_ledger.add(allocation)
+            
+            # Drop used candidates from the groups while collecting affected ones
+            by_crop[crop_id] = [j for j in by_crop[crop_id] if alive[j]]
+            by_field[field_id] = [j for j in by_field[field_id] if alive[j]]
+            affected = dict.fromkeys(by_crop[crop_id])
+            affected.update(
+                (j, None) for j in by_field[field_id]
+                if candidates[j].start_date >= allocation.completion_date
+            )
+            
+            for j in affected:
+                if schedule_index.overlaps(candidates[j]):
+                    alive[j] = False
+                    continue
+                version[j] += 1
+                heapq.heappush(heap, (-score(j), j, version[j]))
+        
+        return allocations
+    
     def _get_candidate_sort_key_with_full_context(
         self, 
         candidate: AllocationCandidate, 
         current_allocations: List[CropAllocation],
         field_schedules: Dict[str, List[CropAllocation]],
         interaction_rules: List,
-        planning_start_date
+        planning_start_date,
+        revenue_ledger: Optional[CropRevenueLedger] = None,
     ) -> float:
         """Get sort key for a candidate with full context.
         
@@ -847,6 +1050,7 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
             field_schedules: Dict mapping field_id to allocations
             interaction_rules: List of interaction rules
             planning_start_date: Planning period start date
+            revenue_ledger: Per-crop revenue totals of current_allocations (O(1) lookup)
             
         Returns:
             Profit rate (to be maximized)
@@ -866,6 +1070,7 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
             field_schedules=field_schedules,
             interaction_rules=interaction_rules,
             planning_start_date=planning_start_date,
+            revenue_ledger=revenue_ledger,
         )
         cost = metrics.cost
         if cost > 0:
@@ -1099,7 +1304,9 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         
         # Solve DP for each field SEQUENTIALLY (considering previous allocations)
         allocations = []
-        field_schedules = {}
+        field_schedules = FieldPredecessorIndex()
+        revenue_ledger = CropRevenueLedger()
+        rule_table = self.interaction_rule_service.rule_table
         
         for field in fields:
             field_id = field.field_id
@@ -1126,10 +1333,10 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
                     crop=candidate.crop,
                     field=candidate.field,
                     start_date=candidate.start_date,
-                    current_allocations=allocations,
                     field_schedules=field_schedules,
-                    interaction_rules=self.interaction_rule_service.rules,
+                    interaction_rules=rule_table,
                     planning_start_date=planning_start_date,
+                    revenue_ledger=revenue_ledger,
                 )
                 # Store evaluated profit for this candidate
                 candidate_profits[id(candidate)] = metrics.profit
@@ -1143,14 +1350,14 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
             for candidate in selected_candidates:
                 # Convert with current context for correct revenue calculation
                 allocation = self._candidate_to_allocation(
-                    candidate, allocations, field_schedules, self.interaction_rule_service.rules, planning_start_date
+                    candidate, allocations, field_schedules, rule_table, planning_start_date,
+                    revenue_ledger,
                 )
                 allocations.append(allocation)
+                revenue_ledger.add(allocation)
                 
                 # Update field schedules
-                if field_id not in field_schedules:
-                    field_schedules[field_id] = []
-                field_schedules[field_id].append(allocation)
+                field_schedules.add(allocation)
         
         return allocations
     
@@ -1186,7 +1393,7 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         if config.enable_alns:
             # Use ALNS
             if self.alns_optimizer is None:
-                self.alns_optimizer = ALNSOptimizer(config)
+                self.alns_optimizer = self._create_alns_optimizer(config)
             
             return self.alns_optimizer.optimize(
                 initial_solution=initial_solution,
@@ -1194,6 +1401,7 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
                 fields=fields,
                 crops=crops_list,
                 max_iterations=config.alns_iterations,
+                time_limit=time_limit,
             )
         else:
             # Use Hill Climbing (existing implementation)
@@ -1201,6 +1409,13 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
                 initial_solution, candidates, fields, config, time_limit, planning_start_date
             )
     
+    @staticmethod
+    def _create_alns_optimizer(config: OptimizationConfig):
+        """ALNS optimizer for the config (multi-start when config.alns_starts > 1)."""
+        if config.alns_starts > 1:
+            return MultiStartALNSOptimizer(config)
+        return ALNSOptimizer(config)
+    
     def _hill_climbing_local_search(
         self,
         initial_solution: List[CropAllocation],
@@ -1213,7 +1428,9 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         """Hill Climbing local search implementation.
         
         Phase 1: Neighbor sampling to limit computational cost
-        Phase 2: Incremental feasibility checking for faster validation
+        Phase 2: Neighbors are moves scored by delta evaluation (only the
+                 accepted move is materialized and fully recalculated),
+                 optionally on config.local_search_workers processes
         Phase 3: Adaptive early stopping
         """
         start_time = time.time()
@@ -1236,81 +1453,92 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         max_no_improvement = max(10, min(config.max_no_improvement, problem_size // 2)) if config.enable_adaptive_early_stopping else config.max_no_improvement
         improvement_threshold = current_profit * config.improvement_threshold_ratio if config.enable_adaptive_early_stopping else 0
         
-        for iteration in range(config.max_local_search_iterations):
-            # Check time limit
-            if time_limit and (time.time() - start_time) > time_limit:
-                break
+        # Candidates indexed by (field, crop) and start date once for all iterations
+        candidate_pool = CandidatePool(candidates)
+        
+        evaluation_pool = NeighborEvaluationPool(
+            fields=list(fields) + [c.field for c in candidates] + [a.field for a in initial_solution],
+            crops=[c.crop for c in candidates] + [a.crop for a in initial_solution],
+            interaction_rules=self.interaction_rule_service.rule_table,
+            planning_start_date=planning_start_date,
+            max_workers=config.local_search_workers,
+        )
+        
+        with evaluation_pool:
+            for iteration in range(config.max_local_search_iterations):
+                # Check time limit
+                if time_limit and (time.time() - start_time) > time_limit:
+                    break
             
-            # Generate neighbors using NeighborGeneratorService (Phase 1 refactoring)
-            neighbors = self.neighbor_generator.generate_neighbors(
-                solution=current_solution,
-                candidates=candidates,
-                fields=fields,
-                crops=crops_list,
-            )
+                # Generate neighbor moves using NeighborGeneratorService (Phase 1 refactoring)
+                moves = self.neighbor_generator.generate_moves(
+                    solution=current_solution,
+                    candidates=candidate_pool,
+                    fields=fields,
+                    crops=crops_list,
+                )
             
-            # Find best neighbor
-            best_neighbor = None
-            best_profit = current_profit
+                # Find best move by delta evaluation against the current solution
+                # (only fields touched by a move are rescored; batch may be split
+                # across worker processes, results keep move order)
+                best_move = None
+                best_delta = 0.0
             
-            for neighbor in neighbors:
-                # Build field_schedules from neighbor for interaction rule calculation
-                neighbor_field_schedules = {}
-                for alloc in neighbor:
-                    field_id = alloc.field.field_id
-                    if field_id not in neighbor_field_schedules:
-                        neighbor_field_schedules[field_id] = []
-                    neighbor_field_schedules[field_id].append(alloc)
-                
-                # Recalculate revenue with full context
-                # Delegate to OptimizationMetrics (single source of truth)
-                adjusted_neighbor = OptimizationMetrics.recalculate_allocations_with_context(
-                    neighbor, 
-                    neighbor_field_schedules, 
-                    self.interaction_rule_service.rules,
-                    planning_start_date
-                )
-                
-                # Use standard or incremental feasibility check
-                if self._is_feasible_solution(adjusted_neighbor):
-                    neighbor_profit = self._calculate_total_profit(adjusted_neighbor)
-                    if neighbor_profit > best_profit:
-                        best_neighbor = adjusted_neighbor
-                        best_profit = neighbor_profit
+                for move, (delta, feasible) in zip(moves, evaluation_pool.evaluate(current_solution, moves)):
+                    if not feasible:
+                        continue  # Violates fallow period in a touched field
+                    if delta > best_delta:
+                        best_move = move
+                        best_delta = delta
             
-            # Update if improvement found
-            if best_neighbor is not None:
-                improvement = best_profit - current_profit
+                # Materialize only the best neighbor, recalculated with full context
+                # Delegate to OptimizationMetrics (single source of truth)
+                best_neighbor = None
+                if best_move is not None:
+                    neighbor = best_move.apply(current_solution)
+                    best_neighbor = OptimizationMetrics.recalculate_allocations_with_context(
+                        neighbor,
+                        FieldPredecessorIndex.from_allocations(neighbor),
+                        self.interaction_rule_service.rule_table,
+                        planning_start_date
+                    )
+                    best_profit = self._calculate_total_profit(best_neighbor)
+                    if best_profit <= current_profit or not self._is_feasible_solution(best_neighbor):
+                        best_neighbor = None
+
+                # Update if improvement found
+                if best_neighbor is not None:
+                    improvement = best_profit - current_profit
                 
-                # Phase 3: Check if improvement is significant
-                if config.enable_adaptive_early_stopping:
-                    if improvement > improvement_threshold:
+                    # Phase 3: Check if improvement is significant
+                    if config.enable_adaptive_early_stopping:
+                        if improvement > improvement_threshold:
+                            current_solution = best_neighbor
+                            current_profit = best_profit
+                            no_improvement_count = 0
+                            best_profit_so_far = best_profit
+                        else:
+                            # Improvement too small
+                            no_improvement_count += 1
+                    else:
                         current_solution = best_neighbor
                         current_profit = best_profit
                         no_improvement_count = 0
-                        best_profit_so_far = best_profit
-                    else:
-                        # Improvement too small
-                        no_improvement_count += 1
                 else:
-                    current_solution = best_neighbor
-                    current_profit = best_profit
-                    no_improvement_count = 0
-            else:
-                no_improvement_count += 1
+                    no_improvement_count += 1
             
-            # Phase 3: Convergence check
-            if config.enable_adaptive_early_stopping:
-                if current_profit >= best_profit_so_far * 0.999:  # Within 0.1%
-                    consecutive_near_optimal += 1
-                    if consecutive_near_optimal >= 5:
-                        break  # Converged
-                else:
-                    consecutive_near_optimal = 0
+                # Phase 3: Convergence check
+                if config.enable_adaptive_early_stopping:
+                    if current_profit >= best_profit_so_far * 0.999:  # Within 0.1%
+                        consecutive_near_optimal += 1
+                        if consecutive_near_optimal >= 5:
+                            break  # Converged
+                    else:
+                        consecutive_near_optimal = 0
             
-            # Early stopping
-            if no_improvement_count >= max_no_improvement:
-                break
+                # Early stopping
+                if no_improvement_count >= max_no_improvement:
+                    break
         
         return current_solution
     
@@ -1322,7 +1550,8 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         current_allocations: Optional[List[CropAllocation]] = None,
         field_schedules: Optional[Dict[str, List[CropAllocation]]] = None,
         interaction_rules: Optional[List] = None,
-        planning_start_date = None
+        planning_start_date = None,
+        revenue_ledger: Optional[CropRevenueLedger] = None,
     ) -> CropAllocation:
         """Convert AllocationCandidate to CropAllocation.
         
@@ -1334,6 +1563,7 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
             field_schedules: Dict mapping field_id to allocations (for interaction rules)
             interaction_rules: List of interaction rules
             planning_start_date: Planning period start date (for soil recovery calculation)
+            revenue_ledger: Per-crop revenue totals of current_allocations (O(1) lookup)
             
         Returns:
             CropAllocation with correct revenue/profit calculated from full context
@@ -1353,6 +1583,7 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
             field_schedules=field_schedules,
             interaction_rules=interaction_rules,
             planning_start_date=planning_start_date,
+            revenue_ledger=revenue_ledger,
         )
         
         return CropAllocation(
@@ -1387,19 +1618,11 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
         - If total_revenue > max_revenue, it means revenue wasn't properly
           recalculated with cumulative context (a bug, not a constraint violation)
         """
-        # Check for time overlaps within each field
-        field_allocations: Dict[str, List[CropAllocation]] = {}
+        # Check for time overlaps within each field (considering fallow period)
+        schedule_index = FieldIntervalIndex()
         for alloc in allocations:
-            field_id = alloc.field.field_id
-            if field_id not in field_allocations:
-                field_allocations[field_id] = []
-            field_allocations[field_id].append(alloc)
-        
-        for field_id, field_allocs in field_allocations.items():
-            for i, alloc1 in enumerate(field_allocs):
-                for alloc2 in field_allocs[i+1:]:
-                    if alloc1.overlaps_with_fallow(alloc2):
-                        return False  # Overlap found (considering fallow period)
+            if not schedule_index.try_add(alloc):
+                return False  # Overlap found
         
         # Verify revenue calculations are consistent (sanity check for bugs)
         # Get unique crops
@@ -1408,12 +1631,10 @@ class MultiFieldCropAllocationGreedyInteractor(BaseOptimizer[AllocationCandidate
             unique_crops[alloc.crop.crop_id] = alloc.crop
         
         # Check: if cumulative revenue > max_revenue, revenue calculation has a bug
+        revenue_ledger = CropRevenueLedger.from_allocations(allocations)
         for crop_id, crop in unique_crops.items():
             if crop.max_revenue is not None:
-                # Use unified calculation method
-                total_revenue = OptimizationMetrics.calculate_crop_cumulative_revenue(
-                    crop_id, allocations
-                )
+                total_revenue = revenue_ledger.cumulative_revenue(crop_id)
                 # This should never happen if OptimizationMetrics works correctly
                 # Allow small tolerance for floating point errors
                 if total_revenue > crop.max_revenue * 1.001:  # 0.1% tolerance
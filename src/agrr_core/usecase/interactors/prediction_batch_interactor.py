@@ -1,6 +1,8 @@
 """Batch prediction interactor."""
 
 import time
+from functools import partial
+from typing import Any, Dict, Optional
 
 from agrr_core.entity.exceptions.prediction_error import PredictionError
 from agrr_core.usecase.ports.input.batch_prediction_input_port import BatchPredictionInputPort
@@ -8,15 +10,28 @@ from agrr_core.usecase.ports.input.multi_metric_prediction_input_port import Mul
 from agrr_core.usecase.dto.batch_prediction_request_dto import BatchPredictionRequestDTO
 from agrr_core.usecase.dto.batch_prediction_response_dto import BatchPredictionResponseDTO
 from agrr_core.usecase.dto.multi_metric_prediction_request_dto import MultiMetricPredictionRequestDTO
+from agrr_core.usecase.gateways.batch_prediction_executor import (
+    BatchPredictionExecutor,
+    SerialBatchPredictionExecutor,
+)
 
 class BatchPredictionInteractor(BatchPredictionInputPort):
     """Interactor for batch prediction for multiple locations."""
     
     def __init__(
         self, 
-        multi_metric_prediction_interactor: MultiMetricPredictionInputPort
+        multi_metric_prediction_interactor: MultiMetricPredictionInputPort,
+        batch_executor: Optional[BatchPredictionExecutor] = None
     ):
+        """Initialize batch prediction interactor.
+        
+        Args:
+            multi_metric_prediction_interactor: Prediction of a single location
+            batch_executor: Runs the per-location predictions
+                (None: one after another in this process)
+        """
         self.multi_metric_prediction_interactor = multi_metric_prediction_interactor
+        self.batch_executor = batch_executor or SerialBatchPredictionExecutor()
     
     def execute(self, request: BatchPredictionRequestDTO) -> BatchPredictionResponseDTO:
         """Execute batch prediction for multiple locations."""
@@ -25,32 +40,23 @@ class BatchPredictionInteractor(BatchPredictionInputPort):
         results = []
         errors = []
         
-        for location_data in request.locations:
-            try:
-                # Create single location request
-                single_request = MultiMetricPredictionRequestDTO(
-                    latitude=location_data['lat'],
-                    longitude=location_data['lon'],
-                    start_date=request.start_date,
-                    end_date=request.end_date,
-                    prediction_days=request.prediction_days,
-                    metrics=request.metrics,
-                    config=request.config,
-                    location_name=location_data.get('name', 'Unknown')
-                )
-                
-                # Execute prediction
-                result = self.multi_metric_prediction_interactor.execute(single_request)
+        outcomes = self.batch_executor.run(
+            partial(self._predict_location, request),
+            request.locations,
+            labels=[str(location_data.get('name', 'Unknown')) for location_data in request.locations]
+        )
+        
+        for location_data, outcome in zip(request.locations, outcomes):
+            if outcome.error is None:
                 results.append({
                     'location': location_data,
-                    'prediction': result,
+                    'prediction': outcome.value,
                     'status': 'success'
                 })
-                
-            except Exception as e:
+            else:
                 errors.append({
                     'location': location_data,
-                    'error': str(e),
+                    'error': outcome.error,
                     'status': 'failed'
                 })
         
@@ -72,3 +78,17 @@ class BatchPredictionInteractor(BatchPredictionInputPort):
             errors=errors,
             processing_time=processing_time
         )
+    
+    def _predict_location(self, request: BatchPredictionRequestDTO, location_data: Dict[str, Any]):
+        """Predict all metrics of a single location."""
+        single_request = MultiMetricPredictionRequestDTO(
+            latitude=location_data['lat'],
+            longitude=location_data['lon'],
+            start_date=request.start_date,
+            end_date=request.end_date,
+            prediction_days=request.prediction_days,
+            metrics=request.metrics,
+            config=request.config,
+            location_name=location_data.get('name', 'Unknown')
+        )
+        return self.multi_metric_prediction_interactor.execute(single_request)
@@ -1,6 +1,6 @@
 """Use case interactor for weather prediction from data."""
 
-from typing import List
+from typing import List, Optional
 from agrr_core.entity.entities.weather_entity import WeatherData
 from agrr_core.entity.entities.prediction_forecast_entity import Forecast
 from agrr_core.entity.validators.weather_validator import WeatherValidator
@@ -26,7 +26,8 @@ class WeatherPredictInteractor:
         input_source: str,
         output_destination: str,
         prediction_days: int,
-        predict_all_temperature_metrics: bool = True
+        predict_all_temperature_metrics: bool = True,
+        station_id: Optional[str] = None
     ) -> List[Forecast]:
         """
         Execute weather prediction from data.
@@ -37,6 +38,7 @@ class WeatherPredictInteractor:
             prediction_days: Number of days to predict
             predict_all_temperature_metrics: If True, predict temperature, temperature_max, temperature_min
                                             (default: True for avoiding saturation)
+            station_id: Station the data belongs to (keys stored models; None: derived from the data)
             
         Returns:
             List of forecast predictions (temperature)
@@ -61,6 +63,10 @@ class WeatherPredictInteractor:
         if not is_valid:
             raise ValueError(error_message)
         
+        model_config = {'prediction_days': prediction_days}
+        if station_id:
+            model_config['station_id'] = station_id
+        
         # Generate predictions
         # デフォルトで全ての気温メトリックを予測（飽和問題の解決）
         if predict_all_temperature_metrics:
@@ -68,7 +74,7 @@ class WeatherPredictInteractor:
             all_predictions = self.prediction_gateway.predict_multiple_metrics(
                 historical_data,
                 ['temperature', 'temperature_max', 'temperature_min'],
-                {'prediction_days': prediction_days}
+                model_config
             )
             
             # モックモードの場合は、PredictionMockGatewayのcreateメソッドを使用
@@ -86,7 +92,7 @@ class WeatherPredictInteractor:
             predictions = self.prediction_gateway.predict(
                 historical_data, 
                 'temperature', 
-                {'prediction_days': prediction_days}
+                model_config
             )
             
             # Create predictions
@@ -8,6 +8,7 @@ from typing import List, Dict, Optional
 
 from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
 from agrr_core.usecase.dto.optimization_config import OptimizationConfig
+from agrr_core.usecase.services.field_interval_index import FieldIntervalIndex
 
 class AllocationFeasibilityChecker:
     """Check if allocation solutions are feasible.
@@ -19,11 +20,9 @@ class AllocationFeasibilityChecker:
     
     Design Pattern:
     - Validator Pattern: Validates business rules
-    - Future: Strategy Pattern for different checking algorithms (Interval Tree)
     
     Time Complexity:
-    - Current: O(n²) for time overlap check
-    - Future: O(n log n) with Interval Tree
+    - O(n log n) for time overlap check (FieldIntervalIndex)
     """
     
     def __init__(self, config: Optional[OptimizationConfig] = None):
@@ -65,9 +64,9 @@ class AllocationFeasibilityChecker:
         """Check that no allocations overlap in time within the same field.
         
         For each field, verify that all allocations have non-overlapping
-        time periods.
+        time periods (including fallow period).
         
-        Time Complexity: O(n²) where n is number of allocations per field
+        Time Complexity: O(n log n) where n is number of allocations
         
         Args:
             allocations: List of allocations to check
@@ -75,20 +74,12 @@ class AllocationFeasibilityChecker:
         Returns:
             True if no time overlaps exist, False otherwise
         """
-        # Group allocations by field
-        field_allocations: Dict[str, List[CropAllocation]] = {}
+        # Insert one by one: the first allocation that does not fit overlaps
+        # an earlier one in its field (including fallow period)
+        schedule_index = FieldIntervalIndex()
         for alloc in allocations:
-            field_id = alloc.field.field_id
-            if field_id not in field_allocations:
-                field_allocations[field_id] = []
-            field_allocations[field_id].append(alloc)
-        
-        # Check for overlaps within each field (including fallow period)
-        for field_id, field_allocs in field_allocations.items():
-            for i, alloc1 in enumerate(field_allocs):
-                for alloc2 in field_allocs[i+1:]:
-                    if alloc1.overlaps_with_fallow(alloc2):
-                        return False  # Found overlap (considering fallow period)
+            if not schedule_index.try_add(alloc):
+                return False  # Found overlap
         
         return True  # No overlaps found
     
@@ -8,13 +8,17 @@ Key Features:
 - Multiple repair operators (greedy, regret, DP)
 - Adaptive weight adjustment based on success rate
 - Simulated Annealing acceptance criterion
+- Incremental evaluation: destroy/repair apply O(Δ) updates to an
+  ALNSSolutionState and report the profit delta directly
 
 Expected Quality: 90-98% (vs current 85-95%)
-Time Complexity: O(iterations × n²)
+Time Complexity: O(iterations × Δ × allocations per field)
 """
 
+import logging
 import random
 import math
+import time
 from typing import List, Dict, Callable, Tuple, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -23,6 +27,10 @@ from agrr_core.entity.entities.field_entity import Field
 from agrr_core.entity.entities.crop_entity import Crop
 from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
 from agrr_core.usecase.dto.optimization_config import OptimizationConfig
+from agrr_core.usecase.services.alns_solution_state import ALNSSolutionState
+from agrr_core.usecase.services.candidate_pool import CandidatePool
+
+logger = logging.getLogger(__name__)
 
 @dataclass
 class OperatorPerformance:
@@ -51,12 +59,13 @@ class OperatorPerformance:
 class AdaptiveWeights:
     """Manage adaptive weights for destroy and repair operators."""
     
-    def __init__(self, operators: List[str], decay_rate: float = 0.99):
+    def __init__(self, operators: List[str], decay_rate: float = 0.99, rng=None):
         self.operators = {
             name: OperatorPerformance(name=name) 
             for name in operators
         }
         self.decay_rate = decay_rate
+        self.rng = rng or random  # random.Random instance or the random module
     
     def select_operator(self) -> str:
         """Select operator using roulette wheel selection based on weights."""
@@ -64,10 +73,10 @@ class AdaptiveWeights:
         
         if total_weight == 0:
             # Fallback: uniform random
-            return random.choice(list(self.operators.keys()))
+            return self.rng.choice(list(self.operators.keys()))
         
         # Roulette wheel selection
-        r = random.uniform(0, total_weight)
+        r = self.rng.uniform(0, total_weight)
         cumulative = 0.0
         
         for name, op in self.operators.items():
@@ -107,6 +116,33 @@ class AdaptiveWeights:
                 # Soft reset: move 50% toward neutral weight
                 op.weight = 0.5 * op.weight + 0.5
 
+@dataclass
+class ALNSTrajectory:
+    """Resumable state of one simulated annealing trajectory.
+    
+    ALNSOptimizer.run() advances a trajectory by a number of iterations, so a
+    run can be split into segments (see MultiStartALNSOptimizer).
+    """
+    
+    state: ALNSSolutionState
+    best: List[CropAllocation]
+    best_profit: float
+    temp: float = 10000.0
+    iteration: int = 0
+    
+    @classmethod
+    def start(cls, solution: List[CropAllocation], temp: float = 10000.0) -> 'ALNSTrajectory':
+        """Start a trajectory from a solution."""
+        state = ALNSSolutionState(solution)
+        return cls(state=state, best=list(solution), best_profit=state.profit, temp=temp)
+    
+    def restart_from(self, solution: List[CropAllocation]) -> None:
+        """Continue from another solution (keeps temperature and own best)."""
+        self.state = ALNSSolutionState(solution)
+        if self.state.profit > self.best_profit:
+            self.best = list(solution)
+            self.best_profit = self.state.profit
+
 class ALNSOptimizer:
     """Adaptive Large Neighborhood Search optimizer.
     
@@ -114,8 +150,21 @@ class ALNSOptimizer:
     adaptive weight adjustment.
     """
     
-    def __init__(self, config: OptimizationConfig):
+    # Simulated Annealing parameters
+    INITIAL_TEMPERATURE = 10000.0
+    COOLING_RATE = 0.99
+    MIN_TEMPERATURE = 1.0
+    
+    def __init__(self, config: OptimizationConfig, rng=None):
+        """Initialize optimizer.
+        
+        Args:
+            config: Optimization configuration
+            rng: random.Random used by operator selection, destroy operators
+                and acceptance (None: the global random module)
+        """
         self.config = config
+        self.rng = rng or random
         
         # Initialize destroy operators
         self.destroy_operators: Dict[str, Callable] = {
@@ -126,16 +175,16 @@ class ALNSOptimizer:
             'time_slice_removal': self._time_slice_removal,
         }
         
-        # Initialize repair operators
+        # Initialize repair operators (operate in place on ALNSSolutionState)
         self.repair_operators: Dict[str, Callable] = {
-            'greedy_insert': self._greedy_insert,
-            'regret_insert': self._regret_insert,
-            'candidate_insert': self._candidate_insert,  # NEW: Insert from unused candidates
+            'greedy_insert': self._greedy_repair,
+            'regret_insert': self._regret_repair,
+            'candidate_insert': self._candidate_repair,  # NEW: Insert from unused candidates
         }
         
         # Adaptive weights
-        self.destroy_weights = AdaptiveWeights(list(self.destroy_operators.keys()))
-        self.repair_weights = AdaptiveWeights(list(self.repair_operators.keys()))
+        self.destroy_weights = AdaptiveWeights(list(self.destroy_operators.keys()), rng=self.rng)
+        self.repair_weights = AdaptiveWeights(list(self.repair_operators.keys()), rng=self.rng)
     
     def optimize(
         self,
@@ -144,6 +193,7 @@ class ALNSOptimizer:
         fields: List[Field],
         crops: List[Crop],
         max_iterations: Optional[int] = None,
+        time_limit: Optional[float] = None,
     ) -> List[CropAllocation]:
         """Execute ALNS optimization.
         
@@ -153,29 +203,56 @@ class ALNSOptimizer:
             fields: List of fields
             crops: List of crops
             max_iterations: Maximum iterations (overrides config)
+            time_limit: Maximum computation time in seconds (None for no limit)
             
         Returns:
             Improved solution
         """
         iterations = max_iterations or self.config.max_local_search_iterations
+        deadline = None if time_limit is None else time.time() + time_limit
         
-        # Initialize
-        current = initial_solution
-        best = current
-        current_profit = self._calculate_profit(current)
-        best_profit = current_profit
+        # Initialize incremental state (profit is maintained by O(Δ) updates)
+        trajectory = ALNSTrajectory.start(initial_solution, self.INITIAL_TEMPERATURE)
+        initial_profit = trajectory.best_profit
         
-        # Debug logging
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"ALNS starting: initial_profit={current_profit:,.0f}, allocations={len(initial_solution)}")
+        # Candidates are fixed for the whole run: rank and index once for candidate_insert
+        ranked_candidates = self._rank_candidates(candidates)
         
-        # Simulated Annealing parameters
-        temp = 10000.0
-        cooling_rate = 0.99
-        min_temp = 1.0
+        logger.info(f"ALNS starting: initial_profit={initial_profit:,.0f}, allocations={len(initial_solution)}")
         
-        for iteration in range(iterations):
+        self.run(trajectory, ranked_candidates, fields, iterations, deadline)
+        
+        # Final logging
+        logger.info(f"ALNS finished: best_profit={trajectory.best_profit:,.0f}, allocations={len(trajectory.best)}")
+        logger.info(f"Improvement: {trajectory.best_profit - initial_profit:,.0f}")
+        
+        return trajectory.best
+    
+    def run(
+        self,
+        trajectory: ALNSTrajectory,
+        ranked_candidates: CandidatePool,
+        fields: List[Field],
+        iterations: int,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """Advance a trajectory by up to `iterations` ALNS iterations.
+        
+        Args:
+            trajectory: Trajectory to advance (updated in place)
+            ranked_candidates: Candidates from _rank_candidates
+            fields: List of fields
+            iterations: Number of iterations to run
+            deadline: time.time() after which to stop (None for no limit)
+        """
+        for _ in range(iterations):
+            iteration = trajectory.iteration
+            if deadline is not None and time.time() > deadline:
+                logger.info(f"ALNS stopped at iteration {iteration}: time limit reached")
+                break
+            trajectory.iteration += 1
+            state = trajectory.state
+            
             # Select destroy operator
             destroy_name = self.destroy_weights.select_operator()
             destroy_op = self.destroy_operators[destroy_name]
@@ -185,61 +262,66 @@ class ALNSOptimizer:
             repair_op = self.repair_operators[repair_name]
             
             # Destroy: remove part of solution
+            current = state.allocations
             try:
-                partial, removed = destroy_op(current)
+                _, removed = destroy_op(current)
                 if iteration < 5:  # Debug first few iterations
-                    logger.debug(f"Iter {iteration}: Destroy '{destroy_name}' removed {len(removed)}/{len(current)} allocations")
+                    logger.debug(f"Iter {iteration}: Destroy '{destroy_name}' removed {len(removed)}/{len(state)} allocations")
             except Exception as e:
                 # If destroy fails, skip this iteration
                 logger.warning(f"Destroy operator '{destroy_name}' failed: {e}")
                 continue
             
-            # Repair: rebuild solution
+            delta = 0.0
+            for alloc in removed:
+                delta += state.remove(alloc)
+            
+            # Repair: rebuild solution in place
             try:
-                new_solution = repair_op(partial, removed, candidates, fields)
+                inserted = repair_op(state, removed, ranked_candidates, fields)
                 if iteration < 5:  # Debug first few iterations
-                    reinserted = len(new_solution) - len(partial)
-                    logger.debug(f"Iter {iteration}: Repair '{repair_name}' reinserted {reinserted}/{len(removed)} allocations")
+                    logger.debug(f"Iter {iteration}: Repair '{repair_name}' reinserted {len(inserted)}/{len(removed)} allocations")
             except Exception as e:
-                # If repair fails, skip this iteration
+                # If repair fails, restore the solution and skip this iteration
                 logger.warning(f"Repair operator '{repair_name}' failed: {e}")
+                trajectory.state = ALNSSolutionState(current)
                 continue
             
-            # Evaluate
-            new_profit = self._calculate_profit(new_solution)
-            delta = new_profit - current_profit
+            # Evaluate (profit delta reported by the incremental updates)
+            for alloc in inserted:
+                delta += state.profit_of(alloc)
+            new_profit = state.profit
             
             # Acceptance criterion (Simulated Annealing)
-            if delta > 0 or (temp > min_temp and random.random() < math.exp(delta / temp)):
-                # Accept new solution
-                current = new_solution
-                current_profit = new_profit
+            temp = trajectory.temp
+            if delta > 0 or (temp > self.MIN_TEMPERATURE and self.rng.random() < math.exp(delta / temp)):
+                # Accept new solution (state already holds it)
                 
                 # Update best
-                if new_profit > best_profit:
-                    best = new_solution
-                    best_profit = new_profit
+                if new_profit > trajectory.best_profit:
+                    trajectory.best = state.allocations
+                    trajectory.best_profit = new_profit
                 
                 # Update weights with success
                 self.destroy_weights.update(destroy_name, delta, threshold=0)
                 self.repair_weights.update(repair_name, delta, threshold=0)
             else:
+                # Reject: undo the move with inverse O(Δ) updates
+                for alloc in inserted:
+                    state.remove(alloc)
+                for alloc in removed:
+                    state.add(alloc)
+                
                 # Reject but still update weights
                 self.destroy_weights.update(destroy_name, delta, threshold=0)
                 self.repair_weights.update(repair_name, delta, threshold=0)
             
             # Cool down temperature
-            temp *= cooling_rate
+            trajectory.temp *= self.COOLING_RATE
             
             # Periodic weight reset
             self.destroy_weights.reset_periodically(iteration)
             self.repair_weights.reset_periodically(iteration)
-        
-        # Final logging
-        logger.info(f"ALNS finished: best_profit={best_profit:,.0f}, allocations={len(best)}")
-        logger.info(f"Improvement: {best_profit - self._calculate_profit(initial_solution):,.0f}")
-        
-        return best
     
     # ===== Destroy Operators =====
     
@@ -251,8 +333,9 @@ class ALNSOptimizer:
         removal_rate = 0.3  # Remove 30%
         n_remove = max(1, int(len(solution) * removal_rate))
         
-        removed = random.sample(solution, n_remove)
-        remaining = [a for a in solution if a not in removed]
+        removed = self.rng.sample(solution, n_remove)
+        removed_ids = {a.allocation_id for a in removed}
+        remaining = [a for a in solution if a.allocation_id not in removed_ids]
         
         return remaining, removed
     
@@ -282,7 +365,7 @@ class ALNSOptimizer:
         n_remove = max(1, int(len(solution) * removal_rate))
         
         # Pick a seed allocation
-        seed = random.choice(solution)
+        seed = self.rng.choice(solution)
         
         # Calculate relatedness
         related = []
@@ -314,7 +397,7 @@ class ALNSOptimizer:
             return solution, []
         
         # Pick random field
-        target_field = random.choice(fields_in_solution)
+        target_field = self.rng.choice(fields_in_solution)
         
         # Remove all from that field
         removed = [a for a in solution if a.field.field_id == target_field]
@@ -342,16 +425,21 @@ class ALNSOptimizer:
             a for a in solution 
             if abs((a.start_date - median_date).days) < time_window.days
         ]
-        remaining = [a for a in solution if a not in removed]
+        removed_ids = {a.allocation_id for a in removed}
+        remaining = [a for a in solution if a.allocation_id not in removed_ids]
         
         # Ensure we remove at least something
         if not removed and solution:
-            removed = [random.choice(solution)]
-            remaining = [a for a in solution if a not in removed]
+            removed = [self.rng.choice(solution)]
+            remaining = [a for a in solution if a is not removed[0]]
         
         return remaining, removed
     
     # ===== Repair Operators =====
+    #
+    # Repair operators mutate an ALNSSolutionState in place and return the
+    # allocations they inserted (the Δ). _greedy_insert is a list-based
+    # wrapper returning the repaired solution.
     
     def _greedy_insert(
         self,
@@ -361,21 +449,33 @@ class ALNSOptimizer:
         fields: List[Field],
     ) -> List[CropAllocation]:
         """Greedily re-insert removed allocations."""
-        current = partial.copy()
+        state = ALNSSolutionState(partial)
+        self._greedy_repair(state, removed, candidates, fields)
+        return state.allocations
+    
+    def _greedy_repair(
+        self,
+        state: ALNSSolutionState,
+        removed: List[CropAllocation],
+        candidates: List['AllocationCandidate'],
+        fields: List[Field],
+    ) -> List[CropAllocation]:
+        """Greedily re-insert removed allocations."""
+        inserted = []
         
         # Sort removed by profit rate (descending)
         sorted_removed = sorted(removed, key=lambda a: a.profit_rate, reverse=True)
         
         for alloc in sorted_removed:
             # Check if feasible
-            if self._is_feasible_to_add(current, alloc):
-                current.append(alloc)
+            if state.try_add(alloc):
+                inserted.append(alloc)
         
-        return current
+        return inserted
     
-    def _regret_insert(
+    def _regret_repair(
         self,
-        partial: List[CropAllocation],
+        state: ALNSSolutionState,
         removed: List[CropAllocation],
         candidates: List['AllocationCandidate'],
         fields: List[Field],
@@ -384,110 +484,98 @@ class ALNSOptimizer:
         
         Regret = opportunity cost of not inserting now
                = (profit if inserted now) - (profit of best alternative)
+        
+        Profit is additive over allocations, so the regret of an allocation is
+        its own profit minus the best profit among the other feasible ones.
         """
-        current = partial.copy()
+        inserted = []
         remaining = removed.copy()
         
         while remaining:
-            # Calculate regret for each allocation
-            regrets = []
+            feasible = [a for a in remaining if state.is_feasible_to_add(a)]
+            if not feasible:
+                break
             
-            for alloc in remaining:
-                if not self._is_feasible_to_add(current, alloc):
-                    continue
-                
-                # Profit if we insert this
-                profit_with = self._calculate_profit(current + [alloc])
-                
-                # Best alternative
-                alternatives = [
-                    a for a in remaining 
-                    if a != alloc and self._is_feasible_to_add(current, a)
-                ]
-                
-                if alternatives:
-                    best_alt = max(alternatives, key=lambda a: a.profit or 0)
-                    profit_with_alt = self._calculate_profit(current + [best_alt])
-                else:
-                    profit_with_alt = self._calculate_profit(current)
-                
-                # Regret = opportunity cost
-                regret = profit_with - profit_with_alt
-                regrets.append((alloc, regret))
+            profits = [a.profit or 0 for a in feasible]
             
-            if not regrets:
-                break
+            # Best and second-best profit for the "best alternative" term
+            best_idx = max(range(len(feasible)), key=lambda i: profits[i])
+            second_best = max(
+                (p for i, p in enumerate(profits) if i != best_idx),
+                default=None,
+            )
+            
+            regrets = []
+            for i, alloc in enumerate(feasible):
+                best_alt = second_best if i == best_idx else profits[best_idx]
+                regret = profits[i] - best_alt if best_alt is not None else profits[i]
+                regrets.append((alloc, regret))
             
             # Insert allocation with highest regret
             best_alloc, _ = max(regrets, key=lambda x: x[1])
-            current.append(best_alloc)
+            state.add(best_alloc)
+            inserted.append(best_alloc)
             remaining.remove(best_alloc)
         
-        return current
+        return inserted
     
-    def _candidate_insert(
+    def _candidate_repair(
         self,
-        partial: List[CropAllocation],
+        state: ALNSSolutionState,
         removed: List[CropAllocation],
-        candidates: List['AllocationCandidate'],
+        ranked_candidates: CandidatePool,
         fields: List[Field],
     ) -> List[CropAllocation]:
         """Insert from unused candidates (similar to CropInsertOperation).
         
         This is the key missing piece: ALNS needs to be able to add
         allocations from the candidate pool, not just reinsert removed ones.
+        
+        Args:
+            ranked_candidates: Candidates in profit order (descending),
+                see _rank_candidates
         """
         from agrr_core.usecase.services.allocation_utils import AllocationUtils
         
-        current = partial.copy()
-        
         # First, reinsert removed allocations (greedy)
-        sorted_removed = sorted(removed, key=lambda a: a.profit_rate, reverse=True)
-        for alloc in sorted_removed:
-            if self._is_feasible_to_add(current, alloc):
-                current.append(alloc)
-        
-        # Then, try to insert from unused candidates
-        # Get IDs of allocations already in solution
-        used_candidate_ids = {
-            (a.field.field_id, a.crop.crop_id, a.start_date.isoformat())
-            for a in current
-        }
+        inserted = self._greedy_repair(state, removed, ranked_candidates, fields)
         
-        # Sort candidates by profit (descending)
-        sorted_candidates = sorted(
-            candidates,
-            key=lambda c: c.profit,
-            reverse=True
-        )
-        
-        # Try to insert unused candidates
+        # Then, try to insert unused candidates (best profit first)
         max_inserts = 50  # Limit to prevent explosion
         inserted_count = 0
         
-        for candidate in sorted_candidates:
+        # Only candidates fitting a free gap after the reinsertion can pass the
+        # feasibility check below (insertions only shrink gaps); profit order kept
+        for candidate in ranked_candidates.fitting_schedule(state):
             if inserted_count >= max_inserts:
                 break
             
-            candidate_id = (
-                candidate.field.field_id,
-                candidate.crop.crop_id,
-                candidate.start_date.isoformat()
-            )
-            
-            if candidate_id in used_candidate_ids:
+            if state.has_key(ALNSSolutionState.allocation_key(candidate)):
                 continue  # Already used
             
-            # Convert candidate to allocation
-            new_alloc = AllocationUtils.candidate_to_allocation(candidate)
+            # Check feasibility before building the allocation
+            if not state.is_feasible_to_add(candidate):
+                continue
             
-            # Try to add
-            if self._is_feasible_to_add(current, new_alloc):
-                current.append(new_alloc)
-                used_candidate_ids.add(candidate_id)
-                inserted_count += 1
+            new_alloc = AllocationUtils.candidate_to_allocation(candidate)
+            state.add(new_alloc)
+            inserted.append(new_alloc)
+            inserted_count += 1
+        
+        return inserted
+    
+    @staticmethod
+    def _rank_candidates(
+        candidates: List['AllocationCandidate'],
+    ) -> CandidatePool:
+        """Index candidates in order of baseline profit (descending).
         
-        return current
+        Profit is evaluated once per candidate instead of once per repair, and
+        the pool finds the candidates fitting free gaps without a full scan.
+        """
+        profits = [c.profit for c in candidates]
+        order = sorted(range(len(candidates)), key=lambda i: profits[i], reverse=True)
+        return CandidatePool(candidates[i] for i in order)
     
     # ===== Helper Methods =====
     
@@ -520,22 +608,6 @@ class ALNSOptimizer:
         
         return score
     
-    def _is_feasible_to_add(
-        self, 
-        current: List[CropAllocation], 
-        new_alloc: CropAllocation
-    ) -> bool:
-        """Check if adding new_alloc to current solution is feasible."""
-        # Check for time overlaps in the same field (including fallow period)
-        for existing in current:
-            if existing.field.field_id == new_alloc.field.field_id:
-                if existing.overlaps_with_fallow(new_alloc):
-                    return False  # Overlap found (considering fallow period)
-        
-        # TODO: Check max_revenue constraint if needed
-        
-        return True
-    
     def _calculate_profit(self, solution: List[CropAllocation]) -> float:
         """Calculate total profit of solution."""
         return sum(a.profit for a in solution if a.profit is not None)
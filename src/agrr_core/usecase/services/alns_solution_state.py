@@ -0,0 +1,118 @@
+"""Incrementally maintained solution state for ALNS.
+
+ALNSOptimizer used to recompute the profit of the whole solution after every
+destroy/repair step, and repair operators checked feasibility against every
+allocation in the solution. Both costs grow linearly with solution size.
+
+ALNSSolutionState keeps, under O(Δ) updates:
+- A FieldIntervalIndex of the allocations (O(log n) fallow-aware feasibility)
+- Cached per-allocation profit and the running total profit
+- (field_id, crop_id, start_date) keys of the allocations in the solution
+
+add() and remove() return the profit delta, so destroy/repair report the
+change in objective directly and a rejected move is undone by applying the
+inverse updates.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+from agrr_core.usecase.services.field_interval_index import FieldIntervalIndex
+
+
+class ALNSSolutionState:
+    """Mutable ALNS solution with cached profit and a per-field interval index."""
+
+    def __init__(self, allocations: Iterable[CropAllocation] = ()):
+        """Initialize state from an existing solution.
+
+        Args:
+            allocations: Initial allocations (assumed feasible)
+        """
+        self._allocations: Dict[str, CropAllocation] = {}
+        self._intervals = FieldIntervalIndex()
+        self._profit_by_id: Dict[str, float] = {}
+        self._keys: Dict[Tuple[str, str, str], int] = {}
+        self.profit = 0.0
+
+        for allocation in allocations:
+            self.add(allocation)
+
+    def __len__(self) -> int:
+        return len(self._allocations)
+
+    def __contains__(self, allocation: CropAllocation) -> bool:
+        return allocation.allocation_id in self._allocations
+
+    @property
+    def allocations(self) -> List[CropAllocation]:
+        """Snapshot of the current allocations (insertion order)."""
+        return list(self._allocations.values())
+
+    @staticmethod
+    def allocation_key(allocation) -> Tuple[str, str, str]:
+        """Identity of an allocation/candidate slot (field, crop, start date)."""
+        return (
+            allocation.field.field_id,
+            allocation.crop.crop_id,
+            allocation.start_date.isoformat(),
+        )
+
+    def has_key(self, key: Tuple[str, str, str]) -> bool:
+        """Check whether an allocation with this (field, crop, start) key is present."""
+        return key in self._keys
+
+    def profit_of(self, allocation: CropAllocation) -> float:
+        """Cached profit of an allocation in the solution."""
+        return self._profit_by_id[allocation.allocation_id]
+
+    def is_feasible_to_add(self, new_alloc) -> bool:
+        """Check fallow-aware overlap against allocations in the same field.
+
+        Args:
+            new_alloc: CropAllocation or AllocationCandidate (field/start/completion)
+
+        Returns:
+            True if new_alloc can be added without violating the fallow period
+        """
+        return self._intervals.is_feasible_to_add(new_alloc)
+
+    def free_gaps(self, field_id: str) -> List[Tuple[Optional[int], Optional[int]]]:
+        """Free day-ordinal ranges of a field (see FieldIntervalIndex.free_gaps)."""
+        return self._intervals.free_gaps(field_id)
+
+    def add(self, allocation: CropAllocation) -> float:
+        """Add an allocation and return the profit delta."""
+        profit = allocation.profit if allocation.profit is not None else 0.0
+        self._allocations[allocation.allocation_id] = allocation
+        self._intervals.add(allocation)
+        self._profit_by_id[allocation.allocation_id] = profit
+        key = self.allocation_key(allocation)
+        self._keys[key] = self._keys.get(key, 0) + 1
+
+        self.profit += profit
+        return profit
+
+    def remove(self, allocation: CropAllocation) -> float:
+        """Remove an allocation and return the profit delta (<= 0 for profitable ones)."""
+        del self._allocations[allocation.allocation_id]
+        self._intervals.remove(allocation)
+        profit = self._profit_by_id.pop(allocation.allocation_id)
+        key = self.allocation_key(allocation)
+        self._keys[key] -= 1
+        if self._keys[key] == 0:
+            del self._keys[key]
+
+        self.profit -= profit
+        return -profit
+
+    def try_add(self, allocation: CropAllocation) -> bool:
+        """Add allocation if feasible.
+
+        Returns:
+            True if the allocation was added
+        """
+        if not self.is_feasible_to_add(allocation):
+            return False
+        self.add(allocation)
+        return True
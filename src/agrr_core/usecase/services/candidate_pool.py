@@ -0,0 +1,201 @@
+"""Allocation candidates indexed by field, crop and start date.
+
+Neighbor operations and ALNS repair look up candidates for one allocation at
+a time: "same field and crop, start closest to this date", "periods starting
+within ±N days", "unused periods that still fit the schedule". Filtering the
+full candidate list for each lookup makes every touched allocation cost
+O(|candidates|).
+
+CandidatePool is built once per optimization and keeps, as integer day
+ordinals sorted by start:
+
+- per (field_id, crop_id): candidate start dates
+- per field_id: fallow-extended intervals [start, completion + fallow), the
+  same intervals as FieldIntervalIndex
+
+so date lookups are a binary search plus the matches: O(log n + k).
+Candidates also keep their pool position (input order), which callers use to
+visit query results in the same order as a scan of the full list.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from agrr_core.usecase.services.field_interval_index import FieldIntervalIndex
+
+
+class CandidatePool:
+    """Allocation candidates indexed by (field_id, crop_id) and start date.
+
+    Works with any object exposing field, crop, start_date and
+    completion_date (AllocationCandidate). Day differences are computed on
+    date ordinals.
+    """
+
+    def __init__(self, candidates: Iterable[Any] = ()):
+        """Build the pool.
+
+        Args:
+            candidates: Candidates in pool order
+        """
+        self._candidates: List[Any] = list(candidates)
+        self._positions: Dict[int, int] = {}
+        by_key: Dict[Tuple[str, str], List[Tuple[int, int]]] = {}
+        by_field: Dict[str, List[Tuple[int, int, int]]] = {}
+
+        for position, candidate in enumerate(self._candidates):
+            self._positions[id(candidate)] = position
+            start, end = FieldIntervalIndex.interval(candidate)
+            field_id = candidate.field.field_id
+            by_key.setdefault((field_id, candidate.crop.crop_id), []).append((start, position))
+            by_field.setdefault(field_id, []).append((start, position, end))
+
+        # Sorted by (start, position): equal starts keep pool order
+        self._key_starts: Dict[Tuple[str, str], List[int]] = {}
+        self._key_items: Dict[Tuple[str, str], List[Any]] = {}
+        for key, entries in by_key.items():
+            entries.sort()
+            self._key_starts[key] = [start for start, _ in entries]
+            self._key_items[key] = [self._candidates[p] for _, p in entries]
+
+        self._field_starts: Dict[str, List[int]] = {}
+        self._field_ends: Dict[str, List[int]] = {}
+        self._field_items: Dict[str, List[Any]] = {}
+        for field_id, entries in by_field.items():
+            entries.sort()
+            self._field_starts[field_id] = [start for start, _, _ in entries]
+            self._field_ends[field_id] = [end for _, _, end in entries]
+            self._field_items[field_id] = [self._candidates[p] for _, p, _ in entries]
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate candidates in pool order."""
+        return iter(self._candidates)
+
+    def position(self, candidate: Any) -> int:
+        """Pool order of a candidate (matched by identity)."""
+        return self._positions[id(candidate)]
+
+    def field_ids(self) -> List[str]:
+        """Fields with at least one candidate."""
+        return list(self._field_items)
+
+    def for_field_crop(self, field_id: str, crop_id: str) -> List[Any]:
+        """Candidates of a field and crop in start order."""
+        return list(self._key_items.get((field_id, crop_id), ()))
+
+    def starting_within(
+        self, field_id: str, crop_id: str, start_date, tolerance_days: int
+    ) -> List[Any]:
+        """Candidates of a field and crop starting within ±tolerance_days of start_date.
+
+        Returns:
+            Matching candidates in start order
+        """
+        starts = self._key_starts.get((field_id, crop_id))
+        if not starts:
+            return []
+        target = start_date.toordinal()
+        lo = bisect_left(starts, target - tolerance_days)
+        hi = bisect_right(starts, target + tolerance_days)
+        return self._key_items[(field_id, crop_id)][lo:hi]
+
+    def nearest(
+        self,
+        field_id: str,
+        crop_id: str,
+        start_date,
+        tolerance_days: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        """Candidates of a field and crop ordered by distance of start to start_date.
+
+        Walks outwards from start_date, so only the returned candidates are
+        visited. Equal distances keep pool order, so the result is the same
+        as a stable sort of the full list by distance.
+
+        Args:
+            field_id: Field ID
+            crop_id: Crop ID
+            start_date: Target start date
+            tolerance_days: Maximum distance in days (None: unlimited)
+            limit: Maximum number of candidates (None: all)
+
+        Returns:
+            Candidates sorted by |start - start_date|
+        """
+        starts = self._key_starts.get((field_id, crop_id))
+        if not starts:
+            return []
+        items = self._key_items[(field_id, crop_id)]
+        target = start_date.toordinal()
+        max_distance = float('inf') if tolerance_days is None else tolerance_days
+        count = len(starts) if limit is None else limit
+
+        result = []
+        right = bisect_left(starts, target)
+        left = right - 1
+        while len(result) < count and (left >= 0 or right < len(starts)):
+            left_distance = target - starts[left] if left >= 0 else float('inf')
+            right_distance = starts[right] - target if right < len(starts) else float('inf')
+            distance = min(left_distance, right_distance)
+            if distance > max_distance:
+                break
+            # Whole groups of equal starts (already in pool order)
+            group = []
+            if left_distance == distance:
+                first = bisect_left(starts, starts[left], 0, left)
+                group.extend(items[first:left + 1])
+                left = first - 1
+            if right_distance == distance:
+                stop = bisect_right(starts, starts[right], right)
+                group.extend(items[right:stop])
+                right = stop
+            if left_distance == right_distance:
+                group.sort(key=self.position)
+            result.extend(group)
+        return result[:count]
+
+    def fitting_gap(
+        self, field_id: str, gap_start: Optional[int], gap_end: Optional[int]
+    ) -> List[Any]:
+        """Candidates of a field whose fallow-extended interval lies within a gap.
+
+        Args:
+            field_id: Field ID
+            gap_start: First free day ordinal (None: unbounded)
+            gap_end: Day ordinal where the gap ends, exclusive (None: unbounded)
+
+        Returns:
+            Candidates with gap_start <= start and end <= gap_end, in start order
+            (see FieldIntervalIndex.free_gaps)
+        """
+        starts = self._field_starts.get(field_id)
+        if not starts:
+            return []
+        ends = self._field_ends[field_id]
+        items = self._field_items[field_id]
+        lo = 0 if gap_start is None else bisect_left(starts, gap_start)
+        hi = len(starts) if gap_end is None else bisect_right(starts, gap_end)
+        if gap_end is None:
+            return items[lo:hi]
+        return [items[j] for j in range(lo, hi) if ends[j] <= gap_end]
+
+    def fitting_schedule(self, schedule: Any) -> List[Any]:
+        """Candidates that can be added to a schedule without overlaps.
+
+        Args:
+            schedule: Current schedule exposing free_gaps(field_id)
+                (FieldIntervalIndex or ALNSSolutionState)
+
+        Returns:
+            Candidates fitting a free gap of their field, in pool order
+        """
+        fitting = []
+        for field_id in self._field_items:
+            for gap_start, gap_end in schedule.free_gaps(field_id):
+                fitting.extend(self.fitting_gap(field_id, gap_start, gap_end))
+        fitting.sort(key=self.position)
+        return fitting
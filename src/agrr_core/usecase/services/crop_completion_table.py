@@ -0,0 +1,170 @@
+"""Per-crop completion tables for allocation adjustment.
+
+Every MOVE or ADD in AllocationAdjustInteractor needs the completion date of
+a crop started on a given day. Answering it with GrowthPeriodOptimizeInteractor
+re-reads the weather and rebuilds the GDD prefix sums of the crop, once per
+crop, field and process: the first drag of an interactive adjustment pays
+the whole GDD sweep.
+
+Completion depends only on the crop profile and the weather, not on the
+field. `optimize allocate` already has both loaded, so it can resolve every
+start day of the planning period once per crop (GDDPrefixSumEngine sweep)
+and persist the result:
+
+    CropCompletionTable.growth_days[i] = growth days when starting on
+                                         first_start + i days
+                                         (None: cannot complete)
+
+`optimize adjust` then answers completion queries by table lookup.
+
+Each table carries a fingerprint of the crop profile (crop, variety and stage
+requirements) and of its start days, so adjust only uses a table built for
+the profile it would otherwise compute with. The weather the tables were
+built from is checked by the gateway (CompletionTableGateway).
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+from agrr_core.entity.entities.crop_profile_entity import CropProfile
+from agrr_core.usecase.services.gdd_prefix_sum_engine import GDDPrefixSumEngine
+from agrr_core.usecase.services.growth_period_candidates import daily_weather_series
+
+
+@dataclass
+class CropCompletionTable:
+    """Growth days of a crop for every start day of a planning period.
+
+    Start days are midnight datetimes; completion of start s with growth days
+    g is s + (g - 1) days (GDDPrefixSumEngine convention). fingerprint is
+    table_fingerprint() of the crop profile and start days it was built for
+    (None: unknown, never matches).
+    """
+
+    crop_id: str
+    variety: Optional[str]
+    first_start: datetime
+    growth_days: List[Optional[int]] = field(default_factory=list)
+    fingerprint: Optional[str] = None
+
+    @property
+    def last_start(self) -> datetime:
+        """Last start day covered by the table."""
+        return self.first_start + timedelta(days=len(self.growth_days) - 1)
+
+    def covers(self, first: datetime, last: datetime) -> bool:
+        """Whether every start day from first to last (midnight) is in the table."""
+        return (
+            first.time() == last.time() == datetime.min.time()
+            and self.first_start <= first
+            and last <= self.last_start
+        )
+
+    def completion(self, start_date: datetime) -> Optional[Tuple[datetime, int]]:
+        """Completion of a start day covered by the table.
+
+        Returns:
+            (completion_date, growth_days), or None if growth cannot complete
+        """
+        growth_days = self.growth_days[(start_date - self.first_start).days]
+        if growth_days is None:
+            return None
+        return start_date + timedelta(days=growth_days - 1), growth_days
+
+    def matches(self, crop_profile: CropProfile) -> bool:
+        """Whether the table was built for this crop profile and its own start days."""
+        return self.fingerprint is not None and self.fingerprint == table_fingerprint(
+            crop_profile, self.first_start, self.last_start
+        )
+
+    @classmethod
+    def build(
+        cls,
+        crop_profile: CropProfile,
+        weather_data: Sequence,
+        first_start: datetime,
+        last_start: datetime,
+    ) -> "CropCompletionTable":
+        """Resolve every start day from first_start to last_start.
+
+        Args:
+            crop_profile: Crop profile (stage requirements)
+            weather_data: WeatherSeries or list of WeatherData
+            first_start: First start day (midnight)
+            last_start: Last start day (midnight)
+
+        Returns:
+            Completion table of the crop
+        """
+        series = daily_weather_series(weather_data)
+        engine = GDDPrefixSumEngine(
+            series.ordinals,
+            series.column('temperature_2m_mean'),
+            crop_profile.stage_requirements,
+        )
+
+        start_dates = [
+            first_start + timedelta(days=i)
+            for i in range((last_start - first_start).days + 1)
+        ]
+        return cls(
+            crop_id=crop_profile.crop.crop_id,
+            variety=crop_profile.crop.variety,
+            first_start=first_start,
+            growth_days=[
+                None if completion is None else completion[1]
+                for completion in engine.sweep(start_dates)
+            ],
+            fingerprint=table_fingerprint(crop_profile, first_start, last_start),
+        )
+
+
+def table_fingerprint(
+    crop_profile: CropProfile, first_start: datetime, last_start: datetime
+) -> str:
+    """Digest of what a completion table depends on besides the weather.
+
+    Args:
+        crop_profile: Crop profile (crop_id, variety, stage requirements)
+        first_start: First start day of the table
+        last_start: Last start day of the table
+
+    Returns:
+        Hex digest
+    """
+    key = (
+        crop_profile.crop.crop_id,
+        crop_profile.crop.variety,
+        crop_profile.stage_requirements,
+        first_start.isoformat(),
+        last_start.isoformat(),
+    )
+    return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()
+
+
+def build_completion_tables(
+    crop_profiles: Sequence[CropProfile],
+    weather_data: Sequence,
+    planning_period_start: datetime,
+    planning_period_end: datetime,
+) -> List[CropCompletionTable]:
+    """Build the completion table of each crop profile over a planning period.
+
+    Args:
+        crop_profiles: Crop profiles of the allocation
+        weather_data: WeatherSeries or list of WeatherData
+        planning_period_start: Planning period start date
+        planning_period_end: Planning period end date
+
+    Returns:
+        One table per crop profile, in input order
+    """
+    series = daily_weather_series(weather_data)  # Converted once for all crops
+    return [
+        CropCompletionTable.build(
+            crop_profile, series, planning_period_start, planning_period_end
+        )
+        for crop_profile in crop_profiles
+    ]
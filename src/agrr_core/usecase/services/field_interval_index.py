@@ -0,0 +1,157 @@
+"""Per-field sorted interval index for fallow-aware overlap checks.
+
+Feasibility checks ("does this allocation overlap another one in the same
+field, including the fallow period?") are the innermost operation of greedy
+allocation, local search and ALNS. Scanning the solution and rebuilding
+`timedelta` objects for every pair makes each check O(n).
+
+FieldIntervalIndex stores, per field_id, the allocations sorted by their
+fallow-extended interval as integer day ordinals:
+
+    [start_date, completion_date + fallow_period_days)
+
+Two allocations overlap exactly when these half-open intervals intersect,
+which is the condition checked by `CropAllocation.overlaps_with_fallow`.
+
+Invariant: the allocations of each field form a feasible schedule (pairwise
+non-overlapping). Under this invariant interval ends are non-decreasing in
+start order, so an overlap query is a binary search plus a backward walk
+over the conflicting allocations only: O(log n + k).
+Adding only through try_add() (or after an is_feasible_to_add() check)
+keeps the invariant; a full solution can be validated by try_add() on each
+allocation in turn.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class FieldIntervalIndex:
+    """Sorted fallow-aware intervals of allocations, keyed by field.
+
+    Works with any object exposing field (with field_id, fallow_period_days),
+    start_date and completion_date: CropAllocation or AllocationCandidate.
+    """
+
+    def __init__(self, allocations: Iterable[Any] = ()):
+        """Initialize index.
+
+        Args:
+            allocations: Initial allocations (assumed to be a feasible schedule)
+        """
+        self._keys: Dict[str, List[Tuple[int, int]]] = {}
+        self._items: Dict[str, List[Any]] = {}
+        self._size = 0
+
+        for allocation in allocations:
+            self.add(allocation)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @staticmethod
+    def interval(allocation: Any) -> Tuple[int, int]:
+        """Fallow-extended interval as day ordinals (start, end exclusive)."""
+        return (
+            allocation.start_date.toordinal(),
+            allocation.completion_date.toordinal() + allocation.field.fallow_period_days,
+        )
+
+    def field_allocations(self, field_id: str) -> List[Any]:
+        """Allocations of a field in start order."""
+        return list(self._items.get(field_id, ()))
+
+    def free_gaps(self, field_id: str) -> List[Tuple[Optional[int], Optional[int]]]:
+        """Free day-ordinal ranges of a field between its fallow-extended intervals.
+
+        An interval [start, end) can be added without overlaps exactly when
+        gap_start <= start and end <= gap_end for one of the gaps.
+
+        Returns:
+            (gap_start, gap_end) pairs in time order; None marks an unbounded
+            side (a field without allocations has the single gap (None, None))
+        """
+        gaps: List[Tuple[Optional[int], Optional[int]]] = []
+        previous_end: Optional[int] = None
+        for start, end in self._keys.get(field_id, ()):
+            gaps.append((previous_end, start))
+            previous_end = end
+        gaps.append((previous_end, None))
+        return gaps
+
+    def conflicts(self, allocation: Any, ignore: Iterable[Any] = ()) -> Iterator[Any]:
+        """Yield allocations in the same field that overlap `allocation`.
+
+        Args:
+            allocation: Allocation or candidate to check
+            ignore: Allocations to skip (e.g. the one being replaced), by identity
+        """
+        keys = self._keys.get(allocation.field.field_id)
+        if not keys:
+            return
+        items = self._items[allocation.field.field_id]
+        ignore_ids = {id(a) for a in ignore}
+        start, end = self.interval(allocation)
+
+        # Last allocation starting before `end`; ends are non-decreasing, so walk
+        # back only while intervals still reach past `start`
+        j = bisect_left(keys, (end,)) - 1
+        while j >= 0 and keys[j][1] > start:
+            if id(items[j]) not in ignore_ids:
+                yield items[j]
+            j -= 1
+
+    def overlaps(self, allocation: Any, ignore: Iterable[Any] = ()) -> bool:
+        """Check whether `allocation` overlaps any allocation in its field."""
+        for _ in self.conflicts(allocation, ignore):
+            return True
+        return False
+
+    def is_feasible_to_add(self, allocation: Any, ignore: Iterable[Any] = ()) -> bool:
+        """Check whether `allocation` can be added without violating fallow periods."""
+        return not self.overlaps(allocation, ignore)
+
+    def add(self, allocation: Any) -> None:
+        """Add allocation (no feasibility check)."""
+        field_id = allocation.field.field_id
+        keys = self._keys.setdefault(field_id, [])
+        items = self._items.setdefault(field_id, [])
+        key = self.interval(allocation)
+        pos = bisect_right(keys, key)
+        keys.insert(pos, key)
+        items.insert(pos, allocation)
+        self._size += 1
+
+    def try_add(self, allocation: Any) -> bool:
+        """Add allocation if feasible.
+
+        Returns:
+            True if the allocation was added
+        """
+        if self.overlaps(allocation):
+            return False
+        self.add(allocation)
+        return True
+
+    def remove(self, allocation: Any) -> None:
+        """Remove allocation (matched by identity, then equality).
+
+        Raises:
+            ValueError: If allocation is not in the index
+        """
+        field_id = allocation.field.field_id
+        keys = self._keys.get(field_id, [])
+        items = self._items.get(field_id, [])
+        key = self.interval(allocation)
+        lo = bisect_left(keys, key)
+        hi = bisect_right(keys, key)
+
+        pos = next((j for j in range(lo, hi) if items[j] is allocation), None)
+        if pos is None:
+            pos = next((j for j in range(lo, hi) if items[j] == allocation), None)
+        if pos is None:
+            raise ValueError(f"Allocation not in index: {allocation}")
+
+        del keys[pos]
+        del items[pos]
+        self._size -= 1
@@ -0,0 +1,208 @@
+"""Array-backed GDD prefix-sum engine for start-date sweeps.
+
+GrowthPeriodOptimizeInteractor evaluates every start date in the evaluation
+window. Re-accumulating GDD day by day from each start date is O(N×M)
+(N start dates × M weather days) per field×crop.
+
+This engine precomputes, once per weather series and crop profile:
+- Daily GDD arrays per distinct stage temperature profile (vectorized
+  trapezoidal model, identical to `TemperatureProfile.daily_gdd`)
+- Cumulative sums of those arrays (prefix sums)
+
+Stage boundaries and the completion date of any start date are then found by
+binary search on the prefix sums: O(S·log M) per start date (S = stages).
+The whole sweep is vectorized across start dates.
+
+Semantics match the stage-aware accumulation in
+`GrowthPeriodOptimizeInteractor._compute_completion_from_start`:
+- Accumulation walks the available weather days in chronological order
+- Surplus GDD of a completed stage carries over to the next stage
+- Missing temperature contributes 0 GDD
+"""
+
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from agrr_core.entity.entities.temperature_profile_entity import TemperatureProfile
+
+
+def temperature_efficiency_array(
+    profile: TemperatureProfile, t_mean: np.ndarray
+) -> np.ndarray:
+    """Vectorized equivalent of `TemperatureProfile._calculate_temperature_efficiency`.
+
+    Args:
+        profile: Temperature profile (base/optimal/max temperatures)
+        t_mean: Daily mean temperatures in °C (NaN = missing)
+
+    Returns:
+        Efficiency array (0.0 to 1.0; 0.0 for missing temperatures)
+    """
+    base = profile.base_temperature
+    opt_min = profile.optimal_min
+    opt_max = profile.optimal_max
+    t_max = profile.max_temperature
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        efficiency = np.zeros_like(t_mean)
+        optimal = (t_mean >= opt_min) & (t_mean <= opt_max)
+        cool = (t_mean > base) & (t_mean < opt_min)
+        warm = (t_mean > opt_max) & (t_mean < t_max)
+
+        efficiency[optimal] = 1.0
+        efficiency[cool] = np.clip((t_mean[cool] - base) / (opt_min - base), 0.0, 1.0)
+        efficiency[warm] = np.clip((t_max - t_mean[warm]) / (t_max - opt_max), 0.0, 1.0)
+    return efficiency
+
+
+def daily_gdd_array(profile: TemperatureProfile, t_mean: np.ndarray) -> np.ndarray:
+    """Vectorized equivalent of `TemperatureProfile.daily_gdd`.
+
+    Args:
+        profile: Temperature profile (base/optimal/max temperatures)
+        t_mean: Daily mean temperatures in °C (NaN = missing)
+
+    Returns:
+        Daily GDD array (0.0 for missing or non-viable temperatures)
+    """
+    efficiency = temperature_efficiency_array(profile, t_mean)
+    with np.errstate(invalid="ignore"):
+        viable = (t_mean > profile.base_temperature) & (t_mean < profile.max_temperature)
+    gdd = np.zeros_like(t_mean)
+    gdd[viable] = (t_mean[viable] - profile.base_temperature) * efficiency[viable]
+    return gdd
+
+
+class GDDPrefixSumEngine:
+    """Answer stage-aware completion queries by binary search on GDD prefix sums.
+
+    Usage:
+        engine = GDDPrefixSumEngine(
+            series.ordinals, series.column('temperature_2m_mean'), stage_requirements
+        )
+        completions = engine.sweep(start_dates)
+        # completions[i] is (completion_date, growth_days) or None
+    """
+
+    def __init__(
+        self,
+        ordinals: np.ndarray,
+        t_mean: np.ndarray,
+        stage_requirements: Sequence,
+    ):
+        """Precompute per-stage cumulative GDD arrays.
+
+        Args:
+            ordinals: Date ordinals of the weather days, strictly increasing
+                (WeatherSeries.ordinals of a series with unique dates)
+            t_mean: Daily mean temperatures in °C aligned with ordinals
+                (NaN = missing)
+            stage_requirements: List of StageRequirement entities (in stage order)
+        """
+        self.ordinals = np.asarray(ordinals, dtype=np.int64)
+        t_mean = np.asarray(t_mean, dtype=np.float64)
+        self.t_mean = t_mean
+
+        self.required_gdd = np.array(
+            [sr.thermal.required_gdd for sr in stage_requirements], dtype=np.float64
+        )
+
+        # Stages frequently share a temperature profile; compute each prefix sum once
+        prefix_by_profile: Dict[TemperatureProfile, np.ndarray] = {}
+        self.stage_prefix: List[np.ndarray] = []
+        for sr in stage_requirements:
+            profile = sr.temperature
+            prefix = prefix_by_profile.get(profile)
+            if prefix is None:
+                prefix = np.concatenate(
+                    ([0.0], np.cumsum(daily_gdd_array(profile, t_mean)))
+                )
+                prefix_by_profile[profile] = prefix
+            self.stage_prefix.append(prefix)
+
+    def start_index(self, start: datetime) -> int:
+        """Return index of the first weather day on or after `start`."""
+        ordinal = start.toordinal()
+        if start.time() != datetime.min.time():
+            ordinal += 1  # Days at midnight before `start` are excluded
+        return int(np.searchsorted(self.ordinals, ordinal, side="left"))
+
+    def completion_indices(self, start_indices: np.ndarray) -> np.ndarray:
+        """Vectorized stage-aware completion search.
+
+        Args:
+            start_indices: Indices into ordinals where accumulation begins
+
+        Returns:
+            Array of completion day indices (-1 where growth cannot complete)
+        """
+        n_days = len(self.ordinals)
+        pos = np.asarray(start_indices, dtype=np.int64).copy()
+        failed = pos >= n_days
+        surplus = np.zeros(len(pos), dtype=np.float64)
+        completion = pos - 1
+
+        if len(self.required_gdd) == 0:
+            return np.full(len(pos), -1, dtype=np.int64)
+
+        for stage_idx, prefix in enumerate(self.stage_prefix):
+            remaining = self.required_gdd[stage_idx] - surplus
+            # Stage already met by carried-over surplus: completes on the same day
+            needs_days = (remaining > 0.0) & ~failed
+
+            safe_pos = np.minimum(pos, n_days)
+            base = prefix[safe_pos]
+            target = base + remaining
+            end = np.searchsorted(prefix, target, side="left")
+            end = np.maximum(end, safe_pos + 1)
+
+            exhausted = needs_days & (end > n_days)
+            failed |= exhausted
+            advance = needs_days & ~exhausted
+
+            safe_end = np.minimum(end, n_days)
+            consumed = prefix[safe_end] - base
+            surplus = np.where(advance, consumed - remaining, -remaining)
+            pos = np.where(advance, safe_end, pos)
+            completion = np.where(advance, safe_end - 1, completion)
+
+        return np.where(failed, -1, completion)
+
+    def sweep(
+        self, start_dates: Sequence[datetime]
+    ) -> List[Optional[Tuple[datetime, int]]]:
+        """Compute completion for every start date in one vectorized pass.
+
+        Args:
+            start_dates: Candidate cultivation start dates
+
+        Returns:
+            List aligned with start_dates; each entry is
+            (completion_date, growth_days) or None if growth cannot complete
+        """
+        if not start_dates:
+            return []
+        start_indices = np.array(
+            [self.start_index(s) for s in start_dates], dtype=np.int64
+        )
+        completion_idx = self.completion_indices(start_indices)
+
+        results: List[Optional[Tuple[datetime, int]]] = []
+        for start, idx in zip(start_dates, completion_idx):
+            if idx < 0:
+                results.append(None)
+                continue
+            completion_date = datetime.combine(
+                date.fromordinal(int(self.ordinals[idx])), datetime.min.time()
+            )
+            growth_days = (completion_date - start).days + 1
+            results.append((completion_date, growth_days))
+        return results
+
+    def completion_from_start(
+        self, start: datetime
+    ) -> Optional[Tuple[datetime, int]]:
+        """Compute completion for a single start date."""
+        return self.sweep([start])[0]
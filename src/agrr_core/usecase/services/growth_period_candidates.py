@@ -0,0 +1,245 @@
+"""Growth period candidates of a crop profile over an evaluation period.
+
+Pure computation shared by GrowthPeriodOptimizeInteractor and
+GrowthPeriodWorkerPool: given a crop profile, a weather series and a field,
+slide the start date over the evaluation period and collect the periods that
+complete growth by its end. No gateways are involved, so workers can run it
+directly on a read-only snapshot.
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.entity.entities.crop_profile_entity import CropProfile
+from agrr_core.entity.entities.field_entity import Field
+from agrr_core.entity.entities.weather_series_entity import WeatherSeries
+from agrr_core.usecase.dto.growth_period_optimize_response_dto import (
+    CandidateResultDTO,
+)
+from agrr_core.usecase.services.gdd_prefix_sum_engine import GDDPrefixSumEngine
+from agrr_core.usecase.services.stress_impact_kernel import StressImpactKernel
+
+# (completion_date, growth_days, yield_factor), or None if growth cannot complete
+Completion = Optional[Tuple[datetime, int, float]]
+
+
+def daily_weather_series(weather_data: Sequence) -> WeatherSeries:
+    """Weather in date order with one record per date (later records win).
+
+    A sorted WeatherSeries without duplicate dates is used as-is, so its
+    columns feed the sweep without building any WeatherData; a list of
+    WeatherData is converted to columns once.
+    """
+    return WeatherSeries.from_weather_data(weather_data).unique_dates()
+
+
+class CompletionSweep:
+    """Completion and yield factor of many start dates for one crop profile.
+
+    Wraps GDDPrefixSumEngine (completion by binary search on cumulative GDD)
+    and StressImpactKernel (yield factor from prefix sums of stress impacts),
+    both fed from the columns of a daily_weather_series().
+    """
+
+    def __init__(self, series: WeatherSeries, stage_requirements: List):
+        t_mean = series.column('temperature_2m_mean')
+        self.engine = GDDPrefixSumEngine(series.ordinals, t_mean, stage_requirements)
+        self.yield_kernel = None
+        if stage_requirements:
+            # Yield stress uses the first stage's temperature profile
+            self.yield_kernel = StressImpactKernel(
+                series.ordinals,
+                t_mean,
+                series.column('temperature_2m_max'),
+                series.column('temperature_2m_min'),
+                stage_requirements[0].temperature,
+            )
+
+    def completions(self, start_dates: List[datetime]) -> Dict[datetime, Completion]:
+        """Resolve completion and yield factor for many start dates at once.
+
+        Args:
+            start_dates: Candidate start dates
+
+        Returns:
+            Dict mapping start date to (completion_date, growth_days, yield_factor),
+            or None if growth cannot complete from that date.
+        """
+        completions = self.engine.sweep(start_dates)
+        completed = [
+            (start, completion)
+            for start, completion in zip(start_dates, completions)
+            if completion is not None
+        ]
+        yield_factors = self.yield_kernel.window_yield_factors(
+            [start for start, _ in completed],
+            [completion[0] for _, completion in completed],
+        ) if completed else []
+
+        result = {start: None for start in start_dates}
+        for (start, (completion_date, growth_days)), yield_factor in zip(
+            completed, yield_factors
+        ):
+            result[start] = (completion_date, growth_days, float(yield_factor))
+        return result
+
+
+def window_start_dates(
+    evaluation_period_start: datetime, evaluation_period_end: datetime
+) -> List[datetime]:
+    """Start dates visited by the sliding window (the day after the period start onwards)."""
+    return [
+        evaluation_period_start + timedelta(days=i)
+        for i in range(1, (evaluation_period_end - evaluation_period_start).days + 1)
+    ]
+
+
+def slide_window(
+    evaluation_period_start: datetime,
+    evaluation_period_end: datetime,
+    field: Field,
+    crop: Crop,
+    completion_of: Callable[[datetime], Completion],
+) -> List[CandidateResultDTO]:
+    """Slide the start date forward one day at a time.
+
+    Stops at the first start date that cannot complete growth or whose
+    completion exceeds the evaluation period end.
+
+    Returns:
+        Candidates in chronological order of start date
+    """
+    results = []
+    for start in window_start_dates(evaluation_period_start, evaluation_period_end):
+        completion = completion_of(start)
+        if completion is None:
+            break
+        completion_date, growth_days, yield_factor = completion
+        if completion_date > evaluation_period_end:
+            break
+        results.append(CandidateResultDTO(
+            start_date=start,
+            completion_date=completion_date,
+            growth_days=growth_days,
+            field=field,
+            crop=crop,
+            is_optimal=False,
+            yield_factor=yield_factor,
+        ))
+    return results
+
+
+def sort_by_cost(candidates: List[CandidateResultDTO]) -> List[CandidateResultDTO]:
+    """Valid candidates sorted by cost (ascending), then invalid ones in input order."""
+    valid = sorted(
+        (c for c in candidates if c.total_cost is not None), key=lambda c: c.total_cost
+    )
+    return valid + [c for c in candidates if c.total_cost is None]
+
+
+def filter_shortest_per_completion_date(
+    candidates: List[CandidateResultDTO],
+) -> List[CandidateResultDTO]:
+    """Keep only the shortest cultivation period per completion date.
+
+    When multiple candidates reach the same completion date, only the one with
+    the shortest growth_days (the one that starts latest) is kept: same
+    deadline constraint satisfaction at a lower total cost.
+
+    Returns:
+        Filtered list ordered by completion_date descending (future to past)
+    """
+    completion_groups: Dict[datetime, List[CandidateResultDTO]] = defaultdict(list)
+    for candidate in candidates:
+        if candidate.completion_date is not None and candidate.growth_days is not None:
+            completion_groups[candidate.completion_date].append(candidate)
+
+    return [
+        min(completion_groups[completion_date], key=lambda c: c.growth_days)
+        for completion_date in sorted(completion_groups, reverse=True)
+    ]
+
+
+def no_candidate_error(
+    candidates: List[CandidateResultDTO],
+    crop_profile: CropProfile,
+    evaluation_period_start: datetime,
+    evaluation_period_end: datetime,
+) -> ValueError:
+    """Error explaining why no candidate completes within the evaluation period."""
+    completed_candidates = [c for c in candidates if c.completion_date is not None]
+    if completed_candidates:
+        earliest_completion = min(c.completion_date for c in completed_candidates)
+        # Only show earliest completion if it's within a reasonable range (not due to bug)
+        if earliest_completion <= evaluation_period_end + timedelta(days=365):
+            return ValueError(
+                f"No candidate can complete by the deadline ({evaluation_period_end.date()}). "
+                f"Earliest possible completion is {earliest_completion.date()}. "
+                f"Consider extending the deadline or choosing an earlier start date range."
+            )
+
+    total_required_gdd = sum(
+        sr.thermal.required_gdd for sr in crop_profile.stage_requirements
+    )
+    return ValueError(
+        f"No candidate can complete growth within the planning period. "
+        f"Total required GDD: {total_required_gdd:.1f}. "
+        f"Planning period: {evaluation_period_start.date()} to {evaluation_period_end.date()}. "
+        f"Consider extending the deadline, reducing GDD requirements, or choosing different start dates."
+    )
+
+
+def evaluate_growth_period_candidates(
+    crop_profile: CropProfile,
+    weather_data: Sequence,
+    field: Field,
+    evaluation_period_start: datetime,
+    evaluation_period_end: datetime,
+    filter_redundant_candidates: bool = True,
+) -> List[CandidateResultDTO]:
+    """Valid growth period candidates of a crop profile in a field.
+
+    Same candidates as GrowthPeriodOptimizeInteractor.execute (prefix-sum path,
+    no weather interpolation), without the optimal-candidate marking.
+
+    Args:
+        crop_profile: Crop profile (crop and stage requirements)
+        weather_data: WeatherSeries or list of WeatherData
+        field: Field whose daily fixed cost prices the candidates
+        evaluation_period_start: Earliest possible cultivation start date
+        evaluation_period_end: Completion deadline
+        filter_redundant_candidates: Keep only the shortest candidate per completion date
+
+    Returns:
+        Valid candidates sorted by cost, or ordered by completion date
+        descending when filtered
+
+    Raises:
+        ValueError: If no candidate reaches 100% growth completion
+    """
+    series = daily_weather_series(weather_data)
+    if not len(series):
+        raise ValueError("No weather data available")
+
+    sweep = CompletionSweep(series, crop_profile.stage_requirements)
+    completions = sweep.completions(
+        window_start_dates(evaluation_period_start, evaluation_period_end)
+    )
+    candidates = sort_by_cost(slide_window(
+        evaluation_period_start,
+        evaluation_period_end,
+        field,
+        crop_profile.crop,
+        completions.__getitem__,
+    ))
+
+    valid_candidates = [c for c in candidates if c.total_cost is not None]
+    if filter_redundant_candidates:
+        valid_candidates = filter_shortest_per_completion_date(valid_candidates)
+    if not valid_candidates:
+        raise no_candidate_error(
+            candidates, crop_profile, evaluation_period_start, evaluation_period_end
+        )
+    return valid_candidates
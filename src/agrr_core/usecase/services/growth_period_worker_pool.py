@@ -0,0 +1,149 @@
+"""Worker pool for batched growth period optimizations.
+
+Candidate generation in MultiFieldCropAllocationGreedyInteractor runs one
+GrowthPeriodOptimizeInteractor per field×crop. Routing every task through a
+shared crop_profile_gateway (save → execute → delete) serializes the work and
+makes it unsafe to parallelize.
+
+This pool removes the shared mutable state:
+- Weather data and crop profiles are loaded once and handed to each worker
+  as a read-only snapshot (process initializer, sent once per worker)
+- Each task names its crop profile by index and computes its candidates
+  directly from the snapshot (no gateways, see growth_period_candidates)
+- Results are returned in task order, so merged candidates are deterministic
+  regardless of worker count or completion order
+
+With max_workers <= 1 the same task function runs in-process (no pool).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+
+from agrr_core.entity.entities.crop_profile_entity import CropProfile
+from agrr_core.entity.entities.field_entity import Field
+from agrr_core.entity.entities.weather_entity import WeatherData
+from agrr_core.usecase.dto.growth_period_optimize_response_dto import (
+    CandidateResultDTO,
+)
+from agrr_core.usecase.services.growth_period_candidates import (
+    evaluate_growth_period_candidates,
+)
+
+
+@dataclass(frozen=True)
+class GrowthPeriodTask:
+    """A single growth period optimization (one field × one crop profile)."""
+
+    field: Field
+    crop_index: int  # Index into the pool's crop profile snapshot
+    evaluation_period_start: datetime
+    evaluation_period_end: datetime
+    filter_redundant_candidates: bool = True
+
+
+@dataclass
+class GrowthPeriodTaskResult:
+    """Result of a GrowthPeriodTask.
+
+    Fields:
+        candidates: Valid candidate periods, as GrowthPeriodOptimizeInteractor
+            returns them (empty on error)
+        error: Error message if the crop cannot complete growth in the period
+    """
+
+    candidates: List[CandidateResultDTO] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def _run_task(
+    task: GrowthPeriodTask,
+    weather_data: List[WeatherData],
+    crop_profiles: List[CropProfile],
+) -> GrowthPeriodTaskResult:
+    """Run one growth period optimization against a read-only snapshot."""
+    try:
+        candidates = evaluate_growth_period_candidates(
+            crop_profile=crop_profiles[task.crop_index],
+            weather_data=weather_data,
+            field=task.field,
+            evaluation_period_start=task.evaluation_period_start,
+            evaluation_period_end=task.evaluation_period_end,
+            filter_redundant_candidates=task.filter_redundant_candidates,
+        )
+    except ValueError as e:
+        # Crop cannot complete growth in the planning period (expected for some seasons)
+        return GrowthPeriodTaskResult(error=str(e))
+    return GrowthPeriodTaskResult(candidates=candidates)
+
+
+# Per-process snapshot, set once by the pool initializer
+_worker_weather_data: Optional[List[WeatherData]] = None
+_worker_crop_profiles: Optional[List[CropProfile]] = None
+
+
+def _init_worker(weather_data: List[WeatherData], crop_profiles: List[CropProfile]) -> None:
+    global _worker_weather_data, _worker_crop_profiles
+    _worker_weather_data = weather_data
+    _worker_crop_profiles = crop_profiles
+
+
+def _run_task_in_worker(task: GrowthPeriodTask) -> GrowthPeriodTaskResult:
+    return _run_task(task, _worker_weather_data, _worker_crop_profiles)
+
+
+class GrowthPeriodWorkerPool:
+    """Run many growth period optimizations, optionally on a process pool."""
+
+    def __init__(
+        self,
+        weather_data: List[WeatherData],
+        crop_profiles: List[CropProfile],
+        max_workers: int = 1,
+    ):
+        """Initialize worker pool.
+
+        Args:
+            weather_data: Weather series shared (read-only) by all tasks
+            crop_profiles: Crop profiles referenced by GrowthPeriodTask.crop_index
+            max_workers: Number of worker processes (<= 1: run in-process,
+                0 or None: os.cpu_count())
+        """
+        self.weather_data = weather_data
+        self.crop_profiles = crop_profiles
+        self.max_workers = self.resolve_worker_count(max_workers)
+
+    @staticmethod
+    def resolve_worker_count(max_workers: Optional[int]) -> int:
+        """Resolve configured worker count (0/None = number of CPUs)."""
+        if not max_workers:
+            return os.cpu_count() or 1
+        return max(1, max_workers)
+
+    def run(self, tasks: List[GrowthPeriodTask]) -> List[GrowthPeriodTaskResult]:
+        """Run all tasks and return results in task order.
+
+        Args:
+            tasks: Tasks to run
+
+        Returns:
+            List of results aligned with tasks
+        """
+        workers = min(self.max_workers, len(tasks))
+        if workers <= 1:
+            return [
+                _run_task(task, self.weather_data, self.crop_profiles)
+                for task in tasks
+            ]
+
+        # Several tasks per round trip to amortize IPC overhead
+        chunksize = max(1, len(tasks) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.weather_data, self.crop_profiles),
+        ) as executor:
+            # Executor.map preserves input order -> deterministic merge
+            return list(executor.map(_run_task_in_worker, tasks, chunksize=chunksize))
@@ -8,6 +8,7 @@ from typing import List, Optional
 
 from agrr_core.entity.entities.interaction_rule_entity import InteractionRule
 from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.entity.value_objects.interaction_rule_table import InteractionRuleTable
 from agrr_core.entity.value_objects.rule_type import RuleType
 
 class InteractionRuleService:
@@ -21,6 +22,28 @@ class InteractionRuleService:
         """
         self.rules = rules
     
+    @property
+    def rules(self) -> List[InteractionRule]:
+        """Interaction rules applied by this service."""
+        return self._rules
+    
+    @rules.setter
+    def rules(self, rules: List[InteractionRule]) -> None:
+        self._rules = rules
+        self._rule_table: Optional[InteractionRuleTable] = None
+    
+    @property
+    def rule_table(self) -> InteractionRuleTable:
+        """Continuous cultivation rules compiled by (previous group, current group).
+        
+        Compiled on first use and again after `rules` is reassigned.
+        Pass it as `interaction_rules` to OptimizationMetrics for
+        near-constant-time interaction impact lookups.
+        """
+        if self._rule_table is None:
+            self._rule_table = InteractionRuleTable(self._rules)
+        return self._rule_table
+    
     def get_continuous_cultivation_impact(
         self,
         current_crop: Crop,
@@ -67,24 +90,8 @@ class InteractionRuleService:
         if not current_crop.groups or not previous_crop.groups:
             return 1.0
         
-        # Find all applicable continuous_cultivation rules
-        combined_impact = 1.0
-        
-        for prev_group in previous_crop.groups:
-            for curr_group in current_crop.groups:
-                for rule in self.rules:
-                    # Only check continuous_cultivation rules
-                    if rule.rule_type != RuleType.CONTINUOUS_CULTIVATION:
-                        continue
-                    
-                    # Get impact for this group combination
-                    impact = rule.get_impact(prev_group, curr_group)
-                    
-                    # If impact is not 1.0, apply it (multiply)
-                    if impact != 1.0:
-                        combined_impact *= impact
-        
-        return combined_impact
+        # Combine all applicable continuous_cultivation rules
+        return self.rule_table.combined_impact(previous_crop.groups, current_crop.groups)
     
     def get_field_crop_impact(
         self,
@@ -0,0 +1,167 @@
+"""Delta evaluation of neighbor moves for local search.
+
+Scoring a neighbor by materializing it, recalculating every allocation with
+full context (OptimizationMetrics.recalculate_allocations_with_context) and
+validating the whole schedule costs O(n log n) or more per neighbor. A move
+(NeighborMove) only changes the fields it touches, so MoveDeltaEvaluator
+keeps per-field contributions of the current solution and rescores just
+those fields.
+
+Why the delta is exact: before the market demand cap, an allocation's
+revenue depends only on its own crop, area and period and on the previous
+allocation in its field (interaction impact, soil recovery). The cap hands
+out each crop's max_revenue in profit-rate order, but whatever the order,
+the crop's capped total is min(max_revenue, sum of uncapped revenues).
+Total profit is therefore
+
+    sum over crops of capped(uncapped revenue of the crop) - total cost
+
+and a move changes it only through the per-crop sums and costs of the
+fields it touches.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+from agrr_core.entity.value_objects.field_predecessor_index import FieldPredecessorIndex
+from agrr_core.entity.value_objects.optimization_objective import OptimizationMetrics
+from agrr_core.usecase.services.field_interval_index import FieldIntervalIndex
+from agrr_core.usecase.services.neighbor_operations.neighbor_move import NeighborMove
+
+# Uncapped revenue by crop_id and total cost of one field's allocations
+FieldScore = Tuple[Dict[str, float], float]
+
+class MoveDeltaEvaluator:
+    """Profit changes of moves relative to a fixed current solution.
+
+    Usage:
+        evaluator = MoveDeltaEvaluator(solution, rule_table, planning_start_date)
+        for move in moves:
+            delta = evaluator.delta(move)  # None if infeasible
+        best = best_move.apply(solution)
+    """
+
+    def __init__(
+        self,
+        solution: Iterable[CropAllocation],
+        interaction_rules=None,
+        planning_start_date=None,
+    ):
+        """Initialize evaluator.
+
+        Args:
+            solution: Current solution
+            interaction_rules: Interaction rules or InteractionRuleTable
+            planning_start_date: Planning period start date (soil recovery)
+        """
+        self._interaction_rules = interaction_rules
+        self._planning_start_date = planning_start_date
+        self._max_revenue: Dict[str, Optional[float]] = {}
+        self._field_allocations: Dict[str, List[CropAllocation]] = {}
+        self._field_of: Dict[str, str] = {}
+        for alloc in solution:
+            self._field_allocations.setdefault(alloc.field.field_id, []).append(alloc)
+            self._field_of[alloc.allocation_id] = alloc.field.field_id
+
+        self._field_scores: Dict[str, FieldScore] = {}
+        self._crop_revenue: Dict[str, float] = {}
+        self._cost = 0.0
+        for field_id, allocations in self._field_allocations.items():
+            revenue_by_crop, cost = self._score_field(allocations, check_feasibility=False)
+            self._field_scores[field_id] = (revenue_by_crop, cost)
+            self._cost += cost
+            for crop_id, revenue in revenue_by_crop.items():
+                self._crop_revenue[crop_id] = self._crop_revenue.get(crop_id, 0.0) + revenue
+
+    @property
+    def profit(self) -> float:
+        """Total profit of the current solution."""
+        revenue = sum(
+            self._capped(crop_id, total) for crop_id, total in self._crop_revenue.items()
+        )
+        return revenue - self._cost
+
+    def delta(self, move: NeighborMove) -> Optional[float]:
+        """Profit change of applying a move to the current solution.
+
+        Args:
+            move: Move generated from the current solution
+
+        Returns:
+            Profit of the neighbor minus profit of the current solution, or
+            None if the neighbor violates fallow periods in a touched field
+        """
+        removed = set(move.remove_ids)
+        touched = [self._field_of[i] for i in move.remove_ids if i in self._field_of]
+        touched.extend(alloc.field.field_id for alloc in move.add)
+
+        crop_delta: Dict[str, float] = {}
+        cost_delta = 0.0
+        for field_id in dict.fromkeys(touched):
+            allocations = [
+                a for a in self._field_allocations.get(field_id, ())
+                if a.allocation_id not in removed
+            ]
+            allocations.extend(a for a in move.add if a.field.field_id == field_id)
+            score = self._score_field(allocations)
+            if score is None:
+                return None
+
+            new_revenue, new_cost = score
+            old_revenue, old_cost = self._field_scores.get(field_id, ({}, 0.0))
+            cost_delta += new_cost - old_cost
+            for crop_id, revenue in new_revenue.items():
+                crop_delta[crop_id] = crop_delta.get(crop_id, 0.0) + revenue
+            for crop_id, revenue in old_revenue.items():
+                crop_delta[crop_id] = crop_delta.get(crop_id, 0.0) - revenue
+
+        revenue_delta = 0.0
+        for crop_id, change in crop_delta.items():
+            total = self._crop_revenue.get(crop_id, 0.0)
+            revenue_delta += self._capped(crop_id, total + change) - self._capped(crop_id, total)
+        return revenue_delta - cost_delta
+
+    def _capped(self, crop_id: str, revenue: float) -> float:
+        max_revenue = self._max_revenue.get(crop_id)
+        return revenue if max_revenue is None else min(revenue, max_revenue)
+
+    def _score_field(
+        self, allocations: List[CropAllocation], check_feasibility: bool = True
+    ) -> Optional[FieldScore]:
+        """Uncapped revenue per crop and cost of one field's allocations.
+
+        Returns:
+            FieldScore, or None if check_feasibility and allocations overlap
+            (including fallow periods)
+        """
+        if check_feasibility:
+            schedule_index = FieldIntervalIndex()
+            for alloc in allocations:
+                if not schedule_index.try_add(alloc):
+                    return None
+
+        field_schedules = FieldPredecessorIndex.from_allocations(allocations)
+        revenue_by_crop: Dict[str, float] = {}
+        cost = 0.0
+        for alloc in allocations:
+            crop_id = alloc.crop.crop_id
+            self._max_revenue.setdefault(crop_id, alloc.crop.max_revenue)
+            # Same factory as the full recalculation, without the market cap
+            metrics = OptimizationMetrics.create_for_allocation(
+                area_used=alloc.area_used,
+                revenue_per_area=alloc.crop.revenue_per_area,
+                max_revenue=None,
+                growth_days=alloc.growth_days,
+                daily_fixed_cost=alloc.field.daily_fixed_cost,
+                crop_id=crop_id,
+                crop=alloc.crop,
+                field=alloc.field,
+                start_date=alloc.start_date,
+                field_schedules=field_schedules,
+                interaction_rules=self._interaction_rules,
+                planning_start_date=self._planning_start_date,
+            )
+            revenue = metrics.revenue
+            revenue_by_crop[crop_id] = revenue_by_crop.get(crop_id, 0.0) + (revenue or 0.0)
+            cost += metrics.cost
+        return revenue_by_crop, cost
@@ -0,0 +1,212 @@
+"""Multi-start ALNS with a shared incumbent.
+
+A single ALNS run is one simulated annealing trajectory. This optimizer runs
+K independent trajectories (ALNSTrajectory) from the same initial solution
+and advances them in epochs of config.alns_exchange_interval iterations:
+
+- Trajectory k has its own random.Random, seeded from a master seed
+  (config.alns_seed), and its own operator-weight initialisation
+  (trajectory 0 uses the default weights of a single ALNS run)
+- After each epoch the best solution of all trajectories becomes the shared
+  incumbent; trajectories that did not improve their own best during the
+  epoch continue from the incumbent
+- All trajectories stop when the iteration budget is used up or the time
+  limit has passed; the deadline is checked before every iteration of every
+  trajectory, so a run overshoots it by at most one iteration
+
+Epochs run on a process pool (config.alns_workers). Candidates and fields
+are sent to each worker once (process initializer); trajectories travel with
+their optimizer, so weights and random state carry over between epochs.
+Results depend only on the master seed and the iterations run, not on the
+worker count: with an iteration budget (no time limit reached) a run is
+reproducible from the master seed.
+"""
+
+import logging
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.entity.entities.field_entity import Field
+from agrr_core.usecase.dto.optimization_config import OptimizationConfig
+from agrr_core.usecase.services.alns_optimizer_service import (
+    ALNSOptimizer,
+    ALNSTrajectory,
+)
+from agrr_core.usecase.services.candidate_pool import CandidatePool
+
+logger = logging.getLogger(__name__)
+
+# (optimizer holding weights and random state, trajectory)
+TrajectoryRun = Tuple[ALNSOptimizer, ALNSTrajectory]
+
+
+def _run_epoch(
+    run: TrajectoryRun,
+    ranked_candidates: CandidatePool,
+    fields: List[Field],
+    iterations: int,
+    deadline: Optional[float] = None,
+) -> TrajectoryRun:
+    optimizer, trajectory = run
+    optimizer.run(trajectory, ranked_candidates, fields, iterations, deadline)
+    return optimizer, trajectory
+
+
+# Per-process snapshot, set once by the pool initializer
+_worker_ranked_candidates: Optional[CandidatePool] = None
+_worker_fields: Optional[List[Field]] = None
+
+
+def _init_worker(candidates: list, fields: List[Field]) -> None:
+    global _worker_ranked_candidates, _worker_fields
+    _worker_ranked_candidates = ALNSOptimizer._rank_candidates(candidates)
+    _worker_fields = fields
+
+
+def _run_epoch_in_worker(
+    run: TrajectoryRun, iterations: int, deadline: Optional[float]
+) -> TrajectoryRun:
+    return _run_epoch(run, _worker_ranked_candidates, _worker_fields, iterations, deadline)
+
+
+class MultiStartALNSOptimizer:
+    """Run several ALNS trajectories that share their best solution.
+
+    Drop-in replacement for ALNSOptimizer.optimize().
+    """
+
+    def __init__(self, config: OptimizationConfig):
+        """Initialize optimizer.
+
+        Args:
+            config: Optimization configuration (alns_starts, alns_workers,
+                alns_seed, alns_exchange_interval)
+        """
+        self.config = config
+        self.starts = max(1, config.alns_starts)
+        self.max_workers = self.resolve_worker_count(config.alns_workers)
+        self.exchange_interval = max(1, config.alns_exchange_interval)
+
+    @staticmethod
+    def resolve_worker_count(max_workers: Optional[int]) -> int:
+        """Resolve configured worker count (0/None = number of CPUs)."""
+        if not max_workers:
+            return os.cpu_count() or 1
+        return max(1, max_workers)
+
+    def create_runs(
+        self, initial_solution: List[CropAllocation], master_seed: Optional[int]
+    ) -> List[TrajectoryRun]:
+        """Create the trajectories of a run.
+
+        Args:
+            initial_solution: Starting solution of every trajectory
+            master_seed: Seed of the per-trajectory seeds (None: OS entropy)
+
+        Returns:
+            One (optimizer, trajectory) pair per start
+        """
+        master = random.Random(master_seed)
+        runs = []
+        for k in range(self.starts):
+            rng = random.Random(master.getrandbits(64))
+            optimizer = ALNSOptimizer(self.config, rng=rng)
+            if k > 0:
+                # Diversify operator preferences across trajectories
+                for weights in (optimizer.destroy_weights, optimizer.repair_weights):
+                    for op in weights.operators.values():
+                        op.weight = rng.uniform(0.5, 2.0)
+            runs.append((optimizer, ALNSTrajectory.start(initial_solution, optimizer.INITIAL_TEMPERATURE)))
+        return runs
+
+    def optimize(
+        self,
+        initial_solution: List[CropAllocation],
+        candidates: list,
+        fields: List[Field],
+        crops: List[Crop],
+        max_iterations: Optional[int] = None,
+        time_limit: Optional[float] = None,
+    ) -> List[CropAllocation]:
+        """Execute multi-start ALNS optimization.
+
+        Args:
+            initial_solution: Initial solution (from greedy)
+            candidates: All allocation candidates
+            fields: List of fields
+            crops: List of crops
+            max_iterations: Iterations per trajectory (overrides config)
+            time_limit: Maximum computation time in seconds (None for no limit)
+
+        Returns:
+            Best solution found by any trajectory
+        """
+        iterations = max_iterations or self.config.max_local_search_iterations
+        deadline = None if time_limit is None else time.time() + time_limit
+        runs = self.create_runs(initial_solution, self.config.alns_seed)
+        initial_profit = runs[0][1].best_profit
+
+        logger.info(
+            f"Multi-start ALNS starting: starts={self.starts}, workers={self.max_workers}, "
+            f"initial_profit={initial_profit:,.0f}"
+        )
+
+        workers = min(self.max_workers, self.starts)
+        executor = None
+        if workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(candidates, fields),
+            )
+        else:
+            ranked_candidates = ALNSOptimizer._rank_candidates(candidates)
+
+        try:
+            done = 0
+            while done < iterations:
+                if deadline is not None and time.time() > deadline:
+                    done = max(trajectory.iteration for _, trajectory in runs)
+                    logger.info(f"Multi-start ALNS stopped after {done} iterations: time limit reached")
+                    break
+                epoch = min(self.exchange_interval, iterations - done)
+                previous_best = [trajectory.best_profit for _, trajectory in runs]
+                if executor is not None:
+                    # Executor.map preserves trajectory order
+                    runs = list(executor.map(
+                        _run_epoch_in_worker, runs, [epoch] * len(runs), [deadline] * len(runs)
+                    ))
+                else:
+                    runs = [_run_epoch(run, ranked_candidates, fields, epoch, deadline) for run in runs]
+                done += epoch
+                self._exchange_incumbent(runs, previous_best)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        best = self.incumbent(runs)
+        logger.info(
+            f"Multi-start ALNS finished: best_profit={best.best_profit:,.0f}, "
+            f"improvement={best.best_profit - initial_profit:,.0f}"
+        )
+        return best.best
+
+    @staticmethod
+    def incumbent(runs: List[TrajectoryRun]) -> ALNSTrajectory:
+        """Trajectory with the best solution (ties: lowest index)."""
+        return max(
+            (trajectory for _, trajectory in runs),
+            key=lambda trajectory: trajectory.best_profit,
+        )
+
+    def _exchange_incumbent(self, runs: List[TrajectoryRun], previous_best: List[float]) -> None:
+        """Restart trajectories that did not improve during the epoch from the incumbent."""
+        incumbent = self.incumbent(runs)
+        for (_, trajectory), previous in zip(runs, previous_best):
+            if trajectory is not incumbent and trajectory.best_profit <= previous:
+                trajectory.restart_from(incumbent.best)
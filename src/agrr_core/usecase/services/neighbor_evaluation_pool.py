@@ -0,0 +1,268 @@
+"""Worker pool for delta evaluation of neighbor moves.
+
+Hill climbing scores each iteration's batch of moves (NeighborMove) against
+the current solution with MoveDeltaEvaluator. The moves of a batch are
+independent, so the batch can be split across processes.
+
+Design:
+- Fields, crops, interaction rules and the planning start date are handed to
+  each worker once (process initializer) as a read-only snapshot
+- Allocations travel as compact tuples that name their field by id and their
+  crop by (crop_id, variety); workers rebuild them against the snapshot
+- The pool is persistent: created on the first parallel batch and reused for
+  every iteration until close()
+- Each batch is split into contiguous chunks and results are merged in move
+  order, so the best move is the same as in the serial path
+
+With max_workers <= 1 moves are evaluated in-process (no pool).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.entity.entities.field_entity import Field
+from agrr_core.usecase.services.move_delta_evaluator import MoveDeltaEvaluator
+from agrr_core.usecase.services.neighbor_operations.neighbor_move import NeighborMove
+
+# Crops are identified by crop_id and variety (varieties share a crop_id)
+CropKey = Tuple[str, Optional[str]]
+# (allocation_id, field_id, crop key, area_used, start_date, completion_date,
+#  growth_days, accumulated_gdd, total_cost)
+EncodedAllocation = Tuple[str, str, CropKey, float, datetime, datetime, int, float, float]
+# (operation, remove_ids, encoded additions)
+EncodedMove = Tuple[str, Tuple[str, ...], Tuple[EncodedAllocation, ...]]
+# (delta, feasible); delta is 0.0 when infeasible
+MoveEvaluation = Tuple[float, bool]
+
+
+def crop_key(crop: Crop) -> CropKey:
+    """Identity of a crop in the snapshot (crop_id, variety)."""
+    return crop.crop_id, crop.variety
+
+
+def encode_allocation(alloc: CropAllocation) -> EncodedAllocation:
+    """Encode an allocation without its Field/Crop entities."""
+    return (
+        alloc.allocation_id,
+        alloc.field.field_id,
+        crop_key(alloc.crop),
+        alloc.area_used,
+        alloc.start_date,
+        alloc.completion_date,
+        alloc.growth_days,
+        alloc.accumulated_gdd,
+        alloc.total_cost,
+    )
+
+
+def decode_allocation(
+    encoded: EncodedAllocation,
+    fields: Dict[str, Field],
+    crops: Dict[CropKey, Crop],
+) -> CropAllocation:
+    """Rebuild an allocation from its encoding and a field/crop snapshot."""
+    allocation_id, field_id, key, *values = encoded
+    return CropAllocation(allocation_id, fields[field_id], crops[key], *values)
+
+
+def encode_move(move: NeighborMove) -> EncodedMove:
+    """Encode a move for transfer to a worker."""
+    return move.operation, move.remove_ids, tuple(encode_allocation(a) for a in move.add)
+
+
+def _evaluate(
+    evaluator: MoveDeltaEvaluator, moves: Iterable[NeighborMove]
+) -> List[MoveEvaluation]:
+    results = []
+    for move in moves:
+        delta = evaluator.delta(move)
+        results.append((0.0, False) if delta is None else (delta, True))
+    return results
+
+
+# Per-process snapshot, set once by the pool initializer
+_worker_fields: Dict[str, Field] = {}
+_worker_crops: Dict[CropKey, Crop] = {}
+_worker_interaction_rules = None
+_worker_planning_start_date = None
+# Evaluator of the batch last seen by this worker (batches can span several chunks)
+_worker_evaluator: Tuple[Optional[int], Optional[MoveDeltaEvaluator]] = (None, None)
+
+
+def _init_worker(fields, crops, interaction_rules, planning_start_date) -> None:
+    global _worker_fields, _worker_crops, _worker_interaction_rules, _worker_planning_start_date
+    _worker_fields = fields
+    _worker_crops = crops
+    _worker_interaction_rules = interaction_rules
+    _worker_planning_start_date = planning_start_date
+
+
+def _evaluate_in_worker(
+    batch_id: int,
+    solution: Sequence[EncodedAllocation],
+    moves: Sequence[EncodedMove],
+) -> List[MoveEvaluation]:
+    global _worker_evaluator
+
+    def decode(encoded: EncodedAllocation) -> CropAllocation:
+        return decode_allocation(encoded, _worker_fields, _worker_crops)
+
+    cached_batch_id, evaluator = _worker_evaluator
+    if cached_batch_id != batch_id:
+        evaluator = MoveDeltaEvaluator(
+            [decode(a) for a in solution],
+            _worker_interaction_rules,
+            _worker_planning_start_date,
+        )
+        _worker_evaluator = (batch_id, evaluator)
+
+    return _evaluate(
+        evaluator,
+        (
+            NeighborMove(operation, remove_ids, tuple(decode(a) for a in add))
+            for operation, remove_ids, add in moves
+        ),
+    )
+
+
+class NeighborEvaluationPool:
+    """Evaluate batches of neighbor moves, optionally on a process pool.
+
+    Usage:
+        with NeighborEvaluationPool(fields, crops, rules, start, max_workers=4) as pool:
+            for iteration in ...:
+                results = pool.evaluate(current_solution, moves)
+    """
+
+    def __init__(
+        self,
+        fields: Iterable[Field],
+        crops: Iterable[Crop],
+        interaction_rules=None,
+        planning_start_date=None,
+        max_workers: int = 1,
+    ):
+        """Initialize evaluation pool.
+
+        Args:
+            fields: Fields referenced by solutions and moves
+            crops: Crops referenced by solutions and moves
+            interaction_rules: Interaction rules or InteractionRuleTable
+            planning_start_date: Planning period start date (soil recovery)
+            max_workers: Number of worker processes (<= 1: evaluate in-process,
+                0 or None: os.cpu_count())
+        """
+        self.fields = self.field_snapshot(fields)
+        self.crops = self.crop_snapshot(crops)
+        self.interaction_rules = interaction_rules
+        self.planning_start_date = planning_start_date
+        self.max_workers = self.resolve_worker_count(max_workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._batch_id = 0
+
+    @staticmethod
+    def field_snapshot(fields: Iterable[Field]) -> Dict[str, Field]:
+        """Index fields by field_id.
+
+        Raises:
+            ValueError: If two different fields share a field_id
+        """
+        snapshot: Dict[str, Field] = {}
+        for field in fields:
+            existing = snapshot.setdefault(field.field_id, field)
+            if existing is not field and existing != field:
+                raise ValueError(f"Conflicting fields for field_id '{field.field_id}'")
+        return snapshot
+
+    @staticmethod
+    def crop_snapshot(crops: Iterable[Crop]) -> Dict[CropKey, Crop]:
+        """Index crops by (crop_id, variety).
+
+        Raises:
+            ValueError: If two different crops share a crop_id and variety
+        """
+        snapshot: Dict[CropKey, Crop] = {}
+        for crop in crops:
+            key = crop_key(crop)
+            existing = snapshot.setdefault(key, crop)
+            if existing is not crop and existing != crop:
+                raise ValueError(
+                    f"Conflicting crops for crop_id '{crop.crop_id}' and variety '{crop.variety}'"
+                )
+        return snapshot
+
+    @staticmethod
+    def resolve_worker_count(max_workers: Optional[int]) -> int:
+        """Resolve configured worker count (0/None = number of CPUs)."""
+        if not max_workers:
+            return os.cpu_count() or 1
+        return max(1, max_workers)
+
+    def evaluate(
+        self, solution: List[CropAllocation], moves: List[NeighborMove]
+    ) -> List[MoveEvaluation]:
+        """Evaluate moves generated from a solution.
+
+        Args:
+            solution: Current solution
+            moves: Moves generated from the current solution
+
+        Returns:
+            (delta, feasible) per move, aligned with moves. delta is the
+            profit change of applying the move (0.0 if infeasible).
+        """
+        workers = min(self.max_workers, len(moves))
+        if workers <= 1:
+            evaluator = MoveDeltaEvaluator(
+                solution, self.interaction_rules, self.planning_start_date
+            )
+            return _evaluate(evaluator, moves)
+
+        self._batch_id += 1
+        encoded_solution = [encode_allocation(a) for a in solution]
+        encoded_moves = [encode_move(m) for m in moves]
+        chunk_size = -(-len(moves) // workers)
+        futures = [
+            self._get_executor().submit(
+                _evaluate_in_worker,
+                self._batch_id,
+                encoded_solution,
+                encoded_moves[i:i + chunk_size],
+            )
+            for i in range(0, len(moves), chunk_size)
+        ]
+        # Merge in chunk order -> same order as the serial path
+        results: List[MoveEvaluation] = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def close(self) -> None:
+        """Shut down worker processes (if started)."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "NeighborEvaluationPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(
+                    self.fields,
+                    self.crops,
+                    self.interaction_rules,
+                    self.planning_start_date,
+                ),
+            )
+        return self._executor
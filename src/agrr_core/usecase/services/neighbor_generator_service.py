@@ -1,13 +1,15 @@
 """Neighbor generator service for local search optimization."""
 
 import random
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 
 from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
 from agrr_core.entity.entities.field_entity import Field
 from agrr_core.entity.entities.crop_entity import Crop
 from agrr_core.usecase.dto.optimization_config import OptimizationConfig
+from agrr_core.usecase.services.candidate_pool import CandidatePool
 from agrr_core.usecase.services.neighbor_operations import (
+    NeighborMove,
     NeighborOperation,
     FieldSwapOperation,
     FieldMoveOperation,
@@ -81,9 +83,34 @@ class NeighborGeneratorService:
         Returns:
             List of neighbor solutions
         """
-        # Prepare context for operations
+        moves = self.generate_moves(solution, candidates, fields, crops)
+        return [move.apply(solution) for move in moves]
+    
+    def generate_moves(
+        self,
+        solution: List[CropAllocation],
+        candidates: Union[List[Any], CandidatePool],
+        fields: List[Field],
+        crops: List[Crop],
+    ) -> List[NeighborMove]:
+        """Generate neighbor moves from current solution.
+        
+        Args:
+            solution: Current allocation solution
+            candidates: Allocation candidates (or a CandidatePool over them)
+            fields: Available fields
+            crops: Available crops
+            
+        Returns:
+            List of moves (apply() builds the neighbor solution)
+        """
+        # Prepare context for operations (candidates indexed once per call
+        # unless a CandidatePool built once per optimization is passed)
+        if not isinstance(candidates, CandidatePool):
+            candidates = CandidatePool(candidates)
         context = {
             "candidates": candidates,
+            "candidate_pool": candidates,
             "fields": fields,
             "crops": crops,
             "config": self.config,
@@ -99,30 +126,29 @@ class NeighborGeneratorService:
         self,
         solution: List[CropAllocation],
         context: Dict[str, Any],
-    ) -> List[List[CropAllocation]]:
-        """Generate all neighbors from all operations.
+    ) -> List[NeighborMove]:
+        """Generate all moves from all operations.
         
         Args:
             solution: Current solution
             context: Context information
             
         Returns:
-            All generated neighbors
+            All generated moves
         """
-        all_neighbors = []
+        all_moves = []
         
         for operation in self.operations:
-            neighbors = operation.generate_neighbors(solution, context)
-            all_neighbors.extend(neighbors)
+            all_moves.extend(operation.generate_moves(solution, context))
         
-        return all_neighbors
+        return all_moves
     
     def _generate_with_sampling(
         self,
         solution: List[CropAllocation],
         context: Dict[str, Any],
-    ) -> List[List[CropAllocation]]:
-        """Generate neighbors with weighted sampling (Phase 1 optimization).
+    ) -> List[NeighborMove]:
+        """Generate moves with weighted sampling (Phase 1 optimization).
         
         Strategy:
         1. Generate neighbors from each operation
@@ -134,7 +160,7 @@ class NeighborGeneratorService:
             context: Context information
             
         Returns:
-            Sampled neighbors
+            Sampled moves
         """
         all_neighbors = []
         max_neighbors = self.config.max_neighbors_per_iteration
@@ -155,7 +181,7 @@ class NeighborGeneratorService:
                 continue
             
             # Generate neighbors from this operation
-            op_neighbors = operation.generate_neighbors(solution, context)
+            op_neighbors = operation.generate_moves(solution, context)
             
             # Sample if too many
             if len(op_neighbors) > target_size:
@@ -5,6 +5,9 @@ neighboring solutions for local search algorithms. Each operation implements
 a specific transformation strategy.
 """
 
+from agrr_core.usecase.services.neighbor_operations.neighbor_move import (
+    NeighborMove,
+)
 from agrr_core.usecase.services.neighbor_operations.base_neighbor_operation import (
     NeighborOperation,
 )
@@ -34,6 +37,7 @@ from agrr_core.usecase.services.neighbor_operations.area_adjust_operation import
 )
 
 __all__ = [
+    "NeighborMove",
     "NeighborOperation",
     "FieldSwapOperation",
     "FieldMoveOperation",
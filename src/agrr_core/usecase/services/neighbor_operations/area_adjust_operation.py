@@ -7,6 +7,7 @@ from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
 from agrr_core.usecase.services.neighbor_operations.base_neighbor_operation import (
     NeighborOperation,
 )
+from agrr_core.usecase.services.neighbor_operations.neighbor_move import NeighborMove
 
 class AreaAdjustOperation(NeighborOperation):
     """A1. Area Adjust: Increase or decrease area by ±10%, ±20%.
@@ -25,25 +26,26 @@ class AreaAdjustOperation(NeighborOperation):
     def default_weight(self) -> float:
         return 0.1
     
-    def generate_neighbors(
+    def generate_moves(
         self,
         solution: List[CropAllocation],
         context: Dict[str, Any],
-    ) -> List[List[CropAllocation]]:
-        """Generate neighbors by adjusting areas."""
-        neighbors = []
+    ) -> List[NeighborMove]:
+        """Generate moves adjusting areas."""
+        moves = []
         config = context.get("config")
         
         multipliers = config.area_adjustment_multipliers if config else [0.8, 0.9, 1.1, 1.2]
         
-        for i, alloc in enumerate(solution):
-            # Calculate available area in field
-            used_area_in_field = sum(
-                a.area_used 
-                for a in solution 
-                if a.field.field_id == alloc.field.field_id and
-                   a.allocation_id != alloc.allocation_id
+        used_area_by_field: Dict[str, float] = {}
+        for a in solution:
+            used_area_by_field[a.field.field_id] = (
+                used_area_by_field.get(a.field.field_id, 0.0) + a.area_used
             )
+        
+        for alloc in solution:
+            # Calculate available area in field (excluding this allocation)
+            used_area_in_field = used_area_by_field[alloc.field.field_id] - alloc.area_used
             available_area = alloc.field.area - used_area_in_field
             
             for multiplier in multipliers:
@@ -76,9 +78,9 @@ class AreaAdjustOperation(NeighborOperation):
                     profit=None,  # Recalculated later
                 )
                 
-                neighbor = solution.copy()
-                neighbor[i] = adjusted_alloc
-                neighbors.append(neighbor)
+                moves.append(NeighborMove(
+                    self.operation_name, (alloc.allocation_id,), (adjusted_alloc,)
+                ))
         
-        return neighbors
+        return moves
 
@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 
 from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+from agrr_core.usecase.services.candidate_pool import CandidatePool
+from agrr_core.usecase.services.neighbor_operations.neighbor_move import NeighborMove
 
 class NeighborOperation(ABC):
     """Abstract base class for neighbor operations.
@@ -14,9 +16,27 @@ class NeighborOperation(ABC):
     Design Pattern: Strategy Pattern
     - Each operation encapsulates a specific neighbor generation algorithm
     - Operations can be composed and weighted dynamically
+    - Neighbors are emitted as NeighborMove descriptors; full solutions are
+      only built on request (generate_neighbors)
     """
     
     @abstractmethod
+    def generate_moves(
+        self,
+        solution: List[CropAllocation],
+        context: Dict[str, Any],
+    ) -> List[NeighborMove]:
+        """Generate neighbor moves from the current solution.
+        
+        Args:
+            solution: Current allocation solution
+            context: Context information (candidates, fields, crops, config, etc.)
+            
+        Returns:
+            List of moves (allocations removed/added relative to solution)
+        """
+        pass
+    
     def generate_neighbors(
         self,
         solution: List[CropAllocation],
@@ -31,7 +51,21 @@ class NeighborOperation(ABC):
         Returns:
             List of neighbor solutions
         """
-        pass
+        return [move.apply(solution) for move in self.generate_moves(solution, context)]
+    
+    @staticmethod
+    def candidate_pool(context: Dict[str, Any]) -> CandidatePool:
+        """Indexed candidates of the context.
+        
+        Uses context["candidate_pool"] (built once per optimization by
+        NeighborGeneratorService); otherwise builds a pool from
+        context["candidates"] and stores it for the other operations.
+        """
+        pool = context.get("candidate_pool")
+        if pool is None:
+            pool = CandidatePool(context.get("candidates", []))
+            context["candidate_pool"] = pool
+        return pool
     
     @property
     @abstractmethod
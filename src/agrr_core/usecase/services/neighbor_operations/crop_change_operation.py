@@ -5,9 +5,11 @@ from typing import List, Dict, Any
 
 from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
 from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.usecase.services.field_interval_index import FieldIntervalIndex
 from agrr_core.usecase.services.neighbor_operations.base_neighbor_operation import (
     NeighborOperation,
 )
+from agrr_core.usecase.services.neighbor_operations.neighbor_move import NeighborMove
 
 class CropChangeOperation(NeighborOperation):
     """C1. Crop Change: Change crop while keeping field and approximate period.
@@ -26,41 +28,38 @@ class CropChangeOperation(NeighborOperation):
     def default_weight(self) -> float:
         return 0.1
     
-    def generate_neighbors(
+    def generate_moves(
         self,
         solution: List[CropAllocation],
         context: Dict[str, Any],
-    ) -> List[List[CropAllocation]]:
-        """Generate neighbors by changing crops.
+    ) -> List[NeighborMove]:
+        """Generate moves by changing crops.
         
         CRITICAL: This method now checks fallow period constraints to ensure
         the new crop's period doesn't violate fallow period with other allocations.
         """
-        neighbors = []
-        candidates = context.get("candidates", [])
+        moves = []
+        candidate_pool = self.candidate_pool(context)
         crops = context.get("crops", [])
         
-        for i, alloc in enumerate(solution):
+        schedule_index = FieldIntervalIndex(solution)
+        
+        for alloc in solution:
             for new_crop in crops:
                 # Skip if same crop
                 if new_crop.crop_id == alloc.crop.crop_id:
                     continue
                 
-                # Find similar candidates (same field, new crop, similar timing)
-                similar_candidates = [
-                    c for c in candidates
-                    if c.field.field_id == alloc.field.field_id and
-                       c.crop.crop_id == new_crop.crop_id
-                ]
+                # Find candidate with closest start date (same field, new crop;
+                # ties go to the first in pool order)
+                closest = candidate_pool.nearest(
+                    alloc.field.field_id, new_crop.crop_id, alloc.start_date, limit=1
+                )
                 
-                if not similar_candidates:
+                if not closest:
                     continue
                 
-                # Find candidate with closest start date
-                best_candidate = min(
-                    similar_candidates,
-                    key=lambda c: abs((c.start_date - alloc.start_date).days)
-                )
+                best_candidate = closest[0]
                 
                 # Keep same area
                 original_area = alloc.area_used
@@ -72,25 +71,15 @@ class CropChangeOperation(NeighborOperation):
                 )
                 
                 # Check if new allocation violates fallow period with other allocations
-                # in the same field
-                has_overlap = False
-                for j, other_alloc in enumerate(solution):
-                    if i == j:  # Skip the allocation being replaced
-                        continue
-                    
-                    if other_alloc.field.field_id == new_alloc.field.field_id:
-                        if new_alloc.overlaps_with_fallow(other_alloc):
-                            has_overlap = True
-                            break
-                
-                if has_overlap:
+                # in the same field (skip the allocation being replaced)
+                if schedule_index.overlaps(new_alloc, ignore=(alloc,)):
                     continue  # Skip this candidate - violates fallow period
                 
-                neighbor = solution.copy()
-                neighbor[i] = new_alloc
-                neighbors.append(neighbor)
+                moves.append(NeighborMove(
+                    self.operation_name, (alloc.allocation_id,), (new_alloc,)
+                ))
         
-        return neighbors
+        return moves
     
     def _candidate_to_allocation_with_area(
         self,
@@ -1,12 +1,14 @@
 """Field move operation for local search."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
 from agrr_core.entity.entities.field_entity import Field
+from agrr_core.usecase.services.field_interval_index import FieldIntervalIndex
 from agrr_core.usecase.services.neighbor_operations.base_neighbor_operation import (
     NeighborOperation,
 )
+from agrr_core.usecase.services.neighbor_operations.neighbor_move import NeighborMove
 
 class FieldMoveOperation(NeighborOperation):
     """F1. Field Move: Move allocation to a different field.
@@ -26,55 +28,49 @@ class FieldMoveOperation(NeighborOperation):
     def default_weight(self) -> float:
         return 0.15
     
-    def generate_neighbors(
+    def generate_moves(
         self,
         solution: List[CropAllocation],
         context: Dict[str, Any],
-    ) -> List[List[CropAllocation]]:
-        """Generate neighbors by moving allocations to different fields."""
-        neighbors = []
-        candidates = context.get("candidates", [])
+    ) -> List[NeighborMove]:
+        """Generate moves by moving allocations to different fields."""
+        moves = []
+        candidate_pool = self.candidate_pool(context)
         fields = context.get("fields", [])
+        # Best candidate per (field_id, crop_id), looked up once
+        best_candidates: Dict[Tuple[str, str], Any] = {}
         
-        for i, alloc in enumerate(solution):
+        schedule_index = FieldIntervalIndex(solution)
+        used_area_by_field: Dict[str, float] = {}
+        for a in solution:
+            used_area_by_field[a.field.field_id] = (
+                used_area_by_field.get(a.field.field_id, 0.0) + a.area_used
+            )
+        
+        for alloc in solution:
             for target_field in fields:
                 # Skip if same field
                 if target_field.field_id == alloc.field.field_id:
                     continue
                 
                 # Calculate available area in target field
-                used_area_in_target = sum(
-                    a.area_used 
-                    for a in solution 
-                    if a.field.field_id == target_field.field_id
-                )
+                used_area_in_target = used_area_by_field.get(target_field.field_id, 0.0)
                 available_area = target_field.area - used_area_in_target
                 
                 # Check if allocation fits
                 if alloc.area_used > available_area:
                     continue
                 
-                # Check time overlap (including fallow period)
-                has_overlap = False
-                for existing in solution:
-                    if existing.field.field_id == target_field.field_id:
-                        if alloc.overlaps_with_fallow(existing):
-                            has_overlap = True
-                            break
-                
-                if has_overlap:
-                    continue
-                
                 # Find best period candidate for target field with same crop
-                best_candidate = None
-                best_profit_rate = -float('inf')
-                
-                for candidate in candidates:
-                    if (candidate.field.field_id == target_field.field_id and
-                        candidate.crop.crop_id == alloc.crop.crop_id):
-                        if candidate.profit_rate > best_profit_rate:
-                            best_candidate = candidate
-                            best_profit_rate = candidate.profit_rate
+                key = (target_field.field_id, alloc.crop.crop_id)
+                if key not in best_candidates:
+                    # Highest profit rate; ties go to the first in pool order
+                    best_candidates[key] = max(
+                        candidate_pool.for_field_crop(*key),
+                        key=lambda c: (c.profit_rate, -candidate_pool.position(c)),
+                        default=None,
+                    )
+                best_candidate = best_candidates[key]
                 
                 if best_candidate is None:
                     continue
@@ -85,11 +81,15 @@ class FieldMoveOperation(NeighborOperation):
                     area_used=alloc.area_used
                 )
                 
-                neighbor = solution.copy()
-                neighbor[i] = moved_alloc
-                neighbors.append(neighbor)
+                # Check time overlap in target field (including fallow period)
+                if schedule_index.overlaps(moved_alloc):
+                    continue
+                
+                moves.append(NeighborMove(
+                    self.operation_name, (alloc.allocation_id,), (moved_alloc,)
+                ))
         
-        return neighbors
+        return moves
     
     def _candidate_to_allocation_with_area(
         self,
@@ -6,6 +6,7 @@ from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
 from agrr_core.usecase.services.neighbor_operations.base_neighbor_operation import (
     NeighborOperation,
 )
+from agrr_core.usecase.services.neighbor_operations.neighbor_move import NeighborMove
 
 class FieldRemoveOperation(NeighborOperation):
     """F5. Field Remove: Remove one allocation.
@@ -23,17 +24,14 @@ class FieldRemoveOperation(NeighborOperation):
     def default_weight(self) -> float:
         return 0.05
     
-    def generate_neighbors(
+    def generate_moves(
         self,
         solution: List[CropAllocation],
         context: Dict[str, Any],
-    ) -> List[List[CropAllocation]]:
-        """Generate neighbors by removing allocations."""
-        neighbors = []
-        
-        for i in range(len(solution)):
-            neighbor = solution[:i] + solution[i+1:]
-            neighbors.append(neighbor)
-        
-        return neighbors
+    ) -> List[NeighborMove]:
+        """Generate moves removing one allocation each."""
+        return [
+            NeighborMove(self.operation_name, remove_ids=(alloc.allocation_id,))
+            for alloc in solution
+        ]
 
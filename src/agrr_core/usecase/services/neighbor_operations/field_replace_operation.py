@@ -1,11 +1,13 @@
 """Field replace operation for local search."""
 
+import dataclasses
 from typing import List, Dict, Any
 
 from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
 from agrr_core.usecase.services.neighbor_operations.base_neighbor_operation import (
     NeighborOperation,
 )
+from agrr_core.usecase.services.neighbor_operations.neighbor_move import NeighborMove
 from agrr_core.usecase.services.neighbor_operations.field_move_operation import (
     FieldMoveOperation,
 )
@@ -29,12 +31,15 @@ class FieldReplaceOperation(NeighborOperation):
     def default_weight(self) -> float:
         return 0.1
     
-    def generate_neighbors(
+    def generate_moves(
         self,
         solution: List[CropAllocation],
         context: Dict[str, Any],
-    ) -> List[List[CropAllocation]]:
-        """Generate neighbors by replacing fields."""
+    ) -> List[NeighborMove]:
+        """Generate moves replacing fields."""
         # Field Replace is essentially the same as Field Move
-        return self._move_operation.generate_neighbors(solution, context)
+        return [
+            dataclasses.replace(move, operation=self.operation_name)
+            for move in self._move_operation.generate_moves(solution, context)
+        ]
 
@@ -4,9 +4,15 @@ import uuid
 from typing import List, Dict, Any, Optional, Tuple
 
 from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+from agrr_core.usecase.services.candidate_pool import CandidatePool
+from agrr_core.usecase.services.field_interval_index import FieldIntervalIndex
 from agrr_core.usecase.services.neighbor_operations.base_neighbor_operation import (
     NeighborOperation,
 )
+from agrr_core.usecase.services.neighbor_operations.neighbor_move import NeighborMove
+
+# Growing numbers of closest candidates tried per side of a swap
+SWAP_SEARCH_LIMITS = (5, 10, 20, 50)
 
 class FieldSwapOperation(NeighborOperation):
     """F2. Field Swap: Swap two allocations between different fields.
@@ -25,25 +31,32 @@ class FieldSwapOperation(NeighborOperation):
     def default_weight(self) -> float:
         return 0.3  # High weight - effective operation
     
-    def generate_neighbors(
+    def generate_moves(
         self,
         solution: List[CropAllocation],
         context: Dict[str, Any],
-    ) -> List[List[CropAllocation]]:
-        """Generate neighbors by swapping allocations between fields.
+    ) -> List[NeighborMove]:
+        """Generate moves by swapping allocations between fields.
         
         Uses candidate pool periods for both sides after swap. Generates a neighbor
         only when both sides have valid candidate periods in their target fields.
         Also checks fallow period overlaps.
         """
-        neighbors = []
-        candidates = context.get("candidates", [])
+        moves = []
+        candidate_pool = self.candidate_pool(context)
         config = context.get("config")
         # Tolerance for start date proximity (None means unlimited if not configured)
         tolerance_days = getattr(config, "candidate_date_tolerance_days", None) if config else None
         
+        schedule_index = FieldIntervalIndex(solution)
+        used_area_by_field: Dict[str, float] = {}
+        for alloc in solution:
+            used_area_by_field[alloc.field.field_id] = (
+                used_area_by_field.get(alloc.field.field_id, 0.0) + alloc.area_used
+            )
+        
         # If no candidate pool is provided, perform simple swap keeping original periods
-        if not candidates:
+        if not candidate_pool:
             for i in range(len(solution)):
                 for j in range(i + 1, len(solution)):
                     alloc_a = solution[i]
@@ -55,26 +68,12 @@ class FieldSwapOperation(NeighborOperation):
                         continue
                     new_alloc_a, new_alloc_b = swapped
                     # Check fallow overlap constraints in their new fields
-                    has_overlap = False
-                    for alloc in solution:
-                        if alloc.allocation_id != alloc_b.allocation_id and alloc.field.field_id == new_alloc_a.field.field_id:
-                            if new_alloc_a.overlaps_with_fallow(alloc):
-                                has_overlap = True
-                                break
-                    if has_overlap:
+                    if schedule_index.overlaps(new_alloc_a, ignore=(alloc_b,)):
                         continue
-                    for alloc in solution:
-                        if alloc.allocation_id != alloc_a.allocation_id and alloc.field.field_id == new_alloc_b.field.field_id:
-                            if new_alloc_b.overlaps_with_fallow(alloc):
-                                has_overlap = True
-                                break
-                    if has_overlap:
+                    if schedule_index.overlaps(new_alloc_b, ignore=(alloc_a,)):
                         continue
-                    neighbor = solution.copy()
-                    neighbor[i] = new_alloc_a
-                    neighbor[j] = new_alloc_b
-                    neighbors.append(neighbor)
-            return neighbors
+                    moves.append(self._swap_move(alloc_a, alloc_b, new_alloc_a, new_alloc_b))
+            return moves
         
         for i in range(len(solution)):
             for j in range(i + 1, len(solution)):
@@ -87,16 +86,8 @@ class FieldSwapOperation(NeighborOperation):
                 # Capacity checks excluding the swapping pair
                 area_a = alloc_a.area_used
                 area_b = alloc_b.area_used
-                used_area_in_field_a = sum(
-                    alloc.area_used
-                    for alloc in solution
-                    if alloc.field.field_id == alloc_a.field.field_id and alloc.allocation_id != alloc_a.allocation_id
-                )
-                used_area_in_field_b = sum(
-                    alloc.area_used
-                    for alloc in solution
-                    if alloc.field.field_id == alloc_b.field.field_id and alloc.allocation_id != alloc_b.allocation_id
-                )
+                used_area_in_field_a = used_area_by_field[alloc_a.field.field_id] - area_a
+                used_area_in_field_b = used_area_by_field[alloc_b.field.field_id] - area_b
                 available_in_field_a = alloc_a.field.area - used_area_in_field_a
                 available_in_field_b = alloc_b.field.area - used_area_in_field_b
                 if area_b > available_in_field_a or area_a > available_in_field_b:
@@ -105,29 +96,35 @@ class FieldSwapOperation(NeighborOperation):
                 # Lookup candidate periods from pool for both sides
                 # Try a limited combination search of closest candidates to avoid overlaps
                 cand_list_a = self._find_candidates_sorted(
-                    candidates=candidates,
+                    candidate_pool=candidate_pool,
                     target_field_id=alloc_b.field.field_id,
                     crop_id=alloc_a.crop.crop_id,
                     target_start=alloc_a.start_date,
+                    tolerance_days=tolerance_days,
                 )
                 cand_list_b = self._find_candidates_sorted(
-                    candidates=candidates,
+                    candidate_pool=candidate_pool,
                     target_field_id=alloc_a.field.field_id,
                     crop_id=alloc_b.crop.crop_id,
                     target_start=alloc_b.start_date,
+                    tolerance_days=tolerance_days,
                 )
-                if tolerance_days is not None:
-                    cand_list_a = [c for c in cand_list_a if abs((c.start_date - alloc_a.start_date).days) <= tolerance_days]
-                    cand_list_b = [c for c in cand_list_b if abs((c.start_date - alloc_b.start_date).days) <= tolerance_days]
                 if not cand_list_a or not cand_list_b:
                     continue
 
                 found = False
-                for limit in (5, 10, 20, 50):
+                for limit in SWAP_SEARCH_LIMITS:
                     for ca in cand_list_a[:limit]:
                         if found:
                             break
+                        # Candidates already carry the target field, so fallow
+                        # overlaps are checked before building allocations
+                        if schedule_index.overlaps(ca, ignore=(alloc_b,)):
+                            continue
                         for cb in cand_list_b[:limit]:
+                            if schedule_index.overlaps(cb, ignore=(alloc_a,)):
+                                continue
+
                             cost_a_in_field_b = ca.growth_days * alloc_b.field.daily_fixed_cost
                             cost_b_in_field_a = cb.growth_days * alloc_a.field.daily_fixed_cost
                             new_alloc_a = CropAllocation(
@@ -156,34 +153,27 @@ class FieldSwapOperation(NeighborOperation):
                                 expected_revenue=None,
                                 profit=None,
                             )
-
-                            has_overlap_a = False
-                            for alloc in solution:
-                                if alloc.allocation_id != alloc_b.allocation_id and alloc.field.field_id == new_alloc_a.field.field_id:
-                                    if new_alloc_a.overlaps_with_fallow(alloc):
-                                        has_overlap_a = True
-                                        break
-                            if has_overlap_a:
-                                continue
-                            has_overlap_b = False
-                            for alloc in solution:
-                                if alloc.allocation_id != alloc_a.allocation_id and alloc.field.field_id == new_alloc_b.field.field_id:
-                                    if new_alloc_b.overlaps_with_fallow(alloc):
-                                        has_overlap_b = True
-                                        break
-                            if has_overlap_b:
-                                continue
-
-                            neighbor = solution.copy()
-                            neighbor[i] = new_alloc_a
-                            neighbor[j] = new_alloc_b
-                            neighbors.append(neighbor)
+                            moves.append(self._swap_move(alloc_a, alloc_b, new_alloc_a, new_alloc_b))
                             found = True
                             break
                     if found:
                         break
         
-        return neighbors
+        return moves
+    
+    def _swap_move(
+        self,
+        alloc_a: CropAllocation,
+        alloc_b: CropAllocation,
+        new_alloc_a: CropAllocation,
+        new_alloc_b: CropAllocation,
+    ) -> NeighborMove:
+        """Move replacing alloc_a/alloc_b with their swapped allocations."""
+        return NeighborMove(
+            self.operation_name,
+            (alloc_a.allocation_id, alloc_b.allocation_id),
+            (new_alloc_a, new_alloc_b),
+        )
     
     def _swap_allocations_with_area_adjustment(
         self,
@@ -272,15 +262,24 @@ class FieldSwapOperation(NeighborOperation):
 
     def _find_candidates_sorted(
         self,
-        candidates: List[Any],
+        candidate_pool: CandidatePool,
         target_field_id: str,
         crop_id: str,
         target_start,
+        tolerance_days: Optional[int] = None,
     ) -> List[Any]:
-        """Return candidates sorted by proximity of start_date to target_start."""
-        filtered = [
-            c for c in candidates
-            if c.field.field_id == target_field_id and c.crop.crop_id == crop_id and c.completion_date is not None
+        """Return the closest candidates sorted by proximity of start_date to target_start.
+        
+        Only the SWAP_SEARCH_LIMITS[-1] closest candidates are ever tried.
+        """
+        return [
+            c for c in candidate_pool.nearest(
+                target_field_id,
+                crop_id,
+                target_start,
+                tolerance_days=tolerance_days,
+                limit=SWAP_SEARCH_LIMITS[-1],
+            )
+            if c.completion_date is not None
         ]
-        return sorted(filtered, key=lambda c: abs((c.start_date - target_start).days))
 
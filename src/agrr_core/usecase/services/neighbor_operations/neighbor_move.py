@@ -0,0 +1,49 @@
+"""Neighbor move descriptor for local search."""
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+
+@dataclass(frozen=True)
+class NeighborMove:
+    """A neighbor described as a change to the current solution.
+
+    Operations emit moves instead of full solution copies, so a neighbor can
+    be scored by delta evaluation (MoveDeltaEvaluator) and only the accepted
+    one is materialized with apply().
+
+    Fields:
+        operation: Name of the operation that produced the move
+        remove_ids: allocation_id of each allocation removed from the solution
+        add: Allocations added to the solution
+    """
+
+    operation: str
+    remove_ids: Tuple[str, ...] = ()
+    add: Tuple[CropAllocation, ...] = ()
+
+    def apply(self, solution: List[CropAllocation]) -> List[CropAllocation]:
+        """Build the neighbor solution.
+
+        Added allocations take the positions of removed ones in solution
+        order; any remaining ones are appended.
+
+        Args:
+            solution: Solution the move was generated from
+
+        Returns:
+            New solution list (the input is not modified)
+        """
+        removed = set(self.remove_ids)
+        additions = iter(self.add)
+        neighbor = []
+        for alloc in solution:
+            if alloc.allocation_id not in removed:
+                neighbor.append(alloc)
+                continue
+            replacement = next(additions, None)
+            if replacement is not None:
+                neighbor.append(replacement)
+        neighbor.extend(additions)
+        return neighbor
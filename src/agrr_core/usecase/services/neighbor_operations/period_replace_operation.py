@@ -4,9 +4,11 @@ import uuid
 from typing import List, Dict, Any
 
 from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+from agrr_core.usecase.services.field_interval_index import FieldIntervalIndex
 from agrr_core.usecase.services.neighbor_operations.base_neighbor_operation import (
     NeighborOperation,
 )
+from agrr_core.usecase.services.neighbor_operations.neighbor_move import NeighborMove
 
 class PeriodReplaceOperation(NeighborOperation):
     """P4. Period Replace: Replace period with candidate from DP results.
@@ -25,29 +27,29 @@ class PeriodReplaceOperation(NeighborOperation):
     def default_weight(self) -> float:
         return 0.1
     
-    def generate_neighbors(
+    def generate_moves(
         self,
         solution: List[CropAllocation],
         context: Dict[str, Any],
-    ) -> List[List[CropAllocation]]:
-        """Generate neighbors by replacing periods.
+    ) -> List[NeighborMove]:
+        """Generate moves by replacing periods.
         
         CRITICAL: This method now checks fallow period constraints to ensure
         the new period doesn't violate fallow period with other allocations.
         """
-        neighbors = []
-        candidates = context.get("candidates", [])
+        moves = []
+        candidate_pool = self.candidate_pool(context)
         config = context.get("config")
         
         max_alternatives = config.max_period_replace_alternatives if config else 3
         
-        for i, alloc in enumerate(solution):
+        schedule_index = FieldIntervalIndex(solution)
+        
+        for alloc in solution:
             # Find candidates for the same field and crop
             similar_candidates = [
-                c for c in candidates
-                if c.field.field_id == alloc.field.field_id and
-                   c.crop.crop_id == alloc.crop.crop_id and
-                   c.start_date != alloc.start_date
+                c for c in candidate_pool.for_field_crop(alloc.field.field_id, alloc.crop.crop_id)
+                if c.start_date != alloc.start_date
             ]
             
             # Try up to N alternatives
@@ -58,25 +60,15 @@ class PeriodReplaceOperation(NeighborOperation):
                 )
                 
                 # Check if new period violates fallow period with other allocations
-                # in the same field
-                has_overlap = False
-                for j, other_alloc in enumerate(solution):
-                    if i == j:  # Skip the allocation being replaced
-                        continue
-                    
-                    if other_alloc.field.field_id == new_alloc.field.field_id:
-                        if new_alloc.overlaps_with_fallow(other_alloc):
-                            has_overlap = True
-                            break
-                
-                if has_overlap:
+                # in the same field (skip the allocation being replaced)
+                if schedule_index.overlaps(new_alloc, ignore=(alloc,)):
                     continue  # Skip this candidate - violates fallow period
                 
-                neighbor = solution.copy()
-                neighbor[i] = new_alloc
-                neighbors.append(neighbor)
+                moves.append(NeighborMove(
+                    self.operation_name, (alloc.allocation_id,), (new_alloc,)
+                ))
         
-        return neighbors
+        return moves
     
     def _candidate_to_allocation_with_area(
         self,
@@ -0,0 +1,159 @@
+"""Batched temperature stress-impact kernel for yield-factor windows.
+
+GrowthPeriodOptimizeInteractor computes a yield factor for every candidate
+cultivation window. Evaluating `TemperatureProfile.calculate_daily_stress_impacts`
+and `YieldImpactAccumulator` day by day repeats the same work for every start
+date, although consecutive windows overlap almost entirely.
+
+This kernel evaluates the per-day stress impacts (high/low temperature, frost,
+sterility) once per temperature profile as arrays, converts them into daily
+yield factors, and answers any window's yield factor from prefix sums:
+
+    yield_factor(window) = exp(sum(log(daily_factor)))   (0.0 if any day is 0)
+
+Semantics match `TemperatureProfile.calculate_daily_stress_impacts` and
+`YieldImpactAccumulator` (multiplicative across stress types and days);
+results agree up to floating point rounding.
+"""
+
+from datetime import datetime
+from typing import Dict, Sequence
+
+import numpy as np
+
+from agrr_core.entity.entities.temperature_profile_entity import TemperatureProfile
+from agrr_core.usecase.services.gdd_prefix_sum_engine import (
+    temperature_efficiency_array,
+)
+
+
+def daily_stress_impacts_array(
+    profile: TemperatureProfile,
+    t_mean: np.ndarray,
+    t_max: np.ndarray,
+    t_min: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Vectorized equivalent of `TemperatureProfile.calculate_daily_stress_impacts`.
+
+    Args:
+        profile: Temperature profile with stress thresholds and impact rates
+        t_mean: Daily mean temperatures in °C (NaN = missing)
+        t_max: Daily maximum temperatures in °C (NaN = missing)
+        t_min: Daily minimum temperatures in °C (NaN = missing)
+
+    Returns:
+        Dict with keys 'high_temp', 'low_temp', 'frost', 'sterility';
+        values are daily impact rate arrays (0.0 = no stress).
+    """
+    n = len(t_mean)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # High temperature stress (daily peak), attenuated by mean-temperature efficiency
+        high_temp = np.zeros(n)
+        is_high = t_max > profile.high_stress_threshold
+        temp_range = t_max - t_min
+        has_range = is_high & (temp_range > 0)
+        stress_proportion = np.minimum(
+            1.0, (t_max - profile.high_stress_threshold) / temp_range
+        )
+        attenuation = 1.0 - temperature_efficiency_array(profile, t_mean) * 0.7
+        high_temp[has_range] = (
+            profile.high_temp_daily_impact * stress_proportion[has_range]
+        ) * attenuation[has_range]
+        high_temp[is_high & ~has_range] = profile.high_temp_daily_impact
+
+        low_temp = np.where(
+            t_mean < profile.low_stress_threshold, profile.low_temp_daily_impact, 0.0
+        )
+        frost = np.where(
+            t_min <= profile.frost_threshold, profile.frost_daily_impact, 0.0
+        )
+        if profile.sterility_risk_threshold is None:
+            sterility = np.zeros(n)
+        else:
+            sterility = np.where(
+                t_max >= profile.sterility_risk_threshold,
+                profile.sterility_daily_impact,
+                0.0,
+            )
+
+    return {
+        "high_temp": high_temp,
+        "low_temp": low_temp,
+        "frost": frost,
+        "sterility": sterility,
+    }
+
+
+class StressImpactKernel:
+    """Window yield factors from prefix sums of daily log yield factors.
+
+    Usage:
+        kernel = StressImpactKernel(
+            series.ordinals,
+            series.column('temperature_2m_mean'),
+            series.column('temperature_2m_max'),
+            series.column('temperature_2m_min'),
+            temperature_profile,
+        )
+        factors = kernel.window_yield_factors(start_dates, end_dates)
+    """
+
+    def __init__(
+        self,
+        ordinals: np.ndarray,
+        t_mean: np.ndarray,
+        t_max: np.ndarray,
+        t_min: np.ndarray,
+        profile: TemperatureProfile,
+    ):
+        """Evaluate daily stress impacts for all weather days at once.
+
+        Args:
+            ordinals: Date ordinals of the weather days, strictly increasing
+            t_mean: Daily mean temperatures in °C aligned with ordinals (NaN = missing)
+            t_max: Daily maximum temperatures in °C (NaN = missing)
+            t_min: Daily minimum temperatures in °C (NaN = missing)
+            profile: Temperature profile used for stress evaluation
+        """
+        n = len(ordinals)
+        self.ordinals = np.asarray(ordinals, dtype=np.int64)
+
+        impacts = daily_stress_impacts_array(profile, t_mean, t_max, t_min)
+
+        # Daily yield factor: product of (1 - impact) over stress types with impact > 0
+        log_factor = np.zeros(n)
+        zero_day = np.zeros(n, dtype=bool)
+        with np.errstate(divide="ignore"):
+            for impact in impacts.values():
+                factor = np.where(impact > 0, np.maximum(0.0, 1.0 - impact), 1.0)
+                zero_day |= factor == 0.0
+                log_factor += np.where(factor > 0.0, np.log(factor), 0.0)
+
+        self.log_prefix = np.concatenate(([0.0], np.cumsum(log_factor)))
+        self.zero_prefix = np.concatenate(([0], np.cumsum(zero_day, dtype=np.int64)))
+
+    def window_yield_factors(
+        self, start_dates: Sequence[datetime], end_dates: Sequence[datetime]
+    ) -> np.ndarray:
+        """Yield factor for each [start_date, end_date] window (inclusive, by date).
+
+        Args:
+            start_dates: Window start dates
+            end_dates: Window end dates (aligned with start_dates)
+
+        Returns:
+            Array of yield factors (0-1): 1.0 = no impact, 0.0 = complete loss
+        """
+        start_ords = np.array([d.toordinal() for d in start_dates], dtype=np.int64)
+        end_ords = np.array([d.toordinal() for d in end_dates], dtype=np.int64)
+        lo = np.searchsorted(self.ordinals, start_ords, side="left")
+        hi = np.searchsorted(self.ordinals, end_ords, side="right")
+        hi = np.maximum(hi, lo)
+
+        factors = np.exp(self.log_prefix[hi] - self.log_prefix[lo])
+        has_zero = (self.zero_prefix[hi] - self.zero_prefix[lo]) > 0
+        return np.where(has_zero, 0.0, np.minimum(factors, 1.0))
+
+    def yield_factor(self, start_date: datetime, end_date: datetime) -> float:
+        """Yield factor for a single window."""
+        return float(self.window_yield_factors([start_date], [end_date])[0])
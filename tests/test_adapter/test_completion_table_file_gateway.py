@@ -0,0 +1,58 @@
+"""Tests for CompletionTableFileGateway."""
+
+from datetime import datetime
+
+import pytest
+
+from agrr_core.adapter.gateways.completion_table_file_gateway import CompletionTableFileGateway
+from agrr_core.framework.services.io.file_service import FileService
+from agrr_core.usecase.services.crop_completion_table import CropCompletionTable
+
+class TestCompletionTableFileGateway:
+    """Test CompletionTableFileGateway."""
+
+    def test_save_and_get_all_round_trip(self, tmp_path):
+        tables = [
+            CropCompletionTable(
+                crop_id="tomato",
+                variety="Momotaro",
+                first_start=datetime(2024, 4, 1),
+                growth_days=[106, 105, 105, None],
+                fingerprint="3a7d",
+            ),
+            CropCompletionTable(
+                crop_id="lettuce",
+                variety=None,
+                first_start=datetime(2024, 4, 1),
+                growth_days=[None, None],
+            ),
+        ]
+        gateway = CompletionTableFileGateway(FileService(), str(tmp_path / "tables.json"))
+
+        gateway.save(tables)
+
+        assert gateway.get_all() == tables
+
+    def test_tables_of_another_weather_file_are_ignored(self, tmp_path):
+        weather_path = tmp_path / "weather.json"
+        weather_path.write_text('{"data": [1]}')
+        tables = [CropCompletionTable("tomato", None, datetime(2024, 4, 1), [90], "3a7d")]
+        path = str(tmp_path / "tables.json")
+        CompletionTableFileGateway(FileService(), path, str(weather_path)).save(tables)
+
+        assert CompletionTableFileGateway(FileService(), path, str(weather_path)).get_all() == tables
+        assert CompletionTableFileGateway(FileService(), path).get_all() == tables
+
+        weather_path.write_text('{"data": [2]}')
+        assert CompletionTableFileGateway(FileService(), path, str(weather_path)).get_all() == []
+
+    def test_missing_file_returns_empty_list(self, tmp_path):
+        assert CompletionTableFileGateway(FileService(), str(tmp_path / "none.json")).get_all() == []
+        assert CompletionTableFileGateway(FileService(), "").get_all() == []
+
+    def test_invalid_file_raises_value_error(self, tmp_path):
+        path = tmp_path / "tables.json"
+        path.write_text('{"completion_tables": [{"crop_id": "tomato"}]}')
+
+        with pytest.raises(ValueError, match="Invalid completion table file format"):
+            CompletionTableFileGateway(FileService(), str(path)).get_all()
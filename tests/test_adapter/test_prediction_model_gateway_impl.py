@@ -1,5 +1,8 @@
 """Tests for prediction model gateway implementation."""
 
+import threading
+from contextlib import nullcontext
+
 import pytest
 from datetime import datetime, timedelta
 from typing import List
@@ -8,6 +11,8 @@ from unittest.mock import Mock, Mock
 from agrr_core.entity import WeatherData, Forecast
 from agrr_core.entity.exceptions.prediction_error import PredictionError
 from agrr_core.adapter.gateways.prediction_model_gateway_impl import PredictionModelGatewayImpl
+from agrr_core.framework.services.ml.batch_prediction_pool import BatchPredictionPool
+from agrr_core.framework.services.ml.shared_dataset_inputs import SharedDatasetInputs
 
 def create_sample_weather_data(days: int = 100) -> List[WeatherData]:
     """Create sample weather data."""
@@ -228,6 +233,7 @@ class TestPredictionModelGatewayImpl:
         """Test ensemble prediction with equal weights."""
         # Mock ARIMA: predicts 15.0°C
         mock_arima = Mock()
+        mock_arima.dataset_scope = Mock(side_effect=nullcontext)
         mock_arima.get_required_data_days = Mock(return_value=30)
         arima_forecasts = [
             Forecast(datetime(2024, 4, i+1), 15.0, 14.0, 16.0)
@@ -237,6 +243,7 @@ class TestPredictionModelGatewayImpl:
         
         # Mock LightGBM: predicts 17.0°C
         mock_lgb = Mock()
+        mock_lgb.dataset_scope = Mock(side_effect=nullcontext)
         mock_lgb.get_required_data_days = Mock(return_value=90)
         lgb_forecasts = [
             Forecast(datetime(2024, 4, i+1), 17.0, 16.0, 18.0)
@@ -265,6 +272,7 @@ class TestPredictionModelGatewayImpl:
     def test_predict_ensemble_weighted(self):
         """Test ensemble prediction with custom weights."""
         mock_arima = Mock()
+        mock_arima.dataset_scope = Mock(side_effect=nullcontext)
         mock_arima.get_required_data_days = Mock(return_value=30)
         arima_forecasts = [
             Forecast(datetime(2024, 4, i+1), 15.0, 14.0, 16.0)
@@ -273,6 +281,7 @@ class TestPredictionModelGatewayImpl:
         mock_arima.predict = Mock(return_value=arima_forecasts)
         
         mock_lgb = Mock()
+        mock_lgb.dataset_scope = Mock(side_effect=nullcontext)
         mock_lgb.get_required_data_days = Mock(return_value=90)
         lgb_forecasts = [
             Forecast(datetime(2024, 4, i+1), 17.0, 16.0, 18.0)
@@ -300,3 +309,119 @@ class TestPredictionModelGatewayImpl:
         assert len(ensemble_forecasts) == 7
         assert abs(ensemble_forecasts[0].predicted_value - 15.6) < 0.01
 
+    
+    @pytest.mark.parametrize('batch_max_workers', [1, 2])
+    def test_batch_predict_isolates_failures(self, batch_max_workers):
+        """Test batch prediction keeps input order and per-dataset errors."""
+        mock_model = Mock()
+        mock_model.get_required_data_days = Mock(return_value=30)
+        mock_model.predict = Mock(return_value=create_sample_forecasts(7))
+        
+        gateway = PredictionModelGatewayImpl(
+            arima_service=mock_model,
+            batch_executor=BatchPredictionPool(max_workers=batch_max_workers)
+        )
+        
+        results = gateway.batch_predict(
+            [create_sample_weather_data(100), create_sample_weather_data(10), create_sample_weather_data(60)],
+            {'prediction_days': 7},
+            ['temperature']
+        )
+        
+        assert len(results) == 3
+        assert len(results[0]['temperature']) == 7
+        assert 'Insufficient data' in results[1]['error']
+        assert len(results[2]['temperature']) == 7
+    
+    def test_predict_ensemble_runs_members_concurrently(self):
+        """Test ensemble members are fitted at the same time."""
+        # Each member waits until the other one has started: run one after
+        # the other, the first wait times out and breaks the barrier
+        both_started = threading.Barrier(2, timeout=5.0)
+        overlapped = []
+
+        def slow_predict(forecasts):
+            def predict(**kwargs):
+                both_started.wait()
+                overlapped.append(True)
+                return forecasts
+            return predict
+        
+        mock_arima = Mock()
+        mock_arima.dataset_scope = Mock(side_effect=nullcontext)
+        mock_arima.get_required_data_days = Mock(return_value=30)
+        mock_arima.predict = Mock(side_effect=slow_predict([
+            Forecast(datetime(2024, 4, i+1), 15.0, None, None) for i in range(7)
+        ]))
+        mock_lgb = Mock()
+        mock_lgb.dataset_scope = Mock(side_effect=nullcontext)
+        mock_lgb.get_required_data_days = Mock(return_value=90)
+        mock_lgb.predict = Mock(side_effect=slow_predict([
+            Forecast(datetime(2024, 4, i+1), 17.0, 16.0, 18.0) for i in range(7)
+        ]))
+        
+        gateway = PredictionModelGatewayImpl(
+            arima_service=mock_arima,
+            lightgbm_service=mock_lgb
+        )
+        
+        ensemble_forecasts = gateway.predict_ensemble(
+            create_sample_weather_data(100),
+            metric='temperature',
+            prediction_days=7,
+            model_types=['arima', 'lightgbm'],
+            weights=[3.0, 1.0]
+        )
+        
+        assert overlapped == [True, True]
+        assert ensemble_forecasts[0].predicted_value == pytest.approx(15.5)
+        # Bounds only come from LightGBM (ARIMA provides none)
+        assert ensemble_forecasts[0].confidence_lower == pytest.approx(4.0)
+        assert ensemble_forecasts[0].confidence_upper == pytest.approx(4.5)
+    
+    def test_predict_ensemble_shares_dataset_inputs_between_members(self):
+        """Test members derive inputs of the dataset once, even when they do not overlap."""
+        factory_calls = []
+        first_done = threading.Event()
+        forecasts = [Forecast(datetime(2024, 4, i+1), 15.0, None, None) for i in range(7)]
+        
+        def derive_series(historical_data):
+            # Like a decorated service method: own scope around the lookup
+            with SharedDatasetInputs.scope():
+                return SharedDatasetInputs.for_dataset(historical_data).get_or_compute(
+                    ('series', 'temperature'), lambda: factory_calls.append(True)
+                )
+        
+        def first_predict(historical_data, **kwargs):
+            derive_series(historical_data)
+            first_done.set()
+            return forecasts
+        
+        def second_predict(historical_data, **kwargs):
+            # Start only after the first member's own scope has exited
+            assert first_done.wait(timeout=5.0)
+            derive_series(historical_data)
+            return forecasts
+        
+        mock_arima = Mock()
+        mock_arima.dataset_scope = Mock(side_effect=SharedDatasetInputs.scope)
+        mock_arima.get_required_data_days = Mock(return_value=30)
+        mock_arima.predict = Mock(side_effect=first_predict)
+        mock_lgb = Mock()
+        mock_lgb.dataset_scope = Mock(side_effect=SharedDatasetInputs.scope)
+        mock_lgb.get_required_data_days = Mock(return_value=30)
+        mock_lgb.predict = Mock(side_effect=second_predict)
+        
+        gateway = PredictionModelGatewayImpl(
+            arima_service=mock_arima,
+            lightgbm_service=mock_lgb
+        )
+        
+        gateway.predict_ensemble(
+            create_sample_weather_data(100),
+            metric='temperature',
+            prediction_days=7,
+            model_types=['arima', 'lightgbm']
+        )
+        
+        assert len(factory_calls) == 1
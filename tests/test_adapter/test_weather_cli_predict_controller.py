@@ -63,6 +63,7 @@ class TestWeatherCliPredictController:
         args.days = 7
         args.model = 'arima'  # Add model type
         args.metrics = 'temperature'  # Add metrics (default)
+        args.station_id = 'tokyo'
         
         # Execute
         self.controller.handle_predict_command(args)
@@ -72,7 +73,8 @@ class TestWeatherCliPredictController:
             input_source="input.json",
             output_destination="output.json",
             prediction_days=7,
-            predict_all_temperature_metrics=False
+            predict_all_temperature_metrics=False,
+            station_id='tokyo'
         )
         self.mock_cli_presenter.display_success_message.assert_called_once()
 
@@ -307,3 +307,23 @@ class TestWeatherCLIPresenter:
         assert result["location"]["longitude"] == 139.6911
         assert result["location"]["elevation"] == 37.0
         assert result["location"]["timezone"] == "Asia/Tokyo"
+    
+    def test_display_weather_data_to_columnar_file_uses_file_repository(self):
+        """Columnar output files are written by the injected file repository."""
+        from unittest.mock import Mock
+        file_repository = Mock()
+        file_repository.is_columnar_weather_file.return_value = True
+        presenter = WeatherCLIPresenter(output_stream=self.output_stream, file_repository=file_repository)
+        list_dto = WeatherDataListResponseDTO(
+            data=[WeatherDataResponseDTO(time="2024-01-15T00:00:00", temperature_2m_mean=11.8)],
+            total_count=1,
+            location=LocationResponseDTO(latitude=35.0, longitude=139.0)
+        )
+        
+        presenter.display_weather_data_to_file(list_dto, "weather.parquet")
+        
+        series, path = file_repository.write_weather_columns.call_args[0]
+        assert path == "weather.parquet"
+        assert series.column('temperature_2m_mean').tolist() == [11.8]
+        assert file_repository.write_weather_columns.call_args[1]['location']['latitude'] == 35.0
+        assert "Weather data saved to: weather.parquet" in self.output_stream.getvalue()
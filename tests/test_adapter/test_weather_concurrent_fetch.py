@@ -0,0 +1,316 @@
+"""Tests for concurrent month/year fetching against local stub servers."""
+
+import calendar
+import gzip
+import logging
+import socket
+import socketserver
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from agrr_core.adapter.gateways.weather_jma_gateway import WeatherJMAGateway
+from agrr_core.adapter.gateways.weather_noaa_ftp_gateway import WeatherNOAAFTPGateway
+from agrr_core.adapter.gateways.weather_noaa_gateway import WeatherNOAAGateway
+from agrr_core.adapter.utils.concurrent_fetch import (
+    DEFAULT_PER_HOST_LIMIT,
+    configure_per_host_limit,
+    fetch_all,
+    host_semaphore,
+)
+from agrr_core.framework.services.io.html_table_service import HtmlTableService
+
+TOKYO = (35.6895, 139.6917)
+NEW_YORK = (40.7128, -74.0060)  # USAF 725030, WBAN 14732
+RESPONSE_DELAY = 0.05
+
+
+@pytest.fixture
+def per_host_limit():
+    """Set the process-wide per-host limit for one test."""
+    yield configure_per_host_limit
+    configure_per_host_limit(DEFAULT_PER_HOST_LIMIT)
+
+
+class _Tracker:
+    """Counts connections and the peak number of requests in flight."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.active = 0
+        self.peak = 0
+
+    def connected(self):
+        with self.lock:
+            self.connections += 1
+
+    def __enter__(self):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(RESPONSE_DELAY)
+
+    def __exit__(self, *exc):
+        with self.lock:
+            self.active -= 1
+
+
+def _serve_http(respond):
+    """Start a keep-alive HTTP stub; respond(path) returns text or None (404)."""
+    tracker = _Tracker()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def setup(self):
+            super().setup()
+            tracker.connected()
+
+        def do_GET(self):
+            with tracker:
+                body = respond(self.path)
+            status = 200 if body is not None else 404
+            payload = (body or 'not found').encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, tracker
+
+
+def _serve_ftp(files):
+    """Start an anonymous FTP stub serving {path: bytes} over passive mode."""
+    tracker = _Tracker()
+
+    class Handler(socketserver.StreamRequestHandler):
+        def reply(self, line):
+            self.wfile.write(f"{line}\r\n".encode('ascii'))
+
+        def handle(self):
+            tracker.connected()
+            cwd = '/'
+            passive = None
+            self.reply('220 stub ready')
+            for raw in self.rfile:
+                command, _, argument = raw.decode('ascii').strip().partition(' ')
+                command = command.upper()
+                if command == 'USER':
+                    self.reply('331 password please')
+                elif command == 'PASS':
+                    self.reply('230 logged in')
+                elif command == 'CWD':
+                    cwd = argument
+                    self.reply('250 ok')
+                elif command == 'TYPE':
+                    self.reply('200 ok')
+                elif command == 'PASV':
+                    passive = socket.create_server(('127.0.0.1', 0))
+                    port = passive.getsockname()[1]
+                    self.reply(f"227 Entering Passive Mode (127,0,0,1,{port >> 8},{port & 255})")
+                elif command == 'RETR':
+                    content = files.get(f"{cwd}/{argument}")
+                    data, _ = passive.accept()
+                    passive.close()
+                    if content is None:
+                        data.close()
+                        self.reply('550 no such file')
+                        continue
+                    self.reply('150 opening data connection')
+                    with tracker:
+                        data.sendall(content)
+                    data.close()
+                    self.reply('226 transfer complete')
+                elif command == 'QUIT':
+                    self.reply('221 bye')
+                    return
+                else:
+                    self.reply('502 not implemented')
+
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, tracker
+
+
+def _jma_page(year, month):
+    rows = ''.join(
+        '<tr>' + ''.join(
+            f'<td>{value}</td>' for value in
+            [day, '1013.0', '1023.0', '1.5', '0.0', '0.0', f'{month + day / 100:.2f}', '25.0', '5.0',
+             '60', '50', '3.0', '3.5', 'N', '10.0', '0', '5.5', '0.0', '0.0', '--', '--']
+        ) + '</tr>'
+        for day in range(1, calendar.monthrange(year, month)[1] + 1)
+    )
+    return f'<html><body><table id="tablefix1"><tr><th>day</th></tr>{rows}</table></body></html>'
+
+
+def _noaa_csv(year):
+    lines = ['DATE,TMP,AA1,WND']
+    day = date(year, 1, 1)
+    while day.year == year:
+        lines.append(f'{day.isoformat()}T12:00:00,"+0150,1","0010","0030"')
+        day += timedelta(days=1)
+    return '\n'.join(lines) + '\n'
+
+
+def _isd_file(year):
+    lines = []
+    day = date(year, 1, 1)
+    while day.year == year:
+        line = [' '] * 105
+        line[15:27] = f"{day.strftime('%Y%m%d')}1200"
+        line[65:69] = '0030'
+        line[87:92] = '+0150'
+        lines.append(''.join(line))
+        day += timedelta(days=1)
+    return gzip.compress('\n'.join(lines).encode('ascii'))
+
+
+class TestConcurrentFetch:
+    """Test fetch_all ordering and error handling."""
+
+    def test_results_and_failures_are_in_key_order(self):
+        def fetch(key):
+            time.sleep(0.01 * (5 - key))  # Later keys finish first
+            if key == 2:
+                raise ValueError('boom')
+            return key * 10
+
+        results, failures = fetch_all(range(5), fetch, max_concurrency=5, host='example.org')
+
+        assert results == [(0, 0), (1, 10), (3, 30), (4, 40)]
+        assert [(key, str(e)) for key, e in failures] == [(2, 'boom')]
+
+    def test_host_limit_is_shared_across_calls(self, per_host_limit):
+        per_host_limit(2)
+        lock = threading.Lock()
+        active = [0, 0]  # Current, peak
+
+        def fetch(key):
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return key
+
+        callers = [
+            threading.Thread(
+                target=fetch_all, args=(range(4), fetch),
+                kwargs={'max_concurrency': 4, 'host': host},
+            )
+            for host in ('Example.org', 'example.org')
+        ]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join()
+
+        assert active[1] == 2
+        assert host_semaphore('EXAMPLE.ORG') is host_semaphore('example.org')
+
+    def test_unexpected_errors_propagate(self):
+        def fetch(key):
+            raise KeyError(key)
+
+        with pytest.raises(KeyError):
+            fetch_all([1, 2], fetch, max_concurrency=2, errors=(ValueError,))
+
+
+class TestWeatherGatewaysAgainstStubServers:
+    """Test JMA, NOAA and NOAA FTP gateways fetching concurrently."""
+
+    def test_jma_months_fetched_concurrently_with_partial_success(self, caplog, per_host_limit):
+        def respond(path):
+            query = parse_qs(urlsplit(path).query)
+            year, month = int(query['year'][0]), int(query['month'][0])
+            return None if month == 5 else _jma_page(year, month)
+
+        server, tracker = _serve_http(respond)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}/daily_s1.php"
+        try:
+            with HtmlTableService(timeout=5) as fetcher:
+                sequential = WeatherJMAGateway(fetcher, base_url=base_url).get_by_location_and_date_range(
+                    *TOKYO, '2023-01-15', '2023-12-31'
+                )
+            tracker.peak = tracker.connections = 0
+            per_host_limit(3)
+            with HtmlTableService(timeout=5) as fetcher:
+                gateway = WeatherJMAGateway(fetcher, max_concurrency=6, base_url=base_url)
+                with caplog.at_level(logging.WARNING):
+                    result = gateway.get_by_location_and_date_range(*TOKYO, '2023-01-15', '2023-12-31')
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        dates = [record.time.date() for record in result.weather_data_list]
+        assert result.weather_data_list == sequential.weather_data_list
+        assert dates[0] == date(2023, 1, 15) and dates[-1] == date(2023, 12, 31)
+        assert not any(d.month == 5 for d in dates)
+        assert dates == sorted(dates)
+        assert 1 < tracker.peak <= 3
+        assert tracker.connections <= 3
+        assert '[(2023, 5)]' in caplog.text
+
+    def test_noaa_years_share_connections(self, caplog):
+        def respond(path):
+            year = int(path.split('/')[1])
+            return None if year == 2017 else _noaa_csv(year)
+
+        server, tracker = _serve_http(respond)
+        gateway = WeatherNOAAGateway(
+            http_client=None,
+            max_concurrency=3,
+            base_url=f"http://127.0.0.1:{server.server_address[1]}",
+            timeout=5,
+        )
+        try:
+            with caplog.at_level(logging.WARNING):
+                result = gateway.get_by_location_and_date_range(*NEW_YORK, '2015-01-01', '2020-12-31')
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        years = sorted({record.time.year for record in result.weather_data_list})
+        assert years == [2015, 2016, 2018, 2019, 2020]
+        assert len(result.weather_data_list) == 365 * 3 + 366 * 2
+        assert 1 < tracker.peak <= 3
+        assert tracker.connections <= 3
+        assert '[2017]' in caplog.text
+
+    def test_noaa_ftp_years_reuse_logged_in_connections(self, caplog):
+        files = {
+            f"/pub/data/noaa/{year}/725030-14732-{year}.gz": _isd_file(year)
+            for year in (2018, 2020, 2021)
+        }
+        server, tracker = _serve_ftp(files)
+        gateway = WeatherNOAAFTPGateway(
+            max_concurrency=2, ftp_host='127.0.0.1', ftp_port=server.server_address[1], timeout=5
+        )
+        try:
+            with caplog.at_level(logging.WARNING):
+                result = gateway.get_by_location_and_date_range(*NEW_YORK, '2018-01-01', '2021-12-31')
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        years = sorted({record.time.year for record in result.weather_data_list})
+        assert years == [2018, 2020, 2021]
+        assert result.weather_data_list[0].temperature_2m_mean == pytest.approx(15.0)
+        assert tracker.connections <= 2
+        assert tracker.peak <= 2
+        assert '[2019]' in caplog.text
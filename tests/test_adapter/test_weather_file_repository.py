@@ -9,8 +9,10 @@ from pathlib import Path
 from unittest.mock import patch, mock_open
 
 from agrr_core.adapter.gateways.weather_file_gateway import WeatherFileGateway
-from agrr_core.entity import WeatherData, Forecast
+from agrr_core.entity import WeatherData, WeatherSeries, Forecast
 from agrr_core.entity.exceptions.file_error import FileError
+from agrr_core.framework.services.io.streaming_record_reader import iter_csv_records, iter_json_records
+from agrr_core.framework.services.io.weather_columnar_store import is_columnar_weather_file
 
 class TestWeatherFileGateway:
     """Test cases for WeatherFileGateway."""
@@ -24,6 +26,17 @@ class TestWeatherFileGateway:
         self.mock_file_repository.exists.return_value = True
         # Configure asynchronous methods
         self.mock_file_repository.read = Mock(return_value='{"data": [{"time": "2024-01-01", "temperature_2m_max": 25.0}]}')
+        self.mock_file_repository.read_chunks = Mock(
+            side_effect=lambda path, use_mmap=None: [self.mock_file_repository.read(path)]
+        )
+        self.mock_file_repository.read_json_records = Mock(
+            side_effect=lambda path, use_mmap=None: iter_json_records(self.mock_file_repository.read_chunks(path))
+        )
+        self.mock_file_repository.read_csv_records = Mock(
+            side_effect=lambda path, use_mmap=None: iter_csv_records(self.mock_file_repository.read_chunks(path))
+        )
+        self.mock_file_repository.load_cached = Mock(side_effect=lambda kind, path, loader: loader())
+        self.mock_file_repository.is_columnar_weather_file = Mock(side_effect=is_columnar_weather_file)
         self.mock_file_repository.write = Mock(return_value=None)
         self.mock_file_repository.delete = Mock(return_value=None)
         self.gateway = WeatherFileGateway(
@@ -161,6 +174,28 @@ class TestWeatherFileGateway:
         finally:
             os.unlink(temp_file)
     
+    # ===== Columnar Reading Tests =====
+
+    def test_read_columnar_file_through_repository(self):
+        """Binary columnar files are read by the injected file repository."""
+        series = WeatherSeries.from_weather_data([
+            WeatherData(time=datetime(2024, 1, 1), temperature_2m_mean=20.0),
+        ])
+        self.mock_file_repository.read_weather_columns.return_value = series
+        gateway = WeatherFileGateway(
+            self.mock_file_repository,
+            file_path="weather.npz",
+            start_date="2024-01-01",
+            use_mmap=False,
+        )
+
+        result = gateway.get()
+
+        assert result is series
+        self.mock_file_repository.read_weather_columns.assert_called_once_with(
+            "weather.npz", datetime(2024, 1, 1).date(), None, use_mmap=False
+        )
+
     # ===== Data Conversion Tests =====
     
     def test_convert_dict_to_weather_data_complete(self):
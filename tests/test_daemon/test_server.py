@@ -0,0 +1,203 @@
+"""Tests for AgrrDaemon request handling (serial and concurrent modes)."""
+
+import functools
+import json
+import multiprocessing
+import socket
+import sys
+import threading
+from concurrent.futures import Future
+from unittest.mock import Mock
+
+import pytest
+
+from agrr_core.daemon.server import BUSY_EXIT_CODE, AgrrDaemon, execute_request
+from agrr_core.framework.services.io.parsed_file_cache import configure_parsed_file_cache
+
+TIMEOUT = 30
+
+
+def _echo_handler(args):
+    """Request handler that answers immediately (picklable)."""
+    return {'stdout': f"echo {' '.join(args)}\n", 'stderr': '', 'exit_code': 0}
+
+
+def _barrier_handler(barrier, args):
+    """Request handler that succeeds only if barrier.parties requests run at once."""
+    barrier.wait(TIMEOUT)
+    return _echo_handler(args)
+
+
+def _blocking_handler(started, release, args):
+    """Request handler that reports it started, then waits for release."""
+    started.put(args[0])
+    release.wait(TIMEOUT)
+    return _echo_handler(args)
+
+
+def _send(socket_path, args):
+    return _send_request(socket_path, {'args': args})
+
+
+def _send_request(socket_path, request):
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(TIMEOUT)
+    try:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        data = b''
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            data += chunk
+        return json.loads(data.decode('utf-8'))
+    finally:
+        sock.close()
+
+
+@pytest.fixture(scope="module")
+def manager():
+    """Synchronization primitives shared with worker processes."""
+    with multiprocessing.Manager() as manager:
+        yield manager
+
+
+@pytest.fixture
+def run_daemon(tmp_path):
+    """Start a daemon on a temporary socket in a background thread.
+
+    Every daemon is stopped and its thread joined at teardown.
+    """
+    started = []
+
+    def _run(**kwargs):
+        socket_path = str(tmp_path / f"agrr{len(started)}.sock")
+        daemon = AgrrDaemon(socket_path=socket_path, **kwargs)
+        thread = threading.Thread(target=daemon.start, daemon=True)
+        started.append((daemon, thread))
+        thread.start()
+        assert daemon.ready.wait(TIMEOUT)
+        return socket_path
+
+    yield _run
+
+    for daemon, thread in started:
+        daemon.stop()
+        thread.join(TIMEOUT)
+        assert not thread.is_alive()
+    configure_parsed_file_cache(0)  # AgrrDaemon enables the process-wide cache
+
+
+def _send_in_threads(socket_path, arg_lists):
+    """Send requests from background threads; returns (threads, results)."""
+    results = [None] * len(arg_lists)
+
+    def worker(i, args):
+        results[i] = _send(socket_path, args)
+
+    threads = [
+        threading.Thread(target=worker, args=(i, args))
+        for i, args in enumerate(arg_lists)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+class TestExecuteRequest:
+    """Test execute_request output capture."""
+
+    def test_captures_output_and_restores_streams(self):
+        stdout, stderr = sys.stdout, sys.stderr
+
+        response = execute_request(['--version'])
+
+        assert response['exit_code'] == 0
+        assert "agrr core version" in response['stdout']
+        assert sys.stdout is stdout and sys.stderr is stderr
+
+
+class TestConcurrentDaemon:
+    """Test concurrent mode with a worker pool."""
+
+    def test_requests_run_in_parallel(self, run_daemon, manager):
+        # Both handlers must reach the barrier together (serial execution breaks it)
+        handler = functools.partial(_barrier_handler, manager.Barrier(2))
+        socket_path = run_daemon(workers=2, max_queue=0, request_handler=handler)
+
+        threads, results = _send_in_threads(socket_path, [['a'], ['b']])
+        for thread in threads:
+            thread.join(TIMEOUT)
+
+        assert [r['exit_code'] for r in results] == [0, 0]
+        assert results[0]['stdout'] == "echo a\n"
+
+    def test_full_queue_is_rejected(self, run_daemon, manager):
+        started, release = manager.Queue(), manager.Event()
+        handler = functools.partial(_blocking_handler, started, release)
+        socket_path = run_daemon(workers=2, max_queue=0, request_handler=handler)
+
+        threads, results = _send_in_threads(socket_path, [['a'], ['b']])
+        assert {started.get(timeout=TIMEOUT), started.get(timeout=TIMEOUT)} == {'a', 'b'}
+
+        busy = _send(socket_path, ['c'])
+        release.set()
+        for thread in threads:
+            thread.join(TIMEOUT)
+
+        assert busy['exit_code'] == BUSY_EXIT_CODE
+        assert busy['error'] == 'busy'
+        assert [r['exit_code'] for r in results] == [0, 0]
+
+        # Capacity is released after completion
+        assert _send(socket_path, ['d'])['exit_code'] == 0
+
+    def test_stop_pool_cancels_pending_requests(self, tmp_path):
+        daemon = AgrrDaemon(
+            workers=2, socket_path=str(tmp_path / "agrr.sock"), request_handler=_echo_handler
+        )
+        configure_parsed_file_cache(0)
+        running, pending = Future(), Future()
+        running.set_running_or_notify_cancel()
+        daemon._pending.update({running, pending})
+        pool = Mock()
+
+        daemon._stop_pool(pool)
+
+        assert pending.cancelled() and not running.cancelled()
+        pool.shutdown.assert_called_once_with(wait=False)  # No cancel_futures (Python 3.9+)
+
+
+class TestSerialDaemon:
+    """Test serial (single worker) mode."""
+
+    def test_serial_request(self, run_daemon):
+        socket_path = run_daemon(workers=1, request_handler=_echo_handler)
+
+        assert _send(socket_path, ['0']) == {'stdout': "echo 0\n", 'stderr': '', 'exit_code': 0}
+
+
+class TestDaemonStatus:
+    """Test the status control request."""
+
+    def test_status_reports_cache_counters(self, run_daemon):
+        socket_path = run_daemon(workers=1, request_handler=_echo_handler, cache_max_mb=1)
+
+        response = _send_request(socket_path, {'control': 'status'})
+
+        assert response['exit_code'] == 0
+        status = response['status']
+        assert status['mode'] == 'serial'
+        assert status['cache']['max_bytes'] == 1024 * 1024
+        assert {'hits', 'misses', 'evictions', 'entries', 'bytes'} <= set(status['cache'])
+
+    def test_status_aggregates_workers(self, run_daemon):
+        socket_path = run_daemon(workers=2, max_queue=0, request_handler=_echo_handler, cache_max_mb=1)
+        _send(socket_path, ['0'])
+
+        status = _send_request(socket_path, {'control': 'status'})['status']
+
+        assert status['mode'] == 'concurrent'
+        assert status['cache']['processes'] == 1
+        assert status['cache']['misses'] == 0
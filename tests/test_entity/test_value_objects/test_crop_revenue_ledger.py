@@ -0,0 +1,105 @@
+"""Tests for CropRevenueLedger value object.
+
+The ledger must agree with OptimizationMetrics.calculate_crop_cumulative_revenue().
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.entity.entities.field_entity import Field
+from agrr_core.entity.value_objects.crop_revenue_ledger import CropRevenueLedger
+from agrr_core.entity.value_objects.optimization_objective import OptimizationMetrics
+
+FIELD = Field("f1", "Field 1", 1000.0, 1000.0)
+CROPS = [
+    Crop("tomato", "Tomato", 0.5, revenue_per_area=100.0, max_revenue=50000.0),
+    Crop("carrot", "Carrot", 0.5, revenue_per_area=80.0),
+]
+
+
+def _allocation(alloc_id, crop, revenue, start=datetime(2025, 4, 1)):
+    return CropAllocation(
+        allocation_id=alloc_id,
+        field=FIELD,
+        crop=crop,
+        area_used=100.0,
+        start_date=start,
+        completion_date=start + timedelta(days=60),
+        growth_days=60,
+        accumulated_gdd=1000.0,
+        total_cost=60000.0,
+        expected_revenue=revenue,
+        profit=None if revenue is None else revenue - 60000.0,
+    )
+
+
+class TestCropRevenueLedger:
+    """Test CropRevenueLedger."""
+
+    def test_add_remove(self):
+        ledger = CropRevenueLedger()
+        a1 = _allocation("a1", CROPS[0], 30000.0)
+        a2 = _allocation("a2", CROPS[0], 15000.0)
+        a3 = _allocation("a3", CROPS[1], None)
+
+        for alloc in (a1, a2, a3):
+            ledger.add(alloc)
+        assert ledger.cumulative_revenue("tomato") == 45000.0
+        assert ledger.cumulative_revenue("carrot") == 0.0
+        assert ledger.cumulative_revenue("unknown") == 0.0
+
+        ledger.remove(a1)
+        assert ledger.cumulative_revenue("tomato") == 15000.0
+
+    def test_copy_is_independent(self):
+        ledger = CropRevenueLedger.from_allocations([_allocation("a1", CROPS[0], 1000.0)])
+        copied = ledger.copy()
+        copied.add(_allocation("a2", CROPS[0], 500.0))
+
+        assert ledger.cumulative_revenue("tomato") == 1000.0
+        assert copied.cumulative_revenue("tomato") == 1500.0
+
+    def test_matches_list_based_cumulative_revenue(self):
+        rng = random.Random(7)
+        allocations = [
+            _allocation(f"a{i}", rng.choice(CROPS), rng.choice([None, rng.uniform(0, 20000)]))
+            for i in range(200)
+        ]
+        ledger = CropRevenueLedger.from_allocations(allocations)
+
+        for crop in CROPS:
+            assert ledger.cumulative_revenue(crop.crop_id) == (
+                OptimizationMetrics.calculate_crop_cumulative_revenue(crop.crop_id, allocations)
+            )
+
+
+class TestCreateForAllocationWithLedger:
+    """OptimizationMetrics.create_for_allocation with a revenue ledger."""
+
+    def test_ledger_and_list_give_same_metrics(self):
+        crop = CROPS[0]
+        current = [_allocation("a1", crop, 30000.0), _allocation("a2", CROPS[1], 8000.0)]
+        kwargs = dict(
+            area_used=300.0,
+            revenue_per_area=crop.revenue_per_area,
+            max_revenue=crop.max_revenue,
+            growth_days=60,
+            daily_fixed_cost=FIELD.daily_fixed_cost,
+            crop_id=crop.crop_id,
+            crop=crop,
+            field=FIELD,
+            start_date=datetime(2025, 8, 1),
+        )
+
+        from_list = OptimizationMetrics.create_for_allocation(current_allocations=current, **kwargs)
+        from_ledger = OptimizationMetrics.create_for_allocation(
+            revenue_ledger=CropRevenueLedger.from_allocations(current), **kwargs
+        )
+
+        assert from_ledger == from_list
+        # Market demand cap: 50000 - 30000 remaining
+        assert from_ledger.revenue == pytest.approx(20000.0)
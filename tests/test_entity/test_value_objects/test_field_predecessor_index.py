@@ -0,0 +1,85 @@
+"""Tests for FieldPredecessorIndex value object.
+
+previous() must agree with the linear scan of a field schedule.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.entity.entities.field_entity import Field
+from agrr_core.entity.value_objects.field_predecessor_index import FieldPredecessorIndex
+from agrr_core.entity.value_objects.optimization_objective import OptimizationMetrics
+
+FIELDS = [Field("f1", "Field 1", 1000.0, 1000.0), Field("f2", "Field 2", 1000.0, 1000.0)]
+CROP = Crop("tomato", "Tomato", 0.5, revenue_per_area=100.0, groups=["Solanaceae"])
+
+
+def _allocation(alloc_id, field, start, days):
+    return CropAllocation(
+        allocation_id=alloc_id,
+        field=field,
+        crop=CROP,
+        area_used=100.0,
+        start_date=start,
+        completion_date=start + timedelta(days=days),
+        growth_days=days,
+        accumulated_gdd=1000.0,
+        total_cost=days * 1000.0,
+    )
+
+
+class TestFieldPredecessorIndex:
+    """Test FieldPredecessorIndex."""
+
+    def test_previous(self):
+        a1 = _allocation("a1", FIELDS[0], datetime(2025, 1, 1), 30)  # Ends Jan 31
+        a2 = _allocation("a2", FIELDS[0], datetime(2025, 3, 1), 30)  # Ends Mar 31
+        index = FieldPredecessorIndex.from_allocations([a2, a1])
+
+        assert index.previous("f1", datetime(2025, 1, 30)) is None
+        assert index.previous("f1", datetime(2025, 1, 31)) is a1
+        assert index.previous("f1", datetime(2025, 6, 1)) is a2
+        assert index.previous("f2", datetime(2025, 6, 1)) is None
+        assert index["f1"] == [a1, a2]
+        assert index.get("f2", []) == []
+
+    def test_remove(self):
+        a1 = _allocation("a1", FIELDS[0], datetime(2025, 1, 1), 30)
+        index = FieldPredecessorIndex.from_allocations([a1])
+
+        index.remove(a1)
+
+        assert "f1" not in index
+        with pytest.raises(ValueError):
+            index.remove(a1)
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(11)
+        allocations = [
+            _allocation(
+                f"a{i}",
+                rng.choice(FIELDS),
+                datetime(2025, 1, 1) + timedelta(days=rng.randrange(365)),
+                rng.randrange(10, 90),
+            )
+            for i in range(150)
+        ]
+        index = FieldPredecessorIndex.from_allocations(allocations)
+        schedules = {}
+        for alloc in allocations:
+            schedules.setdefault(alloc.field.field_id, []).append(alloc)
+
+        for _ in range(300):
+            field = rng.choice(FIELDS)
+            start = datetime(2025, 1, 1) + timedelta(days=rng.randrange(500))
+            expected = OptimizationMetrics.find_previous_allocation(field, start, schedules)
+            assert index.previous(field.field_id, start) is expected
+            assert OptimizationMetrics.calculate_soil_recovery_factor(
+                field, start, index, datetime(2025, 1, 1)
+            ) == OptimizationMetrics.calculate_soil_recovery_factor(
+                field, start, schedules, datetime(2025, 1, 1)
+            )
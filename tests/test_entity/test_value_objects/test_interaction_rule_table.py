@@ -0,0 +1,68 @@
+"""Tests for InteractionRuleTable value object.
+
+Table lookups must give exactly the result of looping over all rules.
+"""
+
+import random
+
+from agrr_core.entity.entities.interaction_rule_entity import InteractionRule
+from agrr_core.entity.value_objects.interaction_rule_table import InteractionRuleTable
+from agrr_core.entity.value_objects.rule_type import RuleType
+
+GROUPS = ["Solanaceae", "Fabaceae", "Brassicaceae", "Poaceae"]
+
+
+def _loop_impact(rules, prev_groups, curr_groups):
+    """Reference: rule loop as in the original interaction impact calculation."""
+    combined = 1.0
+    for prev_group in prev_groups:
+        for curr_group in curr_groups:
+            for rule in rules:
+                if rule.rule_type != RuleType.CONTINUOUS_CULTIVATION:
+                    continue
+                impact = rule.get_impact(prev_group, curr_group)
+                if impact != 1.0:
+                    combined *= impact
+    return combined
+
+
+class TestInteractionRuleTable:
+    """Test InteractionRuleTable."""
+
+    def test_directional_and_undirected_rules(self):
+        rules = [
+            InteractionRule("r1", RuleType.CONTINUOUS_CULTIVATION, "Fabaceae", "Poaceae", 1.1, True),
+            InteractionRule("r2", RuleType.CONTINUOUS_CULTIVATION, "Solanaceae", "Brassicaceae", 0.9, False),
+            InteractionRule("r3", RuleType.SOIL_COMPATIBILITY, "Fabaceae", "Poaceae", 0.5, True),
+        ]
+        table = InteractionRuleTable(rules)
+
+        assert table.impacts("Fabaceae", "Poaceae") == (1.1,)
+        assert table.impacts("Poaceae", "Fabaceae") == ()
+        assert table.impacts("Brassicaceae", "Solanaceae") == (0.9,)
+        assert table.combined_impact(["Fabaceae"], ["Poaceae"]) == 1.1
+        assert table.combined_impact([], ["Poaceae"]) == 1.0
+        assert len(InteractionRuleTable([rules[2]])) == 0
+
+    def test_matches_rule_loop(self):
+        rng = random.Random(3)
+        rule_types = [RuleType.CONTINUOUS_CULTIVATION, RuleType.BENEFICIAL_ROTATION]
+        rules = [
+            InteractionRule(
+                rule_id=f"r{i}",
+                rule_type=rng.choice(rule_types),
+                source_group=rng.choice(GROUPS),
+                target_group=rng.choice(GROUPS),
+                impact_ratio=rng.choice([0.7, 0.85, 1.0, 1.1, 1.2]),
+                is_directional=rng.random() < 0.5,
+            )
+            for i in range(30)
+        ]
+        table = InteractionRuleTable(rules)
+
+        for _ in range(200):
+            prev_groups = rng.sample(GROUPS, rng.randrange(0, 3))
+            curr_groups = rng.sample(GROUPS, rng.randrange(0, 3))
+            assert table.combined_impact(prev_groups, curr_groups) == (
+                _loop_impact(rules, prev_groups, curr_groups)
+            )
@@ -0,0 +1,122 @@
+"""Tests for WeatherSeries entity."""
+
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from agrr_core.entity import WeatherData, WeatherSeries
+
+
+def _records(days=10, start=datetime(2024, 3, 1)):
+    return [
+        WeatherData(
+            time=start + timedelta(days=i),
+            temperature_2m_max=20.0 + i,
+            temperature_2m_min=10.0 + i if i % 3 else None,
+            temperature_2m_mean=15.0 + i,
+            precipitation_sum=None if i == 4 else 0.5 * i,
+            weather_code=i if i % 2 else None,
+        )
+        for i in range(days)
+    ]
+
+
+class TestWeatherSeries:
+    """Test WeatherSeries entity."""
+
+    def test_round_trip_to_list(self):
+        """Records come back as equal WeatherData objects."""
+        records = _records()
+
+        series = WeatherSeries.from_weather_data(iter(records))
+
+        assert len(series) == len(records)
+        assert series.to_list() == records
+        assert series == records
+        assert series[-1] == records[-1]
+        assert isinstance(series[1].weather_code, int)
+
+    def test_columns_use_nan_for_missing(self):
+        """Missing values are NaN in float64 columns."""
+        series = WeatherSeries.from_weather_data(_records())
+
+        precipitation = series.column('precipitation_sum')
+        assert precipitation.dtype == np.float64
+        assert np.isnan(precipitation[4])
+        assert np.isnan(series.column('sunshine_duration')).all()
+        assert series.ordinals[0] == date(2024, 3, 1).toordinal()
+        with pytest.raises(KeyError):
+            series.column('humidity')
+
+    def test_columns_are_read_only(self):
+        """Series cannot be modified through its columns."""
+        series = WeatherSeries.from_weather_data(_records())
+
+        with pytest.raises(ValueError):
+            series.column('temperature_2m_mean')[0] = 0.0
+
+    def test_between_returns_view(self):
+        """Date-range slicing of a sorted series shares the arrays."""
+        series = WeatherSeries.from_weather_data(_records())
+
+        window = series.between(date(2024, 3, 3), datetime(2024, 3, 5, 12))
+
+        assert [r.time.date() for r in window] == [
+            date(2024, 3, 3), date(2024, 3, 4), date(2024, 3, 5)
+        ]
+        assert np.shares_memory(window.column('temperature_2m_mean'), series.column('temperature_2m_mean'))
+        assert len(series.between(date(2025, 1, 1), date(2025, 2, 1))) == 0
+
+    def test_between_on_unsorted_series(self):
+        """Unsorted series keep matching records in their order."""
+        records = _records()
+        series = WeatherSeries.from_weather_data(records[::-1])
+
+        window = series.between(date(2024, 3, 3), date(2024, 3, 5))
+
+        assert window.to_list() == records[2:5][::-1]
+
+    def test_time_of_day_is_preserved(self):
+        """Hourly records keep their time of day."""
+        records = [WeatherData(time=datetime(2024, 1, 1, h, 30)) for h in (0, 6, 18)]
+
+        assert WeatherSeries.from_weather_data(records).to_list() == records
+
+    def test_by_date_later_records_win(self):
+        """Lookup by date keeps the later of duplicate dates."""
+        records = _records()
+        later = WeatherData(time=datetime(2024, 3, 2), temperature_2m_mean=30.0)
+        series = WeatherSeries.from_weather_data(records + [later])
+
+        lookup = series.by_date()
+
+        assert lookup[date(2024, 3, 2)] == later
+        assert lookup[date(2024, 3, 3)] == records[2]
+
+    def test_records_are_built_on_access(self):
+        """Indexing and iteration build records without caching them."""
+        records = _records()
+        series = WeatherSeries.from_weather_data(records)
+
+        assert list(series) == records
+        assert series[3] == records[3]
+        assert series[-1] == records[-1]
+        assert series[3] is not series[3]
+        assert series.to_list() is not series.to_list()
+        with pytest.raises(IndexError):
+            series[len(records)]
+
+    def test_unique_dates(self):
+        """One record per date in date order; later duplicates win."""
+        records = _records(days=4)
+        later = WeatherData(time=datetime(2024, 3, 2), temperature_2m_mean=30.0)
+        series = WeatherSeries.from_weather_data(
+            [records[2], records[0], records[1], later, records[3]]
+        )
+
+        unique = series.unique_dates()
+
+        assert unique.to_list() == [records[0], later, records[2], records[3]]
+        ordered = WeatherSeries.from_weather_data(records)
+        assert ordered.unique_dates() is ordered
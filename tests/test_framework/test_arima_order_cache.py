@@ -0,0 +1,129 @@
+"""Tests for the ARIMA order cache and warm-start fitting."""
+
+import json
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from agrr_core.entity import WeatherData
+from agrr_core.framework.services.ml.arima_order_cache import ARIMAOrderCache
+from agrr_core.framework.services.ml.arima_prediction_service import ARIMAPredictionService
+from agrr_core.framework.services.ml.time_series_arima_service import (
+    STATSMODELS_AVAILABLE,
+    ARIMAModel,
+    TimeSeriesARIMAService,
+)
+
+
+def _weather(days, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        WeatherData(
+            time=datetime(2022, 1, 1) + timedelta(days=i),
+            temperature_2m_mean=15.0 + 10.0 * np.sin(2 * np.pi * i / 365) + float(rng.normal(0, 1.0)),
+        )
+        for i in range(days)
+    ]
+
+
+@pytest.mark.filterwarnings("ignore")
+@pytest.mark.skipif(not STATSMODELS_AVAILABLE, reason="statsmodels not installed")
+class TestARIMAOrderCache:
+    """Test order search, warm start and staleness."""
+
+    CONFIG = {'station_id': '47662', 'apply_seasonal_adjustment': False}
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return ARIMAOrderCache(str(tmp_path / "arima"))
+
+    def _service(self, cache, **kwargs):
+        return ARIMAPredictionService(
+            TimeSeriesARIMAService(),
+            order_cache=cache,
+            order_candidates=((1, 0), (1, 1)),
+            **kwargs
+        )
+
+    def test_cold_cache_searches_and_persists_order(self, cache):
+        data = _weather(300)
+
+        forecasts = self._service(cache).predict(data, 'temperature', 7, self.CONFIG)
+
+        assert len(forecasts) == 7
+        with open(os.path.join(cache.root, '47662', 'temperature.json')) as f:
+            entry = json.load(f)
+        assert tuple(entry['order'][::2]) in {(1, 0), (1, 1)}
+        assert entry['last_date'] == data[-1].time.date().isoformat()
+        assert entry['searched_date'] == entry['last_date']
+
+    def test_appended_days_warm_start(self, cache):
+        data = _weather(310)
+        self._service(cache).predict(data[:300], 'temperature', 7, self.CONFIG)
+        searched = ARIMAOrderCache(cache.root).get('47662', 'temperature')
+
+        service = self._service(ARIMAOrderCache(cache.root))
+        with patch.object(TimeSeriesARIMAService, 'check_stationarity') as stationarity, \
+                patch.object(ARIMAModel, 'fit', autospec=True, side_effect=ARIMAModel.fit) as fit:
+            service.predict(data, 'temperature', 7, self.CONFIG)
+
+        stationarity.assert_not_called()
+        assert fit.call_count == 1
+        assert fit.call_args.kwargs['start_params'] == searched.params
+        state = service.order_cache.get('47662', 'temperature')
+        assert state.order == searched.order
+        assert state.searched_date == searched.searched_date
+        assert state.last_date == data[-1].time.date().isoformat()
+
+    def test_different_series_searches_again(self, cache):
+        self._service(cache).predict(_weather(300), 'temperature', 7, self.CONFIG)
+
+        with patch.object(TimeSeriesARIMAService, 'check_stationarity', return_value=False) as stationarity:
+            self._service(cache).predict(_weather(305, seed=1), 'temperature', 7, self.CONFIG)
+
+        stationarity.assert_called_once()
+
+    def test_stale_order_searches_again(self, cache):
+        data = _weather(320)
+        self._service(cache).predict(data[:300], 'temperature', 7, self.CONFIG)
+
+        service = self._service(cache, max_order_age_days=10)
+        service.predict(data, 'temperature', 7, self.CONFIG)
+
+        assert cache.get('47662', 'temperature').searched_date == data[-1].time.date().isoformat()
+
+    def test_stations_without_station_id_keep_their_own_orders(self, cache):
+        """Without a station id, alternating stations warm-start from their own fits."""
+        config = {k: v for k, v in self.CONFIG.items() if k != 'station_id'}
+        station_a, station_b = _weather(310, seed=1), _weather(310, seed=2)
+        self._service(cache).predict(station_a[:300], 'temperature', 7, config)
+        self._service(cache).predict(station_b[:300], 'temperature', 7, config)
+
+        with patch.object(TimeSeriesARIMAService, 'check_stationarity') as stationarity:
+            self._service(cache).predict(station_a, 'temperature', 7, config)
+            self._service(cache).predict(station_b, 'temperature', 7, config)
+
+        stationarity.assert_not_called()  # No order search: both continued their own entry
+        assert len(os.listdir(cache.root)) == 2
+
+    def test_parallel_order_search_matches_serial(self, cache):
+        data = _weather(300)
+
+        serial = self._service(ARIMAOrderCache()).predict(data, 'temperature', 7, self.CONFIG)
+        parallel = self._service(ARIMAOrderCache(), search_workers=2).predict(
+            data, 'temperature', 7, self.CONFIG
+        )
+
+        assert [f.predicted_value for f in parallel] == pytest.approx(
+            [f.predicted_value for f in serial]
+        )
+
+    def test_explicit_order_bypasses_cache(self, cache):
+        config = {**self.CONFIG, 'order': (1, 0, 0)}
+
+        self._service(cache).predict(_weather(300), 'temperature', 7, config)
+
+        assert cache.get('47662', 'temperature') is None
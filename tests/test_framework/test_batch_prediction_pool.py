@@ -0,0 +1,115 @@
+"""Tests for BatchPredictionPool.
+
+Results must be identical (and in input order) whether locations run
+in-process or on a process pool, and a failing or crashing location must only
+affect its own result.
+"""
+
+import mmap
+import os
+
+import pytest
+
+from agrr_core.framework.services.ml.batch_prediction_pool import (
+    MIN_WORKER_MEMORY_MB,
+    BatchPredictionPool,
+)
+
+
+def _square(value):
+    if value < 0:
+        raise ValueError(f"negative input: {value}")
+    return value * value
+
+
+def _crash_on_seven(value):
+    if value == 7:
+        os._exit(1)  # Simulates a worker killed by the OS
+    return value * value
+
+
+def _allocate(megabytes):
+    return len(bytearray(megabytes * 1024 * 1024))
+
+
+class TestBatchPredictionPool:
+    """Test ordering, failure isolation, progress and memory cap."""
+
+    @pytest.mark.parametrize('max_workers', [1, 3])
+    def test_results_in_input_order(self, max_workers):
+        items = [3, -1, 5, 0, -2, 4]
+
+        outcomes = BatchPredictionPool(max_workers=max_workers).run(_square, items)
+
+        assert [o.value for o in outcomes] == [9, None, 25, 0, None, 16]
+        assert [o.error for o in outcomes] == [
+            None, "negative input: -1", None, None, "negative input: -2", None
+        ]
+
+    def test_progress_reports_every_item(self):
+        reports = []
+        pool = BatchPredictionPool(max_workers=2, progress_callback=reports.append)
+
+        pool.run(_square, [1, -1, 2], labels=['a', 'b', 'c'])
+
+        assert [r.completed for r in reports] == [1, 2, 3]
+        assert reports[-1].failed == 1
+        assert reports[-1].total == 3
+        assert sorted(r.label for r in reports) == ['a', 'b', 'c']
+
+    @pytest.mark.parametrize('max_workers', [1, 2])
+    def test_raising_progress_callback_propagates(self, max_workers):
+        reports = []
+
+        def callback(progress):
+            reports.append(progress)
+            raise RuntimeError("callback failed")
+
+        pool = BatchPredictionPool(max_workers=max_workers, progress_callback=callback)
+
+        with pytest.raises(RuntimeError, match="callback failed"):
+            pool.run(_square, [1, 2, 3])
+        # Reported once, not recorded as a failed location and finished again
+        assert [(r.completed, r.failed) for r in reports] == [(1, 0)]
+
+    def test_crashed_worker_fails_only_its_item(self):
+        items = list(range(10))
+
+        outcomes = BatchPredictionPool(max_workers=3).run(_crash_on_seven, items)
+
+        assert [o.value for i, o in enumerate(outcomes) if i != 7] == [
+            i * i for i in items if i != 7
+        ]
+        assert "terminated unexpectedly" in outcomes[7].error
+
+    def test_worker_count_is_bounded(self):
+        assert BatchPredictionPool(max_workers=8).plan(3) == (3, None)
+        assert BatchPredictionPool(max_workers=1).plan(10) == (0, None)
+
+        workers, limit = BatchPredictionPool(max_workers=8, max_memory_mb=MIN_WORKER_MEMORY_MB * 2).plan(10)
+
+        assert workers == 2
+        assert limit == MIN_WORKER_MEMORY_MB * 1024 * 1024
+
+    def test_memory_cap_fails_only_large_item(self):
+        pool = BatchPredictionPool(max_workers=1, max_memory_mb=512)
+
+        outcomes = pool.run(_allocate, [1, 2048, 2])
+
+        assert [o.value for o in outcomes] == [1024 * 1024, None, 2 * 1024 * 1024]
+        assert "Memory limit exceeded" in outcomes[1].error
+
+    @pytest.mark.skipif(not hasattr(mmap, 'MAP_PRIVATE'), reason="needs private anonymous mmap")
+    def test_memory_cap_counts_from_inherited_data_size(self):
+        # Forked workers start with the parent's data size; the cap must not
+        # count it, or a large parent (e.g. after loading LightGBM) leaves
+        # the workers no room at all.
+        ballast = mmap.mmap(-1, 1024 * 1024 * 1024, flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+        try:
+            pool = BatchPredictionPool(max_workers=1, max_memory_mb=512)
+
+            outcomes = pool.run(_allocate, [1, 2048, 2])
+        finally:
+            ballast.close()
+
+        assert [o.value for o in outcomes] == [1024 * 1024, None, 2 * 1024 * 1024]
@@ -0,0 +1,112 @@
+"""Tests for ClimatologicalStatsTable."""
+
+import statistics
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from agrr_core.entity import WeatherData
+from agrr_core.framework.services.ml.climatological_stats_table import (
+    ClimatologicalStatsTable,
+    day_ordinals,
+    ordinal_to_month_day,
+)
+from agrr_core.framework.services.ml.shared_dataset_inputs import SharedDatasetInputs
+
+
+def _weather(days, start=datetime(2019, 1, 1)):
+    rng = np.random.default_rng(3)
+    data = []
+    for i in range(days):
+        data.append(WeatherData(
+            time=start + timedelta(days=i),
+            temperature_2m_max=None if i % 11 == 0 else float(rng.normal(20, 3)),
+            temperature_2m_min=float(rng.normal(10, 3)),
+            temperature_2m_mean=float(rng.normal(15, 3)),
+            precipitation_sum=float(rng.uniform(0, 5)),
+            sunshine_duration=None,
+        ))
+    return data
+
+
+def _reference(data, field):
+    groups = defaultdict(list)
+    for d in data:
+        value = getattr(d, field)
+        if value is not None:
+            groups[f"{d.time.month:02d}-{d.time.day:02d}"].append(value)
+    return {
+        month_day: {
+            'mean': statistics.mean(values),
+            'std': statistics.stdev(values) if len(values) > 1 else 0.0,
+            'min': min(values),
+            'max': max(values),
+        }
+        for month_day, values in groups.items()
+    }
+
+
+class TestDayOrdinals:
+    """Test day-of-year ordinals."""
+
+    def test_leap_year_slots(self):
+        dates = [datetime(2023, 1, 1), datetime(2024, 2, 29), datetime(2023, 3, 1), datetime(2023, 12, 31)]
+
+        assert day_ordinals(dates).tolist() == [0, 59, 60, 365]
+        assert [ordinal_to_month_day(o) for o in (0, 59, 60, 365)] == ["01-01", "02-29", "03-01", "12-31"]
+
+
+class TestClimatologicalStatsTable:
+    """Test grouped statistics."""
+
+    @pytest.mark.parametrize('metric, field', [
+        ('temperature', 'temperature_2m_mean'),
+        ('temperature_max', 'temperature_2m_max'),
+        ('precipitation', 'precipitation_sum'),
+    ])
+    def test_matches_per_day_statistics(self, metric, field):
+        data = _weather(1500)
+        expected = _reference(data, field)
+
+        actual = ClimatologicalStatsTable.from_weather_data(data).to_dict(metric)
+
+        assert actual.keys() == expected.keys()
+        for month_day, stats in expected.items():
+            for key, value in stats.items():
+                assert actual[month_day][key] == pytest.approx(value, rel=1e-12, abs=1e-12)
+
+    def test_temperature_companions(self):
+        data = _weather(500)
+        leap_day = data[424]  # 2020-02-29, the only sample of its month-day
+        data[424] = WeatherData(
+            time=leap_day.time,
+            temperature_2m_max=None,
+            temperature_2m_min=leap_day.temperature_2m_min,
+            temperature_2m_mean=leap_day.temperature_2m_mean,
+        )
+        table = ClimatologicalStatsTable.from_weather_data(data)
+        stats = table.to_dict('temperature')
+        max_stats = _reference(data, 'temperature_2m_max')
+
+        assert stats["02-29"].keys() == {'mean', 'std', 'min', 'max'}
+        assert stats["03-01"]['temp_max_mean'] == pytest.approx(max_stats["03-01"]['mean'])
+        assert stats["03-01"]['temp_min_std'] >= 0.0
+
+    def test_days_without_samples(self):
+        table = ClimatologicalStatsTable.from_weather_data(_weather(30))
+
+        assert table.has_samples('temperature').sum() == 30
+        assert not table.has_samples('sunshine').any()
+        assert table.to_dict('sunshine') == {}
+
+    def test_cached_per_dataset_within_scope(self):
+        data = _weather(100)
+
+        with SharedDatasetInputs.scope():
+            table = ClimatologicalStatsTable.for_dataset(data)
+
+            assert ClimatologicalStatsTable.for_dataset(data) is table
+            assert ClimatologicalStatsTable.for_dataset(list(data)) is not table
+        assert ClimatologicalStatsTable.for_dataset(data) is not table
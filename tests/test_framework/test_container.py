@@ -3,7 +3,13 @@
 import pytest
 from unittest.mock import MagicMock, patch, Mock
 
+from agrr_core.adapter.utils.concurrent_fetch import (
+    DEFAULT_PER_HOST_LIMIT,
+    configure_per_host_limit,
+    host_semaphore,
+)
 from agrr_core.framework.agrr_core_container import AgrrCoreContainer, WeatherCliContainer
+from agrr_core.framework.services.ml.batch_prediction_pool import BatchPredictionPool
 
 class TestWeatherCliContainer:
     """Test cases for weather CLI container."""
@@ -108,6 +114,48 @@ class TestWeatherCliContainer:
         service2 = self.container.get_prediction_arima_service()
         assert service is service2
     
+    def test_arima_search_workers_from_prediction_args(self):
+        """--arima-search-workers reaches the ARIMA order search."""
+        with patch('agrr_core.framework.agrr_core_container.WeatherCliPredictController'):
+            self.container.run_prediction_cli(
+                ['--input', 'in.json', '--output', 'out.json', '--arima-search-workers', '3']
+            )
+        
+        assert self.container.get_prediction_arima_service().search_workers == 3
+        assert WeatherCliContainer({}).get_prediction_arima_service().search_workers == 1
+    
+    def test_batch_prediction_workers_from_config(self):
+        """batch_prediction_workers/max_memory_mb configure the batch process pool."""
+        executor = WeatherCliContainer(
+            {'batch_prediction_workers': '4', 'batch_prediction_max_memory_mb': 1024}
+        ).get_batch_prediction_executor()
+        
+        assert (executor.max_workers, executor.max_memory_mb) == (4, 1024)
+        assert executor.plan(10) == (4, 256 * 1024 * 1024)
+        assert self.container.get_batch_prediction_executor().plan(10) == (0, None)
+        assert self.container.get_batch_prediction_executor() is self.container.get_batch_prediction_executor()
+    
+    def test_batch_prediction_input_port_uses_process_pool(self):
+        """The batch input port runs locations on the configured process pool."""
+        container = AgrrCoreContainer({'batch_prediction_workers': 2})
+        
+        input_port = container.get_batch_prediction_input_port()
+        
+        assert isinstance(input_port.batch_executor, BatchPredictionPool)
+        assert input_port.batch_executor.max_workers == 2
+        assert input_port.batch_executor is container.get_batch_prediction_executor()
+        assert input_port.multi_metric_prediction_interactor is container.get_multi_metric_prediction_input_port()
+    
+    def test_weather_fetch_per_host_limit_from_config(self):
+        """weather_fetch_per_host_limit bounds requests to each host."""
+        try:
+            WeatherCliContainer({'weather_fetch_per_host_limit': 2}).get_weather_noaa_gateway()
+            semaphore = host_semaphore('limit-test.example.org')
+            assert semaphore.acquire(blocking=False) and semaphore.acquire(blocking=False)
+            assert not semaphore.acquire(blocking=False)
+        finally:
+            configure_per_host_limit(DEFAULT_PER_HOST_LIMIT)
+    
     def test_get_prediction_arima_service_dependency_injection(self):
         """Test that prediction service gets time series service injected."""
         service = self.container.get_prediction_arima_service()
@@ -6,7 +6,7 @@ import numpy as np
 from datetime import datetime, timedelta
 
 from agrr_core.framework.services.ml.feature_engineering_service import FeatureEngineeringService
-from agrr_core.entity import WeatherData
+from agrr_core.entity import WeatherData, WeatherSeries
 
 class TestFeatureEngineeringService:
     """Test cases for FeatureEngineeringService."""
@@ -175,6 +175,16 @@ class TestFeatureEngineeringService:
             assert f'temp_max_std{window}' in feature_names, f"temp_max_std{window} should be in feature names"
             assert f'temp_min_std{window}' in feature_names, f"temp_min_std{window} should be in feature names"
     
+    def test_create_features_from_weather_series_matches_list(self, sample_weather_data):
+        """WeatherSeries columns give the same features as the record list."""
+        service = FeatureEngineeringService()
+        series = WeatherSeries.from_weather_data(sample_weather_data)
+        
+        expected = service.create_features(sample_weather_data, 'temperature', [1, 7, 14, 30])
+        df = service.create_features(series, 'temperature', [1, 7, 14, 30])
+        
+        pd.testing.assert_frame_equal(df, expected)
+    
     def test_create_features_no_nan_values(self, sample_weather_data):
         """Test that created features have no NaN values after fill."""
         service = FeatureEngineeringService()
@@ -0,0 +1,179 @@
+"""Parity tests for the columnar future-feature builders.
+
+The reference below is the previous row-by-row implementation (per-cell
+DataFrame.loc assignments); the columnar builders must produce identical
+frames (values, dtypes and column order).
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from agrr_core.entity import WeatherData
+from agrr_core.framework.services.ml.climatological_stats_table import ClimatologicalStatsTable
+from agrr_core.framework.services.ml.feature_engineering_service import FeatureEngineeringService
+from agrr_core.framework.services.ml.lightgbm_prediction_service import (
+    LIGHTGBM_AVAILABLE,
+    LightGBMPredictionService,
+)
+
+ROLLING = [('ma', 'mean'), ('std', 'std'), ('min', 'min'), ('max', 'max')]
+
+
+def _reference_calendar(future_dates):
+    rows = []
+    for future_date in future_dates:
+        row = {'date': future_date}
+        row['year'] = future_date.year
+        row['month'] = future_date.month
+        row['day'] = future_date.day
+        row['day_of_year'] = future_date.timetuple().tm_yday
+        row['day_of_week'] = future_date.weekday()
+        row['week_of_year'] = future_date.isocalendar()[1]
+        row['is_weekend'] = 1 if future_date.weekday() >= 5 else 0
+        row['month_sin'] = np.sin(2 * np.pi * row['month'] / 12)
+        row['month_cos'] = np.cos(2 * np.pi * row['month'] / 12)
+        row['day_of_year_sin'] = np.sin(2 * np.pi * row['day_of_year'] / 365)
+        row['day_of_year_cos'] = np.cos(2 * np.pi * row['day_of_year'] / 365)
+        row['is_winter'] = 1 if row['month'] in [12, 1, 2] else 0
+        row['is_spring'] = 1 if row['month'] in [3, 4, 5] else 0
+        row['is_summer'] = 1 if row['month'] in [6, 7, 8] else 0
+        row['is_autumn'] = 1 if row['month'] in [9, 10, 11] else 0
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def _reference_climatology(future_df, future_dates, metric, lookback_days, stats_by_day):
+    target_col = FeatureEngineeringService._get_target_column(metric)
+    for i, future_date in enumerate(future_dates):
+        stats = stats_by_day[f"{future_date.month:02d}-{future_date.day:02d}"]
+        for lag in lookback_days:
+            future_df.loc[i, f'{target_col}_lag{lag}'] = stats['mean']
+        for name, key in ROLLING:
+            for window in [7, 14, 30]:
+                future_df.loc[i, f'{target_col}_{name}{window}'] = stats[key]
+        future_df.loc[i, f'{target_col}_diff1'] = 0
+        future_df.loc[i, f'{target_col}_diff7'] = 0
+        future_df.loc[i, f'{target_col}_ema7'] = stats['mean']
+        future_df.loc[i, f'{target_col}_ema30'] = stats['mean']
+        if metric == 'temperature' and 'temp_max_mean' in stats:
+            for prefix in ('temp_max', 'temp_min'):
+                for lag in lookback_days:
+                    future_df.loc[i, f'{prefix}_lag{lag}'] = stats[f'{prefix}_mean']
+                for window in [7, 14, 30]:
+                    future_df.loc[i, f'{prefix}_ma{window}'] = stats[f'{prefix}_mean']
+                for window in [7, 14, 30]:
+                    future_df.loc[i, f'{prefix}_std{window}'] = stats[f'{prefix}_std']
+
+
+def _reference_temp_range(future_df, future_dates, stats_by_day):
+    for i, future_date in enumerate(future_dates):
+        stats = stats_by_day.get(f"{future_date.month:02d}-{future_date.day:02d}", {})
+        if 'temp_max_mean' in stats:
+            future_df.loc[i, 'temp_range'] = stats['temp_max_mean'] - stats['temp_min_mean']
+        else:
+            future_df.loc[i, 'temp_range'] = 0
+    future_df['has_precipitation'] = 0
+    future_df['precip_rolling7'] = 0
+
+
+def _weather(days, start=datetime(2019, 3, 1), missing_max_every=0):
+    rng = np.random.default_rng(1)
+    data = []
+    for i in range(days):
+        base = 15.0 + 10.0 * np.sin(2 * np.pi * i / 365)
+        noise = float(rng.normal(0, 1.0))
+        data.append(WeatherData(
+            time=start + timedelta(days=i),
+            temperature_2m_max=None if missing_max_every and i % missing_max_every == 0 else base + 5 + noise,
+            temperature_2m_min=base - 5 + noise,
+            temperature_2m_mean=base + noise,
+            precipitation_sum=float(rng.uniform(0, 5)),
+            sunshine_duration=float(rng.uniform(0, 40000)),
+        ))
+    return data
+
+
+def _future_dates(data, prediction_days):
+    return [data[-1].time + timedelta(days=i + 1) for i in range(prediction_days)]
+
+
+class TestFeatureEngineeringFutureFeatures:
+    """Test FeatureEngineeringService.create_future_features parity."""
+
+    @pytest.mark.parametrize('metric', ['temperature', 'temperature_max', 'precipitation'])
+    @pytest.mark.parametrize('prediction_days', [1, 90])
+    def test_matches_row_by_row_reference(self, metric, prediction_days):
+        data = _weather(1200)
+        lookback_days = [1, 7, 14, 30]
+
+        actual = FeatureEngineeringService.create_future_features(
+            data, metric, prediction_days, lookback_days
+        )
+
+        future_dates = _future_dates(data, prediction_days)
+        stats = FeatureEngineeringService._precompute_climatological_stats(data, metric)
+        expected = _reference_calendar(future_dates)
+        _reference_climatology(expected, future_dates, metric, lookback_days, stats)
+        if metric == 'temperature':
+            historical = FeatureEngineeringService.create_features(data, metric, lookback_days)
+            for i, future_date in enumerate(future_dates):
+                month_data = historical[historical['month'] == future_date.month]
+                expected.loc[i, 'temp_range'] = month_data['temp_range'].mean()
+            expected['has_precipitation'] = 0
+            expected['precip_rolling7'] = 0
+        expected = expected.ffill().bfill().fillna(0)
+
+        pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+
+    def test_missing_month_day_raises(self):
+        data = [d for d in _weather(400) if not (d.time.month == 3 and d.time.day == 1)]
+
+        with pytest.raises(ValueError, match="month-day: 03-01"):
+            FeatureEngineeringService.create_future_features(data, 'temperature', 365)
+
+
+@pytest.mark.skipif(not LIGHTGBM_AVAILABLE, reason="LightGBM not installed")
+class TestLightGBMFutureFeatures:
+    """Test LightGBMPredictionService future feature builders parity."""
+
+    @pytest.fixture
+    def service(self):
+        return LightGBMPredictionService()
+
+    @pytest.mark.parametrize('missing_max_every', [0, 7])
+    def test_optimized_matches_reference(self, service, missing_max_every):
+        data = _weather(1200, missing_max_every=missing_max_every)
+        lookback_days = [1, 7, 14, 30]
+        table = ClimatologicalStatsTable.for_dataset(data)
+        stats = table.to_dict('temperature')
+
+        actual = service._create_optimized_future_features(data, 'temperature', 365, lookback_days, table)
+
+        future_dates = _future_dates(data, 365)
+        expected = _reference_calendar(future_dates)
+        _reference_climatology(expected, future_dates, 'temperature', lookback_days, stats)
+        _reference_temp_range(expected, future_dates, stats)
+        expected = expected.ffill().bfill().fillna(0)
+
+        pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+
+    def test_multi_target_matches_reference(self, service):
+        data = _weather(1200, missing_max_every=7)
+        metrics = ['temperature', 'temperature_max', 'temperature_min']
+        lookback_days = [1, 7, 14, 30]
+        table = ClimatologicalStatsTable.for_dataset(data)
+        stats = {metric: table.to_dict(metric) for metric in metrics}
+
+        actual = service._create_multi_target_future_features(data, metrics, 200, lookback_days, table)
+
+        future_dates = _future_dates(data, 200)
+        expected = _reference_calendar(future_dates)
+        for metric in metrics:  # Later metrics overwrite shared temp_max/temp_min columns
+            _reference_climatology(expected, future_dates, metric, lookback_days, stats[metric])
+        _reference_temp_range(expected, future_dates, stats['temperature'])
+        expected = expected.ffill().bfill().fillna(0)
+
+        pd.testing.assert_frame_equal(actual, expected, check_exact=True)
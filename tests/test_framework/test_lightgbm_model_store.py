@@ -0,0 +1,132 @@
+"""Tests for the persistent LightGBM model store."""
+
+import os
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from agrr_core.entity import WeatherData
+from agrr_core.framework.services.ml.lightgbm_prediction_service import (
+    LIGHTGBM_AVAILABLE,
+    LightGBMPredictionService,
+)
+
+if LIGHTGBM_AVAILABLE:
+    from agrr_core.framework.services.ml.lightgbm_model_store import LightGBMModelStore
+
+
+def _weather(days, seed=0):
+    rng = np.random.default_rng(seed)
+    data = []
+    for i in range(days):
+        base = 15.0 + 10.0 * np.sin(2 * np.pi * i / 365)
+        noise = float(rng.normal(0, 0.5))
+        data.append(WeatherData(
+            time=datetime(2022, 1, 1) + timedelta(days=i),
+            temperature_2m_max=base + 5.0 + noise,
+            temperature_2m_min=base - 5.0 + noise,
+            temperature_2m_mean=base + noise,
+            precipitation_sum=0.0,
+            sunshine_duration=30000.0,
+        ))
+    return data
+
+
+def _entries(root):
+    return [name for _, _, names in os.walk(root) for name in names if name.endswith('.json')]
+
+
+@pytest.mark.skipif(not LIGHTGBM_AVAILABLE, reason="LightGBM not installed")
+class TestLightGBMModelStore:
+    """Test reuse and incremental refit of stored boosters."""
+
+    MODEL_PARAMS = {
+        'objective': 'regression',
+        'verbose': -1,
+        'learning_rate': 0.1,
+        'n_estimators': 60,
+        'early_stopping_rounds': 10,
+    }
+    CONFIG = {'station_id': '47662', 'prediction_days': 10, 'calculate_confidence_intervals': True}
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        return LightGBMModelStore(str(tmp_path / "models"))
+
+    def _service(self, store, **kwargs):
+        return LightGBMPredictionService(model_params=self.MODEL_PARAMS, model_store=store, **kwargs)
+
+    def test_same_data_reuses_stored_model(self, store):
+        data = _weather(400)
+        trained = self._service(store).predict(data, 'temperature', 10, self.CONFIG)
+
+        service = self._service(store)
+        info = service.train_model(data, self.CONFIG, 'temperature')
+        reused = service.predict(data, 'temperature', 10, self.CONFIG)
+
+        assert info['source'] == 'store'
+        assert [f.predicted_value for f in reused] == [f.predicted_value for f in trained]
+        assert [f.confidence_upper for f in reused] == [f.confidence_upper for f in trained]
+        assert len(_entries(store.root)) == 1
+
+    def test_appended_days_refit_stored_model(self, store):
+        data = _weather(420)
+        self._service(store).train_model(data[:400], self.CONFIG, 'temperature')
+
+        info = self._service(store).train_model(data, self.CONFIG, 'temperature')
+
+        assert info['source'] == 'refit'
+        assert len(_entries(store.root)) == 1  # Refit replaces its parent
+        assert self._service(store).train_model(data, self.CONFIG, 'temperature')['source'] == 'store'
+
+    def test_retrains_after_max_refits(self, store):
+        data = _weather(420)
+        self._service(store).train_model(data[:400], self.CONFIG, 'temperature')
+
+        info = self._service(store, max_refits=0).train_model(data, self.CONFIG, 'temperature')
+
+        assert info['source'] == 'trained'
+
+    def test_changed_history_is_not_reused(self, store):
+        data = _weather(420)
+        self._service(store).train_model(data[:400], self.CONFIG, 'temperature')
+
+        changed = list(data)
+        changed[0] = WeatherData(
+            time=data[0].time,
+            temperature_2m_max=40.0,
+            temperature_2m_min=30.0,
+            temperature_2m_mean=35.0,
+            precipitation_sum=0.0,
+            sunshine_duration=30000.0,
+        )
+        info = self._service(store).train_model(changed, self.CONFIG, 'temperature')
+
+        assert info['source'] == 'trained'
+
+    def test_models_are_kept_per_station(self, store):
+        data = _weather(400)
+        self._service(store).train_model(data, self.CONFIG, 'temperature')
+
+        other = {**self.CONFIG, 'station_id': '47759'}
+        info = self._service(store).train_model(data, other, 'temperature')
+
+        assert info['source'] == 'trained'
+        assert len(_entries(store.root)) == 2
+
+    def test_stations_without_station_id_keep_their_own_models(self, tmp_path):
+        """Without a station id, series of different stations do not evict each other."""
+        store = LightGBMModelStore(str(tmp_path / "models"), max_entries=1)
+        config = {k: v for k, v in self.CONFIG.items() if k != 'station_id'}
+        station_a, station_b = _weather(400, seed=1), _weather(400, seed=2)
+
+        self._service(store).train_model(station_a, config, 'temperature')
+        self._service(store).train_model(station_b, config, 'temperature')
+
+        assert self._service(store).train_model(station_a, config, 'temperature')['source'] == 'store'
+        assert self._service(store).train_model(station_b, config, 'temperature')['source'] == 'store'
+        assert len(os.listdir(store.root)) == 2
+        # Appended days keep the station: station A's own model is refit
+        grown = station_a + _weather(420, seed=1)[400:]
+        assert self._service(store).train_model(grown, config, 'temperature')['source'] == 'refit'
@@ -0,0 +1,171 @@
+"""Tests for ParsedFileCache and its use by the file gateways."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from agrr_core.adapter.gateways.interaction_rule_file_gateway import InteractionRuleFileGateway
+from agrr_core.entity.entities.weather_series_entity import WeatherSeries
+from agrr_core.framework.services.io.file_service import FileService
+from agrr_core.framework.services.io.parsed_file_cache import (
+    ParsedFileCache,
+    configure_parsed_file_cache,
+    estimate_size,
+    get_parsed_file_cache,
+)
+
+
+class _CountingLoader:
+    """Loader returning a fresh list and counting calls."""
+
+    def __init__(self, size=10):
+        self.calls = 0
+        self.size = size
+
+    def __call__(self):
+        self.calls += 1
+        return [f"record-{i}-{self.calls}" for i in range(self.size)]
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("[1, 2, 3]")
+    return path
+
+
+@pytest.fixture
+def process_cache():
+    """Enable the process-wide cache for one test."""
+    cache = configure_parsed_file_cache(1024 * 1024)
+    yield cache
+    configure_parsed_file_cache(0)
+
+
+class TestParsedFileCache:
+    """Test hits, invalidation and eviction."""
+
+    def test_hit_after_miss(self, data_file):
+        cache = ParsedFileCache(max_bytes=1024 * 1024)
+        loader = _CountingLoader()
+
+        first = cache.get_or_load('weather', str(data_file), loader)
+        second = cache.get_or_load('weather', str(data_file), loader)
+
+        assert second is first
+        assert loader.calls == 1
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['entries']) == (1, 1, 1)
+        assert stats['bytes'] > 0
+
+    def test_kinds_are_cached_separately(self, data_file):
+        cache = ParsedFileCache(max_bytes=1024 * 1024)
+        loader = _CountingLoader()
+
+        cache.get_or_load('weather', str(data_file), loader)
+        cache.get_or_load('fields', str(data_file), loader)
+
+        assert loader.calls == 2
+
+    def test_modified_file_is_reloaded(self, data_file):
+        cache = ParsedFileCache(max_bytes=1024 * 1024)
+        loader = _CountingLoader()
+        cache.get_or_load('weather', str(data_file), loader)
+
+        data_file.write_text("[1, 2, 3, 4]")
+        stat = os.stat(data_file)
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        reloaded = cache.get_or_load('weather', str(data_file), loader)
+
+        assert loader.calls == 2
+        assert reloaded[0].endswith("-2")
+        assert cache.stats()['entries'] == 1  # Outdated version dropped
+
+    def test_lru_eviction_by_memory_budget(self, tmp_path):
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"file{i}.json"
+            path.write_text("[]")
+            paths.append(str(path))
+        probe = ParsedFileCache(max_bytes=10 ** 9)
+        probe.get_or_load('weather', paths[0], _CountingLoader())
+        entry_size = probe.stats()['bytes']
+
+        cache = ParsedFileCache(max_bytes=int(entry_size * 2.5))
+        loader = _CountingLoader()
+        cache.get_or_load('weather', paths[0], loader)
+        cache.get_or_load('weather', paths[1], loader)
+        cache.get_or_load('weather', paths[0], loader)  # paths[1] is now LRU
+        cache.get_or_load('weather', paths[2], loader)
+
+        stats = cache.stats()
+        assert stats['evictions'] == 1
+        assert stats['entries'] == 2
+        assert stats['bytes'] <= stats['max_bytes']
+
+        calls = loader.calls
+        cache.get_or_load('weather', paths[0], loader)
+        assert loader.calls == calls
+        cache.get_or_load('weather', paths[1], loader)
+        assert loader.calls == calls + 1
+
+    def test_entry_larger_than_budget_is_not_stored(self, data_file):
+        cache = ParsedFileCache(max_bytes=16)
+        loader = _CountingLoader()
+
+        cache.get_or_load('weather', str(data_file), loader)
+        cache.get_or_load('weather', str(data_file), loader)
+
+        assert loader.calls == 2
+        assert cache.stats()['entries'] == 0
+
+    def test_missing_file_bypasses_cache(self, tmp_path):
+        cache = ParsedFileCache(max_bytes=1024 * 1024)
+        loader = _CountingLoader()
+
+        cache.get_or_load('weather', str(tmp_path / "missing.json"), loader)
+
+        assert loader.calls == 1
+        assert cache.stats()['misses'] == 0
+
+    def test_weather_series_size_covers_its_columns(self):
+        """Views on shared arrays count their data; using the series adds nothing."""
+        days = 3650
+        ordinals = np.arange(days, dtype=np.int64) + 730000
+        columns = {'temperature_2m_mean': np.linspace(0.0, 30.0, 2 * days)[::2]}
+        series = WeatherSeries.from_arrays(ordinals, columns)
+
+        size = estimate_size(series)
+        list(series)
+        series.by_date()
+
+        assert size >= series.nbytes
+        assert estimate_size(series) == pytest.approx(size, rel=0.01)
+
+
+class TestGatewayCaching:
+    """Test gateways reading through the process-wide cache."""
+
+    def test_disabled_by_default(self):
+        assert get_parsed_file_cache() is None
+
+    def test_interaction_rules_are_parsed_once(self, tmp_path, process_cache):
+        path = tmp_path / "rules.json"
+        path.write_text(json.dumps([{
+            "rule_id": "r1",
+            "rule_type": "continuous_cultivation",
+            "source_group": "Solanaceae",
+            "target_group": "Solanaceae",
+            "impact_ratio": 0.7,
+        }]))
+        gateway = InteractionRuleFileGateway(FileService(), str(path))
+
+        first = gateway.get_rules()
+        first.clear()  # Callers get their own list
+        second = InteractionRuleFileGateway(FileService(), str(path)).get_rules()
+
+        assert [rule.rule_id for rule in second] == ["r1"]
+        stats = process_cache.stats()
+        assert (stats['hits'], stats['misses']) == (1, 1)
@@ -0,0 +1,100 @@
+"""Tests for SharedDatasetInputs."""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+from agrr_core.entity import WeatherData
+from agrr_core.framework.services.ml.shared_dataset_inputs import (
+    SharedDatasetInputs,
+    shares_dataset_inputs,
+)
+
+
+def _weather(days):
+    return [
+        WeatherData(time=datetime(2024, 1, 1) + timedelta(days=i), temperature_2m_mean=15.0)
+        for i in range(days)
+    ]
+
+
+class TestSharedDatasetInputs:
+    """Test per-dataset memoization."""
+
+    def test_same_dataset_shares_inputs_within_scope(self):
+        data = _weather(10)
+
+        with SharedDatasetInputs.scope():
+            inputs = SharedDatasetInputs.for_dataset(data)
+            with SharedDatasetInputs.scope():
+                assert SharedDatasetInputs.for_dataset(data) is inputs
+            assert SharedDatasetInputs.for_dataset(data) is inputs
+            assert SharedDatasetInputs.for_dataset(list(data)) is not inputs
+
+        with SharedDatasetInputs.scope():
+            assert SharedDatasetInputs.for_dataset(data) is not inputs
+
+    def test_nothing_is_shared_outside_scope(self):
+        data = _weather(10)
+
+        assert SharedDatasetInputs.for_dataset(data) is not SharedDatasetInputs.for_dataset(data)
+
+    def test_dataset_edited_between_calls_is_recomputed(self):
+        @shares_dataset_inputs
+        def mean_temperature(data):
+            return SharedDatasetInputs.for_dataset(data).get_or_compute(
+                'mean', lambda: sum(w.temperature_2m_mean for w in data) / len(data)
+            )
+
+        data = _weather(2)
+        assert mean_temperature(data) == 15.0
+
+        data[0] = WeatherData(time=data[0].time, temperature_2m_mean=95.0)  # Same length
+
+        assert mean_temperature(data) == 55.0
+
+    def test_concurrent_callers_compute_once(self):
+        inputs = SharedDatasetInputs()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return 'value'
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(inputs.get_or_compute('key', compute)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ['value'] * 4
+        assert len(calls) == 1
+
+    def test_failed_compute_is_retried(self):
+        inputs = SharedDatasetInputs()
+
+        def fail():
+            raise ValueError("no data")
+
+        try:
+            inputs.get_or_compute('key', fail)
+        except ValueError:
+            pass
+
+        assert inputs.get_or_compute('key', lambda: 1) == 1
+
+    def test_prediction_service_dataset_scope_shares_inputs(self):
+        from agrr_core.framework.services.ml.arima_prediction_service import ARIMAPredictionService
+        from agrr_core.framework.services.ml.time_series_arima_service import TimeSeriesARIMAService
+        data = _weather(10)
+
+        with ARIMAPredictionService(TimeSeriesARIMAService()).dataset_scope():
+            inputs = SharedDatasetInputs.for_dataset(data)
+            assert SharedDatasetInputs.for_dataset(data) is inputs
+
+        assert SharedDatasetInputs.for_dataset(data) is not inputs
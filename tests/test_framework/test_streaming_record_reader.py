@@ -0,0 +1,158 @@
+"""Tests for the streaming JSON/CSV record readers."""
+
+import json
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from agrr_core.adapter.gateways.weather_file_gateway import WeatherFileGateway
+from agrr_core.framework.services.io.file_service import FileService
+from agrr_core.framework.services.io.streaming_record_reader import (
+    iter_csv_records,
+    iter_json_records,
+    iter_text_chunks,
+)
+
+
+def _records(days):
+    start = datetime(2000, 1, 1)
+    return [
+        {
+            'time': (start + timedelta(days=i)).strftime('%Y-%m-%d'),
+            'temperature_2m_max': 20.0 + i % 7,
+            'temperature_2m_min': 10.25,
+            'temperature_2m_mean': 15.123456789,
+            'precipitation_sum': i % 3,
+        }
+        for i in range(days)
+    ]
+
+
+def _chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class TestStreamingRecordReader:
+    """Test incremental parsing against json.loads / csv."""
+
+    @pytest.mark.parametrize('chunk_size', [1, 7, 64, 100000])
+    @pytest.mark.parametrize('wrap', [None, 'data', 'weather_data'])
+    def test_json_records_match_json_loads(self, chunk_size, wrap):
+        records = _records(20)
+        document = records if wrap is None else {'location': {'lat': 35.0}, wrap: records}
+        text = json.dumps(document, indent=2)
+
+        assert list(iter_json_records(_chunked(text, chunk_size))) == records
+
+    def test_json_object_without_records_is_one_record(self):
+        text = '{"time": "2024-01-01", "temperature_2m_max": 25}'
+
+        assert list(iter_json_records(_chunked(text, 5))) == [json.loads(text)]
+
+    @pytest.mark.parametrize('text', ['"text"', '[{"a": 1} {"b": 2}]', '[{"a": 1}] []', '[{"a": 1'])
+    def test_invalid_json_raises(self, text):
+        with pytest.raises(ValueError):
+            list(iter_json_records([text]))
+
+    def test_csv_records(self):
+        text = 'time,temperature_2m_max,note\r\n2024-01-01,25.0,"two\nlines"\r\n2024-01-02,26.0,\r\n'
+
+        rows = list(iter_csv_records(_chunked(text, 3)))
+
+        assert rows == [
+            {'time': '2024-01-01', 'temperature_2m_max': '25.0', 'note': 'two\nlines'},
+            {'time': '2024-01-02', 'temperature_2m_max': '26.0', 'note': ''},
+        ]
+
+    @pytest.mark.parametrize('use_mmap', [False, True])
+    def test_text_chunks_decode_multibyte_characters(self, tmp_path, use_mmap):
+        path = tmp_path / 'weather.json'
+        text = json.dumps({'station': '東京' * 5000, 'data': []}, ensure_ascii=False)
+        path.write_text(text, encoding='utf-8')
+
+        chunks = list(iter_text_chunks(str(path), chunk_size=4096, use_mmap=use_mmap))
+
+        assert ''.join(chunks) == text
+        assert len(chunks) > 1
+
+
+class TestWeatherFileGatewayStreaming:
+    """Test WeatherFileGateway reading through the streaming readers."""
+
+    @pytest.fixture
+    def weather_file(self, tmp_path):
+        path = tmp_path / 'weather.json'
+        path.write_text(json.dumps({'data': _records(3000)}))
+        return str(path)
+
+    def test_date_range_is_applied_while_parsing(self, weather_file):
+        gateway = WeatherFileGateway(
+            FileService(), weather_file, start_date='2001-02-01', end_date=date(2001, 2, 10)
+        )
+
+        series = gateway.get()
+
+        assert [d.isoformat() for d in (series.dates()[0], series.dates()[-1])] == [
+            '2001-02-01', '2001-02-10'
+        ]
+        assert len(series) == 10
+
+    def test_csv_and_json_give_same_series(self, tmp_path, weather_file):
+        csv_path = tmp_path / 'weather.csv'
+        rows = _records(3000)
+        csv_path.write_text(
+            ','.join(rows[0]) + '\n' + ''.join(','.join(str(v) for v in r.values()) + '\n' for r in rows)
+        )
+
+        from_json = WeatherFileGateway(FileService(), weather_file).get()
+        from_csv = WeatherFileGateway(FileService(), str(csv_path), use_mmap=True).get()
+
+        assert from_csv == from_json
+
+    def test_memory_does_not_scale_with_skipped_records(self, tmp_path):
+        path = tmp_path / 'weather.json'
+        path.write_text(json.dumps(_records(40000)))  # About 6 MB
+        gateway = WeatherFileGateway(
+            FileService(), str(path), start_date='2000-01-01', end_date='2000-01-31'
+        )
+
+        tracemalloc.start()
+        try:
+            series = gateway.get()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(series) == 31
+        assert peak < path.stat().st_size / 2
+
+    def test_empty_csv_cells_are_missing_values(self, tmp_path):
+        """Empty cells read as None (NaN in the series), like JSON nulls."""
+        csv_path = tmp_path / 'weather.csv'
+        csv_path.write_text(
+            'time,temperature_2m_max,temperature_2m_min,temperature_2m_mean,precipitation_sum\n'
+            '2024-01-01,25.0,,20.0,\n'
+            '2024-01-02,,16.0,21.0,0.0\n'
+        )
+
+        series = WeatherFileGateway(FileService(), str(csv_path)).get()
+
+        assert len(series) == 2
+        assert series[0].temperature_2m_min is None
+        assert series[0].precipitation_sum is None
+        assert series[1].temperature_2m_max is None
+        assert series[1].precipitation_sum == 0.0
+        assert series.column('temperature_2m_mean').tolist() == [20.0, 21.0]
+
+    def test_file_service_streams_chunks(self, weather_file):
+        """The gateway reads through FileService.read_chunks, not read()."""
+
+        class ChunkOnlyFileService(FileService):
+            def read(self, file_path):
+                raise AssertionError("read() loads the whole file")
+
+        series = WeatherFileGateway(ChunkOnlyFileService(), weather_file).get()
+
+        assert len(series) == 3000
+        assert ''.join(FileService().read_chunks(weather_file)) == FileService().read(weather_file)
@@ -0,0 +1,160 @@
+"""Tests for binary columnar weather files (.npz / .parquet)."""
+
+import io
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from agrr_core.adapter.gateways.weather_file_gateway import WeatherFileGateway
+from agrr_core.adapter.presenters.weather_cli_presenter import WeatherCLIPresenter
+from agrr_core.entity import WeatherData, WeatherSeries
+from agrr_core.framework.services.io.file_service import FileService
+from agrr_core.entity.exceptions.file_error import FileError
+from agrr_core.framework.services.io import weather_columnar_store
+from agrr_core.framework.services.io.weather_columnar_store import (
+    PARQUET_AVAILABLE,
+    read_weather_columns,
+    write_weather_columns,
+)
+from agrr_core.usecase.dto.location_response_dto import LocationResponseDTO
+from agrr_core.usecase.dto.weather_data_list_response_dto import WeatherDataListResponseDTO
+from agrr_core.usecase.dto.weather_data_response_dto import WeatherDataResponseDTO
+
+EXTENSIONS = [
+    '.npz',
+    pytest.param('.parquet', marks=pytest.mark.skipif(not PARQUET_AVAILABLE, reason="pyarrow not installed")),
+]
+
+
+def _records(days, start=date(1994, 1, 1)):
+    return [
+        {
+            'time': (start + timedelta(days=i)).isoformat(),
+            'temperature_2m_max': round(20.0 + 10 * np.sin(i / 58.0), 1),
+            'temperature_2m_min': None if i % 11 == 0 else round(5.0 + i % 9, 1),
+            'temperature_2m_mean': round(12.5 + 0.01 * i, 2),
+            'precipitation_sum': float(i % 5),
+            'sunshine_duration': None if i % 7 == 0 else 3600.0 * (i % 12),
+        }
+        for i in range(days)
+    ]
+
+
+@pytest.fixture
+def json_file(tmp_path):
+    path = tmp_path / 'weather.json'
+    path.write_text(json.dumps({'data': _records(3 * 365)}))
+    return str(path)
+
+
+class TestWeatherColumnarStore:
+    """Test round trips against the JSON path and range reads."""
+
+    @pytest.mark.parametrize('extension', EXTENSIONS)
+    @pytest.mark.parametrize('compress', [True, False])
+    def test_round_trip_equals_json_path(self, tmp_path, json_file, extension, compress):
+        from_json = WeatherFileGateway(FileService(), json_file).get()
+        path = str(tmp_path / f'weather{extension}')
+
+        write_weather_columns(from_json, path, compress=compress)
+        from_binary = WeatherFileGateway(FileService(), path).get()
+
+        assert from_binary == from_json.to_list()
+
+    @pytest.mark.parametrize('extension', EXTENSIONS)
+    def test_date_range_read(self, tmp_path, json_file, extension):
+        path = str(tmp_path / f'weather{extension}')
+        write_weather_columns(WeatherFileGateway(FileService(), json_file).get(), path)
+
+        window = WeatherFileGateway(
+            FileService(), path, start_date='1995-02-27', end_date=date(1995, 3, 2)
+        ).get()
+        expected = WeatherFileGateway(
+            FileService(), json_file, start_date='1995-02-27', end_date='1995-03-02'
+        ).get()
+
+        assert window.dates() == [date(1995, 2, 27), date(1995, 2, 28), date(1995, 3, 1), date(1995, 3, 2)]
+        assert window == expected.to_list()
+
+    def test_uncompressed_npz_is_memory_mapped(self, tmp_path, json_file):
+        path = str(tmp_path / 'weather.npz')
+        write_weather_columns(WeatherFileGateway(FileService(), json_file).get(), path, compress=False)
+
+        series = read_weather_columns(path, start_date=date(1995, 1, 1))
+
+        assert isinstance(series.column('temperature_2m_mean').base, np.memmap)
+        assert series.dates()[0] == date(1995, 1, 1)
+
+    def test_npz_is_readable_by_numpy(self, tmp_path, json_file):
+        series = WeatherFileGateway(FileService(), json_file).get()
+        path = str(tmp_path / 'weather.npz')
+        write_weather_columns(series, path, location={'latitude': 35.0, 'longitude': 139.0})
+
+        with np.load(path) as archive:
+            np.testing.assert_array_equal(archive['ordinals'], series.ordinals)
+            np.testing.assert_array_equal(archive['precipitation_sum'], series.column('precipitation_sum'))
+            assert json.loads(archive['metadata.json'])['location']['latitude'] == 35.0
+
+    def test_time_of_day_and_offset_are_preserved(self, tmp_path):
+        tz = timezone(timedelta(hours=9))
+        records = [
+            WeatherData(time=datetime(2024, 1, 1, hour, tzinfo=tz), temperature_2m_mean=float(hour))
+            for hour in range(0, 24, 6)
+        ]
+        path = str(tmp_path / 'hourly.npz')
+
+        write_weather_columns(WeatherSeries.from_weather_data(records), path)
+
+        assert read_weather_columns(path).to_list() == records
+
+    @pytest.mark.skipif(not PARQUET_AVAILABLE, reason="pyarrow not installed")
+    def test_parquet_has_one_row_group_per_year(self, tmp_path, json_file):
+        import pyarrow.parquet as pq
+        path = str(tmp_path / 'weather.parquet')
+
+        write_weather_columns(WeatherFileGateway(FileService(), json_file).get(), path)
+
+        metadata = pq.ParquetFile(path).metadata
+        assert [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)] == [
+            365, 365, 365  # 1994, 1995, 1996 up to Dec 30
+        ]
+
+    def test_parquet_without_pyarrow_raises_import_error(self, tmp_path, json_file, monkeypatch):
+        series = WeatherFileGateway(FileService(), json_file).get()
+        path = str(tmp_path / 'weather.parquet')
+        monkeypatch.setattr(weather_columnar_store, 'PARQUET_AVAILABLE', False)
+
+        with pytest.raises(ImportError, match="pip install pyarrow"):
+            write_weather_columns(series, path)
+        with pytest.raises(ImportError, match="use the .npz format"):
+            read_weather_columns(path)
+        open(path, 'wb').close()
+        with pytest.raises(FileError, match="require pyarrow"):
+            WeatherFileGateway(FileService(), path).get()
+
+    def test_non_weather_npz_is_rejected(self, tmp_path):
+        path = str(tmp_path / 'other.npz')
+        np.savez(path, values=np.arange(3))
+
+        with pytest.raises(ValueError):
+            read_weather_columns(path)
+
+    def test_presenter_writes_columnar_file(self, tmp_path):
+        dto = WeatherDataListResponseDTO(
+            data=[
+                WeatherDataResponseDTO(time='2024-05-01T00:00:00', temperature_2m_mean=18.5, weather_code=3),
+                WeatherDataResponseDTO(time='2024-05-02T00:00:00', precipitation_sum=4.0),
+            ],
+            total_count=2,
+            location=LocationResponseDTO(latitude=35.0, longitude=139.0, elevation=40.0, timezone='Asia/Tokyo'),
+        )
+        path = str(tmp_path / 'weather.npz')
+
+        WeatherCLIPresenter(output_stream=io.StringIO(), file_repository=FileService()).display_weather_data_to_file(dto, path)
+
+        assert read_weather_columns(path).to_list() == [
+            WeatherData(time=datetime(2024, 5, 1), temperature_2m_mean=18.5, weather_code=3),
+            WeatherData(time=datetime(2024, 5, 2), precipitation_sum=4.0),
+        ]
@@ -0,0 +1,28 @@
+"""Tests for reading option values from raw CLI arguments."""
+
+import pytest
+
+from agrr_core.cli import _arg_value
+
+
+class TestArgValue:
+    """_arg_value must accept the same spellings as argparse."""
+
+    @pytest.mark.parametrize('args', [
+        ['optimize', 'allocate', '--planning-start', '2024-04-01', '--planning-end', '2024-10-31'],
+        ['optimize', 'allocate', '--planning-start=2024-04-01', '--planning-end=2024-10-31'],
+        ['optimize', 'allocate', '-s', '2024-04-01', '-e=2024-10-31'],
+    ])
+    def test_reads_separate_and_equals_spellings(self, args):
+        assert _arg_value(args, '--planning-start', '-s') == '2024-04-01'
+        assert _arg_value(args, '--planning-end', '-e') == '2024-10-31'
+
+    def test_last_occurrence_wins(self):
+        args = ['--planning-start', '2024-01-01', '--planning-start=2024-04-01']
+
+        assert _arg_value(args, '--planning-start') == '2024-04-01'
+
+    def test_absent_or_missing_value(self):
+        assert _arg_value(['--planning-end', '2024-10-31'], '--planning-start') is None
+        assert _arg_value(['--planning-start'], '--planning-start') is None
+        assert _arg_value(['--planning-starts=2024-04-01'], '--planning-start') is None
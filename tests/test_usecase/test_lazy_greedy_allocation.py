@@ -0,0 +1,149 @@
+"""Tests for lazy (priority-queue) greedy allocation.
+
+The lazy greedy must select exactly the allocations of the full re-sort.
+"""
+
+import random
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.entity.entities.crop_profile_entity import CropProfile
+from agrr_core.entity.entities.field_entity import Field
+from agrr_core.entity.entities.interaction_rule_entity import InteractionRule
+from agrr_core.entity.value_objects.rule_type import RuleType
+from agrr_core.usecase.dto.optimization_config import OptimizationConfig
+from agrr_core.usecase.interactors.multi_field_crop_allocation_greedy_interactor import (
+    AllocationCandidate,
+    MultiFieldCropAllocationGreedyInteractor,
+)
+
+
+PLANNING_START = datetime(2025, 1, 1)
+
+
+def _interactor(interaction_rules=None):
+    return MultiFieldCropAllocationGreedyInteractor(
+        field_gateway=Mock(),
+        crop_gateway=Mock(),
+        weather_gateway=Mock(),
+        crop_profile_gateway_internal=Mock(),
+        interaction_rules=interaction_rules,
+    )
+
+
+def _random_candidates(seed, n):
+    rng = random.Random(seed)
+    fields = [
+        Field(f"f{i}", f"Field {i}", 1000.0, rng.choice([3000.0, 5000.0]), fallow_period_days=rng.choice([0, 14, 28]))
+        for i in range(4)
+    ]
+    crops = [
+        Crop("tomato", "Tomato", 0.5, revenue_per_area=900.0, max_revenue=600000.0, groups=["Solanaceae"]),
+        Crop("eggplant", "Eggplant", 0.5, revenue_per_area=800.0, groups=["Solanaceae"]),
+        Crop("soybean", "Soybean", 0.5, revenue_per_area=500.0, max_revenue=300000.0, groups=["Fabaceae"]),
+        Crop("cabbage", "Cabbage", 0.5, revenue_per_area=600.0, groups=["Brassicaceae"]),
+    ]
+    candidates = []
+    for _ in range(n):
+        field = rng.choice(fields)
+        growth_days = rng.randrange(40, 120)
+        start = PLANNING_START + timedelta(days=rng.randrange(0, 500))
+        candidates.append(
+            AllocationCandidate(
+                field=field,
+                crop=rng.choice(crops),
+                start_date=start,
+                completion_date=start + timedelta(days=growth_days),
+                growth_days=growth_days,
+                accumulated_gdd=1000.0,
+                area_used=rng.choice([250.0, 500.0, 1000.0]),
+            )
+        )
+    # Exact duplicates in other fields produce ties
+    candidates += [replace(c, field=fields[0]) for c in candidates[: n // 10]]
+    return candidates, [CropProfile(crop=c, stage_requirements=[]) for c in crops]
+
+
+def _signature(allocations):
+    return [
+        (a.field.field_id, a.crop.crop_id, a.start_date, a.area_used, a.expected_revenue, a.profit)
+        for a in allocations
+    ]
+
+
+class TestLazyGreedyAllocation:
+    """Lazy greedy vs full re-sort greedy."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2, 3])
+    def test_matches_full_resort(self, seed):
+        rules = [
+            InteractionRule(
+                rule_id="penalty",
+                rule_type=RuleType.CONTINUOUS_CULTIVATION,
+                source_group="Solanaceae",
+                target_group="Solanaceae",
+                impact_ratio=0.7,
+                is_directional=True,
+            ),
+            InteractionRule(
+                rule_id="benefit",
+                rule_type=RuleType.CONTINUOUS_CULTIVATION,
+                source_group="Fabaceae",
+                target_group="Brassicaceae",
+                impact_ratio=1.2,
+                is_directional=True,
+            ),
+        ]
+        interactor = _interactor(rules)
+        candidates, crops = _random_candidates(seed, 300)
+
+        lazy = interactor._greedy_allocation(
+            candidates, crops, "maximize_profit", PLANNING_START,
+            OptimizationConfig(enable_lazy_greedy=True),
+        )
+        full = interactor._greedy_allocation(
+            candidates, crops, "maximize_profit", PLANNING_START,
+            OptimizationConfig(enable_lazy_greedy=False),
+        )
+
+        assert lazy
+        assert _signature(lazy) == _signature(full)
+        assert interactor._is_feasible_solution(lazy)
+
+    def test_market_demand_limit_rescoring(self):
+        """Once a crop's budget is used up, its other candidates lose priority."""
+        field_a = Field("fa", "A", 1000.0, 1000.0)
+        field_b = Field("fb", "B", 1000.0, 1000.0)
+        capped = Crop("capped", "Capped", 0.5, revenue_per_area=100.0, max_revenue=100000.0)
+        steady = Crop("steady", "Steady", 0.5, revenue_per_area=60.0)
+
+        def candidate(field, crop):
+            return AllocationCandidate(
+                field=field,
+                crop=crop,
+                start_date=datetime(2025, 4, 1),
+                completion_date=datetime(2025, 6, 9),
+                growth_days=70,
+                accumulated_gdd=1000.0,
+                area_used=1000.0,
+            )
+
+        candidates = [
+            candidate(field_a, capped),
+            candidate(field_b, capped),
+            candidate(field_a, steady),
+            candidate(field_b, steady),
+        ]
+        crops = [CropProfile(crop=c, stage_requirements=[]) for c in (capped, steady)]
+        allocations = _interactor()._greedy_allocation(
+            candidates, crops, "maximize_profit", datetime(2025, 4, 1),
+        )
+
+        assert sorted((a.field.field_id, a.crop.crop_id) for a in allocations) == [
+            ("fa", "capped"),
+            ("fb", "steady"),
+        ]
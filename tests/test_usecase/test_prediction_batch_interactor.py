@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import Mock, MagicMock
 
 from agrr_core.usecase.interactors.prediction_batch_interactor import BatchPredictionInteractor
+from agrr_core.usecase.gateways.batch_prediction_executor import SerialBatchPredictionExecutor
 from agrr_core.usecase.ports.input.multi_metric_prediction_input_port import MultiMetricPredictionInputPort
 from agrr_core.usecase.dto.prediction_config_dto import PredictionConfigDTO
 from agrr_core.usecase.dto.batch_prediction_request_dto import BatchPredictionRequestDTO
@@ -160,3 +161,28 @@ def test_execute_empty_locations(interactor, mock_multi_metric_interactor):
     
     # Verify multi-metric interactor was not called
     mock_multi_metric_interactor.execute.assert_not_called()
+
+def test_execute_on_injected_executor(sample_request, sample_prediction_response, mock_multi_metric_interactor):
+    """Test batch prediction through an injected executor with progress reporting."""
+    def side_effect(request):
+        if request.location_name == 'New York':
+            raise Exception("Prediction failed")
+        return sample_prediction_response
+    
+    mock_multi_metric_interactor.execute.side_effect = side_effect
+    reports = []
+    interactor = BatchPredictionInteractor(
+        multi_metric_prediction_interactor=mock_multi_metric_interactor,
+        batch_executor=SerialBatchPredictionExecutor(progress_callback=reports.append)
+    )
+    
+    # Execute
+    result = interactor.execute(sample_request)
+    
+    # Assertions
+    assert [r['location']['name'] for r in result.results] == ['Tokyo', 'London']
+    assert result.results[0]['prediction'] == sample_prediction_response
+    assert [e['location']['name'] for e in result.errors] == ['New York']
+    assert result.errors[0]['error'] == "Prediction failed"
+    assert len(reports) == 3
+    assert reports[-1].failed == 1
@@ -0,0 +1,234 @@
+"""Pytest configuration for use case service tests.
+
+Shared builders of the optimizer and GDD engine tests, exposed as fixtures:
+- Farm: random fields, crops, allocation candidates and a feasible starting
+  solution, with the interaction rules and planning start they are priced with
+- GDD: temperature profiles, a multi-stage tomato crop profile and seasonal
+  weather series with optional gaps
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.entity.entities.crop_profile_entity import CropProfile
+from agrr_core.entity.entities.field_entity import Field
+from agrr_core.entity.entities.growth_stage_entity import GrowthStage
+from agrr_core.entity.entities.interaction_rule_entity import InteractionRule
+from agrr_core.entity.entities.stage_requirement_entity import StageRequirement
+from agrr_core.entity.entities.sunshine_profile_entity import SunshineProfile
+from agrr_core.entity.entities.temperature_profile_entity import TemperatureProfile
+from agrr_core.entity.entities.thermal_requirement_entity import ThermalRequirement
+from agrr_core.entity.entities.weather_entity import WeatherData
+from agrr_core.entity.value_objects.field_predecessor_index import FieldPredecessorIndex
+from agrr_core.entity.value_objects.interaction_rule_table import InteractionRuleTable
+from agrr_core.entity.value_objects.optimization_objective import OptimizationMetrics
+from agrr_core.entity.value_objects.rule_type import RuleType
+from agrr_core.usecase.interactors.multi_field_crop_allocation_greedy_interactor import (
+    AllocationCandidate,
+)
+from agrr_core.usecase.services.field_interval_index import FieldIntervalIndex
+
+# ============================================================================
+# Farm (optimizer neighborhoods)
+# ============================================================================
+
+_FARM_PLANNING_START = datetime(2025, 1, 1)
+_FARM_RULES = InteractionRuleTable([
+    InteractionRule(
+        rule_id="continuous",
+        rule_type=RuleType.CONTINUOUS_CULTIVATION,
+        source_group="Solanaceae",
+        target_group="Solanaceae",
+        impact_ratio=0.7,
+    ),
+])
+
+
+def _recalculate(solution):
+    return OptimizationMetrics.recalculate_allocations_with_context(
+        solution, FieldPredecessorIndex.from_allocations(solution), _FARM_RULES, _FARM_PLANNING_START
+    )
+
+
+def _farm(seed, n_fields=6):
+    rng = random.Random(seed)
+    fields = [
+        Field(
+            field_id=f"f{i}",
+            name=f"f{i}",
+            area=3000.0,
+            daily_fixed_cost=rng.uniform(50.0, 150.0),
+            fallow_period_days=14,
+        )
+        for i in range(n_fields)
+    ]
+    crops = [
+        Crop("tomato", "Tomato", 1.0, revenue_per_area=40.0, max_revenue=60000.0, groups=["Solanaceae"]),
+        Crop("eggplant", "Eggplant", 1.0, revenue_per_area=35.0, groups=["Solanaceae"]),
+        Crop("cabbage", "Cabbage", 1.0, revenue_per_area=25.0, max_revenue=30000.0, groups=["Brassicaceae"]),
+    ]
+    candidates = [
+        AllocationCandidate(
+            field=field,
+            crop=crop,
+            start_date=_FARM_PLANNING_START + timedelta(days=offset),
+            completion_date=_FARM_PLANNING_START + timedelta(days=offset + days),
+            growth_days=days,
+            accumulated_gdd=0.0,
+            area_used=rng.choice([300.0, 500.0]),
+        )
+        for field in fields
+        for crop in crops
+        for offset in range(0, 300, 25)
+        for days in [rng.randint(50, 90)]
+    ]
+
+    # Feasible starting solution: up to 3 random non-overlapping candidates per field
+    schedule_index = FieldIntervalIndex()
+    solution = []
+    for candidate in rng.sample(candidates, len(candidates)):
+        if len(schedule_index.field_allocations(candidate.field.field_id)) < 3 and schedule_index.try_add(candidate):
+            solution.append(CropAllocation(
+                allocation_id=f"a{len(solution)}",
+                field=candidate.field,
+                crop=candidate.crop,
+                area_used=candidate.area_used,
+                start_date=candidate.start_date,
+                completion_date=candidate.completion_date,
+                growth_days=candidate.growth_days,
+                accumulated_gdd=0.0,
+                total_cost=candidate.growth_days * candidate.field.daily_fixed_cost,
+            ))
+    return fields, crops, candidates, _recalculate(solution)
+
+
+@pytest.fixture
+def farm_planning_start():
+    """Planning start date of make_farm candidates."""
+    return _FARM_PLANNING_START
+
+
+@pytest.fixture
+def farm_rules():
+    """Interaction rules of make_farm (continuous Solanaceae cultivation penalty)."""
+    return _FARM_RULES
+
+
+@pytest.fixture
+def make_farm():
+    """Factory: make_farm(seed, n_fields=6) -> (fields, crops, candidates, solution).
+
+    The solution holds up to 3 non-overlapping candidates per field, with
+    revenue and profit recalculated under farm_rules.
+    """
+    return _farm
+
+
+@pytest.fixture
+def recalculate_farm():
+    """Recalculate revenue and profit of allocations under farm_rules."""
+    return _recalculate
+
+
+# ============================================================================
+# GDD (completion engines)
+# ============================================================================
+
+
+def _temperature_profile(base, opt_min, opt_max, max_temp, sterility=None):
+    return TemperatureProfile(
+        base_temperature=base,
+        optimal_min=opt_min,
+        optimal_max=opt_max,
+        low_stress_threshold=opt_min - 3.0,
+        high_stress_threshold=opt_max + 3.0,
+        frost_threshold=0.0,
+        max_temperature=max_temp,
+        sterility_risk_threshold=sterility,
+    )
+
+
+def _crop_profile(stages):
+    crop = Crop(
+        crop_id="tomato",
+        name="Tomato",
+        area_per_unit=0.5,
+        variety="Momotaro",
+        revenue_per_area=1000.0,
+    )
+    stage_requirements = [
+        StageRequirement(
+            stage=GrowthStage(name=f"stage{i}", order=i),
+            temperature=profile,
+            sunshine=SunshineProfile(),
+            thermal=ThermalRequirement(required_gdd=gdd),
+        )
+        for i, (profile, gdd) in enumerate(stages)
+    ]
+    return CropProfile(crop=crop, stage_requirements=stage_requirements)
+
+
+def _seasonal_weather(start, days, seed, missing_rate=0.0):
+    rng = random.Random(seed)
+    weather = []
+    for i in range(days):
+        day = start + timedelta(days=i)
+        if rng.random() < missing_rate:
+            continue  # Gap in the series
+        mean = 15.0 + 12.0 * np.sin(2 * np.pi * (i - 100) / 365.0) + rng.uniform(-4, 4)
+        weather.append(
+            WeatherData(
+                time=day,
+                temperature_2m_mean=mean,
+                temperature_2m_max=mean + rng.uniform(3, 8),
+                temperature_2m_min=mean - rng.uniform(3, 8),
+            )
+        )
+    return weather
+
+
+_MULTI_STAGE = [
+    (_temperature_profile(10.0, 20.0, 28.0, 38.0), 200.0),
+    (_temperature_profile(8.0, 18.0, 26.0, 35.0), 350.0),
+    (_temperature_profile(10.0, 20.0, 28.0, 38.0, sterility=35.0), 150.0),
+    (_temperature_profile(12.0, 22.0, 30.0, 40.0), 300.0),
+]
+
+
+@pytest.fixture
+def make_temperature_profile():
+    """Factory: make_temperature_profile(base, opt_min, opt_max, max_temp, sterility=None).
+
+    Stress thresholds lie 3 degrees outside the optimal range; frost at 0.
+    """
+    return _temperature_profile
+
+
+@pytest.fixture
+def make_crop_profile():
+    """Factory: make_crop_profile(stages) -> tomato (Momotaro) CropProfile.
+
+    stages is a list of (TemperatureProfile, required_gdd), one per stage.
+    """
+    return _crop_profile
+
+
+@pytest.fixture
+def make_seasonal_weather():
+    """Factory: make_seasonal_weather(start, days, seed, missing_rate=0.0).
+
+    Daily WeatherData following a yearly temperature cycle with noise;
+    missing_rate drops random days (gaps in the series).
+    """
+    return _seasonal_weather
+
+
+@pytest.fixture
+def multi_stage():
+    """Four (TemperatureProfile, required_gdd) stages, one with a sterility threshold."""
+    return list(_MULTI_STAGE)
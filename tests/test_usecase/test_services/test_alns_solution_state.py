@@ -0,0 +1,182 @@
+"""Tests for ALNSSolutionState and incremental ALNS evaluation."""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.entity.entities.field_entity import Field
+from agrr_core.usecase.dto.optimization_config import OptimizationConfig
+from agrr_core.usecase.interactors.multi_field_crop_allocation_greedy_interactor import (
+    AllocationCandidate,
+)
+from agrr_core.usecase.services.alns_optimizer_service import ALNSOptimizer
+from agrr_core.usecase.services.alns_solution_state import ALNSSolutionState
+
+
+def _field(field_id, fallow=0):
+    return Field(
+        field_id=field_id,
+        name=field_id,
+        area=1000.0,
+        daily_fixed_cost=100.0,
+        fallow_period_days=fallow,
+    )
+
+
+def _crop(crop_id, revenue_per_area=50.0):
+    return Crop(
+        crop_id=crop_id,
+        name=crop_id,
+        area_per_unit=1.0,
+        revenue_per_area=revenue_per_area,
+    )
+
+
+def _alloc(alloc_id, field, crop, start, days, revenue):
+    cost = days * field.daily_fixed_cost
+    return CropAllocation(
+        allocation_id=alloc_id,
+        field=field,
+        crop=crop,
+        area_used=500.0,
+        start_date=start,
+        completion_date=start + timedelta(days=days),
+        growth_days=days,
+        accumulated_gdd=0.0,
+        total_cost=cost,
+        expected_revenue=revenue,
+        profit=revenue - cost,
+    )
+
+
+class TestALNSSolutionState:
+    """Test ALNSSolutionState incremental updates."""
+
+    def test_add_and_remove_report_profit_delta(self):
+        field = _field("f1")
+        crop = _crop("c1")
+        a1 = _alloc("a1", field, crop, datetime(2025, 1, 1), 30, 10000.0)
+        a2 = _alloc("a2", field, crop, datetime(2025, 3, 1), 30, 5000.0)
+
+        state = ALNSSolutionState([a1])
+        assert state.profit == 7000.0
+
+        assert state.add(a2) == 2000.0
+        assert state.profit == 9000.0
+
+        assert state.remove(a1) == -7000.0
+        assert state.profit == 2000.0
+        assert state.allocations == [a2]
+        assert a1 not in state
+
+    def test_feasibility_only_considers_same_field_with_fallow(self):
+        f1 = _field("f1", fallow=28)
+        f2 = _field("f2", fallow=28)
+        crop = _crop("c1")
+        existing = _alloc("a1", f1, crop, datetime(2025, 1, 1), 30, 10000.0)
+        state = ALNSSolutionState([existing])
+
+        # Within fallow period on the same field
+        too_soon = _alloc("a2", f1, crop, datetime(2025, 2, 15), 30, 10000.0)
+        # After fallow period
+        after_fallow = _alloc("a3", f1, crop, datetime(2025, 3, 3), 30, 10000.0)
+        # Same dates, other field
+        other_field = _alloc("a4", f2, crop, datetime(2025, 1, 1), 30, 10000.0)
+
+        assert state.is_feasible_to_add(too_soon) is False
+        assert state.is_feasible_to_add(after_fallow) is True
+        assert state.is_feasible_to_add(other_field) is True
+        assert state.try_add(too_soon) is False
+        assert len(state) == 1
+
+    def test_allocation_keys_track_slots(self):
+        field = _field("f1")
+        crop = _crop("c1")
+        a1 = _alloc("a1", field, crop, datetime(2025, 1, 1), 30, 10000.0)
+        state = ALNSSolutionState([a1])
+
+        key = ALNSSolutionState.allocation_key(a1)
+        assert state.has_key(key)
+        state.remove(a1)
+        assert not state.has_key(key)
+
+    def test_profit_matches_full_recomputation_after_random_moves(self):
+        rng = random.Random(7)
+        fields = [_field(f"f{i}", fallow=7) for i in range(5)]
+        crops = [_crop("c1"), _crop("c2")]
+        pool = [
+            _alloc(
+                f"a{i}",
+                rng.choice(fields),
+                rng.choice(crops),
+                datetime(2025, 1, 1) + timedelta(days=rng.randrange(300)),
+                rng.randrange(20, 90),
+                rng.uniform(1000.0, 20000.0),
+            )
+            for i in range(200)
+        ]
+
+        state = ALNSSolutionState()
+        for _ in range(2000):
+            alloc = rng.choice(pool)
+            if alloc in state:
+                state.remove(alloc)
+            else:
+                state.try_add(alloc)
+
+        expected = sum(a.profit for a in state.allocations)
+        assert state.profit == pytest.approx(expected)
+
+
+class TestALNSIncrementalOptimize:
+    """ALNSOptimizer.optimize on the incremental state."""
+
+    def _problem(self, n_fields=20):
+        fields = [_field(f"f{i}", fallow=14) for i in range(n_fields)]
+        crops = [_crop("c1", 60.0), _crop("c2", 40.0)]
+        candidates = [
+            AllocationCandidate(
+                field=field,
+                crop=crop,
+                start_date=datetime(2025, 1, 1) + timedelta(days=offset),
+                completion_date=datetime(2025, 1, 1) + timedelta(days=offset + 60),
+                growth_days=60,
+                accumulated_gdd=0.0,
+                area_used=500.0,
+            )
+            for field in fields
+            for crop in crops
+            for offset in range(0, 300, 30)
+        ]
+        initial = [
+            _alloc(f"init_{field.field_id}", field, crops[1], datetime(2025, 1, 1), 60, 20000.0)
+            for field in fields
+        ]
+        return initial, candidates, fields, crops
+
+    def test_best_solution_is_feasible_and_not_worse(self):
+        random.seed(0)
+        initial, candidates, fields, crops = self._problem()
+        optimizer = ALNSOptimizer(OptimizationConfig(enable_alns=True))
+
+        best = optimizer.optimize(initial, candidates, fields, crops, max_iterations=50)
+
+        assert optimizer._calculate_profit(best) >= optimizer._calculate_profit(initial)
+        state = ALNSSolutionState()
+        for alloc in best:
+            assert state.try_add(alloc), alloc
+        assert state.profit == pytest.approx(optimizer._calculate_profit(best))
+
+    def test_time_limit_stops_iterations(self):
+        random.seed(0)
+        initial, candidates, fields, crops = self._problem()
+        optimizer = ALNSOptimizer(OptimizationConfig(enable_alns=True))
+
+        best = optimizer.optimize(
+            initial, candidates, fields, crops, max_iterations=100000, time_limit=0.0
+        )
+
+        assert best == initial
@@ -0,0 +1,166 @@
+"""Tests for CandidatePool (indexed candidate lookups).
+
+Every query is checked against a scan of the full candidate list.
+"""
+
+import random
+from dataclasses import replace
+from datetime import timedelta
+
+import pytest
+
+from agrr_core.usecase.services.candidate_pool import CandidatePool
+from agrr_core.usecase.services.field_interval_index import FieldIntervalIndex
+from agrr_core.usecase.services.neighbor_operations.crop_change_operation import (
+    CropChangeOperation,
+)
+from agrr_core.usecase.services.neighbor_operations.field_move_operation import (
+    FieldMoveOperation,
+)
+
+
+def _days(candidate, start_date):
+    return abs((candidate.start_date - start_date).days)
+
+
+class TestCandidatePool:
+    """Test CandidatePool queries."""
+
+    @pytest.fixture
+    def farm(self, make_farm):
+        fields, crops, candidates, solution = make_farm(11)
+        rng = random.Random(11)
+        return fields, crops, rng.sample(candidates, len(candidates)), solution
+
+    @pytest.fixture
+    def tied_farm(self, make_farm):
+        """Farm whose candidates come in pairs starting 5 days before and after.
+
+        Both halves of a pair have the same profit rate and lie at the same
+        distance from the original start. Pairs are shuffled, and
+        accumulated_gdd tags each candidate with its pool position, so the
+        allocations built from it tell which of the tied candidates was used.
+        """
+        fields, crops, candidates, solution = make_farm(13)
+        shifted = [
+            replace(c, start_date=c.start_date + shift, completion_date=c.completion_date + shift)
+            for c in candidates
+            for shift in (timedelta(days=-5), timedelta(days=5))
+        ]
+        rng = random.Random(13)
+        return fields, crops, [
+            replace(c, accumulated_gdd=float(i))
+            for i, c in enumerate(rng.sample(shifted, len(shifted)))
+        ], solution
+
+    def test_nearest_matches_sorted_scan(self, farm, farm_planning_start):
+        fields, crops, candidates, _ = farm
+        pool = CandidatePool(candidates)
+
+        for field in fields[:3]:
+            for crop in crops:
+                for offset in (-10, 0, 37, 400):
+                    target = farm_planning_start + timedelta(days=offset)
+                    matching = [
+                        c for c in candidates
+                        if c.field.field_id == field.field_id and c.crop.crop_id == crop.crop_id
+                    ]
+                    nearest = pool.nearest(field.field_id, crop.crop_id, target)
+                    assert [_days(c, target) for c in nearest] == sorted(_days(c, target) for c in matching)
+                    assert set(map(id, nearest)) == set(map(id, matching))
+
+                    within = pool.nearest(field.field_id, crop.crop_id, target, tolerance_days=30, limit=3)
+                    expected = sorted(_days(c, target) for c in matching if _days(c, target) <= 30)[:3]
+                    assert [_days(c, target) for c in within] == expected
+
+    def test_nearest_ties_keep_pool_order(self, tied_farm, farm_planning_start):
+        fields, crops, candidates, _ = tied_farm
+        pool = CandidatePool(candidates)
+
+        # Candidates start 5 days either side of every 25th day
+        for field in fields[:3]:
+            for crop in crops:
+                for offset in (0, 25, 40, 60):
+                    target = farm_planning_start + timedelta(days=offset)
+                    matching = [
+                        c for c in candidates
+                        if c.field.field_id == field.field_id and c.crop.crop_id == crop.crop_id
+                    ]
+                    expected = sorted(matching, key=lambda c: _days(c, target))
+                    assert pool.nearest(field.field_id, crop.crop_id, target) == expected
+                    assert pool.nearest(field.field_id, crop.crop_id, target, limit=3) == expected[:3]
+
+    def test_operations_break_ties_by_pool_order(self, tied_farm):
+        fields, crops, candidates, solution = tied_farm
+        context = {"fields": fields, "crops": crops, "candidates": candidates}
+
+        # Baseline scans: first candidate in pool order wins ties
+        def best_profit_rate(field_id, crop_id):
+            best = None
+            for c in candidates:
+                if c.field.field_id == field_id and c.crop.crop_id == crop_id:
+                    if best is None or c.profit_rate > best.profit_rate:
+                        best = c
+            return best
+
+        def closest_start(field_id, crop_id, start_date):
+            return min(
+                (c for c in candidates if c.field.field_id == field_id and c.crop.crop_id == crop_id),
+                key=lambda c: _days(c, start_date),
+            )
+
+        moves = FieldMoveOperation().generate_moves(solution, context)
+        assert moves
+        for move in moves:
+            (alloc_id,), (moved,) = move.remove_ids, move.add
+            alloc = next(a for a in solution if a.allocation_id == alloc_id)
+            expected = best_profit_rate(moved.field.field_id, alloc.crop.crop_id)
+            assert moved.accumulated_gdd == expected.accumulated_gdd
+
+        moves = CropChangeOperation().generate_moves(solution, context)
+        assert moves
+        for move in moves:
+            (alloc_id,), (changed,) = move.remove_ids, move.add
+            alloc = next(a for a in solution if a.allocation_id == alloc_id)
+            expected = closest_start(alloc.field.field_id, changed.crop.crop_id, alloc.start_date)
+            assert changed.accumulated_gdd == expected.accumulated_gdd
+
+    def test_starting_within_matches_scan(self, farm, farm_planning_start):
+        fields, crops, candidates, _ = farm
+        pool = CandidatePool(candidates)
+        target = farm_planning_start + timedelta(days=100)
+
+        result = pool.starting_within(fields[0].field_id, crops[1].crop_id, target, 30)
+
+        expected = [
+            c for c in candidates
+            if c.field.field_id == fields[0].field_id
+            and c.crop.crop_id == crops[1].crop_id
+            and _days(c, target) <= 30
+        ]
+        assert len(result) == len(expected) > 0
+        assert set(map(id, result)) == set(map(id, expected))
+        assert [c.start_date for c in result] == sorted(c.start_date for c in result)
+
+    def test_fitting_schedule_matches_overlap_scan(self, farm):
+        _, _, candidates, solution = farm
+        pool = CandidatePool(candidates)
+        schedule_index = FieldIntervalIndex(solution)
+
+        fitting = pool.fitting_schedule(schedule_index)
+
+        assert fitting == [c for c in candidates if not schedule_index.overlaps(c)]
+        assert 0 < len(fitting) < len(candidates)
+
+    def test_free_gaps(self, farm):
+        _, _, _, solution = farm
+        schedule_index = FieldIntervalIndex(solution)
+        field_id = solution[0].field.field_id
+        intervals = [FieldIntervalIndex.interval(a) for a in schedule_index.field_allocations(field_id)]
+
+        gaps = schedule_index.free_gaps(field_id)
+
+        assert gaps[0] == (None, intervals[0][0])
+        assert gaps[-1] == (intervals[-1][1], None)
+        assert len(gaps) == len(intervals) + 1
+        assert FieldIntervalIndex().free_gaps(field_id) == [(None, None)]
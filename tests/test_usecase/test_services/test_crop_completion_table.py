@@ -0,0 +1,324 @@
+"""Tests for CropCompletionTable.
+
+Tables must reproduce GrowthPeriodOptimizeInteractor completions, and
+AllocationAdjustInteractor must return the same adjustment with and without
+completion tables (tables of other crop profiles are ignored).
+"""
+
+from dataclasses import replace
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from agrr_core.adapter.gateways.crop_profile_inmemory_gateway import CropProfileInMemoryGateway
+from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.entity.entities.crop_profile_entity import CropProfile
+from agrr_core.entity.entities.field_entity import Field
+from agrr_core.entity.entities.field_schedule_entity import FieldSchedule
+from agrr_core.entity.entities.move_instruction_entity import MoveAction, MoveInstruction
+from agrr_core.entity.entities.multi_field_optimization_result_entity import (
+    MultiFieldOptimizationResult,
+)
+from agrr_core.entity.entities.weather_series_entity import WeatherSeries
+from agrr_core.usecase.dto.allocation_adjust_request_dto import AllocationAdjustRequestDTO
+from agrr_core.usecase.dto.multi_field_crop_allocation_request_dto import (
+    MultiFieldCropAllocationRequestDTO,
+)
+from agrr_core.usecase.interactors.allocation_adjust_interactor import AllocationAdjustInteractor
+from agrr_core.usecase.interactors.multi_field_crop_allocation_greedy_interactor import (
+    MultiFieldCropAllocationGreedyInteractor,
+)
+from agrr_core.usecase.services.crop_completion_table import build_completion_tables
+from agrr_core.usecase.services.gdd_prefix_sum_engine import GDDPrefixSumEngine
+
+PLANNING_START = datetime(2024, 3, 1)
+PLANNING_END = datetime(2024, 12, 31)
+FIELDS = [
+    Field(field_id="f1", name="Field 1", area=1000.0, daily_fixed_cost=500.0, fallow_period_days=14),
+    Field(field_id="f2", name="Field 2", area=800.0, daily_fixed_cost=400.0, fallow_period_days=14),
+]
+
+
+def _current_result(crop_profiles):
+    tomato = crop_profiles[0].crop
+    allocation = CropAllocation(
+        allocation_id="a1",
+        field=FIELDS[0],
+        crop=tomato,
+        area_used=100.0,
+        start_date=datetime(2024, 4, 1),
+        completion_date=datetime(2024, 7, 1),
+        growth_days=92,
+        accumulated_gdd=1000.0,
+        total_cost=46000.0,
+        expected_revenue=100000.0,
+        profit=54000.0,
+    )
+    return MultiFieldOptimizationResult(
+        optimization_id="opt",
+        field_schedules=[
+            FieldSchedule(
+                field=FIELDS[0],
+                allocations=[allocation],
+                total_area_used=100.0,
+                total_cost=46000.0,
+                total_revenue=100000.0,
+                total_profit=54000.0,
+                utilization_rate=10.0,
+            ),
+            FieldSchedule(
+                field=FIELDS[1],
+                allocations=[],
+                total_area_used=0.0,
+                total_cost=0.0,
+                total_revenue=0.0,
+                total_profit=0.0,
+                utilization_rate=0.0,
+            ),
+        ],
+        total_cost=46000.0,
+        total_revenue=100000.0,
+        total_profit=54000.0,
+        crop_areas={"tomato": 100.0},
+        optimization_time=0.0,
+        algorithm_used="DP",
+    )
+
+
+def _interactor(crop_profiles, weather, tables=None):
+    allocation_result_gateway = Mock()
+    allocation_result_gateway.get.return_value = _current_result(crop_profiles)
+    weather_gateway = Mock()
+    weather_gateway.get.return_value = weather
+    completion_table_gateway = None
+    if tables is not None:
+        completion_table_gateway = Mock()
+        completion_table_gateway.get_all.return_value = tables
+    return AllocationAdjustInteractor(
+        allocation_result_gateway=allocation_result_gateway,
+        field_gateway=Mock(),
+        crop_gateway=CropProfileInMemoryGateway(crop_profiles),
+        weather_gateway=weather_gateway,
+        crop_profile_gateway_internal=CropProfileInMemoryGateway(),
+        completion_table_gateway=completion_table_gateway,
+    )
+
+
+class TestCropCompletionTable:
+    """Test CropCompletionTable."""
+
+    @pytest.fixture
+    def weather(self, make_seasonal_weather):
+        return make_seasonal_weather(datetime(2024, 1, 1), 500, seed=5, missing_rate=0.03)
+
+    @pytest.fixture
+    def crop_profiles(self, make_crop_profile, make_temperature_profile, multi_stage):
+        lettuce = CropProfile(
+            crop=Crop(
+                crop_id="lettuce",
+                name="Lettuce",
+                area_per_unit=0.2,
+                variety="Green",
+                revenue_per_area=600.0,
+                max_revenue=300000.0,
+            ),
+            stage_requirements=make_crop_profile(
+                [(make_temperature_profile(5.0, 15.0, 22.0, 30.0), 500.0)]
+            ).stage_requirements,
+        )
+        return [make_crop_profile(multi_stage), lettuce]
+
+    @staticmethod
+    def _completions(crop_profiles, weather, crop, starts, tables=None, lookup_only=False):
+        """Completion of each start date, from a fresh interactor per start (None: cannot complete)."""
+        outcomes = []
+        for start_date in starts:
+            interactor = _interactor(crop_profiles, weather, tables)
+            if lookup_only:
+                interactor.growth_period_optimizer = Mock()
+            interactor._load_completion_tables()
+            try:
+                outcomes.append(interactor._calculate_completion_date(
+                    crop, FIELDS[1], start_date, PLANNING_END
+                ))
+            except ValueError:
+                outcomes.append(None)
+            if lookup_only:
+                interactor.growth_period_optimizer.execute.assert_not_called()
+        return outcomes
+
+    def test_matches_engine_sweep(self, weather, crop_profiles):
+        tables = build_completion_tables(crop_profiles, weather, PLANNING_START, PLANNING_END)
+
+        series = WeatherSeries.from_weather_data(weather)
+        starts = [PLANNING_START + timedelta(days=i) for i in range((PLANNING_END - PLANNING_START).days + 1)]
+        for table, crop_profile in zip(tables, crop_profiles):
+            engine = GDDPrefixSumEngine(
+                series.ordinals,
+                series.column('temperature_2m_mean'),
+                crop_profile.stage_requirements,
+            )
+            assert table.crop_id == crop_profile.crop.crop_id
+            assert table.last_start == PLANNING_END
+            assert [table.completion(start) for start in starts] == engine.sweep(starts)
+        assert not tables[0].covers(PLANNING_START - timedelta(days=1), PLANNING_END)
+        assert not tables[0].covers(PLANNING_START, PLANNING_END + timedelta(hours=12))
+
+    def test_allocate_saves_tables_from_run_weather(self, weather, crop_profiles):
+        field_gateway = Mock()
+        field_gateway.get.side_effect = {f.field_id: f for f in FIELDS}.get
+        weather_gateway = Mock()
+        weather_gateway.get.return_value = weather
+        completion_table_gateway = Mock()
+        interactor = MultiFieldCropAllocationGreedyInteractor(
+            field_gateway=field_gateway,
+            crop_gateway=CropProfileInMemoryGateway(crop_profiles),
+            weather_gateway=weather_gateway,
+            crop_profile_gateway_internal=CropProfileInMemoryGateway(),
+            completion_table_gateway=completion_table_gateway,
+        )
+
+        interactor.execute(
+            MultiFieldCropAllocationRequestDTO(
+                field_ids=[f.field_id for f in FIELDS],
+                planning_period_start=PLANNING_START,
+                planning_period_end=PLANNING_END,
+            ),
+            enable_local_search=False,
+        )
+
+        weather_gateway.get.assert_called_once()
+        completion_table_gateway.save.assert_called_once_with(
+            build_completion_tables(crop_profiles, weather, PLANNING_START, PLANNING_END)
+        )
+
+    def test_tables_carry_profile_fingerprint(self, weather, crop_profiles):
+        tables = build_completion_tables(crop_profiles, weather, PLANNING_START, PLANNING_END)
+        tomato, lettuce = crop_profiles
+        slower = replace(tomato, stage_requirements=lettuce.stage_requirements)
+
+        assert [table.matches(p) for table, p in zip(tables, crop_profiles)] == [True, True]
+        assert not tables[0].matches(lettuce)
+        assert not tables[0].matches(slower)
+        assert not replace(tables[0], first_start=PLANNING_START + timedelta(days=1)).matches(tomato)
+
+    def test_adjust_completion_matches_growth_period_optimizer(self, weather, crop_profiles):
+        tables = build_completion_tables(crop_profiles, weather, PLANNING_START, PLANNING_END)
+
+        for crop_profile in crop_profiles:
+            for offset in range(-1, 310, 13):
+                start_date = PLANNING_START + timedelta(days=offset)
+                outcomes = []
+                for interactor in (
+                    _interactor(crop_profiles, weather),
+                    _interactor(crop_profiles, weather, tables),
+                ):
+                    interactor._load_completion_tables()
+                    try:
+                        outcomes.append(interactor._calculate_completion_date(
+                            crop_profile.crop, FIELDS[1], start_date, PLANNING_END
+                        ))
+                    except ValueError:
+                        outcomes.append(None)
+                assert outcomes[1] == outcomes[0], (crop_profile.crop.crop_id, start_date)
+
+    def test_adjust_ignores_tables_of_other_profiles(self, weather, crop_profiles):
+        tomato, lettuce = crop_profiles
+        # Tables built before the tomato stage requirements were edited
+        stale = build_completion_tables(
+            [replace(tomato, stage_requirements=lettuce.stage_requirements), lettuce],
+            weather,
+            PLANNING_START,
+            PLANNING_END,
+        )
+        starts = [PLANNING_START + timedelta(days=offset) for offset in range(0, 310, 29)]
+
+        interactor = _interactor(crop_profiles, weather, stale)
+        interactor._load_completion_tables()
+
+        assert list(interactor._completion_tables) == [("lettuce", "Green")]
+        assert self._completions(crop_profiles, weather, tomato.crop, starts, stale) == (
+            self._completions(crop_profiles, weather, tomato.crop, starts)
+        )
+
+    def test_adjust_selects_table_by_variety(
+        self, weather, crop_profiles, make_crop_profile, make_temperature_profile
+    ):
+        tomato = crop_profiles[0]
+        cherry = CropProfile(
+            crop=replace(tomato.crop, variety="Cherry"),
+            stage_requirements=make_crop_profile(
+                [(make_temperature_profile(8.0, 18.0, 26.0, 35.0), 900.0)]
+            ).stage_requirements,
+        )
+        crop_profiles = [tomato, cherry]
+        tables = build_completion_tables(crop_profiles, weather, PLANNING_START, PLANNING_END)
+        starts = [PLANNING_START + timedelta(days=offset) for offset in range(0, 310, 29)]
+
+        interactor = _interactor(crop_profiles, weather, tables)
+        interactor._load_completion_tables()
+
+        assert set(interactor._completion_tables) == {("tomato", "Momotaro"), ("tomato", "Cherry")}
+        outcomes = {}
+        for crop_profile in crop_profiles:
+            crop = crop_profile.crop
+            outcomes[crop.variety] = self._completions(crop_profiles, weather, crop, starts)
+            assert self._completions(
+                crop_profiles, weather, crop, starts, tables, lookup_only=True
+            ) == outcomes[crop.variety]
+        assert outcomes["Momotaro"] != outcomes["Cherry"]
+
+    def test_adjust_with_tables_matches_without(self, weather, crop_profiles):
+        tables = build_completion_tables(crop_profiles, weather, PLANNING_START, PLANNING_END)
+        request = AllocationAdjustRequestDTO(
+            current_optimization_id="",
+            move_instructions=[
+                MoveInstruction(
+                    allocation_id="a1",
+                    action=MoveAction.MOVE,
+                    to_field_id="f2",
+                    to_start_date=datetime(2024, 5, 10),
+                ),
+                MoveInstruction(
+                    allocation_id=None,
+                    action=MoveAction.ADD,
+                    crop_id="lettuce",
+                    to_field_id="f1",
+                    to_start_date=datetime(2024, 3, 20),
+                    to_area=50.0,
+                ),
+                MoveInstruction(
+                    allocation_id=None,
+                    action=MoveAction.ADD,
+                    crop_id="lettuce",
+                    to_field_id="f1",
+                    to_start_date=datetime(2024, 12, 20),
+                    to_area=50.0,
+                ),
+            ],
+            planning_period_start=PLANNING_START,
+            planning_period_end=PLANNING_END,
+        )
+
+        expected = _interactor(crop_profiles, weather).execute(request)
+        interactor = _interactor(crop_profiles, weather, tables)
+        interactor.growth_period_optimizer = Mock()  # Every move must be answered by lookup
+        response = interactor.execute(request)
+
+        def schedules(result):
+            return [
+                [
+                    (a.crop.crop_id, a.start_date, a.completion_date, a.growth_days, a.total_cost, a.profit)
+                    for a in schedule.allocations
+                ]
+                for schedule in result.field_schedules
+            ]
+
+        assert response.success and expected.success
+        assert len(response.applied_moves) == len(expected.applied_moves) == 2
+        assert len(response.rejected_moves) == len(expected.rejected_moves) == 1
+        assert schedules(response.optimized_result) == schedules(expected.optimized_result)
+        assert response.optimized_result.total_profit == expected.optimized_result.total_profit
+        interactor.growth_period_optimizer.execute.assert_not_called()
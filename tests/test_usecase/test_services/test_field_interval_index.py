@@ -0,0 +1,129 @@
+"""Tests for FieldIntervalIndex.
+
+Index queries must agree with pairwise `CropAllocation.overlaps_with_fallow`.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from agrr_core.entity.entities.crop_allocation_entity import CropAllocation
+from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.entity.entities.field_entity import Field
+from agrr_core.usecase.services.allocation_feasibility_checker import (
+    AllocationFeasibilityChecker,
+)
+from agrr_core.usecase.services.field_interval_index import FieldIntervalIndex
+
+
+CROP = Crop(crop_id="c1", name="Crop", area_per_unit=1.0, revenue_per_area=10.0)
+
+
+def _field(field_id, fallow):
+    return Field(
+        field_id=field_id,
+        name=field_id,
+        area=1000.0,
+        daily_fixed_cost=10.0,
+        fallow_period_days=fallow,
+    )
+
+
+def _alloc(alloc_id, field, start, days):
+    return CropAllocation(
+        allocation_id=alloc_id,
+        field=field,
+        crop=CROP,
+        area_used=100.0,
+        start_date=start,
+        completion_date=start + timedelta(days=days),
+        growth_days=days,
+        accumulated_gdd=0.0,
+        total_cost=days * 10.0,
+    )
+
+
+class TestFieldIntervalIndex:
+    """Test FieldIntervalIndex."""
+
+    def test_fallow_boundary(self):
+        field = _field("f1", fallow=28)
+        existing = _alloc("a1", field, datetime(2025, 1, 1), 30)  # Ends Jan 31
+        index = FieldIntervalIndex([existing])
+
+        # Fallow ends Feb 28: starting that day is allowed, the day before is not
+        assert index.overlaps(_alloc("a2", field, datetime(2025, 2, 27), 10))
+        assert not index.overlaps(_alloc("a3", field, datetime(2025, 2, 28), 10))
+        # A new allocation whose fallow reaches into the existing one
+        assert index.overlaps(_alloc("a4", field, datetime(2024, 12, 1), 10))
+        assert not index.overlaps(_alloc("a5", field, datetime(2024, 11, 1), 3))
+
+    def test_other_fields_and_ignore(self):
+        f1, f2 = _field("f1", 0), _field("f2", 0)
+        existing = _alloc("a1", f1, datetime(2025, 3, 1), 30)
+        index = FieldIntervalIndex([existing])
+
+        replacement = _alloc("a2", f1, datetime(2025, 3, 10), 30)
+        assert index.overlaps(replacement)
+        assert not index.overlaps(replacement, ignore=(existing,))
+        assert not index.overlaps(_alloc("a3", f2, datetime(2025, 3, 1), 30))
+
+    def test_remove(self):
+        field = _field("f1", 0)
+        a1 = _alloc("a1", field, datetime(2025, 1, 1), 30)
+        a2 = _alloc("a2", field, datetime(2025, 3, 1), 30)
+        index = FieldIntervalIndex([a1, a2])
+
+        index.remove(a1)
+
+        assert len(index) == 1
+        assert index.field_allocations("f1") == [a2]
+        with pytest.raises(ValueError):
+            index.remove(a1)
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_queries_match_pairwise_overlap(self, seed):
+        rng = random.Random(seed)
+        fields = [_field("f1", 0), _field("f2", 14), _field("f3", 30)]
+        index = FieldIntervalIndex()
+        schedule = []
+
+        for i in range(400):
+            alloc = _alloc(
+                f"a{i}",
+                rng.choice(fields),
+                datetime(2025, 1, 1) + timedelta(days=rng.randrange(700)),
+                rng.randrange(0, 60),
+            )
+            expected_conflicts = {
+                a.allocation_id for a in schedule if a.overlaps_with_fallow(alloc)
+            }
+            assert {a.allocation_id for a in index.conflicts(alloc)} == expected_conflicts
+
+            added = index.try_add(alloc)
+            assert added == (not expected_conflicts)
+            if added:
+                schedule.append(alloc)
+
+            # Occasionally remove a random allocation
+            if schedule and rng.random() < 0.2:
+                victim = schedule.pop(rng.randrange(len(schedule)))
+                index.remove(victim)
+
+        assert len(index) == len(schedule)
+
+
+class TestFeasibilityCheckerWithIndex:
+    """AllocationFeasibilityChecker time constraint via FieldIntervalIndex."""
+
+    def test_detects_overlap_regardless_of_order(self):
+        field = _field("f1", 7)
+        a1 = _alloc("a1", field, datetime(2025, 1, 1), 30)
+        a2 = _alloc("a2", field, datetime(2025, 6, 1), 30)
+        a3 = _alloc("a3", field, datetime(2025, 2, 3), 10)  # Within a1's fallow
+        checker = AllocationFeasibilityChecker()
+
+        assert checker._check_time_constraints([a1, a2])
+        assert not checker._check_time_constraints([a2, a3, a1])
+        assert not checker._check_time_constraints([a3, a2, a1])
@@ -0,0 +1,207 @@
+"""Parity tests for GDDPrefixSumEngine.
+
+The engine must reproduce the stage-aware day-by-day accumulation of
+GrowthPeriodOptimizeInteractor._compute_completion_from_start, and the
+interactor must return identical candidate lists on both paths.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from agrr_core.entity.entities.field_entity import Field
+from agrr_core.entity.entities.weather_entity import WeatherData
+from agrr_core.entity.entities.weather_series_entity import WeatherSeries
+from agrr_core.usecase.dto.growth_period_optimize_request_dto import (
+    OptimalGrowthPeriodRequestDTO,
+)
+from agrr_core.usecase.interactors.growth_period_optimize_interactor import (
+    GrowthPeriodOptimizeInteractor,
+)
+from agrr_core.usecase.services.gdd_prefix_sum_engine import (
+    GDDPrefixSumEngine,
+    daily_gdd_array,
+)
+
+
+def _engine(weather, stage_requirements):
+    series = WeatherSeries.from_weather_data(weather)
+    return GDDPrefixSumEngine(
+        series.ordinals, series.column('temperature_2m_mean'), stage_requirements
+    )
+
+
+class TestDailyGDDArray:
+    """Vectorized daily GDD must equal TemperatureProfile.daily_gdd."""
+
+    def test_matches_scalar_across_all_zones(self, make_temperature_profile):
+        profile = make_temperature_profile(10.0, 20.0, 28.0, 38.0)
+        temps = [None, -5.0, 10.0, 12.5, 19.9, 20.0, 25.0, 28.0, 30.0, 37.9, 38.0, 45.0]
+        arr = np.array([np.nan if t is None else t for t in temps])
+
+        result = daily_gdd_array(profile, arr)
+
+        for t, value in zip(temps, result):
+            assert value == profile.daily_gdd(t)
+
+
+class TestGDDPrefixSumEngineParity:
+    """Engine completion must match day-by-day accumulation."""
+
+    @pytest.mark.parametrize("seed,missing_rate", [(1, 0.0), (2, 0.0), (3, 0.05)])
+    def test_completion_matches_reference_for_every_start(
+        self, seed, missing_rate, make_crop_profile, make_seasonal_weather, multi_stage
+    ):
+        weather = make_seasonal_weather(datetime(2024, 1, 1), 730, seed, missing_rate)
+        weather_by_date = {w.time.date(): w for w in weather}
+        sorted_dates = sorted(weather_by_date.keys())
+        stage_requirements = make_crop_profile(multi_stage).stage_requirements
+
+        interactor = GrowthPeriodOptimizeInteractor(
+            crop_profile_gateway=Mock(), weather_gateway=Mock()
+        )
+        engine = _engine(weather, stage_requirements)
+
+        starts = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(730)]
+        completions = engine.sweep(starts)
+
+        for start, completion in zip(starts, completions):
+            expected = interactor._compute_completion_from_start(
+                start, weather_by_date, sorted_dates, stage_requirements
+            )
+            if expected is None:
+                assert completion is None, start
+            else:
+                assert completion == (expected[0], expected[1]), start
+
+    def test_surplus_carry_completes_following_stage_same_day(
+        self, make_crop_profile, make_temperature_profile
+    ):
+        """A large surplus can satisfy a tiny next stage without consuming a day."""
+        profile = make_temperature_profile(0.0, 10.0, 30.0, 40.0)
+        weather = [
+            WeatherData(time=datetime(2024, 5, 1) + timedelta(days=i), temperature_2m_mean=20.0)
+            for i in range(10)
+        ]
+        stage_requirements = make_crop_profile([(profile, 30.0), (profile, 5.0)]).stage_requirements
+
+        engine = _engine(weather, stage_requirements)
+
+        # 20 GDD/day: stage 1 completes on day 2 with 10 surplus, covering stage 2
+        assert engine.completion_from_start(datetime(2024, 5, 1)) == (datetime(2024, 5, 2), 2)
+
+    def test_returns_none_when_weather_exhausted(self, make_crop_profile, make_temperature_profile):
+        profile = make_temperature_profile(0.0, 10.0, 30.0, 40.0)
+        weather = [
+            WeatherData(time=datetime(2024, 5, 1) + timedelta(days=i), temperature_2m_mean=20.0)
+            for i in range(5)
+        ]
+        stage_requirements = make_crop_profile([(profile, 200.0)]).stage_requirements
+
+        engine = _engine(weather, stage_requirements)
+
+        assert engine.completion_from_start(datetime(2024, 5, 1)) is None
+        assert engine.completion_from_start(datetime(2024, 6, 1)) is None
+
+
+class TestInteractorParity:
+    """Interactor must return identical CandidateResultDTO lists on both paths."""
+
+    def _run(self, use_gdd_prefix_sum, crop_profile, weather, request):
+        crop_profile_gateway = Mock()
+        crop_profile_gateway.get.return_value = crop_profile
+        weather_gateway = Mock()
+        weather_gateway.get.return_value = weather
+        interactor = GrowthPeriodOptimizeInteractor(
+            crop_profile_gateway=crop_profile_gateway,
+            weather_gateway=weather_gateway,
+            use_gdd_prefix_sum=use_gdd_prefix_sum,
+        )
+        return interactor.execute(request)
+
+    @pytest.mark.parametrize("filter_redundant", [True, False])
+    @pytest.mark.parametrize("seed", [11, 12])
+    def test_candidate_lists_identical(
+        self, filter_redundant, seed, make_crop_profile, make_seasonal_weather, multi_stage
+    ):
+        crop_profile = make_crop_profile(multi_stage)
+        weather = make_seasonal_weather(datetime(2024, 1, 1), 730, seed)
+        field = Field(field_id="f1", name="Field 1", area=1000.0, daily_fixed_cost=500.0)
+        request = OptimalGrowthPeriodRequestDTO(
+            crop_id="tomato",
+            variety="Momotaro",
+            evaluation_period_start=datetime(2024, 3, 1),
+            evaluation_period_end=datetime(2025, 2, 28),
+            field=field,
+            filter_redundant_candidates=filter_redundant,
+        )
+
+        fast = self._run(True, crop_profile, weather, request)
+        reference = self._run(False, crop_profile, weather, request)
+
+        def as_tuples(response):
+            return [
+                (c.start_date, c.completion_date, c.growth_days, c.is_optimal)
+                for c in response.candidates
+            ]
+
+        assert len(fast.candidates) > 0
+        assert as_tuples(fast) == as_tuples(reference)
+        # Yield factors come from StressImpactKernel prefix sums (rounding-level differences)
+        assert [c.yield_factor for c in fast.candidates] == pytest.approx(
+            [c.yield_factor for c in reference.candidates], rel=1e-9
+        )
+        assert fast.optimal_start_date == reference.optimal_start_date
+
+    def test_early_stop_identical(self, make_crop_profile, make_seasonal_weather, multi_stage):
+        crop_profile = make_crop_profile(multi_stage)
+        weather = make_seasonal_weather(datetime(2024, 1, 1), 730, 21)
+        field = Field(field_id="f1", name="Field 1", area=1000.0, daily_fixed_cost=500.0)
+        request = OptimalGrowthPeriodRequestDTO(
+            crop_id="tomato",
+            variety="Momotaro",
+            evaluation_period_start=datetime(2024, 4, 1),
+            evaluation_period_end=datetime(2024, 12, 31),
+            field=field,
+            early_stop_at_first=True,
+        )
+
+        fast = self._run(True, crop_profile, weather, request)
+        reference = self._run(False, crop_profile, weather, request)
+
+        assert [(c.start_date, c.completion_date) for c in fast.candidates] == [
+            (c.start_date, c.completion_date) for c in reference.candidates
+        ]
+        assert [c.yield_factor for c in fast.candidates] == pytest.approx(
+            [c.yield_factor for c in reference.candidates], rel=1e-9
+        )
+
+    def test_series_sweep_builds_no_records(
+        self, monkeypatch, make_crop_profile, make_seasonal_weather, multi_stage
+    ):
+        """A WeatherSeries feeds the sweep through its columns only."""
+        crop_profile = make_crop_profile(multi_stage)
+        weather = make_seasonal_weather(datetime(2024, 1, 1), 730, 31)
+        series = WeatherSeries.from_weather_data(weather)
+        field = Field(field_id="f1", name="Field 1", area=1000.0, daily_fixed_cost=500.0)
+        request = OptimalGrowthPeriodRequestDTO(
+            crop_id="tomato",
+            variety="Momotaro",
+            evaluation_period_start=datetime(2024, 3, 1),
+            evaluation_period_end=datetime(2025, 2, 28),
+            field=field,
+        )
+        expected = self._run(True, crop_profile, weather, request)
+
+        def fail(self):
+            raise AssertionError("WeatherData records were built")
+
+        monkeypatch.setattr(WeatherSeries, "_build_records", fail)
+        from_columns = self._run(True, crop_profile, series, request)
+
+        def as_tuples(response):
+            return [(c.start_date, c.completion_date, c.yield_factor) for c in response.candidates]
+
+        assert as_tuples(from_columns) == as_tuples(expected)
@@ -0,0 +1,253 @@
+"""Tests for GrowthPeriodWorkerPool.
+
+Results must be identical (and in task order) whether tasks run in-process
+or on a process pool, and a crop that cannot complete growth must only
+affect its own task.
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from agrr_core.adapter.gateways.crop_profile_inmemory_gateway import (
+    CropProfileInMemoryGateway,
+)
+from agrr_core.entity.entities.crop_entity import Crop
+from agrr_core.entity.entities.crop_profile_entity import CropProfile
+from agrr_core.entity.entities.field_entity import Field
+from agrr_core.entity.entities.growth_stage_entity import GrowthStage
+from agrr_core.entity.entities.stage_requirement_entity import StageRequirement
+from agrr_core.entity.entities.sunshine_profile_entity import SunshineProfile
+from agrr_core.entity.entities.temperature_profile_entity import TemperatureProfile
+from agrr_core.entity.entities.thermal_requirement_entity import ThermalRequirement
+from agrr_core.entity.entities.weather_entity import WeatherData
+from agrr_core.usecase.dto.growth_period_optimize_request_dto import (
+    OptimalGrowthPeriodRequestDTO,
+)
+from agrr_core.usecase.dto.multi_field_crop_allocation_request_dto import (
+    MultiFieldCropAllocationRequestDTO,
+)
+from agrr_core.usecase.dto.optimization_config import OptimizationConfig
+from agrr_core.usecase.interactors.growth_period_optimize_interactor import (
+    GrowthPeriodOptimizeInteractor,
+)
+from agrr_core.usecase.interactors.multi_field_crop_allocation_greedy_interactor import (
+    MultiFieldCropAllocationGreedyInteractor,
+)
+from agrr_core.usecase.services.growth_period_worker_pool import (
+    GrowthPeriodTask,
+    GrowthPeriodWorkerPool,
+)
+
+
+def _crop_profile(crop_id, required_gdd):
+    crop = Crop(
+        crop_id=crop_id,
+        name=crop_id.capitalize(),
+        area_per_unit=0.5,
+        variety="default",
+        revenue_per_area=1000.0,
+    )
+    stage = StageRequirement(
+        stage=GrowthStage(name="growth", order=1),
+        temperature=TemperatureProfile(
+            base_temperature=10.0,
+            optimal_min=18.0,
+            optimal_max=28.0,
+            low_stress_threshold=12.0,
+            high_stress_threshold=32.0,
+            frost_threshold=0.0,
+            max_temperature=40.0,
+        ),
+        sunshine=SunshineProfile(),
+        thermal=ThermalRequirement(required_gdd=required_gdd),
+    )
+    return CropProfile(crop=crop, stage_requirements=[stage])
+
+
+def _weather(days=240):
+    start = datetime(2024, 3, 1)
+    return [
+        WeatherData(
+            time=start + timedelta(days=i),
+            temperature_2m_mean=14.0 + (i % 60) * 0.2,
+            temperature_2m_max=20.0 + (i % 60) * 0.2,
+            temperature_2m_min=8.0 + (i % 60) * 0.2,
+        )
+        for i in range(days)
+    ]
+
+
+def _tasks(fields, n_crops):
+    return [
+        GrowthPeriodTask(
+            field=field,
+            crop_index=crop_index,
+            evaluation_period_start=datetime(2024, 3, 1),
+            evaluation_period_end=datetime(2024, 6, 30),
+        )
+        for field in fields
+        for crop_index in range(n_crops)
+    ]
+
+
+FIELDS = [
+    Field(field_id="f1", name="Field 1", area=1000.0, daily_fixed_cost=500.0),
+    Field(field_id="f2", name="Field 2", area=800.0, daily_fixed_cost=300.0),
+]
+
+
+class TestGrowthPeriodWorkerPool:
+    """Test GrowthPeriodWorkerPool."""
+
+    def test_resolve_worker_count(self):
+        assert GrowthPeriodWorkerPool.resolve_worker_count(1) == 1
+        assert GrowthPeriodWorkerPool.resolve_worker_count(3) == 3
+        assert GrowthPeriodWorkerPool.resolve_worker_count(-2) == 1
+        assert GrowthPeriodWorkerPool.resolve_worker_count(0) >= 1
+
+    def test_process_pool_matches_in_process(self):
+        """Worker count must not change results or their order."""
+        profiles = [_crop_profile("tomato", 600.0), _crop_profile("lettuce", 300.0)]
+        weather = _weather()
+        tasks = _tasks(FIELDS, len(profiles))
+
+        serial = GrowthPeriodWorkerPool(weather, profiles, max_workers=1).run(tasks)
+        parallel = GrowthPeriodWorkerPool(weather, profiles, max_workers=2).run(tasks)
+
+        assert len(serial) == len(parallel) == len(tasks)
+        for s, p in zip(serial, parallel):
+            assert s.error is None and p.error is None
+            assert len(s.candidates) > 0
+            assert [
+                (c.start_date, c.completion_date, c.total_cost, c.yield_factor)
+                for c in s.candidates
+            ] == [
+                (c.start_date, c.completion_date, c.total_cost, c.yield_factor)
+                for c in p.candidates
+            ]
+
+    def test_cost_reflects_task_field(self):
+        """Each task is evaluated against its own field."""
+        profiles = [_crop_profile("tomato", 600.0)]
+        results = GrowthPeriodWorkerPool(_weather(), profiles).run(
+            _tasks(FIELDS, len(profiles))
+        )
+
+        f1_best, f2_best = results[0].candidates[0], results[1].candidates[0]
+        assert f1_best.total_cost == pytest.approx(f1_best.growth_days * 500.0)
+        assert f2_best.total_cost == pytest.approx(f2_best.growth_days * 300.0)
+
+    @pytest.mark.parametrize("filter_redundant", [True, False])
+    def test_matches_growth_period_interactor(self, filter_redundant):
+        """Tasks return the candidates GrowthPeriodOptimizeInteractor returns."""
+        profile = _crop_profile("tomato", 600.0)
+        weather = _weather()
+        task = GrowthPeriodTask(
+            field=FIELDS[0],
+            crop_index=0,
+            evaluation_period_start=datetime(2024, 3, 1),
+            evaluation_period_end=datetime(2024, 6, 30),
+            filter_redundant_candidates=filter_redundant,
+        )
+        weather_gateway = Mock()
+        weather_gateway.get.return_value = weather
+        response = GrowthPeriodOptimizeInteractor(
+            crop_profile_gateway=CropProfileInMemoryGateway([profile]),
+            weather_gateway=weather_gateway,
+        ).execute(OptimalGrowthPeriodRequestDTO(
+            crop_id="tomato",
+            variety="default",
+            evaluation_period_start=task.evaluation_period_start,
+            evaluation_period_end=task.evaluation_period_end,
+            field=task.field,
+            filter_redundant_candidates=filter_redundant,
+        ))
+
+        result = GrowthPeriodWorkerPool(weather, [profile]).run([task])[0]
+
+        def keys(candidates):
+            return [
+                (c.start_date, c.completion_date, c.growth_days, c.total_cost, c.yield_factor)
+                for c in candidates
+            ]
+
+        assert result.error is None
+        assert keys(result.candidates) == keys(response.candidates)
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_unreachable_crop_is_isolated(self, max_workers):
+        """A crop that cannot complete growth yields an error only for its task."""
+        profiles = [_crop_profile("tomato", 600.0), _crop_profile("impossible", 1e9)]
+        tasks = _tasks(FIELDS[:1], len(profiles))
+
+        results = GrowthPeriodWorkerPool(_weather(), profiles, max_workers).run(tasks)
+
+        assert results[0].error is None
+        assert len(results[0].candidates) > 0
+        assert results[1].error is not None
+        assert results[1].candidates == []
+
+
+class TestAllocatorCandidateGenerationWorkers:
+    """candidate_generation_workers must not change allocator candidates."""
+
+    def _interactor(self, workers):
+        config = OptimizationConfig(candidate_generation_workers=workers)
+        weather_gateway = Mock()
+        weather_gateway.get.return_value = _weather()
+        interactor = MultiFieldCropAllocationGreedyInteractor(
+            field_gateway=Mock(),
+            crop_gateway=Mock(),
+            weather_gateway=weather_gateway,
+            crop_profile_gateway_internal=CropProfileInMemoryGateway(),
+            config=config,
+        )
+        return interactor, config
+
+    def _request(self):
+        return MultiFieldCropAllocationRequestDTO(
+            field_ids=[f.field_id for f in FIELDS],
+            planning_period_start=datetime(2024, 3, 1),
+            planning_period_end=datetime(2024, 6, 30),
+        )
+
+    @staticmethod
+    def _keys(candidates):
+        return [
+            (c.field.field_id, c.crop.crop_id, c.start_date, c.completion_date, c.area_used)
+            for c in candidates
+        ]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_parallel_generation_matches_sequential(self, workers):
+        crops = [_crop_profile("tomato", 600.0), _crop_profile("lettuce", 300.0)]
+
+        interactor, config = self._interactor(1)
+        sequential = interactor._generate_candidates(FIELDS, crops, self._request(), config)
+
+        interactor, config = self._interactor(workers)
+        pooled = interactor._generate_candidates_parallel(
+            FIELDS, crops, self._request(), config
+        )
+
+        assert len(sequential) > 0
+        assert self._keys(pooled) == self._keys(sequential)
+
+    def test_period_template_independent_of_worker_count(self):
+        crops = [_crop_profile("tomato", 600.0), _crop_profile("impossible", 1e9)]
+
+        results = []
+        for workers in (1, 2):
+            interactor, config = self._interactor(workers)
+            results.append(
+                self._keys(
+                    interactor._generate_candidates_with_period_template(
+                        FIELDS, crops, self._request(), config, "greedy"
+                    )
+                )
+            )
+
+        assert len(results[0]) > 0
+        assert results[1] == results[0]
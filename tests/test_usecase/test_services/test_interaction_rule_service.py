@@ -340,3 +340,27 @@ class TestGetFieldCropImpact:
         # Both rules apply: 1.1 * 1.15 = 1.265
         assert impact == pytest.approx(1.265, rel=0.001)
 
+
+class TestRuleTable:
+    """Test precompiled rule_table."""
+    
+    def test_rule_table_recompiled_when_rules_reassigned(self):
+        """Test that reassigning rules invalidates the compiled table."""
+        service = InteractionRuleService([])
+        tomato = Crop(crop_id="tomato", name="Tomato", area_per_unit=0.5, groups=["Solanaceae"])
+        eggplant = Crop(crop_id="eggplant", name="Eggplant", area_per_unit=0.5, groups=["Solanaceae"])
+        
+        assert service.get_continuous_cultivation_impact(eggplant, tomato) == 1.0
+        
+        service.rules = [
+            InteractionRule(
+                rule_id="rule_001",
+                rule_type=RuleType.CONTINUOUS_CULTIVATION,
+                source_group="Solanaceae",
+                target_group="Solanaceae",
+                impact_ratio=0.7,
+            )
+        ]
+        
+        assert len(service.rule_table) == 1
+        assert service.get_continuous_cultivation_impact(eggplant, tomato) == 0.7
@@ -0,0 +1,62 @@
+"""Tests for MoveDeltaEvaluator (delta evaluation of neighbor moves)."""
+
+import pytest
+
+from agrr_core.usecase.dto.optimization_config import OptimizationConfig
+from agrr_core.usecase.services.field_interval_index import FieldIntervalIndex
+from agrr_core.usecase.services.move_delta_evaluator import MoveDeltaEvaluator
+from agrr_core.usecase.services.neighbor_generator_service import NeighborGeneratorService
+from agrr_core.usecase.services.neighbor_operations import NeighborMove
+
+
+def _total_profit(solution):
+    return sum(alloc.profit for alloc in solution)
+
+
+class TestMoveDeltaEvaluator:
+    """Test delta evaluation against full recalculation of each neighbor."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_delta_matches_full_recalculation(
+        self, seed, make_farm, recalculate_farm, farm_rules, farm_planning_start
+    ):
+        fields, crops, candidates, solution = make_farm(seed)
+        moves = NeighborGeneratorService(
+            OptimizationConfig(enable_neighbor_sampling=False)
+        ).generate_moves(solution, candidates, fields, crops)
+
+        evaluator = MoveDeltaEvaluator(solution, farm_rules, farm_planning_start)
+
+        assert evaluator.profit == pytest.approx(_total_profit(solution))
+        assert {"field_swap", "crop_insert", "area_adjust"} <= {move.operation for move in moves}
+        for move in moves:
+            neighbor = move.apply(solution)
+            schedule_index = FieldIntervalIndex()
+            feasible = all(schedule_index.try_add(alloc) for alloc in neighbor)
+            delta = evaluator.delta(move)
+            if not feasible:
+                assert delta is None
+                continue
+            expected = _total_profit(recalculate_farm(neighbor)) - _total_profit(solution)
+            assert delta == pytest.approx(expected, abs=1e-6), move.operation
+
+    def test_overlapping_insert_is_infeasible(self, make_farm, farm_rules, farm_planning_start):
+        _, _, _, solution = make_farm(4)
+        clash = solution[0]
+
+        delta = MoveDeltaEvaluator(solution, farm_rules, farm_planning_start).delta(
+            NeighborMove("crop_insert", add=(clash,))
+        )
+
+        assert delta is None
+
+    def test_apply_replaces_removed_allocations_in_place(self, make_farm):
+        _, _, _, solution = make_farm(5)
+        first, last = solution[0], solution[-1]
+        replacements = (solution[1], solution[2])
+
+        neighbor = NeighborMove("swap", (last.allocation_id, first.allocation_id), replacements).apply(solution)
+
+        assert neighbor[0] is replacements[0]
+        assert neighbor[-1] is replacements[1]
+        assert len(neighbor) == len(solution)
@@ -0,0 +1,87 @@
+"""Tests for MultiStartALNSOptimizer.
+
+Runs must be reproducible from the master seed, independent of the worker
+count, and never worse than the initial solution.
+"""
+
+import itertools
+import time
+
+from agrr_core.usecase.dto.optimization_config import OptimizationConfig
+from agrr_core.usecase.services.alns_optimizer_service import ALNSOptimizer
+from agrr_core.usecase.services.alns_solution_state import ALNSSolutionState
+from agrr_core.usecase.services.multi_start_alns_optimizer_service import (
+    MultiStartALNSOptimizer,
+    _run_epoch,
+)
+
+
+def _keys(solution):
+    return [ALNSSolutionState.allocation_key(a) + (a.area_used,) for a in solution]
+
+
+def _optimize(make_farm, workers, seed=7, time_limit=None):
+    fields, crops, candidates, solution = make_farm(6, n_fields=8)
+    config = OptimizationConfig(
+        alns_starts=3,
+        alns_workers=workers,
+        alns_seed=seed,
+        alns_exchange_interval=10,
+    )
+    result = MultiStartALNSOptimizer(config).optimize(
+        solution, candidates, fields, crops, max_iterations=40, time_limit=time_limit
+    )
+    return solution, result
+
+
+class TestMultiStartALNSOptimizer:
+    """Test MultiStartALNSOptimizer."""
+
+    def test_create_runs_diversifies_seeds_and_weights(self, make_farm):
+        _, _, _, solution = make_farm(6)
+        optimizer = MultiStartALNSOptimizer(OptimizationConfig(alns_starts=3, alns_seed=1))
+
+        runs = optimizer.create_runs(solution, master_seed=1)
+
+        weights = [
+            tuple(op.weight for op in alns.destroy_weights.operators.values())
+            for alns, _ in runs
+        ]
+        assert weights[0] == (1.0,) * len(weights[0])  # Same as a single ALNS run
+        assert len(set(weights)) == 3
+        assert len({alns.rng.random() for alns, _ in runs}) == 3
+        assert all(trajectory.best_profit == runs[0][1].best_profit for _, trajectory in runs)
+
+    def test_reproducible_from_master_seed(self, make_farm):
+        initial, first = _optimize(make_farm, workers=1)
+        _, second = _optimize(make_farm, workers=1)
+        _, other_seed = _optimize(make_farm, workers=1, seed=8)
+
+        assert _keys(second) == _keys(first)
+        assert ALNSSolutionState(first).profit >= ALNSSolutionState(initial).profit
+        assert _keys(other_seed) != _keys(first)
+
+    def test_parallel_matches_in_process(self, make_farm):
+        _, serial = _optimize(make_farm, workers=1)
+        _, parallel = _optimize(make_farm, workers=2)
+
+        assert _keys(parallel) == _keys(serial)
+
+    def test_time_limit_stops_all_trajectories(self, make_farm):
+        initial, result = _optimize(make_farm, workers=1, time_limit=0.0)
+
+        assert _keys(result) == _keys(initial)
+
+    def test_deadline_is_checked_within_an_epoch(self, make_farm, monkeypatch):
+        fields, _, candidates, solution = make_farm(6)
+        optimizer = MultiStartALNSOptimizer(OptimizationConfig(alns_starts=2, alns_seed=3))
+        runs = optimizer.create_runs(solution, master_seed=3)
+        ranked_candidates = ALNSOptimizer._rank_candidates(candidates)
+
+        # Clock advancing one second per reading: the deadline passes mid-epoch
+        for run in runs:
+            clock = itertools.count()
+            monkeypatch.setattr(time, "time", lambda: float(next(clock)))
+            _, trajectory = _run_epoch(run, ranked_candidates, fields, 50, deadline=5.5)
+
+            assert 0 < trajectory.iteration < 50
@@ -0,0 +1,130 @@
+"""Tests for NeighborEvaluationPool.
+
+Move evaluations must be identical (and in move order) whether they run
+in-process or on worker processes, and local search must accept the same
+moves for any worker count.
+"""
+
+import random
+from dataclasses import replace
+from unittest.mock import Mock
+
+import pytest
+
+from agrr_core.usecase.dto.optimization_config import OptimizationConfig
+from agrr_core.usecase.interactors.multi_field_crop_allocation_greedy_interactor import (
+    MultiFieldCropAllocationGreedyInteractor,
+)
+from agrr_core.usecase.services.move_delta_evaluator import MoveDeltaEvaluator
+from agrr_core.usecase.services.neighbor_evaluation_pool import (
+    NeighborEvaluationPool,
+    decode_allocation,
+    encode_allocation,
+)
+from agrr_core.usecase.services.neighbor_generator_service import NeighborGeneratorService
+
+
+def _keys(solution):
+    return [
+        (a.field.field_id, a.crop.crop_id, a.start_date, a.area_used)  # New ids are uuid4
+        for a in solution
+    ]
+
+
+class TestNeighborEvaluationPool:
+    """Test NeighborEvaluationPool."""
+
+    def test_resolve_worker_count(self):
+        assert NeighborEvaluationPool.resolve_worker_count(1) == 1
+        assert NeighborEvaluationPool.resolve_worker_count(3) == 3
+        assert NeighborEvaluationPool.resolve_worker_count(-2) == 1
+        assert NeighborEvaluationPool.resolve_worker_count(0) >= 1
+
+    def test_allocation_encoding_round_trip(self, make_farm):
+        fields, crops, _, solution = make_farm(1)
+        field_map = NeighborEvaluationPool.field_snapshot(fields)
+        crop_map = NeighborEvaluationPool.crop_snapshot(crops)
+
+        decoded = [decode_allocation(encode_allocation(a), field_map, crop_map) for a in solution]
+
+        assert decoded == [replace(a, expected_revenue=None, profit=None) for a in solution]
+
+    def test_crop_snapshot_keeps_varieties_apart(self, make_farm):
+        fields, crops, _, solution = make_farm(1)
+        alloc = solution[0]
+        other_variety = replace(alloc.crop, variety="Other")
+        moved = replace(alloc, crop=other_variety)
+
+        crop_map = NeighborEvaluationPool.crop_snapshot(list(crops) + [other_variety])
+
+        assert decode_allocation(encode_allocation(moved), {f.field_id: f for f in fields}, crop_map).crop is other_variety
+        assert decode_allocation(encode_allocation(alloc), {f.field_id: f for f in fields}, crop_map).crop == alloc.crop
+
+    def test_crop_snapshot_rejects_conflicting_crops(self, make_farm):
+        _, crops, _, _ = make_farm(1)
+
+        with pytest.raises(ValueError, match="Conflicting crops"):
+            NeighborEvaluationPool.crop_snapshot([crops[0], replace(crops[0], revenue_per_area=crops[0].revenue_per_area + 1.0)])
+
+    def test_field_snapshot_rejects_conflicting_fields(self, make_farm):
+        fields, _, _, _ = make_farm(1)
+
+        assert NeighborEvaluationPool.field_snapshot(list(fields) + [fields[0]]) == {f.field_id: f for f in fields}
+        with pytest.raises(ValueError, match="Conflicting fields"):
+            NeighborEvaluationPool.field_snapshot([fields[0], replace(fields[0], area=fields[0].area + 1.0)])
+
+    def test_parallel_evaluation_matches_serial(self, make_farm, farm_rules, farm_planning_start):
+        fields, crops, candidates, solution = make_farm(2)
+        moves = NeighborGeneratorService(
+            OptimizationConfig(enable_neighbor_sampling=False)
+        ).generate_moves(solution, candidates, fields, crops)
+
+        evaluator = MoveDeltaEvaluator(solution, farm_rules, farm_planning_start)
+        expected = [
+            (0.0, False) if delta is None else (delta, True)
+            for delta in map(evaluator.delta, moves)
+        ]
+        with NeighborEvaluationPool(fields, crops, farm_rules, farm_planning_start, max_workers=1) as serial:
+            assert serial.evaluate(solution, moves) == expected
+        with NeighborEvaluationPool(fields, crops, farm_rules, farm_planning_start, max_workers=2) as pool:
+            # Twice: the pool is reused across batches
+            assert pool.evaluate(solution, moves) == expected
+            assert pool.evaluate(solution[1:], moves[:3]) == [
+                (0.0, False) if delta is None else (delta, True)
+                for delta in map(
+                    MoveDeltaEvaluator(solution[1:], farm_rules, farm_planning_start).delta, moves[:3]
+                )
+            ]
+        assert any(feasible for _, feasible in expected)
+
+
+class TestHillClimbingLocalSearchWorkers:
+    """local_search_workers must not change the local search result."""
+
+    @staticmethod
+    def _local_search(farm, planning_start, workers):
+        fields, _, candidates, solution = farm
+        config = OptimizationConfig(
+            max_local_search_iterations=5,
+            max_neighbors_per_iteration=60,
+            local_search_workers=workers,
+        )
+        interactor = MultiFieldCropAllocationGreedyInteractor(
+            field_gateway=Mock(),
+            crop_gateway=Mock(),
+            weather_gateway=Mock(),
+            crop_profile_gateway_internal=Mock(),
+            config=config,
+        )
+        random.seed(42)
+        improved = interactor._hill_climbing_local_search(
+            solution, candidates, fields, config, planning_start_date=planning_start
+        )
+        return _keys(solution), _keys(improved)
+
+    def test_parallel_local_search_matches_serial(self, make_farm, farm_planning_start):
+        initial, serial = self._local_search(make_farm(3), farm_planning_start, 1)
+        _, parallel = self._local_search(make_farm(3), farm_planning_start, 2)
+
+        assert serial != initial
+        assert parallel == serial
@@ -0,0 +1,164 @@
+"""Tests for StressImpactKernel.
+
+Window yield factors must match day-by-day evaluation with
+TemperatureProfile.calculate_daily_stress_impacts and YieldImpactAccumulator.
+"""
+
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from agrr_core.entity.entities.temperature_profile_entity import TemperatureProfile
+from agrr_core.entity.entities.weather_entity import WeatherData
+from agrr_core.entity.entities.weather_series_entity import WeatherSeries
+from agrr_core.entity.value_objects.yield_impact_accumulator import (
+    YieldImpactAccumulator,
+)
+from agrr_core.usecase.services.stress_impact_kernel import (
+    StressImpactKernel,
+    daily_stress_impacts_array,
+)
+
+
+@pytest.fixture
+def rice_profile():
+    return TemperatureProfile(
+        base_temperature=10.0,
+        optimal_min=20.0,
+        optimal_max=28.0,
+        low_stress_threshold=15.0,
+        high_stress_threshold=32.0,
+        frost_threshold=2.0,
+        max_temperature=40.0,
+        sterility_risk_threshold=35.0,
+    )
+
+
+def _weather(days, seed):
+    rng = random.Random(seed)
+    weather = []
+    for i in range(days):
+        mean = rng.uniform(-2.0, 36.0)
+        weather.append(
+            WeatherData(
+                time=datetime(2024, 1, 1) + timedelta(days=i),
+                temperature_2m_mean=mean,
+                temperature_2m_max=mean + rng.uniform(0.0, 9.0),
+                temperature_2m_min=mean - rng.uniform(0.0, 9.0),
+            )
+        )
+    return weather
+
+
+def _kernel(weather, profile):
+    series = WeatherSeries.from_weather_data(weather)
+    return StressImpactKernel(
+        series.ordinals,
+        series.column('temperature_2m_mean'),
+        series.column('temperature_2m_max'),
+        series.column('temperature_2m_min'),
+        profile,
+    )
+
+
+def _reference_yield(profile, weather_by_date, start, end):
+    accumulator = YieldImpactAccumulator()
+    current = start.date()
+    while current <= end.date():
+        if current in weather_by_date:
+            accumulator.accumulate_daily_impact(
+                profile.calculate_daily_stress_impacts(weather_by_date[current])
+            )
+        current += timedelta(days=1)
+    return accumulator.get_yield_factor()
+
+
+class TestDailyStressImpactsArray:
+    """Vectorized impacts must equal calculate_daily_stress_impacts."""
+
+    def test_matches_scalar_per_day(self, rice_profile):
+        weather = _weather(400, seed=5)
+        # Include a zero temperature range day (no attenuation branch)
+        weather.append(
+            WeatherData(
+                time=datetime(2025, 6, 1),
+                temperature_2m_mean=34.0,
+                temperature_2m_max=34.0,
+                temperature_2m_min=34.0,
+            )
+        )
+        t_mean = np.array([w.temperature_2m_mean for w in weather])
+        t_max = np.array([w.temperature_2m_max for w in weather])
+        t_min = np.array([w.temperature_2m_min for w in weather])
+
+        impacts = daily_stress_impacts_array(rice_profile, t_mean, t_max, t_min)
+
+        for i, w in enumerate(weather):
+            expected = rice_profile.calculate_daily_stress_impacts(w)
+            for key, value in expected.items():
+                assert impacts[key][i] == pytest.approx(value, abs=1e-15), (key, w)
+
+    def test_no_sterility_without_threshold(self, rice_profile):
+        profile = TemperatureProfile(
+            base_temperature=10.0,
+            optimal_min=20.0,
+            optimal_max=28.0,
+            low_stress_threshold=15.0,
+            high_stress_threshold=32.0,
+            frost_threshold=2.0,
+            max_temperature=40.0,
+        )
+        hot = np.array([45.0])
+
+        impacts = daily_stress_impacts_array(profile, hot, hot, hot)
+
+        assert impacts["sterility"][0] == 0.0
+
+
+class TestStressImpactKernel:
+    """Window yield factors must match YieldImpactAccumulator."""
+
+    def test_window_yield_factors_match_accumulator(self, rice_profile):
+        weather = _weather(365, seed=9)
+        weather_by_date = {w.time.date(): w for w in weather}
+        kernel = _kernel(weather, rice_profile)
+
+        starts = [datetime(2024, 1, 1) + timedelta(days=i) for i in range(0, 300, 7)]
+        ends = [s + timedelta(days=20 + (i % 40)) for i, s in enumerate(starts)]
+
+        factors = kernel.window_yield_factors(starts, ends)
+
+        for start, end, factor in zip(starts, ends, factors):
+            expected = _reference_yield(rice_profile, weather_by_date, start, end)
+            assert factor == pytest.approx(expected, rel=1e-9, abs=1e-300)
+
+    def test_window_without_weather_has_no_impact(self, rice_profile):
+        kernel = _kernel(_weather(10, seed=1), rice_profile)
+
+        assert kernel.yield_factor(datetime(2025, 1, 1), datetime(2025, 2, 1)) == 1.0
+
+    def test_complete_loss_day_zeroes_window(self):
+        profile = TemperatureProfile(
+            base_temperature=10.0,
+            optimal_min=20.0,
+            optimal_max=28.0,
+            low_stress_threshold=15.0,
+            high_stress_threshold=32.0,
+            frost_threshold=2.0,
+            max_temperature=40.0,
+            frost_daily_impact=1.0,
+        )
+        weather = [
+            WeatherData(time=datetime(2024, 1, 1), temperature_2m_mean=22.0,
+                        temperature_2m_max=25.0, temperature_2m_min=18.0),
+            WeatherData(time=datetime(2024, 1, 2), temperature_2m_mean=5.0,
+                        temperature_2m_max=9.0, temperature_2m_min=-3.0),
+            WeatherData(time=datetime(2024, 1, 3), temperature_2m_mean=22.0,
+                        temperature_2m_max=25.0, temperature_2m_min=18.0),
+        ]
+        kernel = _kernel(weather, profile)
+
+        assert kernel.yield_factor(datetime(2024, 1, 1), datetime(2024, 1, 3)) == 0.0
+        assert kernel.yield_factor(datetime(2024, 1, 3), datetime(2024, 1, 3)) == 1.0